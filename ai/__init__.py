@@ -1,14 +1,63 @@
-from .gemini_analyzer import GeminiAnalyzer
-from .base_analyzer import BaseAnalyzer
-from .backtesting import BacktestEngine
-from .advanced_backtester import AdvancedBacktester
-from .strategy_backtester import StrategyBacktester
-from .backtest_report_generator import BacktestReportGenerator
-from .sentiment_analysis import SentimentAnalysisManager
-from .market_regime_classifier import MarketRegimeClassifier
-from .anomaly_detector import AnomalyDetector
-from .strategy_optimizer import StrategyOptimizationEngine
-from .strategy_auto_deployer import StrategyAutoDeployer
+"""
+ai 패키지
+AI 분석기, 백테스터, 전략 최적화 모듈
+
+패키지 속성은 처음 접근할 때 해당 모듈을 import한다 (PEP 562).
+`import ai` 또는 `from ai.review_executor import ...`만으로는
+Gemini SDK, pandas 기반 백테스터 등이 로드되지 않는다.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+# 공개 이름 → 정의 모듈
+_LAZY_EXPORTS = {
+    'GeminiAnalyzer': '.gemini_analyzer',
+    'BaseAnalyzer': '.base_analyzer',
+    'BacktestEngine': '.backtesting',
+    'AdvancedBacktester': '.advanced_backtester',
+    'StrategyBacktester': '.strategy_backtester',
+    'BacktestReportGenerator': '.backtest_report_generator',
+    'SentimentAnalysisManager': '.sentiment_analysis',
+    'MarketRegimeClassifier': '.market_regime_classifier',
+    'AnomalyDetector': '.anomaly_detector',
+    'StrategyOptimizationEngine': '.strategy_optimizer',
+    'PopulationFitnessEvaluator': '.fitness_evaluator',
+    'StrategyAutoDeployer': '.strategy_auto_deployer',
+    'AIReviewExecutor': '.review_executor',
+    'ReviewRequest': '.review_executor',
+    'ReviewOutcome': '.review_executor',
+    'AnalysisCache': '.analysis_cache',
+    'get_analysis_cache': '.analysis_cache',
+}
+
+if TYPE_CHECKING:
+    from .gemini_analyzer import GeminiAnalyzer
+    from .base_analyzer import BaseAnalyzer
+    from .backtesting import BacktestEngine
+    from .advanced_backtester import AdvancedBacktester
+    from .strategy_backtester import StrategyBacktester
+    from .backtest_report_generator import BacktestReportGenerator
+    from .sentiment_analysis import SentimentAnalysisManager
+    from .market_regime_classifier import MarketRegimeClassifier
+    from .anomaly_detector import AnomalyDetector
+    from .strategy_optimizer import StrategyOptimizationEngine
+    from .fitness_evaluator import PopulationFitnessEvaluator
+    from .strategy_auto_deployer import StrategyAutoDeployer
+    from .review_executor import AIReviewExecutor, ReviewRequest, ReviewOutcome
+    from .analysis_cache import AnalysisCache, get_analysis_cache
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 
 __all__ = [
@@ -22,5 +71,11 @@ __all__ = [
     'MarketRegimeClassifier',
     'AnomalyDetector',
     'StrategyOptimizationEngine',
+    'PopulationFitnessEvaluator',
     'StrategyAutoDeployer',
+    'AIReviewExecutor',
+    'ReviewRequest',
+    'ReviewOutcome',
+    'AnalysisCache',
+    'get_analysis_cache',
 ]
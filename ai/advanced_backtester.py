@@ -9,15 +9,21 @@ Features:
 - Monte Carlo 시뮬레이션
 - 워크포워드 분석
 - 성능 리포트 생성
+
+일별 시뮬레이션은 종목별로 한 번 정렬/날짜 파싱한 봉 배열과 커서 인덱스를 사용한다.
+전략에는 복사 없이 "현재 날짜까지"의 봉을 보여주는 _BarWindow 뷰를 전달하므로
+하루 진행 비용은 종목 수에만 비례한다 (과거 봉 수와 무관).
 """
 from typing import Dict, Any, List, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from collections.abc import Sequence
 import numpy as np
 import statistics
 
 from utils.logger_new import get_logger
+from utils.monte_carlo import MonteCarloEngine
 
 logger = get_logger()
 
@@ -92,6 +98,68 @@ class BacktestResult:
     drawdown_curve: List[Tuple[datetime, float]] = field(default_factory=list)
 
 
+class _BarWindow(Sequence):
+    """
+    정렬된 봉 리스트의 앞부분 [0:end) 읽기 전용 뷰 (복사 없음)
+
+    리스트처럼 len(), 인덱싱(음수 포함), 슬라이싱, 반복을 지원한다.
+    슬라이싱 결과는 일반 리스트이다.
+    """
+
+    __slots__ = ('_bars', '_end')
+
+    def __init__(self, bars: List[Dict], end: int):
+        self._bars = bars
+        self._end = end
+
+    def __len__(self) -> int:
+        return self._end
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            bars = self._bars
+            return [bars[i] for i in range(*index.indices(self._end))]
+        if index < 0:
+            index += self._end
+        if not 0 <= index < self._end:
+            raise IndexError('bar index out of range')
+        return self._bars[index]
+
+    def __iter__(self):
+        bars = self._bars
+        for i in range(self._end):
+            yield bars[i]
+
+    def __eq__(self, other):
+        if isinstance(other, (list, _BarWindow)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"_BarWindow({self._end}/{len(self._bars)} bars)"
+
+
+class _StockSeries:
+    """종목별 사전 처리 데이터 (날짜순 정렬 봉 + 파싱된 날짜 + 커서)"""
+
+    __slots__ = ('bars', 'dates', 'cursor')
+
+    def __init__(self, bars: List[Dict], dates: List[datetime]):
+        self.bars = bars
+        self.dates = dates
+        self.cursor = 0
+
+    def advance(self, date: datetime) -> int:
+        """date 이하 봉까지 커서 전진 (누적 O(봉 수))"""
+        dates = self.dates
+        cursor = self.cursor
+        n = len(dates)
+        while cursor < n and dates[cursor] <= date:
+            cursor += 1
+        self.cursor = cursor
+        return cursor
+
+
 class AdvancedBacktester:
     """
     고급 백테스팅 엔진 (v5.11)
@@ -160,8 +228,11 @@ class AdvancedBacktester:
         # Reset state
         self._reset()
 
+        # 종목별 정렬/날짜 파싱 (1회)
+        series = self._prepare_series(data)
+
         # Get all dates
-        all_dates = self._get_all_dates(data, start_date, end_date)
+        all_dates = self._get_all_dates(series, start_date, end_date)
 
         logger.info(f"Running backtest: {len(all_dates)} days, {len(data)} stocks")
 
@@ -169,8 +240,8 @@ class AdvancedBacktester:
         for i, date in enumerate(all_dates):
             self.current_time = date
 
-            # Get data up to current date
-            current_data = self._get_data_until(data, date)
+            # Get data up to current date (커서 전진 + 뷰 생성, O(종목 수))
+            current_data = self._get_data_until(series, date)
 
             # Run strategy
             try:
@@ -192,7 +263,10 @@ class AdvancedBacktester:
                 logger.debug(f"Backtest progress: {i}/{len(all_dates)} days, Equity: {equity:,.0f}")
 
         # Close all positions at end
-        self._close_all_positions(data)
+        self._close_all_positions({
+            stock_code: _BarWindow(s.bars, len(s.bars))
+            for stock_code, s in series.items() if s.bars
+        })
 
         # Calculate results
         result = self._calculate_results()
@@ -282,15 +356,19 @@ class AdvancedBacktester:
         self,
         result: BacktestResult,
         num_simulations: int = 1000,
-        num_trades: Optional[int] = None
+        num_trades: Optional[int] = None,
+        block_size: int = 1,
+        seed: Optional[int] = None
     ) -> Dict[str, Any]:
         """
-        Monte Carlo 시뮬레이션
+        Monte Carlo 시뮬레이션 (거래 수익률 부트스트랩)
 
         Args:
             result: 백테스트 결과
             num_simulations: 시뮬레이션 횟수
             num_trades: 거래 수 (None이면 원래 거래 수)
+            block_size: 블록 부트스트랩 길이 (1이면 개별 거래 복원추출)
+            seed: 난수 시드 (재현용)
 
         Returns:
             시뮬레이션 결과
@@ -299,43 +377,37 @@ class AdvancedBacktester:
             return {'error': 'No trades to simulate'}
 
         # Extract trade returns
-        returns = [trade.pnl_percent for trade in result.trades]
+        returns = np.array([trade.pnl_percent for trade in result.trades], dtype=np.float64) / 100
 
         if num_trades is None:
             num_trades = len(returns)
 
         logger.info(f"Running Monte Carlo simulation: {num_simulations} simulations, {num_trades} trades each")
 
-        final_equities = []
-
-        for _ in range(num_simulations):
-            # Random sampling with replacement
-            simulated_returns = np.random.choice(returns, size=num_trades, replace=True)
-
-            # Calculate equity curve
-            equity = self.initial_capital
-            for ret in simulated_returns:
-                equity *= (1 + ret / 100)
-
-            final_equities.append(equity)
-
-        final_returns = [(eq - self.initial_capital) / self.initial_capital * 100 for eq in final_equities]
+        engine = MonteCarloEngine(seed=seed)
+        final_equities = engine.terminal_values(
+            self.initial_capital, num_trades, num_simulations,
+            sample=returns, method='block_bootstrap' if block_size > 1 else 'bootstrap',
+            block_size=block_size
+        )
+        final_returns = (final_equities - self.initial_capital) / self.initial_capital * 100
+        percentiles = np.percentile(final_returns, [5, 25, 50, 75, 95])
 
         return {
             'num_simulations': num_simulations,
             'num_trades': num_trades,
-            'mean_final_equity': statistics.mean(final_equities),
-            'median_final_equity': statistics.median(final_equities),
-            'std_final_equity': statistics.stdev(final_equities) if len(final_equities) > 1 else 0,
-            'min_final_equity': min(final_equities),
-            'max_final_equity': max(final_equities),
-            'mean_return_pct': statistics.mean(final_returns),
-            'percentile_5': np.percentile(final_returns, 5),
-            'percentile_25': np.percentile(final_returns, 25),
-            'percentile_50': np.percentile(final_returns, 50),
-            'percentile_75': np.percentile(final_returns, 75),
-            'percentile_95': np.percentile(final_returns, 95),
-            'probability_of_profit': sum(1 for r in final_returns if r > 0) / len(final_returns) * 100
+            'mean_final_equity': float(final_equities.mean()),
+            'median_final_equity': float(np.median(final_equities)),
+            'std_final_equity': float(final_equities.std(ddof=1)) if num_simulations > 1 else 0,
+            'min_final_equity': float(final_equities.min()),
+            'max_final_equity': float(final_equities.max()),
+            'mean_return_pct': float(final_returns.mean()),
+            'percentile_5': float(percentiles[0]),
+            'percentile_25': float(percentiles[1]),
+            'percentile_50': float(percentiles[2]),
+            'percentile_75': float(percentiles[3]),
+            'percentile_95': float(percentiles[4]),
+            'probability_of_profit': float((final_returns > 0).mean() * 100)
         }
 
     # ========================================================================
@@ -351,56 +423,80 @@ class AdvancedBacktester:
         self.equity_curve.clear()
         self.current_time = None
 
+    def _prepare_series(self, data: Dict[str, List[Dict]]) -> Dict[str, _StockSeries]:
+        """
+        종목별 봉을 날짜순으로 정렬하고 날짜를 한 번만 파싱
+
+        날짜를 해석할 수 없는 봉은 제외한다.
+        """
+        series = {}
+
+        for stock_code, bars in data.items():
+            dated = []
+            for bar in bars:
+                date = self._parse_date(bar.get('date'))
+                if date is not None:
+                    dated.append((date, bar))
+
+            # 이미 정렬된 입력이면 순서 유지 (안정 정렬)
+            dated.sort(key=lambda item: item[0])
+            series[stock_code] = _StockSeries(
+                bars=[bar for _, bar in dated],
+                dates=[date for date, _ in dated]
+            )
+
+        return series
+
     def _get_all_dates(
         self,
-        data: Dict[str, List[Dict]],
+        series: Dict[str, _StockSeries],
         start: Optional[datetime],
         end: Optional[datetime]
     ) -> List[datetime]:
         """모든 거래일 추출"""
         all_dates = set()
 
-        for stock_data in data.values():
-            for bar in stock_data:
-                date = bar.get('date')
-                if isinstance(date, str):
-                    date = datetime.fromisoformat(date)
-
-                if start and date < start:
-                    continue
-                if end and date > end:
-                    continue
+        for stock_series in series.values():
+            all_dates.update(stock_series.dates)
 
-                all_dates.add(date)
-
-        return sorted(list(all_dates))
+        return sorted(
+            date for date in all_dates
+            if not (start and date < start) and not (end and date > end)
+        )
 
     def _get_data_until(
         self,
-        data: Dict[str, List[Dict]],
+        series: Dict[str, _StockSeries],
         date: datetime
-    ) -> Dict[str, List[Dict]]:
-        """특정 날짜까지 데이터 추출"""
+    ) -> Dict[str, _BarWindow]:
+        """
+        특정 날짜까지 데이터 뷰 (날짜는 호출마다 증가해야 함)
+
+        각 종목 커서를 전진시키고 [0:cursor) 뷰를 반환한다.
+        """
         result = {}
 
-        for stock_code, bars in data.items():
-            filtered = [
-                bar for bar in bars
-                if self._parse_date(bar.get('date')) <= date
-            ]
-            if filtered:
-                result[stock_code] = filtered
+        for stock_code, stock_series in series.items():
+            end = stock_series.advance(date)
+            if end:
+                result[stock_code] = _BarWindow(stock_series.bars, end)
 
         return result
 
-    def _parse_date(self, date) -> datetime:
-        """날짜 파싱"""
+    def _parse_date(self, date) -> Optional[datetime]:
+        """날짜 파싱 (해석 불가 시 None)"""
         if isinstance(date, datetime):
             return date
         elif isinstance(date, str):
-            return datetime.fromisoformat(date)
+            try:
+                return datetime.fromisoformat(date)
+            except ValueError:
+                try:
+                    return datetime.strptime(date, '%Y%m%d')
+                except ValueError:
+                    return None
         else:
-            return datetime.now()
+            return None
 
     def _execute_signals(self, signals: List[Dict], data: Dict[str, List[Dict]]):
         """신호 실행"""
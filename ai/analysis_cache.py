@@ -0,0 +1,234 @@
+"""
+ai/analysis_cache.py
+LLM 분석 결과 영구 캐시 (SQLite)
+
+- 키: 렌더링된 프롬프트 + 모델 이름 + 프롬프트 템플릿 버전의 SHA-256
+  (같은 종목/점수라도 포트폴리오 등 프롬프트 내용이 다르면 다른 키)
+- TTL 만료 + 최근 사용(LRU) 기준 개수 상한 제거
+- 재시작 후에도 유지되어 재실행/백테스트/반복 스캔의 동일 호출을 재사용
+- 히트/미스 및 절약된 응답 시간 통계
+- 저장은 utils.sqlite_db 공용 계층 (히트 시 last_accessed 갱신은 그룹 커밋)
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from config.constants import DEFAULT_CACHE_TTL
+from utils.sqlite_db import get_database
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = "data/cache/ai_analysis.db"
+
+
+def make_cache_key(prompt: str, model_name: str, prompt_version: str = '') -> str:
+    """프롬프트 내용 기반 캐시 키"""
+    digest = hashlib.sha256()
+    for part in (model_name, prompt_version, prompt):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """
+    LLM 분석 결과 영구 캐시
+
+    Usage:
+        cache = AnalysisCache("data/cache/ai_analysis.db", ttl_seconds=300, max_entries=5000)
+        key = make_cache_key(prompt, 'gemini-2.5-flash', get_prompt_version('stock_analysis_simple'))
+        result = cache.get(key)
+        if result is None:
+            result = call_llm(prompt)
+            cache.set(key, result, latency=elapsed, model_name='gemini-2.5-flash')
+    """
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_DB_PATH,
+        ttl_seconds: float = DEFAULT_CACHE_TTL,
+        max_entries: int = 5000,
+        cleanup_interval_seconds: float = 60.0
+    ):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (':memory:'면 프로세스 내 임시 DB)
+            ttl_seconds: 기본 TTL (초, 0 이하면 만료 없음)
+            max_entries: 최대 엔트리 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+            cleanup_interval_seconds: set() 시 만료 항목 일괄 정리 주기 (초)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, int(max_entries))
+        self.cleanup_interval_seconds = cleanup_interval_seconds
+
+        self._lock = threading.Lock()
+        self._db = get_database(db_path)
+        self._initialize_database()
+        self._last_cleanup = 0.0
+
+        self._hits = 0
+        self._misses = 0
+        self._sets = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._saved_latency = 0.0
+
+    def _initialize_database(self):
+        self._db.executescript('''
+            CREATE TABLE IF NOT EXISTS analysis_cache (
+                key TEXT PRIMARY KEY,
+                model_name TEXT,
+                stock_code TEXT,
+                result TEXT NOT NULL,
+                latency REAL DEFAULT 0,
+                created_at REAL NOT NULL,
+                expires_at REAL,
+                last_accessed REAL NOT NULL,
+                hit_count INTEGER DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_analysis_cache_accessed ON analysis_cache(last_accessed);
+        ''')
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (없거나 만료되면 None)"""
+        now = time.time()
+        with self._lock:
+            row = self._db.query_one(
+                'SELECT result, latency, expires_at FROM analysis_cache WHERE key = ?', (key,)
+            )
+
+            if row is None:
+                self._misses += 1
+                return None
+
+            result, latency, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._db.write('DELETE FROM analysis_cache WHERE key = ?', (key,))
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            # LRU 기록은 조회 경로에서 커밋을 기다리지 않도록 쓰기 스레드에 맡김
+            self._db.write(
+                'UPDATE analysis_cache SET last_accessed = ?, hit_count = hit_count + 1 WHERE key = ?',
+                (now, key)
+            )
+            self._hits += 1
+            self._saved_latency += latency or 0.0
+
+        return json.loads(result)
+
+    def set(
+        self,
+        key: str,
+        result: Dict[str, Any],
+        latency: float = 0.0,
+        model_name: str = '',
+        stock_code: str = '',
+        ttl_seconds: Optional[float] = None
+    ) -> None:
+        """
+        캐시 저장
+
+        Args:
+            key: make_cache_key() 결과
+            result: 분석 결과 (JSON 직렬화 가능)
+            latency: 원래 LLM 호출 소요 시간 (초, 히트 시 절약 시간 통계에 사용)
+            model_name: 모델 이름 (조회/통계용)
+            stock_code: 종목코드 (조회/통계용)
+            ttl_seconds: TTL (None이면 기본값)
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        now = time.time()
+        expires_at = now + ttl if ttl and ttl > 0 else None
+        payload = json.dumps(result, ensure_ascii=False, default=str)
+
+        with self._lock, self._db.transaction() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO analysis_cache '
+                '(key, model_name, stock_code, result, latency, created_at, expires_at, last_accessed, hit_count) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)',
+                (key, model_name, stock_code, payload, latency, now, expires_at, now)
+            )
+            self._sets += 1
+
+            if now - self._last_cleanup >= self.cleanup_interval_seconds:
+                self._purge_expired(conn, now)
+                self._last_cleanup = now
+            self._evict_if_needed(conn)
+
+    def _purge_expired(self, conn: sqlite3.Connection, now: float) -> int:
+        cursor = conn.execute(
+            'DELETE FROM analysis_cache WHERE expires_at IS NOT NULL AND expires_at <= ?', (now,)
+        )
+        self._expirations += cursor.rowcount
+        return cursor.rowcount
+
+    def _evict_if_needed(self, conn: sqlite3.Connection) -> None:
+        count = conn.execute('SELECT COUNT(*) FROM analysis_cache').fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                'DELETE FROM analysis_cache WHERE key IN '
+                '(SELECT key FROM analysis_cache ORDER BY last_accessed ASC LIMIT ?)',
+                (overflow,)
+            )
+            self._evictions += overflow
+
+    def cleanup_expired(self) -> int:
+        """만료 항목 일괄 정리"""
+        with self._lock, self._db.transaction() as conn:
+            return self._purge_expired(conn, time.time())
+
+    def clear(self) -> None:
+        with self._lock, self._db.transaction() as conn:
+            conn.execute('DELETE FROM analysis_cache')
+
+    def __len__(self) -> int:
+        return self._db.query_one('SELECT COUNT(*) FROM analysis_cache')[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """히트/미스, 절약된 LLM 호출 시간 통계"""
+        total = self._hits + self._misses
+        return {
+            'entries': len(self),
+            'hits': self._hits,
+            'misses': self._misses,
+            'sets': self._sets,
+            'evictions': self._evictions,
+            'expirations': self._expirations,
+            'hit_rate': self._hits / total if total > 0 else 0.0,
+            'saved_latency_seconds': round(self._saved_latency, 3),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+_analysis_cache: Optional[AnalysisCache] = None
+_analysis_cache_lock = threading.Lock()
+
+
+def get_analysis_cache() -> AnalysisCache:
+    """프로세스 공용 LLM 분석 캐시"""
+    global _analysis_cache
+    if _analysis_cache is None:
+        with _analysis_cache_lock:
+            if _analysis_cache is None:
+                try:
+                    _analysis_cache = AnalysisCache()
+                except (sqlite3.Error, OSError) as e:
+                    logger.warning(f"AI 분석 캐시 DB 열기 실패, 메모리 캐시 사용: {e}")
+                    _analysis_cache = AnalysisCache(':memory:')
+    return _analysis_cache
+
+
+__all__ = ['AnalysisCache', 'make_cache_key', 'get_analysis_cache']
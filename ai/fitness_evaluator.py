@@ -0,0 +1,440 @@
+"""
+ai/fitness_evaluator.py
+전략 유전자 세대 단위 적합도 평가기
+
+- 평가 데이터셋: 세대마다 (종목, 분봉, 기간)별로 한 번만 로드해
+  종가/지표를 (시각 x 종목) 읽기 전용 배열로 정렬
+- 프로세스 풀: 데이터셋은 워커 초기화 시 한 번만 전달하고, 작업에는 (데이터셋 키, 유전자)만 담는다
+- 메모이제이션: (데이터셋 키, 유전자) → 성과 지표 (엘리트/중복 유전자 재평가 없음)
+- 매수 조건은 유전자별로 전체 구간을 한 번에 벡터 계산하고, 포지션 시뮬레이션만 순차 실행
+"""
+import hashlib
+import json
+import os
+import pickle
+from collections import OrderedDict
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.logger_new import get_logger
+
+logger = get_logger()
+
+# 지표 배열 (시각 x 종목), 봉이 없는 칸은 close가 NaN
+_COLUMNS = ('close', 'rsi', 'macd', 'macd_signal', 'ma5', 'ma20', 'ma60', 'bb_lower', 'bb_upper', 'volume_ratio')
+# 지표가 아직 계산되지 않은 구간의 기본값 (GeneBasedStrategy의 stock_data.get 기본값과 동일)
+_DEFAULTS = {'rsi': 50.0, 'macd': 0.0, 'macd_signal': 0.0, 'ma5': 0.0, 'ma20': 0.0, 'ma60': 0.0,
+             'bb_lower': 0.0, 'bb_upper': 0.0, 'volume_ratio': 1.0}
+
+EMPTY_METRICS = {
+    'total_return_pct': 0.0, 'sharpe_ratio': 0.0, 'win_rate': 0.0,
+    'max_drawdown_pct': 0.0, 'profit_factor': 0.0, 'total_trades': 0
+}
+
+
+@dataclass(frozen=True)
+class EvaluationDataset:
+    """세대 공용 평가 데이터 (읽기 전용)"""
+    key: str
+    codes: Tuple[str, ...]
+    minutes: np.ndarray   # (T,) 장중 분 (HH*60+MM)
+    day_ends: np.ndarray  # (T,) 해당 날짜의 마지막 봉 여부
+    columns: Dict[str, np.ndarray]
+
+    @property
+    def num_bars(self) -> int:
+        return len(self.minutes)
+
+
+def dataset_key(stock_codes: Sequence[str], interval: str, start_date: str, end_date: str) -> str:
+    return f"{','.join(stock_codes)}|{interval}|{start_date}|{end_date}"
+
+
+def build_dataset(historical_data: Dict[str, pd.DataFrame], key: str) -> EvaluationDataset:
+    """
+    종목별 DataFrame → (시각 x 종목) 정렬 배열
+
+    Args:
+        historical_data: {종목코드: datetime/close/volume 컬럼 DataFrame}
+        key: 데이터셋 식별값
+    """
+    from indicators.pipeline import compute_indicators
+
+    frames = {}
+    for code, df in historical_data.items():
+        if df is None or len(df) == 0 or 'datetime' not in df.columns:
+            continue
+        frame = df.dropna(subset=['datetime', 'close']).drop_duplicates('datetime').sort_values('datetime')
+        if len(frame):
+            frames[code] = frame
+
+    codes = tuple(sorted(frames))
+    if not codes:
+        return EvaluationDataset(key, (), np.empty(0, dtype=np.int32), np.empty(0, dtype=bool),
+                                 {name: np.empty((0, 0)) for name in _COLUMNS})
+
+    timeline = np.unique(np.concatenate([
+        frames[code]['datetime'].to_numpy(dtype='datetime64[ns]') for code in codes
+    ]))
+    columns = {name: np.full((len(timeline), len(codes)), np.nan) for name in _COLUMNS}
+
+    for j, code in enumerate(codes):
+        frame = frames[code]
+        rows = np.searchsorted(timeline, frame['datetime'].to_numpy(dtype='datetime64[ns]'))
+        close = frame['close'].to_numpy(dtype=np.float64)
+        volume = frame['volume'].to_numpy(dtype=np.float64) if 'volume' in frame else np.ones(len(frame))
+        indicators = compute_indicators(close, volume=volume, sma_periods=(5, 20, 60), ema_periods=())
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volume_ratio = volume / indicators['volume_sma_20']
+        values = {
+            'close': close,
+            'rsi': indicators['rsi_14'],
+            'macd': indicators['macd'],
+            'macd_signal': indicators['macd_signal'],
+            'ma5': indicators['sma_5'],
+            'ma20': indicators['sma_20'],
+            'ma60': indicators['sma_60'],
+            'bb_lower': indicators['bb_lower'],
+            'bb_upper': indicators['bb_upper'],
+            'volume_ratio': volume_ratio,
+        }
+        for name, array in values.items():
+            if name in _DEFAULTS:
+                array = np.where(np.isfinite(array), array, _DEFAULTS[name])
+            columns[name][rows, j] = array
+
+    for array in columns.values():
+        array.setflags(write=False)
+
+    stamps = pd.DatetimeIndex(timeline)
+    minutes = (stamps.hour * 60 + stamps.minute).to_numpy(dtype=np.int32)
+    days = stamps.normalize().to_numpy()
+    day_ends = np.append(days[1:] != days[:-1], True)
+    minutes.setflags(write=False)
+    day_ends.setflags(write=False)
+    return EvaluationDataset(key, codes, minutes, day_ends, columns)
+
+
+def _to_minutes(hhmm: str) -> int:
+    hour, minute = hhmm.split(':')[:2]
+    return int(hour) * 60 + int(minute)
+
+
+def buy_mask(gene: Dict[str, Any], dataset: EvaluationDataset) -> np.ndarray:
+    """
+    GeneBasedStrategy.should_buy 조건을 전체 구간에 벡터 적용 (보유 종목 수 제한 제외)
+
+    과거 분봉에는 호가 데이터가 없으므로 매수우위(bid_ask_ratio) 조건은 평가하지 않는다.
+    """
+    c = dataset.columns
+    close = c['close']
+    with np.errstate(invalid='ignore'):
+        mask = np.isfinite(close)
+        mask &= (c['rsi'] >= gene['buy_rsi_min']) & (c['rsi'] <= gene['buy_rsi_max'])
+
+        if gene['use_macd'] and gene['buy_macd_signal_cross']:
+            mask &= (c['macd'] > c['macd_signal']) & (c['macd'] > gene['macd_threshold'])
+
+        if gene['use_ma']:
+            ma5, ma20, ma60 = c['ma5'], c['ma20'], c['ma60']
+            if gene['buy_ma_5_above_20']:
+                mask &= ~((ma5 > 0) & (ma20 > 0) & (ma5 <= ma20))
+            if gene['buy_ma_20_above_60']:
+                mask &= ~((ma20 > 0) & (ma60 > 0) & (ma20 <= ma60))
+            if gene['buy_price_above_ma5']:
+                mask &= ~((ma5 > 0) & (close <= ma5))
+
+        if gene['use_bollinger']:
+            lower = c['bb_lower']
+            safe_lower = np.where(lower > 0, lower, 1.0)
+            mask &= ~((lower > 0) & (np.abs(close - lower) / safe_lower > gene['buy_near_lower_band']))
+
+        mask &= (c['volume_ratio'] >= gene['buy_volume_ratio_min']) & (c['volume_ratio'] <= gene['buy_volume_ratio_max'])
+        mask &= (close >= gene['min_price']) & (close <= gene['max_price'])
+
+    minutes = dataset.minutes
+    in_time = (minutes >= _to_minutes(gene['trade_time_start'])) & (minutes <= _to_minutes(gene['trade_time_end']))
+    if gene['avoid_first_30min']:
+        in_time &= minutes >= 10 * 60
+    if gene['avoid_last_30min']:
+        in_time &= minutes <= 14 * 60 + 30
+    return mask & in_time[:, None]
+
+
+def simulate_gene(gene: Dict[str, Any], dataset: EvaluationDataset, initial_cash: float = 10000000) -> Dict[str, Any]:
+    """
+    유전자 하나의 백테스트 성과 지표 (StrategyBacktester와 같은 지표 정의)
+
+    시각마다 매수 후보 → 보유 종목 매도 조건(GeneBasedStrategy.should_sell) 순으로 처리한다.
+    매도 조건은 매수한 다음 봉부터 확인한다.
+    """
+    from ai.strategy_backtester import BacktestResult
+
+    if dataset.num_bars == 0:
+        return dict(EMPTY_METRICS)
+
+    c = dataset.columns
+    close, rsi, bb_upper = c['close'], c['rsi'], c['bb_upper']
+    candidates = buy_mask(gene, dataset)
+    has_candidate = candidates.any(axis=1)
+
+    position_size = gene['position_size_pct']
+    max_positions = gene['max_positions']
+    take_profit, stop_loss = gene['sell_take_profit'], gene['sell_stop_loss']
+    trailing = gene['sell_trailing_stop']
+    sell_rsi_min, sell_rsi_max = gene['sell_rsi_min'], gene['sell_rsi_max']
+    use_bollinger, near_upper = gene['use_bollinger'], gene['sell_near_upper_band']
+
+    cash = float(initial_cash)
+    positions: Dict[int, List[float]] = {}  # 종목 열 → [수량, 매수가, 최고가, 매수 시각]
+    last_price = np.full(len(dataset.codes), np.nan)
+    profits: List[float] = []
+    daily_values: List[float] = []
+
+    for t in range(dataset.num_bars):
+        row = close[t]
+        if has_candidate[t]:
+            for j in np.flatnonzero(candidates[t]):
+                if j in positions or len(positions) >= max_positions:
+                    continue
+                price = row[j]
+                quantity = int(cash * position_size / price)
+                if quantity > 0 and cash >= price * quantity:
+                    cash -= price * quantity
+                    positions[j] = [quantity, price, price, t]
+
+        for j in list(positions):
+            price = row[j]
+            quantity, buy_price, max_price, bought_at = positions[j]
+            if bought_at == t or price != price:  # 방금 매수 / NaN: 이 시각에 봉 없음
+                continue
+            max_price = max(max_price, price)
+            positions[j][2] = max_price
+            profit_pct = (price - buy_price) / buy_price
+            upper = bb_upper[t, j]
+
+            if (profit_pct >= take_profit or profit_pct <= stop_loss
+                    or (price - max_price) / max_price <= -trailing
+                    or sell_rsi_min <= rsi[t, j] <= sell_rsi_max
+                    or (use_bollinger and upper > 0 and abs(price - upper) / upper <= near_upper)):
+                cash += price * quantity
+                profits.append((price - buy_price) * quantity)
+                del positions[j]
+
+        valid = ~np.isnan(row)
+        last_price[valid] = row[valid]
+        if dataset.day_ends[t]:
+            daily_values.append(cash + sum(q * last_price[j] for j, (q, _, _, _) in positions.items()))
+
+    final_cash = cash + sum(q * last_price[j] for j, (q, _, _, _) in positions.items())
+
+    wins = sum(1 for p in profits if p > 0)
+    result = BacktestResult(
+        strategy_name='gene', initial_cash=initial_cash, final_cash=final_cash,
+        total_return=final_cash - initial_cash,
+        total_return_pct=(final_cash - initial_cash) / initial_cash * 100,
+        total_trades=len(profits), winning_trades=wins, losing_trades=len(profits) - wins,
+        win_rate=wins / len(profits) * 100 if profits else 0.0,
+        max_drawdown=0.0, max_drawdown_pct=0.0, sharpe_ratio=0.0, sortino_ratio=0.0,
+        daily_cash=daily_values,
+        daily_returns=[
+            (daily_values[i] - daily_values[i - 1]) / daily_values[i - 1] * 100 if daily_values[i - 1] > 0 else 0
+            for i in range(1, len(daily_values))
+        ],
+        trades=[{'profit': p} for p in profits],
+    )
+    result.calculate_metrics()
+
+    return {
+        'total_return_pct': float(result.total_return_pct),
+        'sharpe_ratio': float(result.sharpe_ratio),
+        'win_rate': float(result.win_rate),
+        'max_drawdown_pct': float(result.max_drawdown_pct),
+        'profit_factor': float(result.profit_factor),
+        'total_trades': int(result.total_trades)
+    }
+
+
+# 워커 프로세스 전역 상태 (풀 초기화 시 1회 설정)
+_worker_datasets: Dict[str, EvaluationDataset] = {}
+_worker_initial_cash: float = 10000000
+
+
+def _init_worker(datasets: Dict[str, EvaluationDataset], initial_cash: float):
+    """워커 초기화: 세대 데이터셋 설정"""
+    global _worker_datasets, _worker_initial_cash
+    _worker_datasets = datasets
+    _worker_initial_cash = initial_cash
+
+
+def _evaluate_task(key: str, gene: Dict[str, Any]) -> Dict[str, Any]:
+    """워커 작업: 데이터셋 key에서 유전자 평가"""
+    return simulate_gene(gene, _worker_datasets[key], _worker_initial_cash)
+
+
+def gene_signature(gene: Dict[str, Any]) -> str:
+    """유전자 메모이제이션 키"""
+    raw = json.dumps(gene, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:24]
+
+
+class PopulationFitnessEvaluator:
+    """
+    세대 단위 적합도 평가기
+
+    Usage:
+        evaluator = PopulationFitnessEvaluator(backtester._fetch_historical_data, engine._calculate_fitness)
+        results = evaluator.evaluate([gene.to_dict() for gene in population], ['005930', '000660'])
+        # [(fitness, metrics), ...] (population 순서)
+    """
+
+    def __init__(
+        self,
+        data_source: Callable[[List[str], str, str, str], Dict[str, pd.DataFrame]],
+        fitness_fn: Callable[..., float],
+        max_workers: Optional[int] = None,
+        lookback_days: int = 90,
+        initial_cash: float = 10000000,
+        memo_size: int = 10000
+    ):
+        """
+        Args:
+            data_source: (종목 리스트, 시작일, 종료일, 분봉) → {종목: DataFrame}
+            fitness_fn: 성과 지표 → 적합도 (total_return_pct, sharpe_ratio, win_rate, max_drawdown_pct, profit_factor)
+            max_workers: 워커 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 실행)
+            lookback_days: 평가 기간 (종료일 기준 과거 일수)
+            initial_cash: 초기 자본
+            memo_size: 메모이제이션 최대 항목 수
+        """
+        self.data_source = data_source
+        self.fitness_fn = fitness_fn
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.lookback_days = lookback_days
+        self.initial_cash = initial_cash
+        self.memo_size = memo_size
+
+        self._datasets: Dict[str, EvaluationDataset] = {}
+        self._memo: 'OrderedDict[Tuple[str, str], Dict[str, Any]]' = OrderedDict()
+        self.last_stats: Dict[str, Any] = {}
+
+    def evaluate(
+        self,
+        genes: Sequence[Dict[str, Any]],
+        stock_codes: Sequence[str],
+        end: Optional[datetime] = None
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        세대 전체 평가
+
+        Args:
+            genes: 유전자 dict 리스트 (StrategyGene.to_dict())
+            stock_codes: 평가 종목
+            end: 평가 종료 시각 (None이면 현재)
+
+        Returns:
+            [(fitness, metrics)] (genes 순서)
+        """
+        end = end or datetime.now()
+        start_date = (end - timedelta(days=self.lookback_days)).strftime('%Y%m%d')
+        end_date = end.strftime('%Y%m%d')
+        codes = list(stock_codes)
+
+        # 세대 데이터셋: 분봉 간격별로 한 번만 로드 (기간이 바뀌면 이전 데이터셋 폐기)
+        keys = {}
+        for gene in genes:
+            interval = str(gene.get('timeframe', '5'))
+            keys.setdefault(interval, dataset_key(codes, interval, start_date, end_date))
+        self._datasets = {key: ds for key, ds in self._datasets.items() if key in keys.values()}
+        loaded = 0
+        for interval, key in keys.items():
+            if key not in self._datasets:
+                historical_data = self.data_source(codes, start_date, end_date, interval) or {}
+                self._datasets[key] = build_dataset(historical_data, key)
+                loaded += 1
+
+        # 메모에 없는 (데이터셋, 유전자)만 평가 (중복 유전자는 한 번)
+        task_keys = [(keys[str(gene.get('timeframe', '5'))], gene_signature(gene)) for gene in genes]
+        pending: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for task_key, gene in zip(task_keys, genes):
+            if task_key in self._memo:
+                self._memo.move_to_end(task_key)
+            else:
+                pending.setdefault(task_key, gene)
+
+        if pending:
+            for task_key, metrics in zip(pending, self._run(pending)):
+                self._memo[task_key] = metrics
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+
+        self.last_stats = {
+            'population': len(genes),
+            'evaluated': len(pending),
+            'memo_hits': len(genes) - len(pending),
+            'datasets_loaded': loaded,
+            'bars': {key: ds.num_bars for key, ds in self._datasets.items()},
+        }
+
+        results = []
+        for task_key in task_keys:
+            metrics = dict(self._memo[task_key])
+            fitness = self.fitness_fn(
+                metrics['total_return_pct'], metrics['sharpe_ratio'], metrics['win_rate'],
+                metrics['max_drawdown_pct'], metrics['profit_factor']
+            )
+            results.append((fitness, metrics))
+        return results
+
+    def clear(self):
+        """데이터셋/메모 초기화"""
+        self._datasets.clear()
+        self._memo.clear()
+
+    def _run(self, pending: Dict[Tuple[str, str], Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """대기 작업 실행 (병렬/직렬), pending 순서의 지표 리스트"""
+        tasks = [(key, gene) for (key, _), gene in pending.items()]
+
+        if self.max_workers > 1 and len(tasks) > 1:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=min(self.max_workers, len(tasks)),
+                    initializer=_init_worker,
+                    initargs=(self._datasets, self.initial_cash)
+                ) as pool:
+                    futures = [pool.submit(_evaluate_task, key, gene) for key, gene in tasks]
+                    results = []
+                    for i, future in enumerate(futures):
+                        try:
+                            results.append(future.result())
+                        except BrokenExecutor:
+                            raise
+                        except Exception as e:
+                            logger.error(f"전략 {i} 평가 실패: {e}")
+                            results.append(dict(EMPTY_METRICS))
+                    return results
+            except (BrokenExecutor, OSError, pickle.PicklingError) as e:
+                logger.warning(f"프로세스 풀 평가 실패 - 현재 프로세스에서 평가: {e}")
+
+        results = []
+        for i, (key, gene) in enumerate(tasks):
+            try:
+                results.append(simulate_gene(gene, self._datasets[key], self.initial_cash))
+            except Exception as e:
+                logger.error(f"전략 {i} 평가 실패: {e}")
+                results.append(dict(EMPTY_METRICS))
+        return results
+
+
+__all__ = [
+    'PopulationFitnessEvaluator',
+    'EvaluationDataset',
+    'build_dataset',
+    'simulate_gene',
+    'buy_mask',
+]
@@ -4,9 +4,11 @@ Google Gemini AI 분석기
 """
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Dict, Any, Optional
+from .analysis_cache import AnalysisCache, get_analysis_cache, make_cache_key
 from .base_analyzer import BaseAnalyzer
-from utils.prompt_loader import load_prompt
+from utils.prompt_loader import load_prompt, get_prompt_version
 from config.constants import AI_MODELS, DEFAULT_CACHE_TTL
 
 logger = logging.getLogger(__name__)
@@ -19,7 +21,13 @@ class GeminiAnalyzer(BaseAnalyzer):
     Gemini API를 사용한 종목/시장 분석
     """
 
-    def __init__(self, api_key: str = None, model_name: str = None, enable_cross_check: bool = False):
+    def __init__(
+        self,
+        api_key: str = None,
+        model_name: str = None,
+        enable_cross_check: bool = False,
+        analysis_cache: Optional[AnalysisCache] = None
+    ):
         """
         Gemini 분석기 초기화
 
@@ -27,6 +35,7 @@ class GeminiAnalyzer(BaseAnalyzer):
             api_key: Gemini API 키
             model_name: 모델 이름 (기본: gemini-2.5-flash)
             enable_cross_check: 크로스 체크 활성화 (2.0 vs 2.5 비교)
+            analysis_cache: 분석 결과 캐시 (기본: 프로세스 공용 영구 캐시)
         """
         super().__init__("GeminiAnalyzer")
 
@@ -48,8 +57,12 @@ class GeminiAnalyzer(BaseAnalyzer):
         self.model_2_0 = None
         self.model_2_5 = None
 
-        # AI 분석 TTL 캐시
-        self._analysis_cache = {}
+        # generate_content 요청 타임아웃 (초, 호출 마감 시간이 더 이르면 그에 맞춤)
+        self.request_timeout = 60.0
+
+        # AI 분석 캐시 (프롬프트 내용 기반, 재시작 후에도 유지)
+        self.stock_prompt_name = 'stock_analysis_simple'
+        self.analysis_cache = analysis_cache if analysis_cache is not None else get_analysis_cache()
         self._cache_ttl = DEFAULT_CACHE_TTL
 
         cross_check_status = "크로스체크 활성화" if enable_cross_check else "단일 모델"
@@ -104,7 +117,8 @@ class GeminiAnalyzer(BaseAnalyzer):
         stock_data: Dict[str, Any],
         analysis_type: str = 'comprehensive',
         score_info: Dict[str, Any] = None,
-        portfolio_info: str = None
+        portfolio_info: str = None,
+        deadline: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         종목 분석
@@ -114,6 +128,7 @@ class GeminiAnalyzer(BaseAnalyzer):
             analysis_type: 분석 유형
             score_info: 점수 정보 (score, percentage, breakdown)
             portfolio_info: 현재 포트폴리오 정보
+            deadline: 분석 마감 시각 (time.monotonic 기준, 이후에는 재시도하지 않음)
 
         Returns:
             분석 결과
@@ -127,54 +142,44 @@ class GeminiAnalyzer(BaseAnalyzer):
             return self._get_error_result(msg)
 
         stock_code = stock_data.get('stock_code', '')
-        score = score_info.get('score', 0) if score_info else 0
-        cache_key = f"{stock_code}_{int(score)}"
+        cross_check = bool(self.enable_cross_check and self.model_2_0 and self.model_2_5)
 
-        if self.enable_cross_check:
-            cache_key += "_crosscheck"
+        try:
+            prompt = self._prepare_stock_prompt(stock_data, score_info, portfolio_info)
+        except Exception as e:
+            logger.error(f"프롬프트 생성 실패: {stock_code} - {e}")
+            return self._get_error_result(f"프롬프트 생성 실패: {e}")
 
-        if cache_key in self._analysis_cache:
-            cached_entry = self._analysis_cache[cache_key]
-            cached_time = cached_entry['timestamp']
-            cached_result = cached_entry['result']
+        # 프롬프트 내용 + 모델 + 템플릿 버전 기준 캐시
+        cache_model = f"{AI_MODELS['secondary']}+{AI_MODELS['primary']}" if cross_check else self.model_name
+        cache_key = make_cache_key(prompt, cache_model, get_prompt_version(self.stock_prompt_name))
 
-            if (time.time() - cached_time) < self._cache_ttl:
-                logger.info(f"AI 분석 캐시 히트: {stock_code} (캐시 유효시간: {int(self._cache_ttl - (time.time() - cached_time))}초)")
-                return cached_result
-            else:
-                del self._analysis_cache[cache_key]
-                logger.info(f"AI 분석 캐시 만료: {stock_code}")
+        cached_result = self.analysis_cache.get(cache_key)
+        if cached_result is not None:
+            logger.info(f"AI 분석 캐시 히트: {stock_code} ({cache_model})")
+            return cached_result
 
         start_time = time.time()
 
         # 크로스 체크 모드
-        if self.enable_cross_check and self.model_2_0 and self.model_2_5:
+        if cross_check:
             logger.info(f"🔀 크로스체크 분석 시작: {stock_code}")
 
-            prompt = self._prepare_stock_prompt(stock_data, score_info, portfolio_info)
-
-            result_2_0 = self._analyze_with_single_model(
-                self.model_2_0,
-                AI_MODELS['secondary'],
+            result_2_0, result_2_5 = self._analyze_models_parallel(
+                [(self.model_2_0, AI_MODELS['secondary']), (self.model_2_5, AI_MODELS['primary'])],
                 prompt,
-                stock_data
-            )
-
-            result_2_5 = self._analyze_with_single_model(
-                self.model_2_5,
-                AI_MODELS['primary'],
-                prompt,
-                stock_data
+                stock_data,
+                self._request_timeout(deadline)
             )
 
             result = self._cross_check_results(result_2_0, result_2_5)
 
-            self._analysis_cache[cache_key] = {
-                'timestamp': time.time(),
-                'result': result
-            }
-
             elapsed_time = time.time() - start_time
+            if result_2_0 and result_2_5:   # 한쪽 모델만 응답한 결과는 캐시하지 않음
+                self.analysis_cache.set(
+                    cache_key, result, latency=elapsed_time,
+                    model_name=cache_model, stock_code=stock_code, ttl_seconds=self._cache_ttl
+                )
             self.update_statistics(True, elapsed_time)
 
             if 'cross_check' in result:
@@ -197,11 +202,9 @@ class GeminiAnalyzer(BaseAnalyzer):
 
         for attempt in range(max_retries):
             try:
-                prompt = self._prepare_stock_prompt(stock_data, score_info, portfolio_info)
-
                 response = self.model.generate_content(
                     prompt,
-                    request_options={'timeout': 60}
+                    request_options={'timeout': self._request_timeout(deadline)}
                 )
 
                 if not response.candidates:
@@ -227,13 +230,13 @@ class GeminiAnalyzer(BaseAnalyzer):
 
                 result = self._parse_stock_analysis_response(response_text, stock_data)
 
-                self._analysis_cache[cache_key] = {
-                    'timestamp': time.time(),
-                    'result': result
-                }
+                elapsed_time = time.time() - start_time
+                self.analysis_cache.set(
+                    cache_key, result, latency=elapsed_time,
+                    model_name=cache_model, stock_code=stock_code, ttl_seconds=self._cache_ttl
+                )
                 logger.info(f"AI 분석 결과 캐시 저장: {stock_code} (TTL: {self._cache_ttl}초)")
 
-                elapsed_time = time.time() - start_time
                 self.update_statistics(True, elapsed_time)
 
                 logger.info(
@@ -253,6 +256,11 @@ class GeminiAnalyzer(BaseAnalyzer):
                 logger.warning(f"❌ 예외 메시지: {error_msg}")
                 logger.warning(f"❌ Traceback:\n{traceback.format_exc()}")
 
+                if deadline is not None and time.monotonic() + retry_delay >= deadline:
+                    logger.warning(f"AI 분석 마감 시간 도달, 재시도 중단: {error_msg}")
+                    self.update_statistics(False)
+                    return self._get_error_result(f"AI 분석 시간 초과: {error_msg}")
+
                 if attempt < max_retries - 1:
                     logger.warning(
                         f"AI 분석 실패 (시도 {attempt+1}/{max_retries}), "
@@ -340,7 +348,7 @@ class GeminiAnalyzer(BaseAnalyzer):
         portfolio_info: str = None
     ) -> str:
         """종목 분석 프롬프트 준비"""
-        prompt_template = load_prompt('stock_analysis_simple')
+        prompt_template = load_prompt(self.stock_prompt_name)
 
         # 기술적 지표 포맷팅
         technical_indicators = "기술적 지표 정보 없음"
@@ -802,14 +810,60 @@ class GeminiAnalyzer(BaseAnalyzer):
             'risks': [],
         }
 
+    def _request_timeout(self, deadline: Optional[float] = None) -> float:
+        """요청 타임아웃 (마감 시각까지 남은 시간으로 제한, 최소 1초)"""
+        if deadline is None:
+            return self.request_timeout
+        return max(1.0, min(self.request_timeout, deadline - time.monotonic()))
+
     # ==================== 크로스 체크 ====================
 
+    def _analyze_models_parallel(
+        self,
+        models: list,
+        prompt: str,
+        stock_data: Dict[str, Any],
+        timeout: float
+    ) -> list:
+        """
+        여러 모델 동시 분석 (timeout 안에 끝나지 않은 모델은 None)
+
+        Args:
+            models: [(모델 인스턴스, 모델 이름), ...]
+            prompt: 분석 프롬프트
+            stock_data: 종목 데이터
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            models 순서의 분석 결과 리스트
+        """
+        pool = ThreadPoolExecutor(max_workers=len(models), thread_name_prefix='gemini-crosscheck')
+        try:
+            futures = [
+                pool.submit(self._analyze_with_single_model, model, model_name, prompt, stock_data, timeout)
+                for model, model_name in models
+            ]
+            done, _ = wait(futures, timeout=timeout)
+        finally:
+            # 늦은 응답은 기다리지 않음
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        results = []
+        for future, (_, model_name) in zip(futures, models):
+            if future in done:
+                results.append(future.result())
+            else:
+                logger.warning(f"[{model_name}] 응답 시간 초과 ({timeout:.0f}초), 결과 제외")
+                results.append(None)
+        return results
+
     def _analyze_with_single_model(
         self,
         model,
         model_name: str,
         prompt: str,
-        stock_data: Dict[str, Any]
+        stock_data: Dict[str, Any],
+        timeout: Optional[float] = None
     ) -> Optional[Dict[str, Any]]:
         """
         단일 모델로 분석 수행
@@ -819,6 +873,7 @@ class GeminiAnalyzer(BaseAnalyzer):
             model_name: 모델 이름 (로깅용)
             prompt: 분석 프롬프트
             stock_data: 종목 데이터
+            timeout: 요청 타임아웃 (초, 기본 request_timeout)
 
         Returns:
             분석 결과 또는 None (실패시)
@@ -828,7 +883,7 @@ class GeminiAnalyzer(BaseAnalyzer):
 
             response = model.generate_content(
                 prompt,
-                request_options={'timeout': 60}
+                request_options={'timeout': timeout or self.request_timeout}
             )
 
             if not response.candidates:
@@ -0,0 +1,185 @@
+"""
+ai/review_executor.py
+AI 검토 동시 실행기
+
+스캔 사이클의 상위 후보 AI 분석을 제한된 동시 실행 수로 한꺼번에 실행한다.
+사이클 마감 시간(deadline) 안에 끝나지 않은 분석은 기다리지 않고
+점수 기준 판단(signal='hold')으로 대체하므로, 느린 LLM 응답 하나가
+매매 사이클 전체를 멈추지 않는다.
+"""
+import asyncio
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from utils.logger_new import get_logger
+
+logger = get_logger()
+
+
+@dataclass
+class ReviewRequest:
+    """AI 검토 요청 (후보 1종목)"""
+    key: str                                  # 결과 키 (보통 종목코드)
+    stock_data: Dict[str, Any]
+    score_info: Optional[Dict[str, Any]] = None
+    portfolio_info: Optional[str] = None
+
+
+@dataclass
+class ReviewOutcome:
+    """AI 검토 결과"""
+    key: str
+    analysis: Dict[str, Any] = field(default_factory=dict)
+    status: str = 'ok'                        # 'ok' | 'timeout' | 'error'
+    elapsed: float = 0.0
+
+    @property
+    def is_fallback(self) -> bool:
+        """점수 기준 판단으로 대체되었는지"""
+        return self.status != 'ok'
+
+
+def score_only_analysis(reason: str) -> Dict[str, Any]:
+    """AI 결과 없이 점수만으로 판단할 때의 분석 결과 (hold → 점수 임계값으로 결정)"""
+    return {
+        'signal': 'hold',
+        'confidence': 'Low',
+        'reasons': [reason],
+        'risks': [],
+        'fallback': True,
+    }
+
+
+class AIReviewExecutor:
+    """
+    AI 검토 동시 실행기
+
+    Usage:
+        executor = AIReviewExecutor(analyzer, max_concurrency=3, deadline=45.0)
+        outcomes = executor.review([
+            ReviewRequest('005930', stock_data, score_info, portfolio_info),
+        ])
+        outcomes['005930'].analysis['signal']
+    """
+
+    def __init__(self, analyzer, max_concurrency: int = 3, deadline: float = 45.0):
+        """
+        Args:
+            analyzer: analyze_stock(stock_data, score_info=, portfolio_info=)을 가진 분석기
+                      (동기 함수 또는 코루틴 함수)
+            max_concurrency: 동시에 실행할 분석 수
+            deadline: 사이클당 AI 검토 마감 시간 (초)
+        """
+        self.analyzer = analyzer
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.deadline = float(deadline)
+
+        # 분석기가 deadline 인자를 받으면 남은 시간 안에서만 재시도하도록 전달
+        try:
+            params = inspect.signature(analyzer.analyze_stock).parameters
+            self._accepts_deadline = 'deadline' in params
+        except (TypeError, ValueError):
+            self._accepts_deadline = False
+
+        # 마지막 실행 통계
+        self.last_stats: Dict[str, Any] = {}
+
+    def _analyze(self, request: ReviewRequest, deadline_at: float) -> Dict[str, Any]:
+        """분석기 호출 (코루틴이면 워커 스레드에서 이벤트 루프 실행)"""
+        kwargs = {'score_info': request.score_info, 'portfolio_info': request.portfolio_info}
+        if self._accepts_deadline:
+            kwargs['deadline'] = deadline_at
+
+        result = self.analyzer.analyze_stock(request.stock_data, **kwargs)
+        if inspect.isawaitable(result):
+            result = asyncio.run(asyncio.wait_for(result, max(0.0, deadline_at - time.monotonic())))
+        return result
+
+    def _timed(self, request: ReviewRequest, deadline_at: float):
+        started = time.monotonic()
+        return self._analyze(request, deadline_at), time.monotonic() - started
+
+    def review(
+        self,
+        requests: List[ReviewRequest],
+        deadline: Optional[float] = None
+    ) -> Dict[str, ReviewOutcome]:
+        """
+        후보 전체 AI 분석을 동시에 실행
+
+        Args:
+            requests: 검토 요청 리스트
+            deadline: 이번 사이클 마감 시간 (초, None이면 기본값)
+
+        Returns:
+            {key: ReviewOutcome} (요청 순서, 마감 초과/실패는 점수 기준 판단)
+        """
+        if not requests:
+            return {}
+
+        budget = self.deadline if deadline is None else float(deadline)
+        started = time.monotonic()
+        deadline_at = started + budget
+
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(requests)),
+            thread_name_prefix='ai-review'
+        )
+        try:
+            futures = {
+                pool.submit(self._timed, request, deadline_at): request
+                for request in requests
+            }
+            done, not_done = wait(futures, timeout=budget)
+        finally:
+            # 시작 전 작업은 취소, 실행 중인 작업은 기다리지 않음 (결과 폐기)
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        outcomes: Dict[str, ReviewOutcome] = {}
+        for future, request in futures.items():
+            if future in not_done:
+                future.cancel()
+                logger.warning(f"AI 검토 마감 초과 ({budget:.0f}초): {request.key} → 점수 기준 판단")
+                outcomes[request.key] = ReviewOutcome(
+                    key=request.key,
+                    analysis=score_only_analysis('AI 검토 시간 초과 - 점수 기준 판단'),
+                    status='timeout',
+                    elapsed=time.monotonic() - started
+                )
+                continue
+
+            try:
+                analysis, elapsed = future.result()
+                if not isinstance(analysis, dict):
+                    raise TypeError(f"분석 결과 형식 오류: {type(analysis).__name__}")
+                outcomes[request.key] = ReviewOutcome(request.key, analysis, 'ok', elapsed)
+            except Exception as e:
+                logger.warning(f"AI 검토 실패: {request.key} - {e} → 점수 기준 판단")
+                outcomes[request.key] = ReviewOutcome(
+                    key=request.key,
+                    analysis=score_only_analysis('AI 분석 실패 - 점수 기준 판단'),
+                    status='error',
+                    elapsed=time.monotonic() - started
+                )
+
+        statuses = [o.status for o in outcomes.values()]
+        self.last_stats = {
+            'requests': len(requests),
+            'completed': statuses.count('ok'),
+            'timed_out': statuses.count('timeout'),
+            'failed': statuses.count('error'),
+            'elapsed': time.monotonic() - started,
+            'deadline': budget,
+        }
+        logger.info(
+            f"AI 검토 완료: {self.last_stats['completed']}/{len(requests)} "
+            f"(마감 초과 {self.last_stats['timed_out']}, 실패 {self.last_stats['failed']}, "
+            f"{self.last_stats['elapsed']:.1f}초)"
+        )
+        return outcomes
+
+
+__all__ = ['AIReviewExecutor', 'ReviewRequest', 'ReviewOutcome', 'score_only_analysis']
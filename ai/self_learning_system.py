@@ -10,9 +10,10 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
-import json
 from pathlib import Path
 
+from utils.journal_store import JournalStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -83,6 +84,7 @@ class SelfLearningSystem:
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._store = JournalStore(self.db_path)
 
         # 하이퍼파라미터
         self.learning_rate = learning_rate
@@ -158,21 +160,21 @@ class SelfLearningSystem:
         # 메모리에 저장
         self.memory.append(experience)
 
-        # 통계 업데이트
-        self._update_stats(experience)
+        with self._store.batch():
+            # 통계 업데이트
+            self._update_stats(experience)
 
-        # Q-Learning 업데이트
-        q_value = self._update_q_table(experience)
+            # Q-Learning 업데이트
+            q_value = self._update_q_table(experience)
 
-        # 패턴 학습
-        self._learn_pattern(experience)
+            # 패턴 학습
+            self._learn_pattern(experience)
 
-        # 주기적 저장 (100개마다)
-        if len(self.memory) % 100 == 0:
-            self._save_data()
+            # Epsilon 감소 (탐험 → 활용)
+            self.epsilon = max(self.epsilon_min, self.epsilon * self.epsilon_decay)
 
-        # Epsilon 감소 (탐험 → 활용)
-        self.epsilon = max(self.epsilon_min, self.epsilon * self.epsilon_decay)
+            # 변경분만 저널에 기록 (거래 1건 = 저널 1줄)
+            self._save_data(experience)
 
         logger.info(
             f"📚 Learned from trade {trade_id}: "
@@ -313,14 +315,16 @@ class SelfLearningSystem:
 
         total_error = 0.0
 
-        for experience in batch:
-            # Q-Learning 업데이트
-            error = self._update_q_table(experience)
-            total_error += abs(error)
+        with self._store.batch():
+            for experience in batch:
+                # Q-Learning 업데이트
+                error = self._update_q_table(experience)
+                total_error += abs(error)
 
-        avg_error = total_error / batch_size
+            self.stats.learning_episodes += 1
+            self._store.set('stats', asdict(self.stats))
 
-        self.stats.learning_episodes += 1
+        avg_error = total_error / batch_size
 
         logger.info(f"📖 Batch learning completed: {batch_size} experiences, Avg error: {avg_error:.4f}")
 
@@ -390,6 +394,9 @@ class SelfLearningSystem:
         # 방문 횟수 증가
         self.visit_counts[state_key][action_key] += 1
 
+        self._store.set(('q_table', state_key, action_key), new_q)
+        self._store.set(('visit_counts', state_key, action_key), self.visit_counts[state_key][action_key])
+
         return td_error
 
     def _learn_pattern(self, experience: TradeExperience):
@@ -494,27 +501,16 @@ class SelfLearningSystem:
         # 최근 보상 추적
         self.recent_rewards.append(experience.reward)
 
-    def _save_data(self):
-        """학습 데이터 저장"""
+    def _save_data(self, experience: TradeExperience):
+        """학습 데이터 저장 (거래 1건의 변경분; Q-테이블 셀은 _update_q_table에서 기록)"""
         try:
-            data = {
-                'stats': asdict(self.stats),
-                'q_table': {
-                    state: dict(actions)
-                    for state, actions in self.q_table.items()
-                },
-                'visit_counts': {
-                    state: dict(actions)
-                    for state, actions in self.visit_counts.items()
-                },
-                'successful_patterns': self.successful_patterns[:50],  # 상위 50개만
-                'failed_patterns': self.failed_patterns[:50],
-                'recent_rewards': list(self.recent_rewards),
-                'epsilon': self.epsilon
-            }
-
-            with open(self.db_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            patterns_key = 'successful_patterns' if experience.is_win else 'failed_patterns'
+            patterns = self.successful_patterns if experience.is_win else self.failed_patterns
+
+            self._store.set('stats', asdict(self.stats))
+            self._store.set(patterns_key, patterns[:50])  # 상위 50개만
+            self._store.append('recent_rewards', experience.reward, limit=self.recent_rewards.maxlen)
+            self._store.set('epsilon', self.epsilon)
 
             logger.debug(f"Saved learning data: {len(self.q_table)} states")
 
@@ -522,12 +518,10 @@ class SelfLearningSystem:
             logger.error(f"Failed to save learning data: {e}")
 
     def _load_data(self):
-        """학습 데이터 로드"""
+        """학습 데이터 로드 (스냅샷 + 저널 재생)"""
         try:
-            if self.db_path.exists():
-                with open(self.db_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
+            data = self._store.data
+            if data:
                 # 통계 복원
                 stats_data = data.get('stats', {})
                 if stats_data:
@@ -544,8 +538,8 @@ class SelfLearningSystem:
                     self.visit_counts[state] = defaultdict(int, actions)
 
                 # 패턴 복원
-                self.successful_patterns = data.get('successful_patterns', [])
-                self.failed_patterns = data.get('failed_patterns', [])
+                self.successful_patterns = [dict(p) for p in data.get('successful_patterns', [])]
+                self.failed_patterns = [dict(p) for p in data.get('failed_patterns', [])]
 
                 # 최근 보상 복원
                 recent = data.get('recent_rewards', [])
@@ -3,7 +3,6 @@
 
 최우수 전략을 자동으로 가상매매에 배포하고 성과를 모니터링합니다.
 """
-import sqlite3
 import json
 import time
 from datetime import datetime, timedelta
@@ -11,6 +10,7 @@ from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
 from utils.logger_new import get_logger
+from utils.sqlite_db import get_database
 
 logger = get_logger()
 
@@ -77,11 +77,7 @@ class StrategyAutoDeployer:
             전략 정보 리스트 (genes, fitness_score, metrics 포함)
         """
         try:
-            conn = sqlite3.connect(self.evolution_db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            cursor.execute("""
+            rows = get_database(self.evolution_db_path).query("""
                 SELECT
                     es.id, es.generation, es.genes,
                     fr.fitness_score, fr.total_return_pct, fr.sharpe_ratio,
@@ -94,7 +90,7 @@ class StrategyAutoDeployer:
             """, (top_n,))
 
             strategies = []
-            for row in cursor.fetchall():
+            for row in rows:
                 strategies.append({
                     'id': row['id'],
                     'generation': row['generation'],
@@ -110,7 +106,6 @@ class StrategyAutoDeployer:
                     }
                 })
 
-            conn.close()
             return strategies
 
         except Exception as e:
@@ -326,10 +326,14 @@ class StrategyBacktester:
         """
         과거 데이터 수집
 
+        로컬 OHLCV 저장소(utils.ohlcv_store)에 구간이 있는 종목은 재다운로드하지 않고,
+        API로 받은 데이터는 저장소에 추가해 다음 백테스트에서 재사용한다.
+
         Returns:
             {stock_code: DataFrame}
         """
         from utils.trading_date import get_last_trading_date
+        from utils.ohlcv_store import get_data_loader
 
         # Fix: end_date가 오늘 또는 미래 날짜인 경우 마지막 거래일로 변경
         today = datetime.now().strftime('%Y%m%d')
@@ -341,13 +345,29 @@ class StrategyBacktester:
 
         logger.info(f"Fetching historical data for {len(stock_codes)} stocks...")
 
+        loader = get_data_loader()
         historical_data = {}
 
+        # 로컬 저장소에 구간이 있는 종목은 바로 사용
+        for stock_code in stock_codes:
+            if loader.covers(stock_code, interval, start_date, end_date):
+                df = loader.load_frame(stock_code, interval, start_date, end_date)
+                if len(df) > 0:
+                    historical_data[stock_code] = df
+
+        if historical_data:
+            logger.info(f"💾 로컬 저장소에서 {len(historical_data)}개 종목 로드")
+
+        pending_codes = [code for code in stock_codes if code not in historical_data]
+        if not pending_codes:
+            return historical_data
+
         # Fix: OpenAPI 클라이언트 우선 사용 (장 마감 시간과 무관하게 데이터 조회 가능)
         if self.openapi_client and hasattr(self.openapi_client, 'is_connected') and self.openapi_client.is_connected:
             logger.info("✅ OpenAPI 클라이언트 사용 (장 마감 시간 무관)")
             try:
-                for stock_code in stock_codes:
+                openapi_fetched = 0
+                for stock_code in pending_codes:
                     try:
                         logger.info(f"  {stock_code}: OpenAPI로 분봉 데이터 요청 중...")
 
@@ -441,6 +461,10 @@ class StrategyBacktester:
                                 continue
 
                             df = df.sort_values('datetime')
+                            try:
+                                loader.ingest(stock_code, interval, df, start_date, end_date)
+                            except Exception as e:
+                                logger.warning(f"  {stock_code}: 로컬 저장소 기록 실패 - {e}")
 
                             # 날짜 범위 필터링
                             start_dt = pd.to_datetime(start_date, format='%Y%m%d')
@@ -449,6 +473,7 @@ class StrategyBacktester:
 
                             if len(df) > 0:
                                 historical_data[stock_code] = df
+                                openapi_fetched += 1
                                 logger.info(f"  {stock_code}: {len(df)} bars ({df['datetime'].iloc[0].strftime('%m/%d')} ~ {df['datetime'].iloc[-1].strftime('%m/%d')})")
                             else:
                                 logger.warning(f"  {stock_code}: No data in date range")
@@ -463,8 +488,8 @@ class StrategyBacktester:
                         import traceback
                         logger.debug(traceback.format_exc())
 
-                if historical_data:
-                    logger.info(f"✅ OpenAPI로 {len(historical_data)}개 종목 데이터 수집 완료")
+                if openapi_fetched:
+                    logger.info(f"✅ OpenAPI로 {openapi_fetched}개 종목 데이터 수집 완료")
                     return historical_data
                 else:
                     logger.warning("⚠️ OpenAPI로 데이터를 가져오지 못했습니다. REST API로 시도합니다.")
@@ -503,60 +528,46 @@ class StrategyBacktester:
             # 넉넉하게 10000개 요청 (한투 API 최대값)
             data_count = 10000
 
-            for stock_code in stock_codes:
+            for stock_code in pending_codes:
                 try:
                     # Fix: 더 상세한 로깅 추가
                     logger.info(f"  {stock_code}: 데이터 요청 중 (interval={interval_int}, count={data_count})...")
 
-                    # Fix: base_date 파라미터 추가 (과거 데이터 조회)
-                    # 백테스팅은 과거 데이터를 사용하므로 end_date를 base_date로 설정
-                    data = None
-                    max_retries = 3
-                    for retry in range(max_retries):
-                        try:
-                            data = self.chart_api.get_minute_chart(
-                                stock_code=stock_code,
-                                interval=interval_int,
-                                count=data_count,
-                                base_date=end_date  # Fix: 과거 데이터 조회를 위해 base_date 전달
-                            )
-                            if data:
-                                break
-                            if retry < max_retries - 1:
-                                logger.debug(f"  {stock_code}: 데이터 없음, 재시도 {retry + 1}/{max_retries}")
-                                time.sleep(1)
-                        except Exception as e:
-                            if retry < max_retries - 1:
-                                logger.debug(f"  {stock_code}: API 오류, 재시도 {retry + 1}/{max_retries}: {e}")
-                                time.sleep(1)
-                            else:
-                                raise
-
-                    # Fix: 데이터 응답 타입과 길이 로깅
-                    logger.debug(f"  {stock_code}: 응답 타입={type(data)}, 길이={len(data) if data else 0}")
-
-                    if data and isinstance(data, list) and len(data) > 0:
-                        df = pd.DataFrame(data)
-
-                        df['date'] = pd.to_datetime(df['date'], format='%Y%m%d')
-                        df['time'] = pd.to_datetime(df['time'], format='%H%M%S').dt.time
-                        df['datetime'] = pd.to_datetime(
-                            df['date'].dt.strftime('%Y%m%d') + ' ' + df['time'].astype(str),
-                            format='%Y%m%d %H:%M:%S'
-                        )
-
-                        df = df.sort_values('datetime')
+                    def fetch_with_retry():
+                        # Fix: base_date 파라미터 추가 (과거 데이터 조회)
+                        # 백테스팅은 과거 데이터를 사용하므로 end_date를 base_date로 설정
+                        data = None
+                        max_retries = 3
+                        for retry in range(max_retries):
+                            try:
+                                data = self.chart_api.get_minute_chart(
+                                    stock_code=stock_code,
+                                    interval=interval_int,
+                                    count=data_count,
+                                    base_date=end_date  # Fix: 과거 데이터 조회를 위해 base_date 전달
+                                )
+                                if data:
+                                    break
+                                if retry < max_retries - 1:
+                                    logger.debug(f"  {stock_code}: 데이터 없음, 재시도 {retry + 1}/{max_retries}")
+                                    time.sleep(1)
+                            except Exception as e:
+                                if retry < max_retries - 1:
+                                    logger.debug(f"  {stock_code}: API 오류, 재시도 {retry + 1}/{max_retries}: {e}")
+                                    time.sleep(1)
+                                else:
+                                    raise
 
-                        start_dt = pd.to_datetime(start_date, format='%Y%m%d')
-                        end_dt = pd.to_datetime(end_date, format='%Y%m%d')
+                        # Fix: 데이터 응답 타입과 길이 로깅
+                        logger.debug(f"  {stock_code}: 응답 타입={type(data)}, 길이={len(data) if data else 0}")
+                        return data if isinstance(data, list) else []
 
-                        df = df[(df['datetime'] >= start_dt) & (df['datetime'] <= end_dt)]
+                    # 저장소에 추가한 뒤 구간 조회 (datetime 파싱/정렬/범위 필터 포함)
+                    df = loader.load_frame(stock_code, interval_int, start_date, end_date, fetch=fetch_with_retry)
 
-                        if len(df) > 0:
-                            historical_data[stock_code] = df
-                            logger.info(f"  {stock_code}: {len(df)} bars")
-                        else:
-                            logger.warning(f"  {stock_code}: No data in date range")
+                    if len(df) > 0:
+                        historical_data[stock_code] = df
+                        logger.info(f"  {stock_code}: {len(df)} bars")
                     else:
                         # Fix: 더 상세한 에러 메시지
                         logger.warning(f"  {stock_code}: API에서 데이터가 반환되지 않음")
@@ -6,17 +6,19 @@
 import logging
 import time
 import random
-import sqlite3
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Tuple, Optional
 from dataclasses import dataclass, asdict
 import json
 
 from utils.logger_new import get_logger
+from utils.sqlite_db import get_database
 
 logger = get_logger()
 
+# 평가 종목 미지정 시 기본 종목 (run_strategy_optimizer.py --stocks 기본값과 동일)
+DEFAULT_EVALUATION_CODES = ['005930', '000660', '035720']
+
 
 @dataclass
 class StrategyGene:
@@ -99,9 +101,14 @@ class StrategyOptimizationEngine:
         chart_api = None,
         openapi_client = None,
         virtual_trading_manager = None,
-        auto_deploy: bool = False
+        auto_deploy: bool = False,
+        eval_workers: Optional[int] = None
     ):
-        """초기화"""
+        """초기화
+
+        Args:
+            eval_workers: 적합도 평가 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스)
+        """
         self.db_path = db_path
         self.population_size = population_size
         self.mutation_rate = mutation_rate
@@ -131,10 +138,19 @@ class StrategyOptimizationEngine:
                 if openapi_client:
                     logger.info("  - OpenAPIClient 연결: 실시간 데이터 사용 가능")
             except Exception as e:
-                logger.warning(f"백테스터 초기화 실패: {e}. 시뮬레이션 모드로 실행됩니다.")
+                logger.warning(f"백테스터 초기화 실패: {e}. 오프라인 데이터로 평가합니다.")
                 self.backtester = None
         else:
-            logger.info("💡 시뮬레이션 모드로 실행 (market_api 미제공)")
+            logger.info("💡 오프라인 데이터로 평가 (market_api 미제공: 로컬 OHLCV 저장소/합성 데이터)")
+
+        # 세대 단위 적합도 평가기 (데이터셋 1회 로드 + 프로세스 풀 + 유전자 메모이제이션)
+        from ai.fitness_evaluator import PopulationFitnessEvaluator
+        self._offline_backtester = None
+        self.fitness_evaluator = PopulationFitnessEvaluator(
+            data_source=self._load_evaluation_data,
+            fitness_fn=self._calculate_fitness,
+            max_workers=eval_workers
+        )
 
         # 자동 배포 시스템 초기화
         if auto_deploy and virtual_trading_manager:
@@ -156,27 +172,21 @@ class StrategyOptimizationEngine:
         logger.info(f"전략 최적화 엔진 초기화 완료")
         logger.info(f"  - 세대당 전략 수: {population_size}")
         logger.info(f"  - 변이 확률: {mutation_rate * 100}%")
-        logger.info(f"  - 모드: {'실제 백테스팅' if self.backtester else '시뮬레이션'}")
+        logger.info(f"  - 모드: {'실제 백테스팅' if self.backtester else '오프라인 데이터 백테스팅'}")
+        logger.info(f"  - 평가 워커: {self.fitness_evaluator.max_workers}개")
         logger.info(f"  - 자동 배포: {'활성화' if self.auto_deployer else '비활성화'}")
 
     def _init_database(self):
         """데이터베이스 초기화"""
-        import os
-        os.makedirs(os.path.dirname(self.db_path) if os.path.dirname(self.db_path) else '.', exist_ok=True)
-
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        self.db = get_database(self.db_path)
+        self.db.executescript("""
             CREATE TABLE IF NOT EXISTS evolved_strategies (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 generation INTEGER NOT NULL,
                 genes TEXT NOT NULL,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+            );
 
-        cursor.execute("""
             CREATE TABLE IF NOT EXISTS fitness_results (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 strategy_id INTEGER NOT NULL,
@@ -190,10 +200,8 @@ class StrategyOptimizationEngine:
                 fitness_score REAL NOT NULL,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (strategy_id) REFERENCES evolved_strategies(id)
-            )
-        """)
+            );
 
-        cursor.execute("""
             CREATE TABLE IF NOT EXISTS generation_stats (
                 generation INTEGER PRIMARY KEY,
                 best_fitness REAL NOT NULL,
@@ -201,11 +209,8 @@ class StrategyOptimizationEngine:
                 worst_fitness REAL NOT NULL,
                 best_strategy_id INTEGER,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
+            );
         """)
-
-        conn.commit()
-        conn.close()
         logger.info(f"데이터베이스 초기화 완료: {self.db_path}")
 
     def initialize_population(self) -> List[StrategyGene]:
@@ -392,6 +397,37 @@ class StrategyOptimizationEngine:
 
         return GeneBasedStrategy(gene, name)
 
+    def _load_evaluation_data(self, stock_codes: List[str], start_date: str, end_date: str, interval: str):
+        """평가 데이터 로드 (백테스터 데이터 경로: 로컬 저장소 → OpenAPI → REST → 합성 데이터)"""
+        backtester = self.backtester
+        if backtester is None:
+            if self._offline_backtester is None:
+                from ai.strategy_backtester import StrategyBacktester
+                self._offline_backtester = StrategyBacktester(market_api=None)
+            backtester = self._offline_backtester
+        return backtester._fetch_historical_data(stock_codes, start_date, end_date, interval)
+
+    def evaluate_population(self, population: List[StrategyGene], stock_codes: List[str] = None) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        세대 전체 적합도 평가 (최근 3개월 백테스트)
+
+        평가 데이터는 세대마다 분봉 간격별로 한 번만 로드하고,
+        이미 평가한 유전자는 다시 백테스트하지 않는다.
+
+        Returns:
+            [(fitness_score, metrics_dict)] (population 순서)
+        """
+        results = self.fitness_evaluator.evaluate(
+            [gene.to_dict() for gene in population],
+            stock_codes or DEFAULT_EVALUATION_CODES
+        )
+        stats = self.fitness_evaluator.last_stats
+        logger.info(
+            f"  적합도 평가: {stats['evaluated']}개 백테스트, {stats['memo_hits']}개 재사용, "
+            f"데이터셋 {stats['datasets_loaded']}개 로드"
+        )
+        return results
+
     def evaluate_fitness(self, gene: StrategyGene, stock_codes: List[str] = None) -> Tuple[float, Dict[str, Any]]:
         """
         적합도 평가 (백테스팅)
@@ -399,75 +435,7 @@ class StrategyOptimizationEngine:
         Returns:
             (fitness_score, metrics_dict)
         """
-        # 실제 백테스팅 실행
-        if self.backtester and stock_codes:
-            try:
-                # 전략 생성
-                strategy = self._create_strategy_from_gene(gene, f"Gene-{self.current_generation}")
-
-                # 백테스터에 전략 주입 (기존 전략 대체)
-                original_strategies = self.backtester.strategies
-                self.backtester.strategies = [strategy]
-
-                # 최근 3개월 백테스트
-                from datetime import datetime, timedelta
-                end_date = datetime.now()
-                start_date = end_date - timedelta(days=90)
-
-                results = self.backtester.run_backtest(
-                    stock_codes=stock_codes,
-                    start_date=start_date.strftime('%Y%m%d'),
-                    end_date=end_date.strftime('%Y%m%d'),
-                    interval=gene.timeframe,  # 유전자의 타임프레임 사용
-                    parallel=False
-                )
-
-                # 원래 전략 복원
-                self.backtester.strategies = original_strategies
-
-                # 결과 추출
-                if strategy.name in results:
-                    result = results[strategy.name]
-                    metrics = {
-                        'total_return_pct': result.total_return_pct,
-                        'sharpe_ratio': result.sharpe_ratio,
-                        'win_rate': result.win_rate,
-                        'max_drawdown_pct': result.max_drawdown_pct,
-                        'profit_factor': result.profit_factor,
-                        'total_trades': result.total_trades
-                    }
-                    fitness = self._calculate_fitness(
-                        result.total_return_pct,
-                        result.sharpe_ratio,
-                        result.win_rate,
-                        result.max_drawdown_pct,
-                        result.profit_factor
-                    )
-                    return fitness, metrics
-                else:
-                    logger.warning(f"백테스트 결과 없음 - 시뮬레이션 모드로 fallback")
-
-            except Exception as e:
-                logger.warning(f"백테스트 실패: {e} - 시뮬레이션 모드로 fallback")
-
-        # 시뮬레이션 모드 (fallback)
-        total_return = random.uniform(-10, 30)
-        sharpe_ratio = random.uniform(0, 2)
-        win_rate = random.uniform(40, 70)
-        max_drawdown = random.uniform(-20, -3)
-        profit_factor = random.uniform(0.5, 2.5)
-
-        metrics = {
-            'total_return_pct': total_return,
-            'sharpe_ratio': sharpe_ratio,
-            'win_rate': win_rate,
-            'max_drawdown_pct': max_drawdown,
-            'profit_factor': profit_factor,
-            'total_trades': random.randint(10, 50)
-        }
-
-        fitness = self._calculate_fitness(total_return, sharpe_ratio, win_rate, max_drawdown, profit_factor)
-        return fitness, metrics
+        return self.evaluate_population([gene], stock_codes)[0]
 
     def _calculate_fitness(self, total_return_pct, sharpe_ratio, win_rate, max_drawdown_pct, profit_factor) -> float:
         """적합도 계산"""
@@ -524,68 +492,65 @@ class StrategyOptimizationEngine:
         return next_generation
 
     def save_generation(self, population: List[StrategyGene], fitness_scores: List[float], metrics_list: List[Dict[str, Any]]):
-        """세대 저장 (실제 성과 지표 포함)"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """세대 저장 (실제 성과 지표 포함, 세대 하나 = 트랜잭션 하나)"""
         try:
-            strategy_ids = []
-            for gene, fitness, metrics in zip(population, fitness_scores, metrics_list):
-                # 전략 저장
-                cursor.execute("INSERT INTO evolved_strategies (generation, genes) VALUES (?, ?)",
-                             (self.current_generation, json.dumps(gene.to_dict())))
-                strategy_id = cursor.lastrowid
-                strategy_ids.append(strategy_id)
-
-                # 실제 성과 지표 저장
-                cursor.execute("""
+            with self.db.transaction() as conn:
+                # 전략 저장 (ID가 필요하므로 행 단위, 같은 문장은 캐시된 prepared statement 재사용)
+                strategy_ids = [
+                    conn.execute("INSERT INTO evolved_strategies (generation, genes) VALUES (?, ?)",
+                                 (self.current_generation, json.dumps(gene.to_dict()))).lastrowid
+                    for gene in population
+                ]
+
+                # 실제 성과 지표 저장 (executemany 한 번)
+                conn.executemany("""
                     INSERT INTO fitness_results (
                         strategy_id, generation, fitness_score,
                         total_return_pct, sharpe_ratio, win_rate,
                         max_drawdown_pct, profit_factor, total_trades
                     ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, [
+                    (
+                        strategy_id, self.current_generation, fitness,
+                        metrics.get('total_return_pct', 0),
+                        metrics.get('sharpe_ratio', 0),
+                        metrics.get('win_rate', 0),
+                        metrics.get('max_drawdown_pct', 0),
+                        metrics.get('profit_factor', 0),
+                        metrics.get('total_trades', 0)
+                    )
+                    for strategy_id, fitness, metrics in zip(strategy_ids, fitness_scores, metrics_list)
+                ])
+
+                # 세대 통계 저장 (최우수 전략 ID 포함)
+                best_idx = fitness_scores.index(max(fitness_scores))
+                best_strategy_id = strategy_ids[best_idx]
+
+                # Fix: UNIQUE constraint 오류 방지 - 명시적 DELETE 후 INSERT
+                conn.execute("DELETE FROM generation_stats WHERE generation = ?", (self.current_generation,))
+
+                conn.execute("""
+                    INSERT INTO generation_stats (
+                        generation, best_fitness, avg_fitness, worst_fitness, best_strategy_id
+                    ) VALUES (?, ?, ?, ?, ?)
                 """, (
-                    strategy_id, self.current_generation, fitness,
-                    metrics.get('total_return_pct', 0),
-                    metrics.get('sharpe_ratio', 0),
-                    metrics.get('win_rate', 0),
-                    metrics.get('max_drawdown_pct', 0),
-                    metrics.get('profit_factor', 0),
-                    metrics.get('total_trades', 0)
+                    self.current_generation,
+                    max(fitness_scores),
+                    sum(fitness_scores) / len(fitness_scores),
+                    min(fitness_scores),
+                    best_strategy_id
                 ))
 
-            # 세대 통계 저장 (최우수 전략 ID 포함)
-            best_idx = fitness_scores.index(max(fitness_scores))
-            best_strategy_id = strategy_ids[best_idx]
-
-            # Fix: UNIQUE constraint 오류 방지 - 명시적 DELETE 후 INSERT
-            cursor.execute("DELETE FROM generation_stats WHERE generation = ?", (self.current_generation,))
-
-            cursor.execute("""
-                INSERT INTO generation_stats (
-                    generation, best_fitness, avg_fitness, worst_fitness, best_strategy_id
-                ) VALUES (?, ?, ?, ?, ?)
-            """, (
-                self.current_generation,
-                max(fitness_scores),
-                sum(fitness_scores) / len(fitness_scores),
-                min(fitness_scores),
-                best_strategy_id
-            ))
-
-            conn.commit()
             logger.info(f"✅ 세대 {self.current_generation} DB 저장 완료 (best={max(fitness_scores):.2f}, avg={sum(fitness_scores)/len(fitness_scores):.2f})")
         except Exception as e:
             logger.error(f"❌ DB 저장 실패 (세대 {self.current_generation}): {e}")
-            conn.rollback()
-        finally:
-            conn.close()
 
     def run_continuous_optimization(self, stock_codes: List[str] = None, max_generations: int = None, interval_seconds: int = 600):
         """지속적 최적화 실행"""
         logger.info("🚀 지속적 전략 최적화 시작")
-        logger.info(f"  모드: {'실제 백테스팅' if self.backtester and stock_codes else '시뮬레이션'}")
-        if stock_codes:
-            logger.info(f"  테스트 종목: {', '.join(stock_codes)}")
+        stock_codes = stock_codes or DEFAULT_EVALUATION_CODES
+        logger.info(f"  모드: {'실제 백테스팅' if self.backtester else '오프라인 데이터 백테스팅'}")
+        logger.info(f"  테스트 종목: {', '.join(stock_codes)}")
 
         self.running = True
         population = self.initialize_population()
@@ -597,26 +562,10 @@ class StrategyOptimizationEngine:
             logger.info("=" * 80)
             start_time = time.time()
 
-            # 병렬 평가
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                futures = {executor.submit(self.evaluate_fitness, gene, stock_codes): i for i, gene in enumerate(population)}
-                fitness_scores = [0.0] * len(population)
-                metrics_list = [{}] * len(population)
-
-                for future in as_completed(futures):
-                    idx = futures[future]
-                    try:
-                        fitness, metrics = future.result()
-                        fitness_scores[idx] = fitness
-                        metrics_list[idx] = metrics
-                    except Exception as e:
-                        logger.error(f"전략 {idx} 평가 실패: {e}")
-                        # 기본값 설정
-                        fitness_scores[idx] = 0.0
-                        metrics_list[idx] = {
-                            'total_return_pct': 0, 'sharpe_ratio': 0, 'win_rate': 0,
-                            'max_drawdown_pct': 0, 'profit_factor': 0, 'total_trades': 0
-                        }
+            # 세대 단위 병렬 평가 (프로세스 풀)
+            results = self.evaluate_population(population, stock_codes)
+            fitness_scores = [fitness for fitness, _ in results]
+            metrics_list = [metrics for _, metrics in results]
 
             elapsed = time.time() - start_time
             logger.info(f"✅ 세대 {self.current_generation} 평가 완료 ({elapsed:.1f}초)")
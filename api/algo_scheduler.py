@@ -0,0 +1,823 @@
+"""
+Algorithmic Order Scheduler
+Single-threaded event scheduler that drives many concurrent parent orders
+(TWAP, VWAP, Iceberg, Adaptive) without blocking a thread per order.
+
+- Slice / child-order deadlines live in one heap; the worker thread sleeps
+  until the earliest deadline or until new work arrives.
+- Child orders are placed through a pluggable exchange adapter
+  (KiwoomExchange for OrderAPI/MarketAPI, SimulatedExchange for tests).
+- Fills are reconciled from order-execution events by order number.
+- Cancelled quantity is only freed once the exchange confirms the cancel
+  (or the order status shows nothing left open); until then it stays working.
+- Rejected slices are retried; a parent that keeps failing finishes as ERROR.
+- Execution quality (slippage vs arrival price and market VWAP) is kept as
+  running sums, so metrics are O(1) at any time.
+"""
+
+import heapq
+import itertools
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Parent order states
+RUNNING = 'running'
+COMPLETED = 'completed'
+EXPIRED = 'expired'
+CANCELLED = 'cancelled'
+ERROR = 'error'
+
+FINAL_STATES = (COMPLETED, EXPIRED, CANCELLED, ERROR)
+
+
+def _to_number(value: Any) -> float:
+    """Kiwoom string fields ('+71500', '-1,200', '') -> absolute number"""
+    if value is None or value == '':
+        return 0.0
+    if isinstance(value, (int, float)):
+        return abs(float(value))
+    try:
+        return abs(float(str(value).replace(',', '').strip() or 0))
+    except ValueError:
+        return 0.0
+
+
+# ---------------------------------------------------------------------------
+# Exchange adapters
+# ---------------------------------------------------------------------------
+
+class ExchangeAdapter:
+    """
+    Exchange adapter interface used by AlgoScheduler
+
+    quote() returns {'price': float, 'volume': float} where volume is the
+    cumulative traded volume of the day (deltas are taken by the scheduler).
+    Adapters that know about fills synchronously (e.g. a simulator) report
+    them through the callback passed to attach().
+    """
+
+    def attach(self, on_fill: Callable[[str, int, float], None]) -> None:
+        """Register fill callback (order_no, quantity, price)"""
+        self._on_fill = on_fill
+
+    def quote(self, stock_code: str) -> Dict[str, float]:
+        raise NotImplementedError
+
+    def place(self, stock_code: str, side: str, quantity: int, price: float) -> Optional[str]:
+        """Place a limit order and return its order number (None on failure)"""
+        raise NotImplementedError
+
+    def cancel(self, order_no: str, stock_code: str, quantity: int) -> bool:
+        """Request a cancel; True only when the exchange accepted it"""
+        raise NotImplementedError
+
+    def order_status(self, order_no: str, stock_code: str) -> Optional[Dict[str, int]]:
+        """
+        Current state of an order: {'filled': cumulative filled quantity,
+        'open': quantity still resting}. None when the state is unknown.
+        """
+        return None
+
+
+class KiwoomExchange(ExchangeAdapter):
+    """OrderAPI / MarketAPI adapter (fills arrive via websocket '00' events)"""
+
+    def __init__(self, order_api, market_api):
+        self.order_api = order_api
+        self.market_api = market_api
+
+    def quote(self, stock_code: str) -> Dict[str, float]:
+        if hasattr(self.market_api, 'get_stock_price'):
+            data = self.market_api.get_stock_price(stock_code)
+        else:
+            data = self.market_api.get_current_price(stock_code)
+        data = data or {}
+        return {
+            'price': _to_number(data.get('current_price')),
+            'volume': _to_number(data.get('acc_volume', data.get('volume'))),
+        }
+
+    def place(self, stock_code: str, side: str, quantity: int, price: float) -> Optional[str]:
+        send = self.order_api.buy if side == 'buy' else self.order_api.sell
+        result = send(stock_code=stock_code, quantity=quantity, price=int(price), order_type='02')
+        if not result or result.get('status') == 'error':
+            return None
+        return result.get('order_no')
+
+    def cancel(self, order_no: str, stock_code: str, quantity: int) -> bool:
+        result = self.order_api.cancel(order_no, stock_code, quantity)
+        return bool(result) and result.get('status') not in ('error', 'failed')
+
+    def order_status(self, order_no: str, stock_code: str) -> Optional[Dict[str, int]]:
+        result = self.order_api.get_order_status(order_no)
+        if not result or result.get('status') in ('error', 'failed'):
+            return None
+        return {
+            'filled': int(_to_number(result.get('filled_quantity', result.get('cntr_qty')))),
+            'open': int(_to_number(result.get('unfilled_quantity', result.get('oso_qty')))),
+        }
+
+
+class SimulatedExchange(ExchangeAdapter):
+    """
+    In-memory exchange for tests and dry runs
+
+    Each placed order is filled immediately at the current price for
+    fill_ratio of its quantity (the rest stays working until cancelled).
+    Prices and cumulative volume are set with set_market().
+    """
+
+    def __init__(self, fill_ratio: float = 1.0, auto_fill: bool = True, accept_cancels: bool = True):
+        self.fill_ratio = fill_ratio
+        self.auto_fill = auto_fill
+        self.accept_cancels = accept_cancels
+        self.market: Dict[str, Tuple[float, float]] = {}
+        self.orders: Dict[str, Dict[str, Any]] = {}
+        self.cancelled: List[str] = []
+        self._on_fill = None
+        self._seq = itertools.count(1)
+
+    def set_market(self, stock_code: str, price: float, volume: float = 0) -> None:
+        self.market[stock_code] = (price, volume)
+
+    def quote(self, stock_code: str) -> Dict[str, float]:
+        price, volume = self.market.get(stock_code, (0.0, 0.0))
+        return {'price': price, 'volume': volume}
+
+    def place(self, stock_code: str, side: str, quantity: int, price: float) -> Optional[str]:
+        order_no = f"SIM{next(self._seq):06d}"
+        self.orders[order_no] = {
+            'stock_code': stock_code, 'side': side, 'quantity': quantity, 'price': price, 'filled': 0,
+        }
+        if self.auto_fill:
+            self.fill(order_no, int(quantity * self.fill_ratio))
+        return order_no
+
+    def fill(self, order_no: str, quantity: int, price: Optional[float] = None) -> None:
+        """Report a (partial) fill to the scheduler"""
+        order = self.orders[order_no]
+        quantity = min(quantity, order['quantity'] - order['filled'])
+        if quantity <= 0:
+            return
+        order['filled'] += quantity
+        if price is None:
+            price = self.market.get(order['stock_code'], (order['price'], 0))[0]
+        if self._on_fill:
+            self._on_fill(order_no, quantity, price)
+
+    def cancel(self, order_no: str, stock_code: str, quantity: int) -> bool:
+        self.cancelled.append(order_no)
+        if order_no not in self.orders or not self.accept_cancels:
+            return False
+        self.orders[order_no]['cancelled'] = True
+        return True
+
+    def order_status(self, order_no: str, stock_code: str) -> Optional[Dict[str, int]]:
+        order = self.orders.get(order_no)
+        if order is None:
+            return None
+        open_quantity = 0 if order.get('cancelled') else order['quantity'] - order['filled']
+        return {'filled': order['filled'], 'open': open_quantity}
+
+
+# ---------------------------------------------------------------------------
+# Order state
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ChildOrder:
+    """
+    Single exchange order (one slice of a parent)
+
+    status: 'working' -> 'cancelling' (cancel sent, not confirmed) -> 'cancelled',
+    or 'filled'. A cancelling child still counts as open quantity.
+    """
+    order_no: str
+    algo_id: str
+    quantity: int
+    price: float
+    deadline: float
+    filled: int = 0
+    status: str = 'working'
+    cancel_attempts: int = 0
+
+    @property
+    def open_quantity(self) -> int:
+        return self.quantity - self.filled if self.status in ('working', 'cancelling') else 0
+
+
+@dataclass
+class ParentOrder:
+    """Parent algorithm order and its incremental execution statistics"""
+    algo_id: str
+    algo_type: str
+    stock_code: str
+    side: str
+    total_quantity: int
+    start: float
+    end: Optional[float]
+    params: Dict[str, Any]
+    start_time: datetime = field(default_factory=datetime.now)
+    end_time: Optional[datetime] = None
+    status: str = RUNNING
+    arrival_price: float = 0.0
+    filled_quantity: int = 0
+    filled_notional: float = 0.0
+    market_notional: float = 0.0
+    market_volume: float = 0.0
+    last_volume: Optional[float] = None
+    interval_volume: float = 0.0
+    slices_sent: int = 0
+    rejected_slices: int = 0  # consecutive rejections
+    exhausted: bool = False
+    children: Dict[str, ChildOrder] = field(default_factory=dict)
+    fills: List[Dict[str, Any]] = field(default_factory=list)
+    slice_token: int = 0
+    done: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def working_quantity(self) -> int:
+        return sum(child.open_quantity for child in self.children.values())
+
+    @property
+    def unallocated_quantity(self) -> int:
+        """Quantity neither filled nor resting in a working child"""
+        return max(0, self.total_quantity - self.filled_quantity - self.working_quantity)
+
+    @property
+    def average_price(self) -> float:
+        return self.filled_notional / self.filled_quantity if self.filled_quantity else 0.0
+
+    @property
+    def market_vwap(self) -> float:
+        return self.market_notional / self.market_volume if self.market_volume else 0.0
+
+    def _slippage_bps(self, benchmark: float) -> Optional[float]:
+        if not benchmark or not self.filled_quantity:
+            return None
+        sign = 1 if self.side == 'buy' else -1
+        return round(sign * (self.average_price - benchmark) / benchmark * 10000, 2)
+
+    def summary(self) -> Dict[str, Any]:
+        """Execution summary (same keys as the legacy blocking executor + quality metrics)"""
+        duration = None
+        if self.end_time:
+            duration = (self.end_time - self.start_time).total_seconds()
+        return {
+            'algo_id': self.algo_id,
+            'algo_type': self.algo_type,
+            'stock_code': self.stock_code,
+            'side': self.side,
+            'status': self.status,
+            'total_quantity': self.total_quantity,
+            'executed_quantity': self.filled_quantity,
+            'working_quantity': self.working_quantity,
+            'fill_rate': (self.filled_quantity / self.total_quantity * 100) if self.total_quantity else 0,
+            'average_price': round(self.average_price, 2),
+            'total_value': round(self.filled_notional, 2),
+            'num_fills': len(self.fills),
+            'num_slices': self.slices_sent,
+            'arrival_price': self.arrival_price,
+            'market_vwap': round(self.market_vwap, 2),
+            'slippage_vs_arrival_bps': self._slippage_bps(self.arrival_price),
+            'slippage_vs_vwap_bps': self._slippage_bps(self.market_vwap),
+            'duration_seconds': duration,
+            'start_time': self.start_time,
+            'end_time': self.end_time,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------
+
+class AlgoScheduler:
+    """
+    Drives all parent orders from one worker thread
+
+    Events in the heap:
+    - ('slice', algo_id, token): place the next child order for a parent
+    - ('expire', order_no, None): child order deadline -> cancel the remainder
+    - ('reconcile', order_no, None): unconfirmed cancel -> check order status / retry
+    - ('end', algo_id, None): parent deadline -> stop slicing, finish
+
+    Tests can skip the thread entirely and call run_pending() with a fake clock.
+    """
+
+    def __init__(
+        self,
+        exchange: ExchangeAdapter,
+        clock: Callable[[], float] = time.monotonic,
+        slice_timeout: float = 30.0,
+        history_limit: int = 500,
+        retry_interval: float = 5.0,
+        max_retries: int = 5,
+    ):
+        """
+        Args:
+            exchange: Exchange adapter (KiwoomExchange / SimulatedExchange)
+            clock: Monotonic clock in seconds
+            slice_timeout: Default lifetime of a child order before it is cancelled
+            history_limit: Number of finished parent orders kept in memory
+            retry_interval: Delay before re-checking an unconfirmed cancel or
+                            re-sending a rejected slice
+            max_retries: Unconfirmed cancel checks / consecutive slice rejections
+                         before the parent is finished as ERROR
+        """
+        self.exchange = exchange
+        self.clock = clock
+        self.slice_timeout = slice_timeout
+        self.history_limit = history_limit
+        self.retry_interval = retry_interval
+        self.max_retries = max_retries
+
+        self.active: Dict[str, ParentOrder] = {}
+        self.completed: Dict[str, ParentOrder] = {}
+        self._children: Dict[str, ChildOrder] = {}
+        self._orphan_fills: Dict[str, List[Tuple[int, float]]] = {}
+
+        self._heap: List[Tuple[float, int, str, str, Optional[int]]] = []
+        self._seq = itertools.count()
+        self._lock = threading.RLock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        self._planners = {
+            'TWAP': self._plan_twap,
+            'VWAP': self._plan_vwap,
+            'ICEBERG': self._plan_iceberg,
+            'ADAPTIVE': self._plan_adaptive,
+        }
+
+        exchange.attach(self.on_fill)
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the worker thread (idempotent)"""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name='AlgoScheduler', daemon=True)
+            self._thread.start()
+        logger.info("Algo scheduler started")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the worker thread (working orders are left as they are)"""
+        with self._lock:
+            self._running = False
+            self._wakeup.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._running:
+                    return
+                delay = self._next_delay()
+                if delay is None or delay > 0:
+                    self._wakeup.wait(delay)
+                    continue
+            self.run_pending()
+
+    def _next_delay(self) -> Optional[float]:
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - self.clock())
+
+    def _push(self, due: float, kind: str, key: str, token: Optional[int] = None) -> None:
+        heapq.heappush(self._heap, (due, next(self._seq), kind, key, token))
+        self._wakeup.notify()
+
+    def run_pending(self) -> int:
+        """Process every event that is due now; returns the number handled"""
+        handled = 0
+        with self._lock:
+            while self._heap and self._heap[0][0] <= self.clock():
+                _, _, kind, key, token = heapq.heappop(self._heap)
+                try:
+                    if kind == 'slice':
+                        self._on_slice(key, token)
+                    elif kind == 'expire':
+                        self._on_expire(key)
+                    elif kind == 'reconcile':
+                        self._on_reconcile(key)
+                    elif kind == 'end':
+                        self._on_end(key)
+                except Exception as e:
+                    parent = self.active.get(key) or self.active.get(getattr(self._children.get(key), 'algo_id', ''))
+                    logger.error(f"Algo scheduler event {kind}:{key} failed: {e}")
+                    if parent:
+                        self._finish(parent, ERROR)
+                handled += 1
+        return handled
+
+    # -- submission / control ----------------------------------------------
+
+    def submit(
+        self,
+        algo_id: str,
+        algo_type: str,
+        stock_code: str,
+        side: str,
+        total_quantity: int,
+        duration_seconds: Optional[float] = None,
+        **params,
+    ) -> ParentOrder:
+        """
+        Register a parent order; the first slice is placed on the next tick
+
+        Args:
+            algo_id: Unique parent order ID
+            algo_type: 'TWAP' / 'VWAP' / 'ICEBERG' / 'ADAPTIVE'
+            stock_code: Stock code
+            side: 'buy' or 'sell'
+            total_quantity: Total quantity
+            duration_seconds: Parent deadline (None = until filled)
+            **params: Algorithm parameters (num_slices, target_participation,
+                      interval_seconds, display_quantity, limit_price, urgency)
+        """
+        if algo_type not in self._planners:
+            raise ValueError(f"Unsupported algorithm: {algo_type}")
+        if total_quantity <= 0:
+            raise ValueError("total_quantity must be positive")
+
+        with self._lock:
+            now = self.clock()
+            quote = self.exchange.quote(stock_code)
+            parent = ParentOrder(
+                algo_id=algo_id,
+                algo_type=algo_type,
+                stock_code=stock_code,
+                side=side,
+                total_quantity=total_quantity,
+                start=now,
+                end=now + duration_seconds if duration_seconds else None,
+                params=params,
+                arrival_price=quote['price'],
+                last_volume=quote['volume'],
+            )
+            self.active[algo_id] = parent
+            self._push(now, 'slice', algo_id, parent.slice_token)
+            if parent.end is not None:
+                self._push(parent.end, 'end', algo_id)
+
+        logger.info(
+            f"[{algo_id}] Submitted {algo_type}: {stock_code} {side.upper()} "
+            f"{total_quantity:,} shares (arrival {parent.arrival_price:,.0f}원)"
+        )
+        return parent
+
+    def cancel(self, algo_id: str) -> bool:
+        """Cancel a parent order and all of its working child orders"""
+        with self._lock:
+            parent = self.active.get(algo_id)
+            if parent is None:
+                return False
+            self._cancel_children(parent)
+            self._finish(parent, CANCELLED)
+        logger.info(f"Algorithm {algo_id} cancelled")
+        return True
+
+    def amend(
+        self,
+        algo_id: str,
+        total_quantity: Optional[int] = None,
+        duration_seconds: Optional[float] = None,
+        **params,
+    ) -> bool:
+        """
+        Amend a running parent order
+
+        total_quantity below the filled quantity is clamped to it. Reducing the
+        quantity below filled + working cancels the working children; the next
+        slice re-plans from the new remainder. duration_seconds is measured from
+        the original start.
+        """
+        with self._lock:
+            parent = self.active.get(algo_id)
+            if parent is None:
+                return False
+
+            if total_quantity is not None:
+                parent.total_quantity = max(int(total_quantity), parent.filled_quantity)
+                if parent.filled_quantity + parent.working_quantity > parent.total_quantity:
+                    self._cancel_children(parent)
+            if duration_seconds is not None:
+                parent.end = parent.start + duration_seconds
+                self._push(parent.end, 'end', algo_id)
+            parent.params.update(params)
+
+            if self._check_complete(parent):
+                return True
+            self._reschedule(parent, self.clock())
+
+        logger.info(f"[{algo_id}] Amended: total={parent.total_quantity:,} params={params}")
+        return True
+
+    def wait(self, algo_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Block until the parent order finishes; returns its summary"""
+        parent = self.get(algo_id)
+        if parent is None:
+            return None
+        parent.done.wait(timeout)
+        return parent.summary()
+
+    def get(self, algo_id: str) -> Optional[ParentOrder]:
+        with self._lock:
+            return self.active.get(algo_id) or self.completed.get(algo_id)
+
+    # -- fills -------------------------------------------------------------
+
+    def on_fill(self, order_no: str, quantity: int, price: float) -> None:
+        """
+        Reconcile a fill against its child order
+
+        Fills for unknown order numbers are buffered (the execution event can
+        arrive before place() returns) and applied once the child is registered.
+        Late fills of cancelled children (cancel raced the fill) still count
+        toward the parent. Over-fills beyond the child quantity are ignored.
+        """
+        if quantity <= 0:
+            return
+        with self._lock:
+            child = self._children.get(order_no)
+            if child is None:
+                self._orphan_fills.setdefault(order_no, []).append((quantity, price))
+                return
+
+            quantity = min(quantity, child.quantity - child.filled)
+            if quantity <= 0:
+                return
+            child.filled += quantity
+            if child.filled >= child.quantity and child.status in ('working', 'cancelling'):
+                child.status = 'filled'
+
+            parent = self.get(child.algo_id)
+            if parent is None:
+                return
+            parent.filled_quantity += quantity
+            parent.filled_notional += quantity * price
+            parent.fills.append({
+                'order_no': order_no,
+                'quantity': quantity,
+                'price': price,
+                'timestamp': datetime.now().isoformat(),
+            })
+
+            if parent.status != RUNNING or self._check_complete(parent):
+                return
+            if parent.algo_type == 'ICEBERG' and child.status == 'filled':
+                self._reschedule(parent, self.clock())
+
+    def on_order_event(self, data: Dict[str, Any]) -> None:
+        """
+        Websocket order-execution ('00') event -> on_fill
+
+        9203: order number, 914/915: unit fill price/quantity
+        (falls back to 910/911 when unit fields are absent)
+        """
+        values = data.get('values', data)
+        order_no = str(values.get('9203', '')).strip()
+        if not order_no:
+            return
+        quantity = int(_to_number(values.get('915', values.get('911'))))
+        price = _to_number(values.get('914', values.get('910')))
+        if quantity > 0 and price > 0:
+            self.on_fill(order_no, quantity, price)
+
+    # -- event handlers ----------------------------------------------------
+
+    def _on_slice(self, algo_id: str, token: Optional[int]) -> None:
+        parent = self.active.get(algo_id)
+        if parent is None or token != parent.slice_token:
+            return  # finished or superseded by a reschedule
+
+        now = self.clock()
+        quote = self.exchange.quote(parent.stock_code)
+        self._observe_market(parent, quote)
+
+        quantity, next_delay = self._planners[parent.algo_type](parent, quote, now)
+        quantity = min(quantity, parent.unallocated_quantity)
+        price = parent.params.get('limit_price') or quote['price']
+
+        if quantity > 0 and price > 0:
+            lifetime = self.slice_timeout if next_delay is None else min(self.slice_timeout, next_delay)
+            if parent.end is not None:
+                lifetime = min(lifetime, max(parent.end - now, 0.0))
+            if not self._place_child(parent, quantity, price, now + lifetime):
+                if parent.rejected_slices >= self.max_retries:
+                    logger.error(f"[{algo_id}] {parent.rejected_slices} slices rejected in a row, giving up")
+                    self._cancel_children(parent)
+                    self._finish(parent, ERROR)
+                    return
+                if next_delay is None:
+                    # nothing else would place the remainder (iceberg / last slice)
+                    self._reschedule(parent, now + self.retry_interval)
+                    return
+
+        if parent.status == RUNNING and next_delay is not None:
+            self._push(now + next_delay, 'slice', algo_id, parent.slice_token)
+
+    def _on_expire(self, order_no: str) -> None:
+        child = self._children.get(order_no)
+        if child is None or child.status != 'working':
+            return
+        parent = self.active.get(child.algo_id)
+        self._cancel_child(child, parent.stock_code if parent else '')
+        if parent is not None and child.status != 'cancelling':
+            self._after_child_closed(parent)
+
+    def _on_reconcile(self, order_no: str) -> None:
+        """Resolve a cancel the exchange did not confirm: order status first, then retry the cancel"""
+        child = self._children.get(order_no)
+        if child is None or child.status != 'cancelling':
+            return
+        parent = self.get(child.algo_id)
+        stock_code = parent.stock_code if parent else ''
+
+        status = self.exchange.order_status(order_no, stock_code)
+        if status is not None:
+            missed = status['filled'] - child.filled
+            if missed > 0:
+                self.on_fill(order_no, missed, child.price)  # fill event was lost
+            if child.status == 'cancelling' and status['open'] <= 0:
+                child.status = 'cancelled'
+        if child.status == 'cancelling':
+            try:
+                if self.exchange.cancel(order_no, stock_code, child.open_quantity):
+                    child.status = 'cancelled'
+            except Exception as e:
+                logger.warning(f"[{child.algo_id}] Cancel retry #{order_no} failed: {e}")
+
+        if child.status == 'cancelling':
+            child.cancel_attempts += 1
+            if child.cancel_attempts <= self.max_retries:
+                self._push(self.clock() + self.retry_interval, 'reconcile', order_no)
+                return
+            logger.error(
+                f"[{child.algo_id}] Cancel #{order_no} unconfirmed after {child.cancel_attempts} attempts; "
+                f"{child.open_quantity:,} shares may still be working"
+            )
+            if parent is not None:
+                self._finish(parent, ERROR)
+            return
+
+        if parent is not None and parent.status == RUNNING:
+            self._after_child_closed(parent)
+
+    def _after_child_closed(self, parent: ParentOrder) -> None:
+        """A child's remainder is confirmed free: finish or re-slice"""
+        if self._check_complete(parent):
+            return
+        if parent.exhausted or (parent.end is not None and self.clock() >= parent.end):
+            self._finish_if_idle(parent)
+        elif parent.algo_type == 'ICEBERG':
+            self._reschedule(parent, self.clock())
+
+    def _on_end(self, algo_id: str) -> None:
+        parent = self.active.get(algo_id)
+        if parent is None or parent.end is None or self.clock() < parent.end:
+            return  # amended to a later deadline
+        parent.slice_token += 1
+        self._cancel_children(parent)
+        self._finish_if_idle(parent)
+
+    # -- planners: (quantity, delay until next slice or None) ----------------
+
+    def _plan_twap(self, parent: ParentOrder, quote: Dict[str, float], now: float):
+        num_slices = max(1, int(parent.params.get('num_slices', 10)))
+        slices_left = max(1, num_slices - parent.slices_sent)
+        quantity = math.ceil(parent.unallocated_quantity / slices_left)
+        if slices_left <= 1:
+            parent.exhausted = True
+            return quantity, None
+        time_left = (parent.end - now) if parent.end is not None else self.slice_timeout * slices_left
+        return quantity, max(time_left, 0.0) / slices_left
+
+    def _plan_vwap(self, parent: ParentOrder, quote: Dict[str, float], now: float):
+        interval = float(parent.params.get('interval_seconds', 30.0))
+        participation = float(parent.params.get('target_participation', 0.10))
+        traded = parent.interval_volume
+        if parent.slices_sent == 0 and not traded:
+            traded = quote['volume'] * 0.01  # no interval volume yet: assume 1% of the day so far
+        quantity = int(traded * participation)
+        if parent.end is not None and now + interval >= parent.end:
+            parent.exhausted = True
+            return quantity, None
+        return quantity, interval
+
+    def _plan_iceberg(self, parent: ParentOrder, quote: Dict[str, float], now: float):
+        if parent.working_quantity > 0:
+            return 0, None  # next slice is scheduled when the visible one fills or expires
+        display = int(parent.params.get('display_quantity') or parent.total_quantity)
+        return display, None
+
+    def _plan_adaptive(self, parent: ParentOrder, quote: Dict[str, float], now: float):
+        urgency = float(parent.params.get('urgency', 0.5))
+        remaining = parent.unallocated_quantity
+        if parent.end is not None:
+            duration = max(parent.end - parent.start, 1e-9)
+            time_fraction = max(parent.end - now, 0.0) / duration
+        else:
+            time_fraction = 1.0
+        aggression = 1 - (time_fraction * (1 - urgency))  # more aggressive as time runs out
+        quantity = max(1, min(int(remaining * aggression * 0.2), remaining)) if remaining else 0
+        return quantity, 10 * (1 - aggression) + 5
+
+    # -- helpers -----------------------------------------------------------
+
+    def _observe_market(self, parent: ParentOrder, quote: Dict[str, float]) -> None:
+        """Accumulate the market VWAP benchmark from cumulative volume deltas"""
+        volume = quote['volume']
+        parent.interval_volume = 0.0
+        if parent.last_volume is not None and volume > parent.last_volume:
+            parent.interval_volume = volume - parent.last_volume
+            parent.market_notional += quote['price'] * parent.interval_volume
+            parent.market_volume += parent.interval_volume
+        parent.last_volume = volume
+
+    def _place_child(self, parent: ParentOrder, quantity: int, price: float, deadline: float) -> bool:
+        order_no = self.exchange.place(parent.stock_code, parent.side, quantity, price)
+        parent.slices_sent += 1
+        if not order_no:
+            parent.rejected_slices += 1
+            logger.warning(f"[{parent.algo_id}] Slice {parent.slices_sent} rejected: {quantity:,} @ {price:,.0f}원")
+            return False
+
+        parent.rejected_slices = 0
+        child = ChildOrder(order_no, parent.algo_id, quantity, price, deadline)
+        parent.children[order_no] = child
+        self._children[order_no] = child
+        self._push(deadline, 'expire', order_no)
+        logger.info(f"[{parent.algo_id}] Slice {parent.slices_sent}: {quantity:,} @ {price:,.0f}원 (#{order_no})")
+
+        for fill_qty, fill_price in self._orphan_fills.pop(order_no, []):
+            self.on_fill(order_no, fill_qty, fill_price)
+        return True
+
+    def _cancel_child(self, child: ChildOrder, stock_code: str) -> None:
+        """Cancel a working child; if unconfirmed it stays open until reconciled"""
+        if child.status != 'working':
+            return
+        child.status = 'cancelling'
+        try:
+            confirmed = self.exchange.cancel(child.order_no, stock_code, child.open_quantity)
+        except Exception as e:
+            logger.warning(f"[{child.algo_id}] Cancel #{child.order_no} failed: {e}")
+            confirmed = False
+        if child.status != 'cancelling':
+            return  # filled while cancelling
+        if confirmed:
+            child.status = 'cancelled'
+        else:
+            self._push(self.clock() + self.retry_interval, 'reconcile', child.order_no)
+
+    def _cancel_children(self, parent: ParentOrder) -> None:
+        for child in parent.children.values():
+            self._cancel_child(child, parent.stock_code)
+
+    def _reschedule(self, parent: ParentOrder, when: float) -> None:
+        """Invalidate the pending slice event and schedule a new one"""
+        if parent.end is not None and when >= parent.end:
+            return
+        parent.slice_token += 1
+        self._push(when, 'slice', parent.algo_id, parent.slice_token)
+
+    def _check_complete(self, parent: ParentOrder) -> bool:
+        if parent.filled_quantity >= parent.total_quantity:
+            self._cancel_children(parent)
+            self._finish(parent, COMPLETED)
+            return True
+        return False
+
+    def _finish_if_idle(self, parent: ParentOrder) -> None:
+        if parent.working_quantity == 0:
+            status = COMPLETED if parent.filled_quantity >= parent.total_quantity else EXPIRED
+            self._finish(parent, status)
+
+    def _finish(self, parent: ParentOrder, status: str) -> None:
+        if parent.status in FINAL_STATES:
+            return
+        parent.status = status
+        parent.end_time = datetime.now()
+        parent.slice_token += 1
+        self.active.pop(parent.algo_id, None)
+        self.completed[parent.algo_id] = parent
+        while len(self.completed) > self.history_limit:
+            dropped = self.completed.pop(next(iter(self.completed)))
+            for order_no in dropped.children:
+                self._children.pop(order_no, None)
+        parent.done.set()
+        logger.info(f"[{parent.algo_id}] {parent.algo_type} {status}: {parent.summary()}")
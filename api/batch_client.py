@@ -19,8 +19,8 @@ class BatchAPIClient:
     배치 API 클라이언트
 
     Features:
-    - 병렬 API 호출 (ThreadPoolExecutor)
-    - 비동기 HTTP 요청 (aiohttp)
+    - 일괄 API 호출 (request_many, aiohttp 커넥션 풀)
+    - 일괄 호출로 처리할 수 없는 조회는 스레드 병렬 호출
     - 자동 재시도 (exponential backoff)
     - Rate limiting
     - 에러 핸들링
@@ -60,6 +60,54 @@ class BatchAPIClient:
         # ThreadPoolExecutor
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
 
+        # 비동기 REST 클라이언트 (request_many 첫 호출 시 생성)
+        self._async_client = None
+
+        # TR 호출 정의/단건 조회용 MarketAPI (첫 사용 시 생성)
+        self._market_api = None
+
+    @property
+    def market_api(self):
+        """기존 클라이언트를 사용하는 MarketAPI"""
+        if self._market_api is None:
+            from api import MarketAPI
+            self._market_api = MarketAPI(self.base_client)
+        return self._market_api
+
+    @property
+    def async_client(self):
+        """기존 클라이언트의 토큰/호출 예산을 공유하는 AsyncKiwoomRESTClient"""
+        if self._async_client is None:
+            from core.async_rest_client import AsyncKiwoomRESTClient
+            self._async_client = AsyncKiwoomRESTClient.from_sync_client(
+                self.base_client,
+                max_concurrency=self.max_workers
+            )
+        return self._async_client
+
+    async def request_many(
+        self,
+        specs: List[tuple],
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        원시 API 요청 일괄 실행 (aiohttp 커넥션 풀 사용)
+
+        스레드 풀 대신 하나의 이벤트 루프에서 요청을 다중화한다.
+        호출 루프와 무관하게 비동기 클라이언트의 전용 루프에서 실행되므로
+        커넥션 풀이 호출 간에 재사용된다.
+
+        Args:
+            specs: [(api_id, body, path), ...]
+            max_concurrency: 동시 실행 수
+
+        Returns:
+            입력 순서와 같은 응답 리스트
+        """
+        client = self.async_client
+        future = client.submit(client.request_many(specs, max_concurrency))
+        return await asyncio.wrap_future(future)
+
     async def get_multiple_stock_prices(
         self,
         stock_codes: List[str],
@@ -89,9 +137,14 @@ class BatchAPIClient:
         logger.info(f"배치 API 호출 시작: {total}개 종목, {len(batches)}개 배치")
         start_time = time.time()
 
-        # 배치별 병렬 처리
+        from utils.trading_date import is_nxt_hours
+
+        # 배치별 처리 (NXT 시간대는 _NX 코드 우선 조회가 필요하므로 단건 경로 사용)
         for batch_idx, batch in enumerate(batches):
-            batch_results = await self._process_batch(batch, self._fetch_price)
+            if is_nxt_hours():
+                batch_results = await self._process_batch(batch, self._fetch_price)
+            else:
+                batch_results = await self._fetch_prices_batched(batch)
 
             for stock_code, result in zip(batch, batch_results):
                 if result:
@@ -110,6 +163,49 @@ class BatchAPIClient:
 
         return results
 
+    async def _fetch_prices_batched(self, stock_codes: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        체결정보(ka10003) 일괄 조회
+
+        request_many로 한 번에 보내고, 실패한 종목만 단건 경로
+        (호가 fallback 포함)로 다시 조회한다.
+
+        Args:
+            stock_codes: 종목 코드 리스트
+
+        Returns:
+            입력 순서와 같은 가격 데이터 리스트 (실패 시 None)
+        """
+        calls = [
+            self.market_api.stock_price_call(code[:-3] if code.endswith("_NX") else code)
+            for code in stock_codes
+        ]
+
+        try:
+            responses = await self.request_many([call.spec for call in calls])
+        except Exception as e:
+            logger.error(f"가격 일괄 조회 실패: {e}")
+            responses = [None] * len(calls)
+
+        results: List[Optional[Dict[str, Any]]] = []
+        for stock_code, call, response in zip(stock_codes, calls, responses):
+            try:
+                results.append(call.parse(response))
+            except Exception as e:
+                logger.error(f"가격 응답 파싱 실패 ({stock_code}): {e}")
+                results.append(None)
+
+        retry_indexes = [i for i, result in enumerate(results) if not result]
+        if retry_indexes:
+            retried = await self._process_batch(
+                [stock_codes[i] for i in retry_indexes],
+                self._fetch_price
+            )
+            for i, result in zip(retry_indexes, retried):
+                results[i] = result
+
+        return results
+
     async def _process_batch(
         self,
         items: List[Any],
@@ -201,10 +297,7 @@ class BatchAPIClient:
         """
         try:
             # 기존 MarketAPI 사용
-            from api import MarketAPI
-            market_api = MarketAPI(self.base_client)
-
-            price_data = market_api.get_stock_price(stock_code)
+            price_data = self.market_api.get_stock_price(stock_code)
             return price_data
 
         except Exception as e:
@@ -229,67 +322,44 @@ class BatchAPIClient:
             {stock_code: detail_data}
         """
 
-        results = {}
-
         # 기본 가격 조회 (배치)
         prices = await self.get_multiple_stock_prices(stock_codes)
 
-        for stock_code, price_data in prices.items():
-            detail = {
-                'price': price_data
-            }
+        results = {
+            stock_code: {'price': price_data}
+            for stock_code, price_data in prices.items()
+        }
 
-            # 추가 데이터 조회 (필요 시)
+        # 추가 데이터 조회 (필요 시): 전 종목의 차트/투자자 TR을 한 번에 전송
+        calls = []
+        for stock_code in results:
             if include_chart:
-                chart_data = await self._fetch_chart_data(stock_code)
-                detail['chart'] = chart_data
-
+                calls.append((stock_code, 'chart', self.market_api.daily_chart_call(stock_code, period=30)))
             if include_investor:
-                investor_data = await self._fetch_investor_data(stock_code)
-                detail['investor'] = investor_data
-
-            results[stock_code] = detail
+                calls.append((stock_code, 'investor', self.market_api.investor_trading_call(stock_code)))
+
+        if calls:
+            try:
+                responses = await self.request_many([call.spec for _, _, call in calls])
+            except Exception as e:
+                logger.error(f"상세 정보 일괄 조회 실패: {e}")
+                responses = [None] * len(calls)
+
+            for (stock_code, key, call), response in zip(calls, responses):
+                try:
+                    results[stock_code][key] = call.parse(response)
+                except Exception as e:
+                    logger.error(f"{key} 조회 실패 ({stock_code}): {e}")
+                    results[stock_code][key] = None
 
         return results
 
-    async def _fetch_chart_data(self, stock_code: str) -> Optional[Dict[str, Any]]:
-        """차트 데이터 조회"""
-        try:
-            from api import MarketAPI
-            market_api = MarketAPI(self.base_client)
-
-            # 일봉 데이터 조회
-            chart_data = await asyncio.to_thread(
-                market_api.get_daily_chart,
-                stock_code,
-                period=30
-            )
-            return chart_data
-
-        except Exception as e:
-            logger.error(f"차트 조회 실패 ({stock_code}): {e}")
-            return None
-
-    async def _fetch_investor_data(self, stock_code: str) -> Optional[Dict[str, Any]]:
-        """투자자별 매매 데이터 조회"""
-        try:
-            from api import MarketAPI
-            market_api = MarketAPI(self.base_client)
-
-            # 투자자별 매매동향 조회
-            investor_data = await asyncio.to_thread(
-                market_api.get_investor_trading,
-                stock_code
-            )
-            return investor_data
-
-        except Exception as e:
-            logger.error(f"투자자 데이터 조회 실패 ({stock_code}): {e}")
-            return None
-
     def close(self):
         """리소스 정리"""
         self.executor.shutdown(wait=True)
+        if self._async_client is not None:
+            self._async_client.shutdown()
+            self._async_client = None
 
 
 # 싱글톤 인스턴스
@@ -8,12 +8,16 @@ api/market/__init__.py
 - ranking.py: 순위 정보
 - investor_data.py: 투자자 매매 데이터
 - stock_info.py: 종목/업종/테마 정보
+- single_flight.py: 동일 TR 요청 병합
+- tr_call.py: TR 요청/파싱 정의 (동기 호출과 request_many 일괄 호출 공용)
 """
 from .market_data import MarketDataAPI
 from .chart_data import ChartDataAPI, get_daily_chart
 from .ranking import RankingAPI
 from .investor_data import InvestorDataAPI
 from .stock_info import StockInfoAPI
+from .single_flight import SingleFlightGroup, CoalescingClient, get_coalescing_client
+from .tr_call import TRCall
 import logging
 
 logger = logging.getLogger(__name__)
@@ -45,21 +49,33 @@ class MarketAPI:
         daily_chart = market_api.get_daily_chart('005930', period=20)
     """
 
-    def __init__(self, client):
+    def __init__(self, client, coalesce: bool = None):
         """
         MarketAPI 초기화
 
         Args:
             client: KiwoomRESTClient 인스턴스
+            coalesce: 동일 TR 요청 병합 사용 여부 (None이면 TR_COALESCING['ENABLED'])
         """
         self.client = client
 
+        if coalesce is None:
+            try:
+                from config.settings import TR_COALESCING
+                coalesce = TR_COALESCING.get('ENABLED', True)
+            except ImportError:
+                coalesce = True
+
+        # 같은 클라이언트를 쓰는 MarketAPI 인스턴스끼리 병합 그룹 공유
+        request_client = get_coalescing_client(client) if coalesce else client
+        self.coalescing = request_client if coalesce else None
+
         # 5개 서브 API 초기화
-        self.market_data = MarketDataAPI(client)
-        self.chart_data = ChartDataAPI(client)
-        self.ranking = RankingAPI(client)
-        self.investor_data = InvestorDataAPI(client)
-        self.stock_info = StockInfoAPI(client)
+        self.market_data = MarketDataAPI(request_client)
+        self.chart_data = ChartDataAPI(request_client)
+        self.ranking = RankingAPI(request_client)
+        self.investor_data = InvestorDataAPI(request_client)
+        self.stock_info = StockInfoAPI(request_client)
 
         logger.info("MarketAPI 초기화 완료 (5개 모듈 통합)")
 
@@ -83,6 +99,14 @@ class MarketAPI:
         """시장 지수 조회"""
         return self.market_data.get_market_index(market_code)
 
+    def stock_price_call(self, stock_code: str, source: str = 'regular_market'):
+        """체결정보 TR 호출 정의 (기본 코드, fallback 없음)"""
+        return self.market_data.stock_price_call(stock_code, source)
+
+    def orderbook_call(self, stock_code: str):
+        """호가 TR 호출 정의 (기본 코드)"""
+        return self.market_data.orderbook_call(stock_code)
+
     # =========================================================================
     # ChartDataAPI 메서드 위임 (차트)
     # =========================================================================
@@ -95,6 +119,10 @@ class MarketAPI:
         """일봉 가격 데이터 조회 (get_daily_chart 별칭)"""
         return self.chart_data.get_daily_chart(stock_code, period=days, date=date)
 
+    def daily_chart_call(self, stock_code: str, period: int = 20, date: str = None):
+        """일봉 차트 TR 호출 정의"""
+        return self.chart_data.daily_chart_call(stock_code, period, date)
+
     def get_minute_chart(self, stock_code: str, interval: int = 1, count: int = 100,
                         adjusted: bool = True, base_date: str = None, use_nxt_fallback: bool = True):
         """분봉 차트 데이터 조회"""
@@ -162,6 +190,10 @@ class MarketAPI:
         """투자자 매매 데이터 조회 (get_investor_trading 별칭)"""
         return self.investor_data.get_investor_data(stock_code, date)
 
+    def investor_trading_call(self, stock_code: str, date: str = None):
+        """투자자별 매매 동향 TR 호출 정의"""
+        return self.investor_data.investor_trading_call(stock_code, date)
+
     def get_intraday_investor_trading_market(self, market: str = 'KOSPI', investor_type: str = 'institution', amount_or_qty: str = 'amount', exchange: str = 'KRX'):
         """장중 투자자별 매매 상위 (시장 전체)"""
         return self.investor_data.get_intraday_investor_trading_market(market, investor_type, amount_or_qty, exchange)
@@ -174,6 +206,10 @@ class MarketAPI:
         """종목별 기관매매추이"""
         return self.investor_data.get_institutional_trading_trend(stock_code, days, price_type)
 
+    def institutional_trading_trend_call(self, stock_code: str, days: int = 5, price_type: str = 'buy'):
+        """종목별 기관매매추이 TR 호출 정의"""
+        return self.investor_data.institutional_trading_trend_call(stock_code, days, price_type)
+
     def get_securities_firm_trading(self, firm_code: str, stock_code: str, days: int = 3):
         """증권사별 종목매매동향"""
         return self.investor_data.get_securities_firm_trading(firm_code, stock_code, days)
@@ -186,6 +222,18 @@ class MarketAPI:
         """프로그램매매 추이 조회"""
         return self.investor_data.get_program_trading(stock_code, days)
 
+    def securities_firm_trading_call(self, firm_code: str, stock_code: str, days: int = 3):
+        """증권사별 종목매매동향 TR 호출 정의"""
+        return self.investor_data.securities_firm_trading_call(firm_code, stock_code, days)
+
+    def execution_intensity_call(self, stock_code: str, days: int = 1):
+        """체결강도 TR 호출 정의"""
+        return self.investor_data.execution_intensity_call(stock_code, days)
+
+    def program_trading_call(self, stock_code: str, days: int = 1):
+        """프로그램매매 추이 TR 호출 정의"""
+        return self.investor_data.program_trading_call(stock_code, days)
+
     # =========================================================================
     # StockInfoAPI 메서드 위임 (종목/업종/테마)
     # =========================================================================
@@ -214,6 +262,21 @@ class MarketAPI:
         """종목 검색"""
         return self.stock_info.search_stock(keyword)
 
+    # =========================================================================
+    # 요청 병합 (single-flight)
+    # =========================================================================
+
+    def get_coalescing_stats(self):
+        """동일 TR 요청 병합 통계 (병합 미사용 시 None)"""
+        if self.coalescing is None:
+            return None
+        return self.coalescing.group.get_stats()
+
+    def invalidate_cache(self, api_id: str = None):
+        """재사용 중인 TR 응답 무효화 (api_id None이면 전체)"""
+        if self.coalescing is not None:
+            self.coalescing.group.invalidate(api_id)
+
 
 # Export consolidated API
 __all__ = [
@@ -224,4 +287,8 @@ __all__ = [
     'InvestorDataAPI',
     'StockInfoAPI',
     'get_daily_chart',
+    'SingleFlightGroup',
+    'CoalescingClient',
+    'get_coalescing_client',
+    'TRCall',
 ]
@@ -5,10 +5,12 @@ api/market/chart_data.py
 - 분봉 차트 데이터 조회 추가 (1/5/15/30/60분)
 - 다양한 시간프레임 지원
 - 데이터 검증 및 에러 핸들링 강화
+- 구간 히스토리는 로컬 OHLCV 저장소(utils.ohlcv_store) 우선 조회
 """
 import logging
-from typing import Dict, Any, List, Literal
+from typing import Dict, Any, List, Literal, Optional
 from utils.trading_date import get_last_trading_date
+from .tr_call import TRCall
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +62,20 @@ class ChartDataAPI:
                 ...
             ]
         """
+        return self.daily_chart_call(stock_code, period, date).run(self.client)
+
+    def daily_chart_call(
+        self,
+        stock_code: str,
+        period: int = 20,
+        date: str = None
+    ) -> TRCall:
+        """
+        일봉 차트 TR 호출 정의 (get_daily_chart와 동일한 요청/파싱)
+
+        Returns:
+            TRCall (파싱 결과는 get_daily_chart 반환값과 같음)
+        """
         # 날짜 자동 계산
         if not date:
             date = get_last_trading_date()
@@ -70,36 +86,33 @@ class ChartDataAPI:
             "upd_stkpc_tp": "1"  # 수정주가 반영
         }
 
-        response = self.client.request(
-            api_id="ka10081",
-            body=body,
-            path="chart"
-        )
-
-        if response and response.get('return_code') == 0:
-            # ka10081은 'stk_dt_pole_chart_qry' 키에 데이터 반환
-            daily_data = response.get('stk_dt_pole_chart_qry', [])
-
-            # 데이터 표준화
-            standardized_data = []
-            for item in daily_data:
-                try:
-                    standardized_data.append({
-                        'date': item.get('dt', ''),
-                        'open': int(float(item.get('open_pric', 0))),
-                        'high': int(float(item.get('high_pric', 0))),
-                        'low': int(float(item.get('low_pric', 0))),
-                        'close': int(float(item.get('cur_prc', 0))),
-                        'volume': int(float(item.get('trde_qty', 0)))
-                    })
-                except (ValueError, TypeError):
-                    continue
-
-            logger.info(f"{stock_code} 일봉 차트 {len(standardized_data)}개 조회 완료")
-            return standardized_data[:period] if period else standardized_data  # period만큼만 반환
-        else:
-            logger.error(f"일봉 차트 조회 실패: {response.get('return_msg')}")
-            return []
+        def parse(response: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            if response and response.get('return_code') == 0:
+                # ka10081은 'stk_dt_pole_chart_qry' 키에 데이터 반환
+                daily_data = response.get('stk_dt_pole_chart_qry', [])
+
+                # 데이터 표준화
+                standardized_data = []
+                for item in daily_data:
+                    try:
+                        standardized_data.append({
+                            'date': item.get('dt', ''),
+                            'open': int(float(item.get('open_pric', 0))),
+                            'high': int(float(item.get('high_pric', 0))),
+                            'low': int(float(item.get('low_pric', 0))),
+                            'close': int(float(item.get('cur_prc', 0))),
+                            'volume': int(float(item.get('trde_qty', 0)))
+                        })
+                    except (ValueError, TypeError):
+                        continue
+
+                logger.info(f"{stock_code} 일봉 차트 {len(standardized_data)}개 조회 완료")
+                return standardized_data[:period] if period else standardized_data  # period만큼만 반환
+            else:
+                logger.error(f"일봉 차트 조회 실패: {response.get('return_msg') if response else 'No response'}")
+                return []
+
+        return TRCall("ka10081", body, "chart", parse)
 
     def get_minute_chart(
         self,
@@ -334,6 +347,40 @@ class ChartDataAPI:
         logger.info(f"{stock_code} 다중 시간프레임 조회 완료: {list(result.keys())}")
         return result
 
+    def load_history(
+        self,
+        stock_code: str,
+        interval: Literal[1, 5, 15, 30, 60, 'daily'],
+        start_date: str,
+        end_date: str,
+        loader=None
+    ) -> Dict[str, Any]:
+        """
+        구간 히스토리 컬럼 조회 (로컬 OHLCV 저장소 우선)
+
+        저장소에 [start_date, end_date] 구간이 없을 때만 API를 호출해 저장한다.
+
+        Args:
+            stock_code: 종목코드
+            interval: 분봉 간격 또는 'daily'
+            start_date: 시작일 (YYYYMMDD)
+            end_date: 종료일 (YYYYMMDD, API 기준일)
+            loader: HistoricalDataLoader (None이면 공용 로더)
+
+        Returns:
+            {'timestamp': datetime64 배열, 'open', 'high', 'low', 'close', 'volume'}
+        """
+        from utils.ohlcv_store import get_data_loader
+
+        loader = loader or get_data_loader()
+
+        def fetch():
+            if interval == 'daily':
+                return self.get_daily_chart(stock_code, period=0, date=end_date)
+            return self.get_minute_chart(stock_code, interval=interval, count=0, base_date=end_date)
+
+        return loader.load(stock_code, interval, start_date, end_date, fetch=fetch)
+
 
 # Standalone functions for backward compatibility
 def get_daily_chart(stock_code: str, period: int = 20, date: str = None) -> List[Dict[str, Any]]:
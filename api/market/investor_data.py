@@ -5,6 +5,7 @@ api/market/investor_data.py
 import logging
 from typing import Dict, Any, List, Optional
 from utils.trading_date import get_last_trading_date
+from .tr_call import TRCall
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +54,19 @@ class InvestorDataAPI:
                 ...
             }
         """
+        return self.investor_trading_call(stock_code, date).run(self.client)
+
+    def investor_trading_call(
+        self,
+        stock_code: str,
+        date: str = None
+    ) -> TRCall:
+        """
+        투자자별 매매 동향 TR 호출 정의 (get_investor_trading과 동일한 요청/파싱)
+
+        Returns:
+            TRCall (파싱 결과는 get_investor_trading 반환값과 같음)
+        """
         # 날짜 자동 계산
         if not date:
             date = get_last_trading_date()
@@ -65,68 +79,65 @@ class InvestorDataAPI:
             "unit_tp": "1000"   # 1000:천주, 1:단주
         }
 
-        response = self.client.request(
-            api_id="ka10059",
-            body=body,
-            path="stkinfo"
-        )
+        def parse(response: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+            if response and response.get('return_code') == 0:
+                # ka10059 응답 구조: stk_invsr_orgn 리스트
+                stk_invsr_orgn = response.get('stk_invsr_orgn', [])
 
-        if response and response.get('return_code') == 0:
-            # ka10059 응답 구조: stk_invsr_orgn 리스트
-            stk_invsr_orgn = response.get('stk_invsr_orgn', [])
+                if not stk_invsr_orgn:
+                    logger.warning(f"{stock_code} 투자자별 매매 데이터 없음")
+                    return None
 
-            if not stk_invsr_orgn:
-                logger.warning(f"{stock_code} 투자자별 매매 데이터 없음")
+                # 가장 최근 데이터 (첫 번째 항목)
+                latest = stk_invsr_orgn[0]
+
+                # 필드 파싱 (천 단위로 제공되므로 1000 곱함)
+                def parse_value(val: str) -> int:
+                    """문자열 값을 정수로 변환 (+/- 기호 제거, 천 단위 → 원 단위)"""
+                    if not val:
+                        return 0
+                    val_str = val.replace('+', '').replace('-', '').strip()
+                    try:
+                        # 천 단위로 제공되므로 1000을 곱함
+                        return int(float(val_str)) * 1000
+                    except (ValueError, AttributeError):
+                        return 0
+
+                # 부호 확인 (+ 또는 -)
+                def get_sign(val: str) -> int:
+                    """값의 부호 반환 (1 또는 -1)"""
+                    if not val:
+                        return 1
+                    return -1 if val.startswith('-') else 1
+
+                # 기관, 외국인, 개인 순매수 추출
+                orgn_val = latest.get('orgn', '0')
+                frgnr_val = latest.get('frgnr_invsr', '0')
+                ind_val = latest.get('ind_invsr', '0')
+
+                institutional_net = parse_value(orgn_val) * get_sign(orgn_val)
+                foreign_net = parse_value(frgnr_val) * get_sign(frgnr_val)
+                individual_net = parse_value(ind_val) * get_sign(ind_val)
+
+                investor_info = {
+                    '기관_순매수': institutional_net,
+                    '외국인_순매수': foreign_net,
+                    '개인_순매수': individual_net,
+                    '날짜': latest.get('dt', date),
+                    '현재가': parse_value(latest.get('cur_prc', '0')),
+                    '등락율': latest.get('flu_rt', '0'),
+                }
+
+                logger.info(
+                    f"{stock_code} 투자자별 매매 조회 완료: "
+                    f"기관={institutional_net:,}, 외국인={foreign_net:,}, 개인={individual_net:,}"
+                )
+                return investor_info
+            else:
+                logger.error(f"투자자별 매매 동향 조회 실패: {response.get('return_msg') if response else 'No response'}")
                 return None
 
-            # 가장 최근 데이터 (첫 번째 항목)
-            latest = stk_invsr_orgn[0]
-
-            # 필드 파싱 (천 단위로 제공되므로 1000 곱함)
-            def parse_value(val: str) -> int:
-                """문자열 값을 정수로 변환 (+/- 기호 제거, 천 단위 → 원 단위)"""
-                if not val:
-                    return 0
-                val_str = val.replace('+', '').replace('-', '').strip()
-                try:
-                    # 천 단위로 제공되므로 1000을 곱함
-                    return int(float(val_str)) * 1000
-                except (ValueError, AttributeError):
-                    return 0
-
-            # 부호 확인 (+ 또는 -)
-            def get_sign(val: str) -> int:
-                """값의 부호 반환 (1 또는 -1)"""
-                if not val:
-                    return 1
-                return -1 if val.startswith('-') else 1
-
-            # 기관, 외국인, 개인 순매수 추출
-            orgn_val = latest.get('orgn', '0')
-            frgnr_val = latest.get('frgnr_invsr', '0')
-            ind_val = latest.get('ind_invsr', '0')
-
-            institutional_net = parse_value(orgn_val) * get_sign(orgn_val)
-            foreign_net = parse_value(frgnr_val) * get_sign(frgnr_val)
-            individual_net = parse_value(ind_val) * get_sign(ind_val)
-
-            investor_info = {
-                '기관_순매수': institutional_net,
-                '외국인_순매수': foreign_net,
-                '개인_순매수': individual_net,
-                '날짜': latest.get('dt', date),
-                '현재가': parse_value(latest.get('cur_prc', '0')),
-                '등락율': latest.get('flu_rt', '0'),
-            }
-
-            logger.info(
-                f"{stock_code} 투자자별 매매 조회 완료: "
-                f"기관={institutional_net:,}, 외국인={foreign_net:,}, 개인={individual_net:,}"
-            )
-            return investor_info
-        else:
-            logger.error(f"투자자별 매매 동향 조회 실패: {response.get('return_msg') if response else 'No response'}")
-            return None
+        return TRCall("ka10059", body, "stkinfo", parse)
 
     def get_investor_data(
         self,
@@ -355,31 +366,46 @@ class InvestorDataAPI:
             }
         """
         try:
-            from datetime import datetime, timedelta
+            return self.institutional_trading_trend_call(stock_code, days, price_type).run(self.client)
 
-            # 날짜 범위 계산
-            end_date = datetime.strptime(get_last_trading_date(), "%Y%m%d")
-            start_date = end_date - timedelta(days=days)
-            start_dt_str = start_date.strftime("%Y%m%d")
-            end_dt_str = end_date.strftime("%Y%m%d")
+        except Exception as e:
+            logger.error(f"기관매매추이 조회 중 예외 발생: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
 
-            price_type_map = {'buy': '1', 'sell': '2'}
-            prsm_unp_tp = price_type_map.get(price_type.lower(), '1')
+    def institutional_trading_trend_call(
+        self,
+        stock_code: str,
+        days: int = 5,
+        price_type: str = 'buy'
+    ) -> TRCall:
+        """
+        종목별 기관매매추이 TR 호출 정의 (get_institutional_trading_trend와 동일한 요청/파싱)
 
-            body = {
-                "stk_cd": stock_code,
-                "strt_dt": start_dt_str,      # 시작일자
-                "end_dt": end_dt_str,         # 종료일자
-                "orgn_prsm_unp_tp": prsm_unp_tp,  # 기관추정단가구분
-                "for_prsm_unp_tp": prsm_unp_tp    # 외인추정단가구분
-            }
+        Returns:
+            TRCall (파싱 결과는 get_institutional_trading_trend 반환값과 같음)
+        """
+        from datetime import datetime, timedelta
 
-            response = self.client.request(
-                api_id="ka10045",
-                body=body,
-                path="mrkcond"
-            )
+        # 날짜 범위 계산
+        end_date = datetime.strptime(get_last_trading_date(), "%Y%m%d")
+        start_date = end_date - timedelta(days=days)
+        start_dt_str = start_date.strftime("%Y%m%d")
+        end_dt_str = end_date.strftime("%Y%m%d")
+
+        price_type_map = {'buy': '1', 'sell': '2'}
+        prsm_unp_tp = price_type_map.get(price_type.lower(), '1')
+
+        body = {
+            "stk_cd": stock_code,
+            "strt_dt": start_dt_str,      # 시작일자
+            "end_dt": end_dt_str,         # 종료일자
+            "orgn_prsm_unp_tp": prsm_unp_tp,  # 기관추정단가구분
+            "for_prsm_unp_tp": prsm_unp_tp    # 외인추정단가구분
+        }
 
+        def parse(response: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
             if response and response.get('return_code') == 0:
                 # 응답 키 자동 탐색
                 data_keys = [k for k in response.keys() if k not in ['return_code', 'return_msg', 'api-id', 'cont-yn', 'next-key']]
@@ -400,11 +426,7 @@ class InvestorDataAPI:
                 logger.error(f"기관매매추이 조회 실패: {response.get('return_msg')}")
                 return None
 
-        except Exception as e:
-            logger.error(f"기관매매추이 조회 중 예외 발생: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+        return TRCall("ka10045", body, "mrkcond", parse)
 
     def get_securities_firm_trading(
         self,
@@ -436,27 +458,42 @@ class InvestorDataAPI:
             ]
         """
         try:
-            from datetime import datetime, timedelta
+            return self.securities_firm_trading_call(firm_code, stock_code, days).run(self.client)
 
-            # 날짜 범위 계산
-            end_date = datetime.strptime(get_last_trading_date(), "%Y%m%d")
-            start_date = end_date - timedelta(days=days)
-            start_dt_str = start_date.strftime("%Y%m%d")
-            end_dt_str = end_date.strftime("%Y%m%d")
+        except Exception as e:
+            logger.error(f"증권사별 매매동향 조회 중 예외 발생: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
 
-            body = {
-                "mmcm_cd": firm_code,      # 회원사코드
-                "stk_cd": stock_code,      # 종목코드
-                "strt_dt": start_dt_str,   # 시작일자
-                "end_dt": end_dt_str       # 종료일자
-            }
+    def securities_firm_trading_call(
+        self,
+        firm_code: str,
+        stock_code: str,
+        days: int = 3
+    ) -> TRCall:
+        """
+        증권사별 종목매매동향 TR 호출 정의 (get_securities_firm_trading과 동일한 요청/파싱)
 
-            response = self.client.request(
-                api_id="ka10078",
-                body=body,
-                path="mrkcond"
-            )
+        Returns:
+            TRCall (파싱 결과는 get_securities_firm_trading 반환값과 같음)
+        """
+        from datetime import datetime, timedelta
+
+        # 날짜 범위 계산
+        end_date = datetime.strptime(get_last_trading_date(), "%Y%m%d")
+        start_date = end_date - timedelta(days=days)
+        start_dt_str = start_date.strftime("%Y%m%d")
+        end_dt_str = end_date.strftime("%Y%m%d")
+
+        body = {
+            "mmcm_cd": firm_code,      # 회원사코드
+            "stk_cd": stock_code,      # 종목코드
+            "strt_dt": start_dt_str,   # 시작일자
+            "end_dt": end_dt_str       # 종료일자
+        }
 
+        def parse(response: Optional[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
             if response and response.get('return_code') == 0:
                 # 응답 키 자동 탐색
                 data_keys = [k for k in response.keys() if k not in ['return_code', 'return_msg', 'api-id', 'cont-yn', 'next-key']]
@@ -512,11 +549,7 @@ class InvestorDataAPI:
                 logger.error(f"증권사별 매매동향 조회 실패: {response.get('return_msg')}")
                 return None
 
-        except Exception as e:
-            logger.error(f"증권사별 매매동향 조회 중 예외 발생: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+        return TRCall("ka10078", body, "mrkcond", parse)
 
     def get_execution_intensity(
         self,
@@ -540,12 +573,28 @@ class InvestorDataAPI:
             }
         """
         try:
-            response = self.client.request(
-                api_id="ka10047",
-                body={"stk_cd": stock_code},
-                path="mrkcond"
-            )
+            return self.execution_intensity_call(stock_code, days).run(self.client)
+
+        except Exception as e:
+            logger.error(f"체결강도 조회 중 예외 발생: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
 
+    def execution_intensity_call(
+        self,
+        stock_code: str,
+        days: int = 1
+    ) -> TRCall:
+        """
+        체결강도 TR 호출 정의 (get_execution_intensity와 동일한 요청/파싱)
+
+        Returns:
+            TRCall (파싱 결과는 get_execution_intensity 반환값과 같음)
+        """
+        body = {"stk_cd": stock_code}
+
+        def parse(response: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
             if response and response.get('return_code') == 0:
                 # 응답 키 자동 탐색
                 data_keys = [k for k in response.keys() if k not in ['return_code', 'return_msg', 'api-id', 'cont-yn', 'next-key']]
@@ -582,11 +631,7 @@ class InvestorDataAPI:
                 logger.error(f"체결강도 조회 실패: {response.get('return_msg')}")
                 return None
 
-        except Exception as e:
-            logger.error(f"체결강도 조회 중 예외 발생: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+        return TRCall("ka10047", body, "mrkcond", parse)
 
     def get_program_trading(
         self,
@@ -611,16 +656,32 @@ class InvestorDataAPI:
             }
         """
         try:
-            response = self.client.request(
-                api_id="ka90013",
-                body={
-                    "stk_cd": stock_code,
-                    "amt_qty_tp": "1",  # 1:금액
-                    "date": ""  # 빈 값이면 최근일
-                },
-                path="mrkcond"
-            )
+            return self.program_trading_call(stock_code, days).run(self.client)
 
+        except Exception as e:
+            logger.error(f"프로그램매매 조회 중 예외 발생: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
+
+    def program_trading_call(
+        self,
+        stock_code: str,
+        days: int = 1
+    ) -> TRCall:
+        """
+        프로그램매매 추이 TR 호출 정의 (get_program_trading과 동일한 요청/파싱)
+
+        Returns:
+            TRCall (파싱 결과는 get_program_trading 반환값과 같음)
+        """
+        body = {
+            "stk_cd": stock_code,
+            "amt_qty_tp": "1",  # 1:금액
+            "date": ""  # 빈 값이면 최근일
+        }
+
+        def parse(response: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
             if response and response.get('return_code') == 0:
                 # 응답 키 자동 탐색
                 data_keys = [k for k in response.keys() if k not in ['return_code', 'return_msg', 'api-id', 'cont-yn', 'next-key']]
@@ -669,11 +730,7 @@ class InvestorDataAPI:
                 logger.error(f"프로그램매매 조회 실패: {response.get('return_msg')}")
                 return None
 
-        except Exception as e:
-            logger.error(f"프로그램매매 조회 중 예외 발생: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+        return TRCall("ka90013", body, "mrkcond", parse)
 
 
 __all__ = ['InvestorDataAPI']
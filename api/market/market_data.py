@@ -4,6 +4,7 @@ api/market/market_data.py
 """
 import logging
 from typing import Dict, Any, Optional
+from .tr_call import TRCall
 
 logger = logging.getLogger(__name__)
 
@@ -87,46 +88,12 @@ class MarketDataAPI:
                         return price_info
 
         # 기본 코드로 조회 (일반 시간 또는 NXT fallback)
-        body = {"stk_cd": base_code}
-
-        response = self.client.request(
-            api_id="ka10003",
-            body=body,
-            path="stkinfo"
-        )
-
-        if response and response.get('return_code') == 0:
-            # ka10003 응답: cntr_infr 리스트
-            cntr_infr = response.get('cntr_infr', [])
-
-            if cntr_infr and len(cntr_infr) > 0:
-                # 최신 체결 정보 (첫 번째 항목)
-                latest = cntr_infr[0]
-
-                # 현재가 파싱 (+/- 부호 제거)
-                cur_prc_str = latest.get('cur_prc', '0')
-                current_price = abs(int(cur_prc_str.replace('+', '').replace('-', '')))
-
-                # 정규화된 응답
-                price_info = {
-                    'current_price': current_price,
-                    'cur_prc': current_price,  # 원본 필드명도 유지
-                    'change': latest.get('pred_pre', '0'),
-                    'change_rate': latest.get('pre_rt', '0'),
-                    'volume': latest.get('cntr_trde_qty', '0'),
-                    'acc_volume': latest.get('acc_trde_qty', '0'),
-                    'acc_trading_value': latest.get('acc_trde_prica', '0'),
-                    'time': latest.get('tm', ''),
-                    'stex_tp': latest.get('stex_tp', ''),
-                    'source': 'nxt_realtime' if is_nxt else 'regular_market',
-                }
-
-                logger.info(f"{base_code} 현재가: {current_price:,}원 (출처: {price_info['source']})")
-                return price_info
-            else:
-                logger.warning(f"현재가 조회 실패: 체결정보 없음")
-        else:
-            logger.warning(f"현재가 조회 API 실패: {response.get('return_msg') if response else 'No response'}")
+        price_info = self.stock_price_call(
+            base_code,
+            source='nxt_realtime' if is_nxt else 'regular_market'
+        ).run(self.client)
+        if price_info:
+            return price_info
 
         # Fallback 1: 호가 정보에서 현재가 추출 시도 (NXT 코드)
         if use_fallback:
@@ -258,63 +225,124 @@ class MarketDataAPI:
                         logger.warning(f"{nx_code} NXT 호가 파싱 실패: {e}, fallback to 기본 코드")
 
         # 기본 코드로 조회 (일반 시간 또는 NXT fallback)
-        body = {"stk_cd": base_code}
+        return self.orderbook_call(base_code).run(self.client)
 
-        response = self.client.request(
-            api_id="ka10004",
-            body=body,
-            path="mrkcond"
-        )
+    def stock_price_call(self, stock_code: str, source: str = 'regular_market') -> TRCall:
+        """
+        체결정보 TR 호출 정의 (get_stock_price의 기본 코드 조회와 동일한 요청/파싱)
 
-        if response and response.get('return_code') == 0:
-            # ka10004 응답은 output 키 없이 바로 데이터가 옴
-            orderbook = response
-
-            # 매도1호가 / 매수1호가 파싱
-            sel_fpr_bid = orderbook.get('sel_fpr_bid', '0').replace('+', '').replace('-', '')
-            buy_fpr_bid = orderbook.get('buy_fpr_bid', '0').replace('+', '').replace('-', '')
-
-            sell_price = abs(int(sel_fpr_bid)) if sel_fpr_bid and sel_fpr_bid != '0' else 0
-            buy_price = abs(int(buy_fpr_bid)) if buy_fpr_bid and buy_fpr_bid != '0' else 0
-
-            # 총잔량 파싱
-            tot_sel_req = orderbook.get('tot_sel_req', '0').replace('+', '').replace('-', '')
-            tot_buy_req = orderbook.get('tot_buy_req', '0').replace('+', '').replace('-', '')
-
-            total_sell_qty = abs(int(tot_sel_req)) if tot_sel_req and tot_sel_req != '0' else 0
-            total_buy_qty = abs(int(tot_buy_req)) if tot_buy_req and tot_buy_req != '0' else 0
-
-            # 정규화된 응답
-            orderbook['sell_price'] = sell_price  # 매도1호가
-            orderbook['buy_price'] = buy_price    # 매수1호가
-
-            # scanner_pipeline.py 호환 필드명 추가
-            orderbook['매도_총잔량'] = total_sell_qty
-            orderbook['매수_총잔량'] = total_buy_qty
-
-            # 중간가 계산
-            if sell_price > 0 and buy_price > 0:
-                orderbook['mid_price'] = (sell_price + buy_price) // 2
-            elif sell_price > 0:
-                orderbook['mid_price'] = sell_price
-            elif buy_price > 0:
-                orderbook['mid_price'] = buy_price
-            else:
-                orderbook['mid_price'] = 0
+        NXT 코드 시도와 호가 fallback은 포함하지 않는다.
 
-            # 현재가 필드 추가 (scanner 호환)
-            orderbook['현재가'] = orderbook['mid_price']
+        Args:
+            stock_code: 종목코드 (기본 코드)
+            source: 결과의 'source' 필드 값
 
-            logger.info(
-                f"{base_code} 호가 조회 완료: "
-                f"매도1={sell_price:,}, 매수1={buy_price:,}, "
-                f"총잔량(매도={total_sell_qty:,}, 매수={total_buy_qty:,})"
-            )
-            return orderbook
-        else:
-            logger.error(f"호가 조회 실패: {response.get('return_msg') if response else 'No response'}")
+        Returns:
+            TRCall (실패 시 파싱 결과 None)
+        """
+        body = {"stk_cd": stock_code}
+
+        def parse(response: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+            if response and response.get('return_code') == 0:
+                # ka10003 응답: cntr_infr 리스트
+                cntr_infr = response.get('cntr_infr', [])
+
+                if cntr_infr and len(cntr_infr) > 0:
+                    # 최신 체결 정보 (첫 번째 항목)
+                    latest = cntr_infr[0]
+
+                    # 현재가 파싱 (+/- 부호 제거)
+                    cur_prc_str = latest.get('cur_prc', '0')
+                    current_price = abs(int(cur_prc_str.replace('+', '').replace('-', '')))
+
+                    # 정규화된 응답
+                    price_info = {
+                        'current_price': current_price,
+                        'cur_prc': current_price,  # 원본 필드명도 유지
+                        'change': latest.get('pred_pre', '0'),
+                        'change_rate': latest.get('pre_rt', '0'),
+                        'volume': latest.get('cntr_trde_qty', '0'),
+                        'acc_volume': latest.get('acc_trde_qty', '0'),
+                        'acc_trading_value': latest.get('acc_trde_prica', '0'),
+                        'time': latest.get('tm', ''),
+                        'stex_tp': latest.get('stex_tp', ''),
+                        'source': source,
+                    }
+
+                    logger.info(f"{stock_code} 현재가: {current_price:,}원 (출처: {price_info['source']})")
+                    return price_info
+                else:
+                    logger.warning(f"현재가 조회 실패: 체결정보 없음")
+            else:
+                logger.warning(f"현재가 조회 API 실패: {response.get('return_msg') if response else 'No response'}")
             return None
 
+        return TRCall("ka10003", body, "stkinfo", parse)
+
+    def orderbook_call(self, stock_code: str) -> TRCall:
+        """
+        호가 TR 호출 정의 (get_orderbook의 기본 코드 조회와 동일한 요청/파싱)
+
+        Args:
+            stock_code: 종목코드 (기본 코드)
+
+        Returns:
+            TRCall (실패 시 파싱 결과 None)
+        """
+        body = {"stk_cd": stock_code}
+
+        def parse(response: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+            if response and response.get('return_code') == 0:
+                # ka10004 응답은 output 키 없이 바로 데이터가 옴
+                orderbook = response
+
+                # 매도1호가 / 매수1호가 파싱
+                sel_fpr_bid = orderbook.get('sel_fpr_bid', '0').replace('+', '').replace('-', '')
+                buy_fpr_bid = orderbook.get('buy_fpr_bid', '0').replace('+', '').replace('-', '')
+
+                sell_price = abs(int(sel_fpr_bid)) if sel_fpr_bid and sel_fpr_bid != '0' else 0
+                buy_price = abs(int(buy_fpr_bid)) if buy_fpr_bid and buy_fpr_bid != '0' else 0
+
+                # 총잔량 파싱
+                tot_sel_req = orderbook.get('tot_sel_req', '0').replace('+', '').replace('-', '')
+                tot_buy_req = orderbook.get('tot_buy_req', '0').replace('+', '').replace('-', '')
+
+                total_sell_qty = abs(int(tot_sel_req)) if tot_sel_req and tot_sel_req != '0' else 0
+                total_buy_qty = abs(int(tot_buy_req)) if tot_buy_req and tot_buy_req != '0' else 0
+
+                # 정규화된 응답
+                orderbook['sell_price'] = sell_price  # 매도1호가
+                orderbook['buy_price'] = buy_price    # 매수1호가
+
+                # scanner_pipeline.py 호환 필드명 추가
+                orderbook['매도_총잔량'] = total_sell_qty
+                orderbook['매수_총잔량'] = total_buy_qty
+
+                # 중간가 계산
+                if sell_price > 0 and buy_price > 0:
+                    orderbook['mid_price'] = (sell_price + buy_price) // 2
+                elif sell_price > 0:
+                    orderbook['mid_price'] = sell_price
+                elif buy_price > 0:
+                    orderbook['mid_price'] = buy_price
+                else:
+                    orderbook['mid_price'] = 0
+
+                # 현재가 필드 추가 (scanner 호환)
+                orderbook['현재가'] = orderbook['mid_price']
+
+                logger.info(
+                    f"{stock_code} 호가 조회 완료: "
+                    f"매도1={sell_price:,}, 매수1={buy_price:,}, "
+                    f"총잔량(매도={total_sell_qty:,}, 매수={total_buy_qty:,})"
+                )
+                return orderbook
+            else:
+                logger.error(f"호가 조회 실패: {response.get('return_msg') if response else 'No response'}")
+                return None
+
+        return TRCall("ka10004", body, "mrkcond", parse)
+
     def get_bid_ask(self, stock_code: str) -> Optional[Dict[str, Any]]:
         """
         호가 데이터 조회 (get_orderbook의 별칭)
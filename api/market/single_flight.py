@@ -0,0 +1,288 @@
+"""
+api/market/single_flight.py
+시장 데이터 TR 중복 요청 병합 (single-flight)
+
+한 사이클 안에서 여러 모듈이 같은 종목의 같은 TR을 요청하는 경우
+(딥스캔, 스코어링, 가상매매 보강, 대시보드 차트 등):
+- 진행 중인 동일 요청이 있으면 새로 호출하지 않고 그 응답을 함께 받음
+- 성공 응답은 TR별 짧은 유효 시간 동안 재사용
+
+요청 키 = api_id + path + HTTP 메서드 + 정규화된 body
+"""
+import copy
+import json
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# TR별 응답 재사용 시간 (초). 없는 TR은 DEFAULT_TTL (0 = 진행 중 요청 병합만)
+DEFAULT_FRESHNESS = {
+    # 시세/호가
+    'ka10003': 1.0,   # 체결정보
+    'ka10004': 1.0,   # 호가
+    # 차트
+    'ka10080': 5.0,   # 분봉
+    'ka10081': 30.0,  # 일봉
+    # 투자자/프로그램/증권사
+    'ka10045': 30.0,
+    'ka10047': 10.0,
+    'ka10059': 30.0,
+    'ka10063': 30.0,
+    'ka10065': 30.0,
+    'ka10066': 30.0,
+    'ka10078': 30.0,
+    'ka90009': 30.0,
+    'ka90013': 10.0,
+    # 순위
+    'ka10023': 10.0,
+    'ka10027': 10.0,
+    'ka10028': 10.0,
+    'ka10031': 10.0,
+    'ka10032': 10.0,
+    'ka10033': 10.0,
+    'ka10034': 10.0,
+    'ka10035': 10.0,
+}
+
+
+def normalize_body(body: Optional[Dict[str, Any]]) -> str:
+    """
+    요청 body 정규화 (키 정렬, 값 문자열화)
+
+    {'stk_cd': '005930', 'cnt': 20}과 {'cnt': '20', 'stk_cd': '005930'}은 같은 키가 된다.
+    """
+    if not body:
+        return ''
+
+    def _norm(value):
+        if isinstance(value, dict):
+            return {str(k): _norm(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [_norm(v) for v in value]
+        return '' if value is None else str(value)
+
+    return json.dumps(_norm(body), sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+
+
+def _is_success(result: Any) -> bool:
+    """재사용 가능한 응답인지 (return_code 0)"""
+    return isinstance(result, dict) and result.get('return_code', 0) == 0
+
+
+class _Call:
+    """진행 중인 요청"""
+
+    __slots__ = ('event', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlightGroup:
+    """
+    키별 요청 병합 + 짧은 유효 시간 캐시
+
+    Thread-safe. 같은 키의 동시 호출 중 하나만 fn을 실행하고 나머지는 결과를 기다린다.
+    반환값은 호출자마다 복사본이므로 응답을 수정해도 다른 호출자에게 영향이 없다.
+    """
+
+    def __init__(
+        self,
+        freshness: Optional[Dict[str, float]] = None,
+        default_ttl: float = 0.0,
+        max_entries: int = 2048
+    ):
+        """
+        Args:
+            freshness: {api_id: 유효 시간(초)}
+            default_ttl: freshness에 없는 TR의 유효 시간
+            max_entries: 보관할 최대 응답 수 (LRU)
+        """
+        self.freshness = dict(DEFAULT_FRESHNESS if freshness is None else freshness)
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple, _Call] = {}
+        self._fresh: 'OrderedDict[Tuple, Tuple[float, Any]]' = OrderedDict()
+
+        # 통계
+        self.calls = 0
+        self.fresh_hits = 0
+        self.coalesced = 0
+        self.executed = 0
+
+    def ttl_for(self, api_id: str) -> float:
+        """TR 유효 시간"""
+        return self.freshness.get(api_id, self.default_ttl)
+
+    def do(self, key: Tuple, api_id: str, fn: Callable[[], Any]) -> Any:
+        """
+        키 단위로 병합하여 fn 실행
+
+        Args:
+            key: 요청 키
+            api_id: TR ID (유효 시간 결정)
+            fn: 실제 호출 함수
+
+        Returns:
+            fn 결과 (복사본)
+        """
+        now = time.monotonic()
+        with self._lock:
+            self.calls += 1
+
+            entry = self._fresh.get(key)
+            if entry is not None:
+                expires_at, result = entry
+                if now < expires_at:
+                    self._fresh.move_to_end(key)
+                    self.fresh_hits += 1
+                    return copy.deepcopy(result)
+                del self._fresh[key]
+
+            call = self._inflight.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._inflight[key] = _Call()
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                ttl = self.ttl_for(api_id)
+                if call.error is None and ttl > 0 and _is_success(call.result):
+                    self._fresh[key] = (time.monotonic() + ttl, copy.deepcopy(call.result))
+                    self._fresh.move_to_end(key)
+                    while len(self._fresh) > self.max_entries:
+                        self._fresh.popitem(last=False)
+            call.event.set()
+
+        # 대기자가 있으면 리더도 복사본을 받음 (대기자는 call.result를 복사)
+        return copy.deepcopy(call.result) if call.waiters else call.result
+
+    def invalidate(self, api_id: Optional[str] = None):
+        """유효 시간 캐시 무효화 (api_id None이면 전체)"""
+        with self._lock:
+            if api_id is None:
+                self._fresh.clear()
+                return
+            for key in [k for k in self._fresh if k[0] == api_id]:
+                del self._fresh[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계"""
+        with self._lock:
+            saved = self.fresh_hits + self.coalesced
+            return {
+                'calls': self.calls,
+                'executed': self.executed,
+                'fresh_hits': self.fresh_hits,
+                'coalesced': self.coalesced,
+                'saved_ratio': saved / self.calls if self.calls else 0.0,
+                'inflight': len(self._inflight),
+                'entries': len(self._fresh),
+            }
+
+
+class CoalescingClient:
+    """
+    REST 클라이언트 래퍼
+
+    request()만 SingleFlightGroup을 거치고 나머지 속성은 원본 클라이언트로 위임한다.
+    """
+
+    def __init__(self, client, group: SingleFlightGroup):
+        self._client = client
+        self.group = group
+
+    def request(
+        self,
+        api_id: str,
+        body: Dict[str, Any],
+        path: str,
+        http_method: str = "POST"
+    ) -> Optional[Dict[str, Any]]:
+        """API 요청 (동일 요청 병합)"""
+        key = (api_id, path, http_method.upper(), normalize_body(body))
+        return self.group.do(
+            key, api_id,
+            lambda: self._client.request(api_id=api_id, body=body, path=path, http_method=http_method)
+        )
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+# 클라이언트별 공용 그룹 (MarketAPI를 여러 번 생성해도 같은 그룹 사용)
+_groups: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+_groups_lock = threading.Lock()
+
+
+def _create_group_from_config() -> SingleFlightGroup:
+    """config/settings.py의 TR_COALESCING 설정으로 그룹 생성"""
+    try:
+        from config.settings import TR_COALESCING
+    except ImportError:
+        return SingleFlightGroup()
+
+    freshness = dict(DEFAULT_FRESHNESS)
+    freshness.update(TR_COALESCING.get('FRESHNESS', {}) or {})
+    return SingleFlightGroup(
+        freshness=freshness,
+        default_ttl=TR_COALESCING.get('DEFAULT_TTL', 0.0),
+        max_entries=TR_COALESCING.get('MAX_ENTRIES', 2048),
+    )
+
+
+def get_coalescing_client(client) -> CoalescingClient:
+    """
+    클라이언트 공용 SingleFlightGroup을 사용하는 CoalescingClient 반환
+
+    Args:
+        client: KiwoomRESTClient 인스턴스 (이미 CoalescingClient면 그대로 반환)
+    """
+    if isinstance(client, CoalescingClient):
+        return client
+
+    with _groups_lock:
+        try:
+            group = _groups.get(client)
+        except TypeError:  # weakref 불가 객체
+            return CoalescingClient(client, _create_group_from_config())
+        if group is None:
+            group = _groups[client] = _create_group_from_config()
+    return CoalescingClient(client, group)
+
+
+__all__ = [
+    'SingleFlightGroup',
+    'CoalescingClient',
+    'get_coalescing_client',
+    'normalize_body',
+    'DEFAULT_FRESHNESS',
+]
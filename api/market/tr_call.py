@@ -0,0 +1,32 @@
+"""
+api/market/tr_call.py
+단일 TR 호출 정의
+
+요청(api_id, body, path)과 응답 파싱을 한 객체로 묶어
+동기 클라이언트 호출(run)과 비동기 일괄 호출(request_many의 spec)이
+같은 정의를 공유하도록 한다.
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+@dataclass
+class TRCall:
+    """TR 요청 + 응답 파서"""
+    api_id: str                                   # 키움 TR id (예: 'ka10059')
+    body: Dict[str, Any]                          # 요청 body
+    path: str                                     # REST 경로 (예: 'stkinfo')
+    parse: Callable[[Optional[Dict[str, Any]]], Any]  # 원시 응답 → 결과
+
+    @property
+    def spec(self) -> Tuple[str, Dict[str, Any], str]:
+        """request_many용 (api_id, body, path)"""
+        return (self.api_id, self.body, self.path)
+
+    def run(self, client) -> Any:
+        """동기 클라이언트로 호출 후 파싱"""
+        response = client.request(api_id=self.api_id, body=self.body, path=self.path)
+        return self.parse(response)
+
+
+__all__ = ['TRCall']
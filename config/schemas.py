@@ -230,6 +230,8 @@ class AIConfig(BaseModel):
     )
     timeout_seconds: int = Field(default=30, ge=5, le=120, description="타임아웃 (초)")
     analysis_interval: int = Field(default=300, ge=0, description="분석 주기 (초)")
+    review_concurrency: int = Field(default=3, ge=1, le=10, description="스캔 후보 AI 검토 동시 실행 수")
+    review_deadline_seconds: float = Field(default=45.0, ge=5.0, description="사이클당 AI 검토 마감 시간 (초)")
     models: List[str] = Field(
         default=["gemini", "ensemble"],
         description="사용할 AI 모델 목록"
@@ -586,6 +588,12 @@ class MainCycleConfig(BaseModel):
     sleep_seconds: int = Field(default=60, ge=1, description="메인 루프 대기 시간 (초)")
     health_check_interval: int = Field(default=300, ge=60, description="헬스 체크 간격 (초)")
 
+    # 이벤트 기반 엔진 (False면 sleep_seconds 주기 폴링 루프)
+    event_driven: bool = Field(default=True, description="이벤트 기반 엔진 사용")
+    account_refresh_interval: int = Field(default=30, ge=1, description="계좌 갱신 간격 (초)")
+    control_check_interval: int = Field(default=5, ge=1, description="제어 파일 확인 간격 (초)")
+    market_status_interval: int = Field(default=60, ge=1, description="장 상태 확인 간격 (초)")
+
     # Backward compatibility
     @property
     def SLEEP_SECONDS(self) -> int:
@@ -30,16 +30,39 @@ API_RATE_LIMIT = {
     'REST_CALL_INTERVAL': 0.3,  # 초
     'REST_MAX_RETRIES': 3,
     'REST_RETRY_BACKOFF': 1.0,
+    'REST_CALLS_PER_SECOND': None,  # 전역 초당 호출 한도 (None이면 REST_CALL_INTERVAL로 환산)
+    'REST_BURST': None,  # 전역 버스트 용량 (None이면 초당 한도와 동일)
+    'REST_RATE_LIMIT_TIMEOUT': 30.0,  # 호출 예산 대기 최대 시간 (초)
+    'THROTTLE_BACKOFF_FACTOR': 0.5,  # 429/한도 초과 시 속도 감소 배율
+    'THROTTLE_MAX_PENALTY': 30.0,  # 한도 초과 시 최대 호출 중지 시간 (초)
+    'TR_CALLS_PER_SECOND': 2.0,  # api-id(TR)별 기본 초당 호출 예산 (전역 한도보다 낮게 → 한 TR의 전역 예산 독점 방지)
+    'TR_BURST': 2,
+    'TR_RATE_OVERRIDES': {},  # {'ka10078': 3.0} 형태로 TR별 예산 지정
     'WEBSOCKET_RECONNECT_DELAY': 5,
     'WEBSOCKET_MAX_RECONNECTS': 10,
 }
 
+# 시장 데이터 TR 중복 요청 병합 (api/market/single_flight.py)
+TR_COALESCING = {
+    'ENABLED': True,
+    'DEFAULT_TTL': 0.0,  # FRESHNESS에 없는 TR의 응답 재사용 시간 (0 = 진행 중 요청 병합만)
+    'FRESHNESS': {},  # {'ka10081': 60.0} 형태로 TR별 재사용 시간 지정 (기본값 덮어쓰기)
+    'MAX_ENTRIES': 2048,
+}
+
 # 메인 사이클 설정
 MAIN_CYCLE_CONFIG = {
     'SLEEP_SECONDS': 60,
     'HEALTH_CHECK_INTERVAL': 300,  # 5분
 }
 
+# 시작 시간 프로파일링 (utils/startup_profiler.py, main.py --profile-startup)
+STARTUP_PROFILE = {
+    'ENABLED': os.getenv('AUTOTRADE_PROFILE_STARTUP', '0') == '1',  # 모듈별 import / 컴포넌트별 초기화 시간 보고
+    'BUDGET_SECONDS': float(os.getenv('AUTOTRADE_STARTUP_BUDGET', '20')),  # 초과 시 느린 구간 경고
+    'TOP_N': 20,
+}
+
 # 기본 제어 상태
 def get_default_control_state() -> Dict[str, Any]:
     """기본 제어 상태 반환"""
@@ -72,7 +95,9 @@ __all__ = [
     'LOG_CONFIG',
     'FILE_PATHS',
     'API_RATE_LIMIT',
+    'TR_COALESCING',
     'MAIN_CYCLE_CONFIG',
+    'STARTUP_PROFILE',
     'get_default_control_state',
     'validate_environment',
 ]
\ No newline at end of file
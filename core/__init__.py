@@ -8,38 +8,96 @@ v4.2 CRITICAL #2: 표준 타입 시스템 추가
 
 v6.0: OpenAPI 클라이언트 추가
 - KiwoomOpenAPIClient (koapy 기반 자동매매)
+
+패키지 속성은 처음 접근할 때 해당 모듈을 import한다 (PEP 562).
+`from core.trading_types import Position`처럼 하위 모듈만 쓰면
+requests/aiohttp 기반 클라이언트는 로드되지 않는다.
 """
-from .rest_client import KiwoomRESTClient
-from .openapi_client import KiwoomOpenAPIClient, get_openapi_client
-from .exceptions import (
-    KiwoomAPIError,
-    AuthenticationError,
-    TokenExpiredError,
-    RateLimitError,
-    NetworkError,
-    InvalidResponseError,
-    WebSocketError,
-    WebSocketConnectionError,
-    WebSocketMessageError,
-    ConfigurationError,
-    ValidationError,
-    StrategyError,
-    OrderError,
+import importlib
+from typing import TYPE_CHECKING
+
+_EXCEPTIONS = (
+    'KiwoomAPIError',
+    'AuthenticationError',
+    'TokenExpiredError',
+    'RateLimitError',
+    'NetworkError',
+    'InvalidResponseError',
+    'WebSocketError',
+    'WebSocketConnectionError',
+    'WebSocketMessageError',
+    'ConfigurationError',
+    'ValidationError',
+    'StrategyError',
+    'OrderError',
 )
 
 # v4.2 Standard Types (CRITICAL #2)
-from .trading_types import (
-    OrderAction,
-    OrderType,
-    PositionStatus,
-    Position,
-    Trade,
-    MarketSnapshot,
+_TRADING_TYPES = (
+    'OrderAction',
+    'OrderType',
+    'PositionStatus',
+    'Position',
+    'Trade',
+    'MarketSnapshot',
 )
 
+# 공개 이름 → 정의 모듈
+_LAZY_EXPORTS = {
+    'KiwoomRESTClient': '.rest_client',
+    'AsyncKiwoomRESTClient': '.async_rest_client',
+    'KiwoomOpenAPIClient': '.openapi_client',
+    'get_openapi_client': '.openapi_client',
+    **{name: '.exceptions' for name in _EXCEPTIONS},
+    **{name: '.trading_types' for name in _TRADING_TYPES},
+}
+
+if TYPE_CHECKING:
+    from .rest_client import KiwoomRESTClient
+    from .async_rest_client import AsyncKiwoomRESTClient
+    from .openapi_client import KiwoomOpenAPIClient, get_openapi_client
+    from .exceptions import (
+        KiwoomAPIError,
+        AuthenticationError,
+        TokenExpiredError,
+        RateLimitError,
+        NetworkError,
+        InvalidResponseError,
+        WebSocketError,
+        WebSocketConnectionError,
+        WebSocketMessageError,
+        ConfigurationError,
+        ValidationError,
+        StrategyError,
+        OrderError,
+    )
+    from .trading_types import (
+        OrderAction,
+        OrderType,
+        PositionStatus,
+        Position,
+        Trade,
+        MarketSnapshot,
+    )
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
 __all__ = [
     # REST Client
     'KiwoomRESTClient',
+    'AsyncKiwoomRESTClient',
 
     # OpenAPI Client (v6.0)
     'KiwoomOpenAPIClient',
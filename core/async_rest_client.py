@@ -0,0 +1,514 @@
+"""
+core/async_rest_client.py
+키움증권 REST API 비동기 클라이언트 (aiohttp)
+
+- 공유 커넥션 풀 (aiohttp.TCPConnector, keep-alive)
+- 토큰 갱신 단일화: 동시에 만료를 감지한 요청들이 한 번의 재인증만 기다림
+- KiwoomRESTClient와 같은 RateLimiter 예산 공유
+- request_many(): (api_id, body, path) 목록을 동시에 실행하고 입력 순서대로 반환
+"""
+import asyncio
+import concurrent.futures
+import datetime
+import json
+import logging
+import threading
+from typing import Any, Coroutine, Dict, List, Optional, Sequence, Tuple, Union
+
+from .rate_limiter import RateLimiter, get_shared_rate_limiter
+from .rest_client import KiwoomRESTClient, build_request_url
+
+logger = logging.getLogger(__name__)
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    logger.warning("aiohttp not installed. AsyncKiwoomRESTClient disabled.")
+
+
+# (api_id, body, path) 또는 (api_id, body, path, http_method)
+RequestSpec = Union[Tuple[str, Dict[str, Any], str], Tuple[str, Dict[str, Any], str, str]]
+
+
+class AsyncKiwoomRESTClient:
+    """
+    키움증권 REST API 비동기 클라이언트
+
+    응답 형식과 에러 코드(return_code)는 KiwoomRESTClient와 동일하다.
+
+    Usage:
+        async with AsyncKiwoomRESTClient.from_sync_client(client) as aclient:
+            results = await aclient.request_many([
+                ('ka10081', {'stk_cd': '005930', 'base_dt': '20250101', 'upd_stkpc_tp': '1'}, 'chart'),
+                ('ka10059', {'stk_cd': '005930', ...}, 'stkinfo'),
+            ])
+
+        # 스레드 코드에서 (백그라운드 이벤트 루프 사용)
+        results = aclient.request_many_sync(specs)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        appkey: str,
+        appsecret: str,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_connections: int = 20,
+        max_concurrency: int = 20,
+        request_timeout: float = 10.0,
+        rate_limit_timeout: float = 30.0,
+        max_retries: int = 3
+    ):
+        """
+        Args:
+            base_url: REST API 기본 URL
+            appkey: 앱키
+            appsecret: 시크릿키
+            rate_limiter: 호출 예산 (None이면 프로세스 공용 RateLimiter)
+            max_connections: 커넥션 풀 크기
+            max_concurrency: request_many 동시 실행 수
+            request_timeout: 요청 타임아웃 (초)
+            rate_limit_timeout: 호출 예산 대기 최대 시간 (초)
+            max_retries: 호출 한도 초과 시 재시도 횟수
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp가 필요합니다: pip install aiohttp")
+
+        self.base_url = base_url
+        self.appkey = appkey
+        self.appsecret = appsecret
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
+        self.max_connections = max_connections
+        self.max_concurrency = max_concurrency
+        self.request_timeout = request_timeout
+        self.rate_limit_timeout = rate_limit_timeout
+        self.max_retries = max_retries
+
+        # 토큰 관리
+        self.token: Optional[str] = None
+        self.token_expiry: datetime.datetime = datetime.datetime.now()
+        self.last_error_msg: Optional[str] = None
+
+        # 이벤트 루프에 묶이는 객체는 첫 사용 시 생성
+        self._session: Optional['aiohttp.ClientSession'] = None
+        self._token_lock: Optional[asyncio.Lock] = None
+
+        # request_many_sync용 백그라운드 이벤트 루프
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+        # 통계
+        self.token_refreshes = 0
+
+        # from_sync_client로 생성한 경우 토큰을 동기 클라이언트와 주고받음
+        self._sync_client: Optional[KiwoomRESTClient] = None
+
+    @classmethod
+    def from_sync_client(cls, client: KiwoomRESTClient, **kwargs) -> 'AsyncKiwoomRESTClient':
+        """
+        동기 클라이언트의 설정/토큰/호출 예산을 이어받아 생성
+
+        Args:
+            client: KiwoomRESTClient 인스턴스
+            **kwargs: 생성자 추가 인자
+        """
+        kwargs.setdefault('rate_limiter', getattr(client, 'rate_limiter', None))
+        kwargs.setdefault('rate_limit_timeout', getattr(client, 'rate_limit_timeout', 30.0))
+        kwargs.setdefault('max_retries', getattr(client, 'max_retries', 3))
+
+        aclient = cls(client.base_url, client.appkey, client.appsecret, **kwargs)
+        aclient._sync_client = client
+        aclient.token = client.token
+        aclient.token_expiry = client.token_expiry
+        return aclient
+
+    # ------------------------------------------------------------------
+    # 세션 / 루프 관리
+    # ------------------------------------------------------------------
+
+    async def _get_session(self) -> 'aiohttp.ClientSession':
+        """공유 HTTP 세션 (커넥션 풀) 반환"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                keepalive_timeout=30,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+            )
+            logger.info(f"비동기 HTTP 세션 생성 완료 (커넥션 풀 {self.max_connections}개)")
+        return self._session
+
+    def _get_token_lock(self) -> asyncio.Lock:
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+        return self._token_lock
+
+    async def close(self):
+        """세션 종료"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        # 락은 이벤트 루프에 묶이므로 다음 루프에서 새로 생성
+        self._token_lock = None
+
+    async def __aenter__(self):
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    # ------------------------------------------------------------------
+    # 토큰 관리
+    # ------------------------------------------------------------------
+
+    def _is_token_valid(self) -> bool:
+        """토큰 유효성 확인 (만료 1분 전까지 유효)"""
+        if not self.token:
+            return False
+        return datetime.datetime.now() < (self.token_expiry - datetime.timedelta(minutes=1))
+
+    async def _ensure_token(self, stale_token: Optional[str] = None) -> bool:
+        """
+        유효한 토큰 확보
+
+        토큰 락 안에서 다시 확인하므로, 동시에 만료를 감지한 요청이 여러 개여도
+        실제 발급 요청은 한 번만 나간다.
+
+        Args:
+            stale_token: 401을 받은 토큰 (이미 다른 요청이 갱신했으면 재발급하지 않음)
+        """
+        if stale_token is None and self._is_token_valid():
+            return True
+
+        async with self._get_token_lock():
+            if stale_token is not None and self.token != stale_token and self._is_token_valid():
+                return True
+            if stale_token is None and self._is_token_valid():
+                return True
+
+            # 동기 클라이언트가 먼저 갱신했으면 그 토큰을 사용
+            sync_client = self._sync_client
+            if (sync_client is not None and sync_client.token
+                    and sync_client.token not in (self.token, stale_token)):
+                self.token = sync_client.token
+                self.token_expiry = sync_client.token_expiry
+                if self._is_token_valid():
+                    return True
+
+            if not await self._issue_token():
+                return False
+
+            if sync_client is not None:
+                sync_client.token = self.token
+                sync_client.token_expiry = self.token_expiry
+            return True
+
+    async def _issue_token(self) -> bool:
+        """토큰 발급 (토큰 락 보유 상태에서 호출)"""
+        logger.info("API 토큰 발급 시도 (async)...")
+        session = await self._get_session()
+        payload = {
+            "grant_type": "client_credentials",
+            "appkey": self.appkey,
+            "secretkey": self.appsecret
+        }
+
+        try:
+            async with session.post(
+                f"{self.base_url}/oauth2/token",
+                headers={"content-type": "application/json;charset=UTF-8"},
+                data=json.dumps(payload),
+            ) as res:
+                if res.status != 200:
+                    text = await res.text()
+                    self._set_error(f"토큰 발급 실패 ({res.status}): {text[:200]}")
+                    return False
+                token_data = await res.json(content_type=None)
+
+        except asyncio.TimeoutError:
+            self._set_error("토큰 요청 시간 초과")
+            return False
+        except aiohttp.ClientError as e:
+            self._set_error(f"토큰 요청 네트워크 오류: {e}")
+            return False
+
+        access_token = token_data.get('token')
+        expires_dt_str = token_data.get('expires_dt')
+        if not access_token or not expires_dt_str:
+            self._set_error(
+                f"토큰 발급 실패 ({token_data.get('return_code', 'N/A')}): "
+                f"{token_data.get('return_msg', '알 수 없는 토큰 응답')}"
+            )
+            return False
+
+        try:
+            self.token_expiry = datetime.datetime.strptime(expires_dt_str, '%Y%m%d%H%M%S')
+        except ValueError:
+            self._set_error(f"토큰 만료 시간 파싱 실패: {expires_dt_str}")
+            return False
+
+        self.token = access_token
+        self.token_refreshes += 1
+        self.last_error_msg = None
+        logger.info(f"토큰 발급 성공 (async, 만료: {self.token_expiry.strftime('%Y-%m-%d %H:%M:%S')})")
+        return True
+
+    def _set_error(self, msg: str):
+        """에러 메시지 설정"""
+        self.last_error_msg = msg
+        logger.error(msg)
+
+    # ------------------------------------------------------------------
+    # 요청
+    # ------------------------------------------------------------------
+
+    async def _acquire_budget(self, api_id: str) -> bool:
+        """
+        RateLimiter에서 호출 1회분 획득 (이벤트 루프를 막지 않음)
+
+        동기 클라이언트 스레드와 같은 TR별 공정 대기열에서 차례를 기다린다.
+        """
+        return await self.rate_limiter.acquire_async(api_id, timeout=self.rate_limit_timeout)
+
+    async def request(
+        self,
+        api_id: str,
+        body: Dict[str, Any],
+        path: str,
+        http_method: str = "POST"
+    ) -> Dict[str, Any]:
+        """
+        API 요청 실행 (자동 토큰 관리)
+
+        Args:
+            api_id: API ID
+            body: 요청 본문
+            path: API 경로
+            http_method: HTTP 메서드
+
+        Returns:
+            API 응답 딕셔너리
+        """
+        if not await self._ensure_token():
+            return {"return_code": -401, "return_msg": f"토큰 갱신 실패: {self.last_error_msg}"}
+
+        return await self._execute_request(api_id, body, path, http_method)
+
+    async def _execute_request(
+        self,
+        api_id: str,
+        body: Dict[str, Any],
+        path: str,
+        http_method: str,
+        retry_on_auth: bool = True,
+        throttle_retries: int = 0
+    ) -> Dict[str, Any]:
+        """실제 API 요청 실행"""
+        if not await self._acquire_budget(api_id):
+            logger.error(f"API 호출 예산 대기 시간 초과 ({api_id})")
+            return {"return_code": -429, "return_msg": "API 호출 한도 대기 시간 초과"}
+
+        token = self.token
+        headers = {
+            "Content-Type": "application/json; charset=utf-8",
+            "authorization": f"Bearer {token}",
+            "api-id": api_id
+        }
+        url = build_request_url(self.base_url, path)
+        session = await self._get_session()
+
+        try:
+            if http_method.upper() == "POST":
+                request_ctx = session.post(
+                    url, headers=headers,
+                    data=json.dumps(body, ensure_ascii=False) if body else None
+                )
+            elif http_method.upper() == "GET":
+                request_ctx = session.get(url, headers=headers, params=body)
+            else:
+                return {"return_code": -101, "return_msg": f"지원하지 않는 HTTP 메서드: {http_method}"}
+
+            async with request_ctx as res:
+                status = res.status
+                retry_after = res.headers.get('Retry-After')
+                text = await res.text()
+
+        except asyncio.TimeoutError:
+            logger.error(f"API 요청 시간 초과 ({api_id})")
+            return {"return_code": -102, "return_msg": "API 요청 시간 초과"}
+        except aiohttp.ClientError as e:
+            logger.error(f"네트워크 오류 ({api_id}): {e}")
+            return {"return_code": -103, "return_msg": f"네트워크 오류: {e}"}
+
+        # 429 / 호출 한도 초과: 백오프 후 재시도
+        if KiwoomRESTClient._is_quota_exceeded(status):
+            try:
+                retry_after_sec = float(retry_after) if retry_after else None
+            except ValueError:
+                retry_after_sec = None
+            self.rate_limiter.report_throttled(api_id, retry_after_sec)
+            if throttle_retries < self.max_retries:
+                return await self._execute_request(
+                    api_id, body, path, http_method, retry_on_auth, throttle_retries + 1
+                )
+            return {"return_code": -429, "return_msg": "API 호출 한도 초과"}
+
+        # 401: 토큰 1회 갱신 후 재시도 (동시 401은 한 번의 재발급만 기다림)
+        if status == 401 and retry_on_auth:
+            logger.warning(f"401 에러 - 토큰 갱신 후 재시도 ({api_id})")
+            if await self._ensure_token(stale_token=token):
+                return await self._execute_request(api_id, body, path, http_method, retry_on_auth=False)
+            return {"return_code": -401, "return_msg": f"재시도 실패: {self.last_error_msg}"}
+
+        if status >= 400:
+            logger.error(f"HTTP 오류 ({api_id}): {status} - {text[:200]}")
+            return {
+                "return_code": -int(status),
+                "return_msg": f"HTTP 오류: {status}",
+                "error_detail": text[:200]
+            }
+
+        try:
+            result_data = json.loads(text)
+        except json.JSONDecodeError:
+            logger.error(f"JSON 파싱 실패 ({api_id}): {text[:200]}")
+            return {"return_code": -999, "return_msg": "응답 JSON 파싱 실패", "response_text": text[:200]}
+
+        if KiwoomRESTClient._is_quota_exceeded(status, result_data):
+            self.rate_limiter.report_throttled(api_id)
+            if throttle_retries < self.max_retries:
+                return await self._execute_request(
+                    api_id, body, path, http_method, retry_on_auth, throttle_retries + 1
+                )
+        else:
+            self.rate_limiter.report_success(api_id)
+
+        if result_data.get('return_code', 0) != 0:
+            logger.warning(f"API 로직 오류 ({api_id}): {result_data.get('return_msg')} (코드: {result_data.get('return_code')})")
+
+        return result_data
+
+    async def request_many(
+        self,
+        specs: Sequence[RequestSpec],
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 API 요청을 동시에 실행
+
+        Args:
+            specs: [(api_id, body, path), ...] 또는 [(api_id, body, path, http_method), ...]
+            max_concurrency: 동시 실행 수 (None이면 생성자 설정)
+
+        Returns:
+            입력 순서와 같은 응답 리스트 (예외는 return_code -104 응답으로 변환)
+        """
+        if not specs:
+            return []
+
+        # 첫 요청들이 동시에 토큰을 발급받지 않도록 미리 확보
+        await self._ensure_token()
+
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+
+        async def run(spec: RequestSpec) -> Dict[str, Any]:
+            api_id, body, path = spec[0], spec[1], spec[2]
+            http_method = spec[3] if len(spec) > 3 else "POST"
+            async with semaphore:
+                try:
+                    return await self.request(api_id, body, path, http_method)
+                except Exception as e:
+                    logger.error(f"예외 발생 ({api_id}): {e}", exc_info=True)
+                    return {"return_code": -104, "return_msg": f"내부 오류: {e}"}
+
+        return list(await asyncio.gather(*(run(spec) for spec in specs)))
+
+    # ------------------------------------------------------------------
+    # 동기 코드용 브리지
+    # ------------------------------------------------------------------
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """백그라운드 이벤트 루프 스레드 시작 (한 번만)"""
+        with self._loop_lock:
+            if self._loop is None or not self._loop_thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name='async-rest-client',
+                    daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        """
+        코루틴을 클라이언트 전용 백그라운드 루프에서 실행
+
+        세션/커넥션 풀이 그 루프에 묶이므로, 다른 스레드나 다른 이벤트 루프에서
+        요청할 때는 이 메서드로 넘긴다. 이벤트 루프 안에서는
+        asyncio.wrap_future()로 감싸 await 한다.
+
+        Returns:
+            concurrent.futures.Future
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def request_many_sync(
+        self,
+        specs: Sequence[RequestSpec],
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        스레드 코드에서 request_many 실행
+
+        모든 호출이 하나의 백그라운드 이벤트 루프와 커넥션 풀을 공유하므로
+        호출마다 스레드를 만들지 않는다.
+        """
+        return self.submit(self.request_many(specs, max_concurrency)).result(timeout)
+
+    def shutdown(self):
+        """백그라운드 루프와 세션 종료"""
+        with self._loop_lock:
+            loop = self._loop
+            if loop is None:
+                return
+            asyncio.run_coroutine_threadsafe(self.close(), loop).result(timeout=5)
+            loop.call_soon_threadsafe(loop.stop)
+            self._loop_thread.join(timeout=5)
+            self._loop = None
+            self._loop_thread = None
+
+
+# 동기 클라이언트별 공용 비동기 클라이언트 (백그라운드 루프/커넥션 풀을 호출 측끼리 공유)
+_shared_clients: Dict[KiwoomRESTClient, AsyncKiwoomRESTClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_async_client(client) -> Optional[AsyncKiwoomRESTClient]:
+    """
+    동기 클라이언트의 토큰/호출 예산을 이어받은 공용 AsyncKiwoomRESTClient 반환
+
+    Args:
+        client: KiwoomRESTClient 인스턴스
+
+    Returns:
+        AsyncKiwoomRESTClient (aiohttp가 없거나 KiwoomRESTClient가 아니면 None)
+    """
+    if not AIOHTTP_AVAILABLE or not isinstance(client, KiwoomRESTClient):
+        return None
+
+    with _shared_clients_lock:
+        aclient = _shared_clients.get(client)
+        if aclient is None:
+            aclient = _shared_clients[client] = AsyncKiwoomRESTClient.from_sync_client(client)
+    return aclient
+
+
+__all__ = ['AsyncKiwoomRESTClient', 'AIOHTTP_AVAILABLE', 'get_shared_async_client']
@@ -7,6 +7,8 @@ import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+from ai.review_executor import AIReviewExecutor, ReviewRequest
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,7 +22,14 @@ class StockScanner:
     - AI 검토 및 승인
     """
 
-    def __init__(self, strategy_manager, scoring_system, ai_analyzer):
+    def __init__(
+        self,
+        strategy_manager,
+        scoring_system,
+        ai_analyzer,
+        review_concurrency: int = 3,
+        review_deadline: float = 45.0
+    ):
         """
         초기화
 
@@ -28,10 +37,17 @@ class StockScanner:
             strategy_manager: 전략 매니저
             scoring_system: 스코어링 시스템
             ai_analyzer: AI 분석기
+            review_concurrency: AI 검토 동시 실행 수
+            review_deadline: 사이클당 AI 검토 마감 시간 (초)
         """
         self.strategy_manager = strategy_manager
         self.scoring_system = scoring_system
         self.ai_analyzer = ai_analyzer
+        self.review_executor = AIReviewExecutor(
+            ai_analyzer,
+            max_concurrency=review_concurrency,
+            deadline=review_deadline
+        )
 
         # 스캔 진행 상황
         self.scan_progress = {
@@ -197,12 +213,8 @@ class StockScanner:
 
         portfolio_info = self._get_portfolio_info(portfolio_manager)
 
-        for idx, candidate in enumerate(candidates, 1):
-            self.scan_progress['reviewing'] = f"{candidate.name} ({idx}/{len(candidates)})"
-
-            logger.info(f"\n🤖 [{idx}/{len(candidates)}] {candidate.name} AI 검토 중...")
-
-            # AI 분석 실행
+        requests = []
+        for candidate in candidates:
             scoring_result = scores[candidate.code]
 
             stock_data = {
@@ -228,24 +240,18 @@ class StockScanner:
                 }
             }
 
-            # AI 분석 (비동기는 동기로 호출)
-            import asyncio
-            try:
-                ai_analysis = asyncio.run(
-                    self.ai_analyzer.analyze_stock(
-                        stock_data,
-                        score_info=score_info,
-                        portfolio_info=portfolio_info
-                    )
-                )
-            except:
-                # 폴백: Mock 분석
-                ai_analysis = {
-                    'signal': 'hold',
-                    'confidence': 0.5,
-                    'reasons': ['AI 분석 실패'],
-                    'risks': []
-                }
+            requests.append(ReviewRequest(candidate.code, stock_data, score_info, portfolio_info))
+
+        # AI 분석 동시 실행 (마감 초과/실패 종목은 점수 기준 판단)
+        self.scan_progress['reviewing'] = f"{len(requests)}개 종목 동시 검토"
+        outcomes = self.review_executor.review(requests)
+
+        for idx, candidate in enumerate(candidates, 1):
+            scoring_result = scores[candidate.code]
+            outcome = outcomes[candidate.code]
+            ai_analysis = outcome.analysis
+
+            logger.info(f"\n🤖 [{idx}/{len(candidates)}] {candidate.name} AI 검토 ({outcome.status}, {outcome.elapsed:.1f}초)")
 
             ai_signal = ai_analysis.get('signal', 'hold')
 
@@ -0,0 +1,298 @@
+"""
+core/candle_buffer.py
+실시간 캔들 링 버퍼 + 다중 주기 집계 + 증분 지표
+
+- CandleRingBuffer: 고정 용량 NumPy 링 버퍼
+  각 봉을 [i]와 [i + capacity] 두 곳에 기록(미러링)해서 최근 N개가 항상 연속 구간 →
+  append/evict O(1), 최근 N개 조회는 복사 없는 뷰
+- IncrementalIndicators: 봉 마감마다 EMA / RSI(Wilder) 상태만 갱신 (전체 재계산 없음)
+- MultiIntervalCandles: 체결 1건으로 1/3/5/15/30/60분봉과 당일 VWAP을 함께 갱신
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_INTERVALS = (1, 3, 5, 15, 30, 60)
+
+_OPEN, _HIGH, _LOW, _CLOSE, _VOLUME = range(5)
+_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+
+class CandleRingBuffer:
+    """
+    고정 용량 OHLCV 링 버퍼
+
+    Usage:
+        buf = CandleRingBuffer(390)
+        buf.append(ts, price, volume)      # 새 봉
+        buf.update_last(price, volume)     # 진행 중인 봉 갱신
+        cols = buf.last(60)                # {'timestamp', 'open', ...} 뷰
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity는 1 이상이어야 합니다")
+        self.capacity = capacity
+        self._ts = np.zeros(2 * capacity, dtype=np.int64)
+        self._ohlcv = np.zeros((5, 2 * capacity), dtype=np.float64)
+        self._head = 0  # 다음 기록 위치 [0, capacity)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        if not self._size:
+            return None
+        return int(self._ts[(self._head - 1) % self.capacity])
+
+    def append(self, ts: int, price: float, volume: float):
+        """새 봉 추가 (가득 차면 가장 오래된 봉을 덮어씀)"""
+        i = self._head
+        j = i + self.capacity
+        self._ts[i] = self._ts[j] = ts
+        self._ohlcv[:4, i] = self._ohlcv[:4, j] = price
+        self._ohlcv[_VOLUME, i] = self._ohlcv[_VOLUME, j] = volume
+        self._head = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def update_last(self, price: float, volume: float):
+        """마지막 봉에 체결 반영"""
+        i = (self._head - 1) % self.capacity
+        data = self._ohlcv
+        for k in (i, i + self.capacity):
+            if price > data[_HIGH, k]:
+                data[_HIGH, k] = price
+            if price < data[_LOW, k]:
+                data[_LOW, k] = price
+            data[_CLOSE, k] = price
+            data[_VOLUME, k] += volume
+
+    def last_close(self) -> Optional[float]:
+        if not self._size:
+            return None
+        return float(self._ohlcv[_CLOSE, (self._head - 1) % self.capacity])
+
+    def last(self, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        최근 n개 봉 (시간순, 복사 없는 뷰)
+
+        뷰는 이후 체결로 값이 바뀌므로 보관하려면 복사해서 사용한다.
+        """
+        n = self._size if n is None else max(0, min(n, self._size))
+        end = self._head + self.capacity
+        start = end - n
+        result = {'timestamp': self._ts[start:end]}
+        for k, name in enumerate(_FIELDS):
+            result[name] = self._ohlcv[k, start:end]
+        return result
+
+    def latest(self) -> Optional[Dict[str, float]]:
+        """마지막 봉 값"""
+        if not self._size:
+            return None
+        i = (self._head - 1) % self.capacity
+        values = {name: float(self._ohlcv[k, i]) for k, name in enumerate(_FIELDS)}
+        values['timestamp'] = int(self._ts[i])
+        return values
+
+
+class IncrementalIndicators:
+    """
+    봉 마감 단위 증분 지표
+
+    - EMA: pandas ewm(span, adjust=False)와 같은 정의 (첫 종가로 시작)
+    - RSI: Wilder 평활 (첫 period개 변화량의 단순 평균으로 시작)
+
+    values(live_close)는 진행 중인 봉의 종가를 반영한 잠정값을 상태 변경 없이 계산한다.
+    """
+
+    def __init__(self, ema_periods: Iterable[int] = (12, 26), rsi_period: int = 14):
+        self.ema_periods = tuple(ema_periods)
+        self.rsi_period = rsi_period
+        self.ema: Dict[int, Optional[float]] = {p: None for p in self.ema_periods}
+
+        self.prev_close: Optional[float] = None
+        self._warmup_gain = 0.0
+        self._warmup_loss = 0.0
+        self._warmup_count = 0
+        self.avg_gain: Optional[float] = None
+        self.avg_loss: Optional[float] = None
+
+    def update(self, close: float):
+        """마감된 봉 종가 반영"""
+        for period, value in self.ema.items():
+            alpha = 2.0 / (period + 1)
+            self.ema[period] = close if value is None else value + alpha * (close - value)
+
+        if self.prev_close is not None:
+            change = close - self.prev_close
+            gain, loss = max(change, 0.0), max(-change, 0.0)
+            p = self.rsi_period
+            if self.avg_gain is None:
+                self._warmup_gain += gain
+                self._warmup_loss += loss
+                self._warmup_count += 1
+                if self._warmup_count == p:
+                    self.avg_gain = self._warmup_gain / p
+                    self.avg_loss = self._warmup_loss / p
+            else:
+                self.avg_gain = (self.avg_gain * (p - 1) + gain) / p
+                self.avg_loss = (self.avg_loss * (p - 1) + loss) / p
+        self.prev_close = close
+
+    @staticmethod
+    def _rsi(avg_gain: float, avg_loss: float) -> float:
+        if avg_loss == 0:
+            return 100.0 if avg_gain > 0 else 50.0
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    def values(self, live_close: Optional[float] = None) -> Dict[str, Optional[float]]:
+        """
+        지표 값
+
+        Args:
+            live_close: 진행 중인 봉 종가 (주면 잠정값, 없으면 마감 봉 기준)
+        """
+        result: Dict[str, Optional[float]] = {}
+        for period, value in self.ema.items():
+            if live_close is not None:
+                alpha = 2.0 / (period + 1)
+                value = live_close if value is None else value + alpha * (live_close - value)
+            result[f'ema_{period}'] = value
+
+        rsi = None
+        if self.avg_gain is not None:
+            avg_gain, avg_loss = self.avg_gain, self.avg_loss
+            if live_close is not None:
+                change = live_close - self.prev_close
+                p = self.rsi_period
+                avg_gain = (avg_gain * (p - 1) + max(change, 0.0)) / p
+                avg_loss = (avg_loss * (p - 1) + max(-change, 0.0)) / p
+            rsi = self._rsi(avg_gain, avg_loss)
+        result[f'rsi_{self.rsi_period}'] = rsi
+        return result
+
+
+class MultiIntervalCandles:
+    """
+    체결 → 다중 주기 봉 + 증분 지표
+
+    봉 시작 시각은 자정 기준 분 단위 정렬 (5분봉: 09:00, 09:05, ...).
+
+    Usage:
+        candles = MultiIntervalCandles(capacity=390)
+        candles.on_tick(datetime(2024, 3, 4, 9, 3), 70000, 10)
+        candles.last(5, 12)         # 5분봉 최근 12개 뷰
+        candles.indicators(5)       # {'ema_12', 'ema_26', 'rsi_14', 'vwap'}
+    """
+
+    def __init__(
+        self,
+        intervals: Iterable[int] = DEFAULT_INTERVALS,
+        capacity: int = 390,
+        ema_periods: Iterable[int] = (12, 26),
+        rsi_period: int = 14
+    ):
+        self.intervals: Tuple[int, ...] = tuple(sorted(set(intervals)))
+        self.buffers: Dict[int, CandleRingBuffer] = {
+            interval: CandleRingBuffer(capacity) for interval in self.intervals
+        }
+        self.states: Dict[int, IncrementalIndicators] = {
+            interval: IncrementalIndicators(ema_periods, rsi_period) for interval in self.intervals
+        }
+
+        # 당일 VWAP (체결 단위 누적, 날짜가 바뀌면 초기화)
+        self._session_date = None
+        self._pv = 0.0
+        self._volume = 0.0
+
+        self.last_tick_at: Optional[datetime] = None
+
+    def on_tick(self, minute: datetime, price: float, volume: float) -> bool:
+        """
+        체결 1건 반영
+
+        Args:
+            minute: 체결 시각 (초 이하는 무시)
+            price: 체결가
+            volume: 체결량
+
+        Returns:
+            반영 여부 (이미 지난 봉의 늦은 체결은 무시)
+        """
+        minute = minute.replace(second=0, microsecond=0)
+        base_ts = int(minute.timestamp())
+        minute_of_day = minute.hour * 60 + minute.minute
+
+        if minute.date() != self._session_date:
+            self._session_date = minute.date()
+            self._pv = 0.0
+            self._volume = 0.0
+
+        applied = False
+        for interval in self.intervals:
+            ts = base_ts - (minute_of_day % interval) * 60
+            buffer = self.buffers[interval]
+            last_ts = buffer.last_timestamp
+
+            if last_ts == ts:
+                buffer.update_last(price, volume)
+            elif last_ts is None or ts > last_ts:
+                if last_ts is not None:
+                    # 직전 봉 마감 → 지표 상태 갱신
+                    self.states[interval].update(buffer.last_close())
+                buffer.append(ts, price, volume)
+            else:
+                continue
+            applied = True
+
+        if applied:
+            self._pv += price * volume
+            self._volume += volume
+            self.last_tick_at = minute
+        return applied
+
+    def last(self, interval: int = 1, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """주기별 최근 n개 봉 (복사 없는 뷰)"""
+        return self.buffers[interval].last(n)
+
+    def count(self, interval: int = 1) -> int:
+        return len(self.buffers[interval])
+
+    @property
+    def vwap(self) -> Optional[float]:
+        return self._pv / self._volume if self._volume else None
+
+    def indicators(self, interval: int = 1, live: bool = True) -> Dict[str, Optional[float]]:
+        """
+        주기별 지표 (live=True면 진행 중인 봉 포함 잠정값)
+        """
+        live_close = self.buffers[interval].last_close() if live else None
+        values = self.states[interval].values(live_close)
+        values['vwap'] = self.vwap
+        return values
+
+    def to_dicts(self, interval: int = 1, n: Optional[int] = None) -> List[Dict]:
+        """최근 n개 봉 dict 리스트 (API 응답용, 시간순)"""
+        cols = self.last(interval, n)
+        stamps = cols['timestamp'].tolist()
+        values = {name: cols[name].tolist() for name in _FIELDS}
+        rows = []
+        for i, ts in enumerate(stamps):
+            moment = datetime.fromtimestamp(ts)
+            row = {
+                'date': moment.strftime('%Y%m%d'),
+                'time': moment.strftime('%H%M%S'),
+            }
+            for name in _FIELDS:
+                row[name] = int(values[name][i])
+            row['timestamp'] = ts
+            rows.append(row)
+        return rows
+
+
+__all__ = ['CandleRingBuffer', 'IncrementalIndicators', 'MultiIntervalCandles', 'DEFAULT_INTERVALS']
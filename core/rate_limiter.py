@@ -0,0 +1,589 @@
+"""
+core/rate_limiter.py
+API 호출 예산 관리 (Token Bucket)
+
+- TokenBucket: 초당 보충 속도 + 버스트 용량을 가진 토큰 버킷
+- ApiRateBudget: 키움 api-id(TR)별 토큰 버킷 묶음
+- RateLimiter: 전역 버킷 + TR별 버킷, 공정 대기열, 429/한도 초과 시 적응형 백오프
+"""
+import asyncio
+import time
+import threading
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 기본 한도
+# - 전역: 기존 최소 호출 간격(0.3초)을 환산한 약 3.33회/초 (앱키 전체 합산)
+# - TR별: 전역보다 낮게 두어 한 TR이 몰려도 전역 예산의 일부만 쓰고
+#   나머지는 다른 TR 호출에 남는다 (TR별 한도 >= 전역 한도면 TR별 한도는 의미 없음)
+DEFAULT_CALL_INTERVAL = 0.3
+DEFAULT_GLOBAL_RATE = 1.0 / DEFAULT_CALL_INTERVAL
+DEFAULT_TR_RATE = 2.0
+
+
+class TokenBucket:
+    """
+    토큰 버킷 (스레드 안전)
+
+    rate 만큼 초당 토큰이 보충되고, 최대 capacity 개까지 쌓인다.
+    acquire()는 토큰이 생길 때까지 락 밖에서 대기하므로
+    한 스레드의 대기가 다른 버킷의 호출을 막지 않는다.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: 초당 보충 토큰 수
+            capacity: 버킷 최대 용량 (None이면 rate와 동일, 최소 1)
+        """
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 보충 (락 보유 상태에서 호출)"""
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._last_refill = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰 획득 시도 (대기하지 않음)
+
+        Returns:
+            0.0이면 획득 성공, 그 외에는 토큰이 생길 때까지 필요한 대기 시간(초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """
+        토큰 획득 (필요 시 대기)
+
+        Args:
+            tokens: 필요한 토큰 수
+            timeout: 최대 대기 시간 (None이면 무제한)
+
+        Returns:
+            획득 성공 여부
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            wait_time = self.try_acquire(tokens)
+            if wait_time <= 0:
+                return True
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait_time = min(wait_time, remaining)
+
+            time.sleep(wait_time)
+
+    def wait_time(self, tokens: float = 1.0) -> float:
+        """토큰을 소비하지 않고 필요한 대기 시간(초)만 계산"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def consume(self, tokens: float = 1.0):
+        """토큰 소비 (wait_time()으로 확인한 뒤 호출)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+
+    def set_rate(self, rate: float):
+        """보충 속도 변경 (적응형 백오프용)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(1e-3, float(rate))
+
+    @property
+    def available(self) -> float:
+        """현재 사용 가능한 토큰 수"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+class ApiRateBudget:
+    """
+    api-id(TR)별 호출 예산
+
+    TR마다 독립된 TokenBucket을 두어, 서로 다른 TR 호출은
+    서로의 대기에 묶이지 않고 각자의 한도 안에서 병렬로 진행된다.
+
+    Usage:
+        budget = ApiRateBudget(default_rate=2.0, overrides={'ka10078': 1.0})
+        budget.acquire('ka10059')
+        market_api.get_investor_data('005930')
+    """
+
+    def __init__(
+        self,
+        default_rate: float = DEFAULT_TR_RATE,
+        default_burst: Optional[float] = None,
+        overrides: Optional[Dict[str, float]] = None
+    ):
+        """
+        Args:
+            default_rate: 기본 초당 호출 수
+            default_burst: 기본 버스트 용량 (None이면 default_rate)
+            overrides: api-id별 초당 호출 수
+        """
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.overrides = dict(overrides or {})
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _get_bucket(self, api_id: str) -> TokenBucket:
+        """api-id에 해당하는 버킷 반환 (없으면 생성)"""
+        bucket = self._buckets.get(api_id)
+        if bucket is not None:
+            return bucket
+
+        with self._lock:
+            bucket = self._buckets.get(api_id)
+            if bucket is None:
+                rate = self.overrides.get(api_id, self.default_rate)
+                burst = self.default_burst if api_id not in self.overrides else None
+                bucket = TokenBucket(rate, burst)
+                self._buckets[api_id] = bucket
+            return bucket
+
+    def acquire(self, api_id: str, timeout: Optional[float] = None) -> bool:
+        """api-id 예산에서 호출 1회분 획득"""
+        return self._get_bucket(api_id).acquire(1.0, timeout)
+
+    def try_acquire(self, api_id: str) -> float:
+        """대기 없이 획득 시도 (0.0이면 성공, 그 외에는 필요한 대기 시간)"""
+        return self._get_bucket(api_id).try_acquire(1.0)
+
+
+class _ApiState:
+    """RateLimiter 내부: api-id별 버킷/대기열/통계"""
+
+    def __init__(self, bucket: TokenBucket, base_rate: float):
+        self.bucket = bucket
+        self.base_rate = base_rate
+        self.waiters: Deque[object] = deque()
+        self.blocked_until = 0.0
+        self.recent_calls: Deque[float] = deque()
+
+        # 통계
+        self.total_calls = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.throttled = 0
+        self.rejected = 0
+
+
+class RateLimiter:
+    """
+    키움 REST 호출 속도 제한기
+
+    - 전역 버킷: 모든 TR 합산 초당 호출 한도
+    - TR별 버킷: api-id마다 별도 한도 (overrides로 지정)
+    - 공정 대기열: 같은 TR의 대기자는 도착 순서대로 토큰을 받는다.
+      대기는 락 밖(Condition.wait)에서 이루어지므로 한 스레드의 대기가
+      다른 TR 호출을 막지 않는다.
+    - 적응형 백오프: 429/호출 한도 초과 응답 시 해당 TR(및 전역) 속도를 낮추고
+      일정 시간 호출을 멈춘 뒤, 성공 응답마다 원래 속도로 점진 복구한다.
+
+    Usage:
+        limiter = RateLimiter(global_rate=3.3, default_rate=2.0)
+        if limiter.acquire('ka10081', timeout=10):
+            res = session.post(...)
+            if res.status_code == 429:
+                limiter.report_throttled('ka10081')
+            else:
+                limiter.report_success('ka10081')
+    """
+
+    STATS_WINDOW_SECONDS = 60.0
+
+    def __init__(
+        self,
+        global_rate: float = DEFAULT_GLOBAL_RATE,
+        global_burst: Optional[float] = None,
+        default_rate: float = DEFAULT_TR_RATE,
+        default_burst: Optional[float] = None,
+        overrides: Optional[Dict[str, float]] = None,
+        backoff_factor: float = 0.5,
+        min_rate_ratio: float = 0.1,
+        recovery_ratio: float = 0.05,
+        base_penalty: float = 1.0,
+        max_penalty: float = 30.0
+    ):
+        """
+        Args:
+            global_rate: 전역 초당 호출 수
+            global_burst: 전역 버스트 용량
+            default_rate: TR별 기본 초당 호출 수
+            default_burst: TR별 기본 버스트 용량
+            overrides: api-id별 초당 호출 수
+            backoff_factor: 한도 초과 시 속도 감소 배율
+            min_rate_ratio: 감소 가능한 최저 속도 (기준 속도 대비)
+            recovery_ratio: 성공 1회당 복구 비율 (기준 속도 대비)
+            base_penalty: 첫 한도 초과 시 호출 중지 시간 (초)
+            max_penalty: 호출 중지 시간 상한 (초)
+        """
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.overrides = dict(overrides or {})
+        self.backoff_factor = backoff_factor
+        self.min_rate_ratio = min_rate_ratio
+        self.recovery_ratio = recovery_ratio
+        self.base_penalty = base_penalty
+        self.max_penalty = max_penalty
+
+        self._global = _ApiState(TokenBucket(global_rate, global_burst), global_rate)
+        self._apis: Dict[str, _ApiState] = {}
+        self._consecutive_throttles = 0
+
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+
+    # ------------------------------------------------------------------
+    # 내부 헬퍼 (락 보유 상태에서 호출)
+    # ------------------------------------------------------------------
+
+    def _state(self, api_id: str) -> _ApiState:
+        state = self._apis.get(api_id)
+        if state is None:
+            rate = self.overrides.get(api_id, self.default_rate)
+            burst = self.default_burst if api_id not in self.overrides else None
+            state = _ApiState(TokenBucket(rate, burst), rate)
+            self._apis[api_id] = state
+        return state
+
+    def _wait_needed(self, state: _ApiState, now: float) -> float:
+        """TR 버킷과 전역 버킷 모두에서 토큰을 받기까지 필요한 시간"""
+        blocked = max(state.blocked_until, self._global.blocked_until) - now
+        return max(
+            blocked,
+            state.bucket.wait_time(),
+            self._global.bucket.wait_time(),
+        )
+
+    def _take(self, state: _ApiState, now: float, waited: float):
+        state.bucket.consume()
+        self._global.bucket.consume()
+
+        for s in (state, self._global):
+            s.total_calls += 1
+            s.total_wait += waited
+            s.max_wait = max(s.max_wait, waited)
+            s.recent_calls.append(now)
+            self._prune(s, now)
+
+    def _prune(self, state: _ApiState, now: float):
+        cutoff = now - self.STATS_WINDOW_SECONDS
+        while state.recent_calls and state.recent_calls[0] < cutoff:
+            state.recent_calls.popleft()
+
+    # ------------------------------------------------------------------
+    # 토큰 획득
+    # ------------------------------------------------------------------
+
+    def try_acquire(self, api_id: str) -> float:
+        """
+        대기 없이 획득 시도
+
+        같은 TR에 대기자가 있으면 순서를 지키기 위해 실패로 처리한다.
+
+        Returns:
+            0.0이면 획득 성공, 그 외에는 예상 대기 시간(초)
+        """
+        with self._lock:
+            state = self._state(api_id)
+            now = time.monotonic()
+            wait = self._wait_needed(state, now)
+
+            if state.waiters:
+                state.rejected += 1
+                return max(wait, 1.0 / state.bucket.rate)
+
+            if wait > 0:
+                state.rejected += 1
+                return wait
+
+            self._take(state, now, 0.0)
+            return 0.0
+
+    def acquire(self, api_id: str, timeout: Optional[float] = None) -> bool:
+        """
+        토큰 획득 (공정 대기열에서 차례를 기다림)
+
+        Args:
+            api_id: 키움 TR id
+            timeout: 최대 대기 시간 (None이면 무제한)
+
+        Returns:
+            획득 성공 여부
+        """
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        ticket = object()
+
+        with self._cond:
+            state = self._state(api_id)
+            state.waiters.append(ticket)
+
+            try:
+                while True:
+                    now = time.monotonic()
+
+                    if state.waiters[0] is ticket:
+                        wait = self._wait_needed(state, now)
+                        if wait <= 0:
+                            self._take(state, now, now - start)
+                            return True
+                    else:
+                        wait = None  # 앞 순서 대기자가 처리되면 notify로 깨어남
+
+                    if deadline is not None:
+                        remaining = deadline - now
+                        if remaining <= 0:
+                            state.rejected += 1
+                            return False
+                        wait = remaining if wait is None else min(wait, remaining)
+
+                    self._cond.wait(wait)
+            finally:
+                state.waiters.remove(ticket)
+                self._cond.notify_all()
+
+    async def acquire_async(self, api_id: str, timeout: Optional[float] = None) -> bool:
+        """
+        acquire()의 코루틴 버전 (이벤트 루프를 막지 않음)
+
+        스레드 대기자와 같은 공정 대기열에 줄을 서므로, 동기/비동기 호출이
+        섞여도 같은 TR은 도착 순서대로 토큰을 받는다. Condition 알림으로는
+        코루틴을 깨울 수 없으므로 예상 대기 시간만큼 잠든 뒤 다시 확인한다.
+
+        Args:
+            api_id: 키움 TR id
+            timeout: 최대 대기 시간 (None이면 무제한)
+
+        Returns:
+            획득 성공 여부
+        """
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        ticket = object()
+
+        with self._cond:
+            state = self._state(api_id)
+            state.waiters.append(ticket)
+
+        try:
+            while True:
+                with self._cond:
+                    now = time.monotonic()
+                    wait = self._wait_needed(state, now)
+                    if state.waiters[0] is ticket:
+                        if wait <= 0:
+                            self._take(state, now, now - start)
+                            return True
+                    else:
+                        # 앞 순서 대기자가 토큰을 받을 때까지
+                        wait = max(wait, 1.0 / state.bucket.rate)
+
+                    if deadline is not None:
+                        remaining = deadline - now
+                        if remaining <= 0:
+                            state.rejected += 1
+                            return False
+                        wait = min(wait, remaining)
+
+                await asyncio.sleep(wait)
+        finally:
+            with self._cond:
+                state.waiters.remove(ticket)
+                self._cond.notify_all()
+
+    # ------------------------------------------------------------------
+    # 응답 피드백 (적응형 백오프)
+    # ------------------------------------------------------------------
+
+    def report_throttled(self, api_id: str, retry_after: Optional[float] = None):
+        """
+        429/호출 한도 초과 응답 보고
+
+        해당 TR과 전역 속도를 backoff_factor만큼 낮추고,
+        retry_after(없으면 지수 증가 페널티) 동안 호출을 멈춘다.
+        """
+        with self._cond:
+            state = self._state(api_id)
+            self._consecutive_throttles += 1
+
+            penalty = retry_after
+            if penalty is None:
+                penalty = min(
+                    self.max_penalty,
+                    self.base_penalty * (2 ** (self._consecutive_throttles - 1))
+                )
+
+            now = time.monotonic()
+            for s in (state, self._global):
+                s.throttled += 1
+                s.blocked_until = max(s.blocked_until, now + penalty)
+                new_rate = max(s.base_rate * self.min_rate_ratio, s.bucket.rate * self.backoff_factor)
+                s.bucket.set_rate(new_rate)
+
+            logger.warning(
+                f"API 호출 한도 초과 ({api_id}): {penalty:.1f}초 대기, "
+                f"속도 {state.bucket.rate:.2f}/s로 감소"
+            )
+            self._cond.notify_all()
+
+    def report_success(self, api_id: str):
+        """정상 응답 보고 - 감소된 속도를 기준 속도까지 점진 복구"""
+        with self._lock:
+            self._consecutive_throttles = 0
+            state = self._state(api_id)
+
+            for s in (state, self._global):
+                if s.bucket.rate < s.base_rate:
+                    s.bucket.set_rate(min(s.base_rate, s.bucket.rate + s.base_rate * self.recovery_ratio))
+
+    # ------------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------------
+
+    def _state_stats(self, state: _ApiState, now: float) -> Dict[str, Any]:
+        self._prune(state, now)
+        calls_last_window = len(state.recent_calls)
+        quota_per_window = state.base_rate * self.STATS_WINDOW_SECONDS
+
+        return {
+            'base_rate': state.base_rate,
+            'current_rate': state.bucket.rate,
+            'tokens_available': round(state.bucket.available, 2),
+            'waiting': len(state.waiters),
+            'total_calls': state.total_calls,
+            'calls_last_minute': calls_last_window,
+            'quota_usage_pct': round(calls_last_window / quota_per_window * 100, 1) if quota_per_window else 0.0,
+            'avg_wait_ms': round(state.total_wait / state.total_calls * 1000, 1) if state.total_calls else 0.0,
+            'max_wait_ms': round(state.max_wait * 1000, 1),
+            'throttled': state.throttled,
+            'rejected': state.rejected,
+            'backoff_remaining': round(max(0.0, state.blocked_until - now), 2),
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        호출 한도 사용 현황
+
+        Returns:
+            {'global': {...}, 'apis': {api_id: {...}}}
+        """
+        with self._lock:
+            now = time.monotonic()
+            return {
+                'window_seconds': self.STATS_WINDOW_SECONDS,
+                'global': self._state_stats(self._global, now),
+                'apis': {
+                    api_id: self._state_stats(state, now)
+                    for api_id, state in sorted(self._apis.items())
+                },
+            }
+
+
+def create_budget_from_config() -> ApiRateBudget:
+    """config.API_RATE_LIMIT 설정으로 ApiRateBudget 생성"""
+    try:
+        from config import API_RATE_LIMIT
+
+        return ApiRateBudget(
+            default_rate=API_RATE_LIMIT.get('TR_CALLS_PER_SECOND', DEFAULT_TR_RATE),
+            default_burst=API_RATE_LIMIT.get('TR_BURST'),
+            overrides=API_RATE_LIMIT.get('TR_RATE_OVERRIDES', {}),
+        )
+    except ImportError:
+        logger.warning("config 모듈을 찾을 수 없습니다. 기본 호출 예산을 사용합니다.")
+        return ApiRateBudget()
+
+
+def create_rate_limiter_from_config() -> RateLimiter:
+    """config.API_RATE_LIMIT 설정으로 RateLimiter 생성"""
+    try:
+        from config import API_RATE_LIMIT
+        settings = API_RATE_LIMIT
+    except ImportError:
+        logger.warning("config 모듈을 찾을 수 없습니다. 기본 속도 제한을 사용합니다.")
+        settings = {}
+
+    # 전역 한도 미지정 시 기존 최소 호출 간격에서 환산
+    interval = settings.get('REST_CALL_INTERVAL', DEFAULT_CALL_INTERVAL)
+    global_rate = settings.get('REST_CALLS_PER_SECOND') or (1.0 / interval if interval > 0 else DEFAULT_GLOBAL_RATE)
+    default_rate = settings.get('TR_CALLS_PER_SECOND', DEFAULT_TR_RATE)
+
+    if default_rate >= global_rate:
+        logger.warning(
+            f"TR별 기본 한도({default_rate:.2f}/s)가 전역 한도({global_rate:.2f}/s) 이상입니다. "
+            f"TR별 한도는 적용되지 않고 한 TR이 전역 예산을 모두 쓸 수 있습니다."
+        )
+
+    return RateLimiter(
+        global_rate=global_rate,
+        global_burst=settings.get('REST_BURST'),
+        default_rate=default_rate,
+        default_burst=settings.get('TR_BURST'),
+        overrides=settings.get('TR_RATE_OVERRIDES', {}),
+        backoff_factor=settings.get('THROTTLE_BACKOFF_FACTOR', 0.5),
+        max_penalty=settings.get('THROTTLE_MAX_PENALTY', 30.0),
+    )
+
+
+_shared_rate_limiter: Optional[RateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_rate_limiter() -> RateLimiter:
+    """
+    프로세스 공용 RateLimiter 반환
+
+    동기/비동기 REST 클라이언트가 같은 앱키의 호출 한도를 나눠 쓰도록 공유한다.
+    """
+    global _shared_rate_limiter
+
+    if _shared_rate_limiter is None:
+        with _shared_lock:
+            if _shared_rate_limiter is None:
+                _shared_rate_limiter = create_rate_limiter_from_config()
+
+    return _shared_rate_limiter
+
+
+__all__ = [
+    'TokenBucket',
+    'ApiRateBudget',
+    'RateLimiter',
+    'create_budget_from_config',
+    'create_rate_limiter_from_config',
+    'get_shared_rate_limiter',
+]
@@ -2,53 +2,20 @@
 실시간 분봉 차트 생성기
 
 WebSocket으로 받은 체결 데이터를 1분 단위로 집계하여 OHLCV 생성
+1분봉과 함께 3/5/15/30/60분봉, EMA/RSI/VWAP을 체결마다 증분 갱신 (core.candle_buffer)
 """
 
-import asyncio
-from datetime import datetime, timedelta
-from collections import defaultdict
+from datetime import datetime
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field
 
+import numpy as np
+
+from core.candle_buffer import MultiIntervalCandles, DEFAULT_INTERVALS
 from utils.logger_new import get_logger
 
 logger = get_logger()
 
 
-@dataclass
-class MinuteCandle:
-    """1분봉 캔들"""
-    timestamp: datetime
-    open: int = 0
-    high: int = 0
-    low: int = 999999999
-    close: int = 0
-    volume: int = 0
-
-    def update(self, price: int, volume: int):
-        """체결 데이터로 캔들 업데이트"""
-        if self.open == 0:
-            self.open = price
-
-        self.high = max(self.high, price)
-        self.low = min(self.low, price)
-        self.close = price
-        self.volume += volume
-
-    def to_dict(self) -> Dict[str, Any]:
-        """딕셔너리로 변환"""
-        return {
-            'date': self.timestamp.strftime('%Y%m%d'),
-            'time': self.timestamp.strftime('%H%M%S'),
-            'open': self.open,
-            'high': self.high,
-            'low': self.low,
-            'close': self.close,
-            'volume': self.volume,
-            'timestamp': int(self.timestamp.timestamp())
-        }
-
-
 class RealtimeMinuteChart:
     """실시간 분봉 차트 생성기"""
 
@@ -63,15 +30,16 @@ class RealtimeMinuteChart:
         self.stock_code = stock_code
         self.ws_manager = websocket_manager
 
-        # 분봉 데이터 저장 (최대 1일치: 390분 = 6.5시간)
-        self.candles: Dict[datetime, MinuteCandle] = {}
+        # 분봉 데이터 저장 (주기별 링 버퍼, 최대 1일치: 390분 = 6.5시간)
         self.max_candles = 390  # 09:00 ~ 15:30
+        self.candles = MultiIntervalCandles(DEFAULT_INTERVALS, capacity=self.max_candles)
 
         # 현재 처리 중인 분봉 타임스탬프
         self.current_minute = None
 
         # 구독 상태
         self.is_subscribed = False
+        self._subscriber = None  # WebSocketManager 스트림 구독자 핸들
 
         logger.info(f"RealtimeMinuteChart 초기화: {stock_code}")
 
@@ -97,15 +65,15 @@ class RealtimeMinuteChart:
 
             # 체결 데이터 구독
             logger.info(f"{self.stock_code} 체결 데이터 구독 중...")
-            success = await self.ws_manager.subscribe(
-                stock_codes=[self.stock_code],
-                types=["0B"],  # 주식체결
-                grp_no=f"minute_{self.stock_code}"
+            # 이 종목의 체결(0B)만 _on_tick으로 전달됨
+            self._subscriber = await self.ws_manager.subscribe_stream(
+                self.stock_code,
+                '0B',  # 주식체결
+                self._on_tick,
+                name=f"minute_chart:{self.stock_code}"
             )
 
-            if success:
-                # 콜백 등록
-                self.ws_manager.register_callback('0B', self._on_tick)
+            if self._subscriber:
                 self.is_subscribed = True
                 logger.info(f"✅ {self.stock_code} 실시간 분봉 수집 시작")
                 return True
@@ -123,7 +91,8 @@ class RealtimeMinuteChart:
             return
 
         try:
-            await self.ws_manager.unsubscribe(f"minute_{self.stock_code}")
+            await self.ws_manager.unsubscribe_stream(self._subscriber)
+            self._subscriber = None
             self.is_subscribed = False
             logger.info(f"✅ {self.stock_code} 실시간 분봉 수집 중지")
         except Exception as e:
@@ -146,11 +115,6 @@ class RealtimeMinuteChart:
                 }
         """
         try:
-            # 종목 필터링
-            item_code = data.get('item', '')
-            if item_code != self.stock_code:
-                return
-
             values = data.get('values', {})
 
             # 체결 데이터 파싱
@@ -179,46 +143,47 @@ class RealtimeMinuteChart:
             if now.hour < 8 or now.hour >= 20:
                 return
 
-            # 분봉 업데이트
-            if now not in self.candles:
-                # 새로운 분봉 생성
-                self.candles[now] = MinuteCandle(timestamp=now)
-
-                # 오래된 데이터 제거 (최대 390개 유지)
-                if len(self.candles) > self.max_candles:
-                    oldest = min(self.candles.keys())
-                    del self.candles[oldest]
-
-                logger.debug(f"새 분봉 생성: {now.strftime('%H:%M')} (총 {len(self.candles)}개)")
-
-            # 캔들 업데이트
-            self.candles[now].update(price, volume)
-            self.current_minute = now
+            # 분봉 업데이트 (가득 차면 가장 오래된 봉을 덮어씀, 지난 분의 늦은 체결은 무시)
+            is_new = now != self.current_minute
+            if self.candles.on_tick(now, price, volume):
+                self.current_minute = now
+                if is_new:
+                    logger.debug(f"새 분봉 생성: {now.strftime('%H:%M')} (총 {self.candles.count()}개)")
 
         except Exception as e:
             logger.error(f"체결 데이터 처리 오류: {e}")
 
-    def get_minute_data(self, minutes: int = 60) -> List[Dict[str, Any]]:
+    def get_minute_data(self, minutes: Optional[int] = 60, interval: int = 1) -> List[Dict[str, Any]]:
         """
-        최근 N분 데이터 조회
+        최근 N개 봉 조회
 
         Args:
-            minutes: 조회할 분봉 개수
+            minutes: 조회할 봉 개수 (None이면 전체)
+            interval: 봉 주기 (분, 1/3/5/15/30/60)
 
         Returns:
-            분봉 데이터 리스트 (시간순 정렬)
+            봉 데이터 리스트 (시간순 정렬)
         """
-        if not self.candles:
-            return []
+        return self.candles.to_dicts(interval, minutes)
 
-        # 시간순 정렬
-        sorted_candles = sorted(self.candles.items(), key=lambda x: x[0])
+    def get_series(self, interval: int = 1, count: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        최근 N개 봉 컬럼 배열 (전략용, 복사 없는 뷰)
 
-        # 최근 N개 추출
-        recent_candles = sorted_candles[-minutes:] if len(sorted_candles) > minutes else sorted_candles
+        Returns:
+            {'timestamp'(epoch 초), 'open', 'high', 'low', 'close', 'volume'}
+        """
+        return self.candles.last(interval, count)
 
-        # 딕셔너리로 변환
-        return [candle.to_dict() for timestamp, candle in recent_candles]
+    def get_indicators(self, interval: int = 1, live: bool = True) -> Dict[str, Optional[float]]:
+        """
+        주기별 증분 지표 (ema_12, ema_26, rsi_14, vwap)
+
+        Args:
+            interval: 봉 주기 (분)
+            live: 진행 중인 봉까지 반영한 잠정값 여부
+        """
+        return self.candles.indicators(interval, live)
 
     def get_current_candle(self) -> Optional[Dict[str, Any]]:
         """
@@ -227,14 +192,15 @@ class RealtimeMinuteChart:
         Returns:
             현재 분봉 데이터 또는 None
         """
-        if not self.current_minute or self.current_minute not in self.candles:
+        if not self.current_minute:
             return None
 
-        return self.candles[self.current_minute].to_dict()
+        rows = self.candles.to_dicts(1, 1)
+        return rows[0] if rows else None
 
-    def get_candle_count(self) -> int:
-        """저장된 분봉 개수 반환"""
-        return len(self.candles)
+    def get_candle_count(self, interval: int = 1) -> int:
+        """저장된 봉 개수 반환"""
+        return self.candles.count(interval)
 
 
 class RealtimeMinuteChartManager:
@@ -293,13 +259,14 @@ class RealtimeMinuteChartManager:
 
         logger.info(f"✅ {stock_code} 실시간 분봉 제거")
 
-    def get_minute_data(self, stock_code: str, minutes: int = 60) -> List[Dict[str, Any]]:
+    def get_minute_data(self, stock_code: str, minutes: Optional[int] = 60, interval: int = 1) -> List[Dict[str, Any]]:
         """
         특정 종목의 분봉 데이터 조회
 
         Args:
             stock_code: 종목코드
-            minutes: 조회할 분봉 개수
+            minutes: 조회할 봉 개수
+            interval: 봉 주기 (분)
 
         Returns:
             분봉 데이터 리스트
@@ -307,7 +274,23 @@ class RealtimeMinuteChartManager:
         if stock_code not in self.charts:
             return []
 
-        return self.charts[stock_code].get_minute_data(minutes)
+        return self.charts[stock_code].get_minute_data(minutes, interval)
+
+    def get_indicators(self, stock_code: str, interval: int = 1) -> Optional[Dict[str, Optional[float]]]:
+        """
+        특정 종목의 증분 지표 조회
+
+        Args:
+            stock_code: 종목코드
+            interval: 봉 주기 (분)
+
+        Returns:
+            지표 딕셔너리 또는 None
+        """
+        if stock_code not in self.charts:
+            return None
+
+        return self.charts[stock_code].get_indicators(interval)
 
     def get_current_candle(self, stock_code: str) -> Optional[Dict[str, Any]]:
         """
@@ -337,6 +320,7 @@ class RealtimeMinuteChartManager:
                 code: {
                     'subscribed': chart.is_subscribed,
                     'candle_count': chart.get_candle_count(),
+                    'intervals': list(chart.candles.intervals),
                     'current_minute': chart.current_minute.strftime('%H:%M') if chart.current_minute else None
                 }
                 for code, chart in self.charts.items()
@@ -19,17 +19,31 @@ from .exceptions import (
     NetworkError,
     InvalidResponseError,
 )
+from .rate_limiter import get_shared_rate_limiter
 
 logger = logging.getLogger(__name__)
 
 
+def build_request_url(base_url: str, path: str) -> str:
+    """
+    API 경로로 요청 URL 구성
+
+    path에 전체 경로가 없으면 /api/dostk/ prefix 추가
+    (예: "acnt", "inquire/dailyprice" → /api/dostk/acnt)
+    """
+    if path.startswith('/'):
+        # 이미 전체 경로(/api/dostk/...)이거나 슬래시로 시작하는 경로
+        return f"{base_url}{path}"
+    return f"{base_url}/api/dostk/{path}"
+
+
 class KiwoomRESTClient:
     """
     키움증권 REST API 클라이언트 (싱글톤 패턴)
     
     주요 기능:
     - 자동 토큰 관리 (발급, 갱신, 만료 처리)
-    - API 호출 속도 제한
+    - API 호출 속도 제한 (전역 + TR별 토큰 버킷, 429 시 적응형 백오프)
     - 자동 재시도
     - 스레드 안전
     """
@@ -67,10 +81,9 @@ class KiwoomRESTClient:
             self.token: Optional[str] = None
             self.token_expiry: datetime.datetime = datetime.datetime.now()
             
-            # 속도 제한 관리
-            self.rate_limit_lock = threading.Lock()
-            self.min_call_interval = 0.3  # config에서 가져오도록 수정 가능
-            self.last_call_time = 0.0
+            # 속도 제한 관리 (전역 + api-id별 토큰 버킷)
+            # (AsyncKiwoomRESTClient와 같은 예산을 공유)
+            self.rate_limiter = get_shared_rate_limiter()
             
             # 에러 메시지
             self.last_error_msg: Optional[str] = None
@@ -97,9 +110,9 @@ class KiwoomRESTClient:
             self.account_suffix = kiwoom_config['account_suffix']
             
             # API 속도 제한 설정
-            self.min_call_interval = API_RATE_LIMIT.get('REST_CALL_INTERVAL', 0.3)
             self.max_retries = API_RATE_LIMIT.get('REST_MAX_RETRIES', 3)
             self.retry_backoff = API_RATE_LIMIT.get('REST_RETRY_BACKOFF', 1.0)
+            self.rate_limit_timeout = API_RATE_LIMIT.get('REST_RATE_LIMIT_TIMEOUT', 30.0)
 
             # 중요: NXT 시간외 거래는 실제 운영 서버(api.kiwoom.com)에서만 가능
             # 모의투자 서버(mockapi.kiwoom.com)는 KRX만 지원
@@ -119,18 +132,19 @@ class KiwoomRESTClient:
             self.account_number_full = ""
             self.account_prefix = ""
             self.account_suffix = ""
-            self.min_call_interval = 0.3
             self.max_retries = 3
             self.retry_backoff = 1.0
+            self.rate_limit_timeout = 30.0
     
     def _create_session(self) -> requests.Session:
         """재시도 기능이 있는 HTTP 세션 생성"""
         session = requests.Session()
 
         # 500 에러는 재시도하지 않음 (서버 측 문제이므로 즉시 확인 필요)
+        # 429는 RateLimiter가 백오프 후 직접 재시도하므로 제외
         retry_strategy = Retry(
             total=self.max_retries,
-            status_forcelist=[429, 502, 503, 504],  # 500 제거
+            status_forcelist=[502, 503, 504],
             allowed_methods=["HEAD", "GET", "POST", "PUT", "DELETE"],
             backoff_factor=self.retry_backoff
         )
@@ -280,18 +294,46 @@ class KiwoomRESTClient:
         finally:
             self.token = None
     
-    def _handle_rate_limit(self):
-        """API 호출 속도 제한 처리"""
-        with self.rate_limit_lock:
-            current_time = time.monotonic()
-            elapsed = current_time - self.last_call_time
-            wait_time = self.min_call_interval - elapsed
-            
-            if wait_time > 0:
-                logger.debug(f"API 속도 제한: {wait_time:.3f}초 대기")
-                time.sleep(wait_time)
-            
-            self.last_call_time = time.monotonic()
+    def _handle_rate_limit(self, api_id: str) -> bool:
+        """
+        API 호출 속도 제한 처리
+
+        전역/TR별 토큰 버킷에서 호출 1회분을 받을 때까지 공정 대기열에서 대기한다.
+
+        Returns:
+            토큰 획득 여부 (rate_limit_timeout 초과 시 False)
+        """
+        return self.rate_limiter.acquire(api_id, timeout=self.rate_limit_timeout)
+
+    @staticmethod
+    def _is_quota_exceeded(status_code: int, result_data: Optional[Dict[str, Any]] = None) -> bool:
+        """429 또는 호출 한도 초과 응답 여부"""
+        if status_code == 429:
+            return True
+
+        if result_data and result_data.get('return_code', 0) != 0:
+            msg = str(result_data.get('return_msg', ''))
+            return '초과' in msg and ('요청' in msg or '호출' in msg)
+
+        return False
+
+    @staticmethod
+    def _parse_retry_after(res: requests.Response) -> Optional[float]:
+        """Retry-After 헤더 파싱 (초)"""
+        value = res.headers.get('Retry-After') if res is not None else None
+        try:
+            return float(value) if value else None
+        except ValueError:
+            return None
+
+    def get_rate_limit_stats(self) -> Dict[str, Any]:
+        """
+        호출 한도 사용 현황 (대시보드용)
+
+        Returns:
+            {'global': {...}, 'apis': {api_id: {'quota_usage_pct', 'calls_last_minute', ...}}}
+        """
+        return self.rate_limiter.get_stats()
     
     def _set_error(self, msg: str):
         """에러 메시지 설정"""
@@ -342,7 +384,8 @@ class KiwoomRESTClient:
         body: Dict[str, Any],
         path: str,
         http_method: str,
-        retry_on_auth: bool = True
+        retry_on_auth: bool = True,
+        throttle_retries: int = 0
     ) -> Optional[Dict[str, Any]]:
         """
         실제 API 요청 실행
@@ -353,12 +396,15 @@ class KiwoomRESTClient:
             path: API 경로
             http_method: HTTP 메서드
             retry_on_auth: 401 에러 시 재시도 여부
+            throttle_retries: 호출 한도 초과로 재시도한 횟수
         
         Returns:
             API 응답 딕셔너리
         """
         # 속도 제한 처리
-        self._handle_rate_limit()
+        if not self._handle_rate_limit(api_id):
+            logger.error(f"API 호출 예산 대기 시간 초과 ({api_id})")
+            return {"return_code": -429, "return_msg": "API 호출 한도 대기 시간 초과"}
         
         # 헤더 구성
         headers = {
@@ -368,16 +414,7 @@ class KiwoomRESTClient:
         }
         
         # URL 구성
-        # path에 전체 경로가 없으면 /api/dostk/ prefix 추가
-        if path.startswith('/api/dostk/'):
-            # 이미 전체 경로인 경우
-            url = f"{self.base_url}{path}"
-        elif path.startswith('/'):
-            # 슬래시로 시작하지만 /api/dostk/ 없는 경우
-            url = f"{self.base_url}{path}"
-        else:
-            # 상대 경로인 경우 (예: "acnt", "inquire/dailyprice")
-            url = f"{self.base_url}/api/dostk/{path}"
+        url = build_request_url(self.base_url, path)
 
         logger.debug(f"[REST] {http_method} {url} (API ID: {api_id})")
         
@@ -414,6 +451,15 @@ class KiwoomRESTClient:
                     logger.error(f"  응답 헤더: {dict(res.headers)}")
                     logger.error(f"  응답 본문: {res.text[:1000]}")
 
+            # 429 / 호출 한도 초과: 백오프 후 재시도
+            if self._is_quota_exceeded(res.status_code):
+                self.rate_limiter.report_throttled(api_id, self._parse_retry_after(res))
+                if throttle_retries < self.max_retries:
+                    return self._execute_request(
+                        api_id, body, path, http_method, retry_on_auth, throttle_retries + 1
+                    )
+                return {"return_code": -429, "return_msg": "API 호출 한도 초과"}
+
             # 401 에러 처리 (토큰 갱신 후 재시도)
             if res.status_code == 401 and retry_on_auth:
                 logger.warning(f"401 에러 - 토큰 갱신 후 재시도 ({api_id})")
@@ -431,7 +477,18 @@ class KiwoomRESTClient:
             res.raise_for_status()
             
             # 응답 파싱
-            return self._process_api_response(res, api_id)
+            result_data = self._process_api_response(res, api_id)
+
+            if self._is_quota_exceeded(res.status_code, result_data):
+                self.rate_limiter.report_throttled(api_id)
+                if throttle_retries < self.max_retries:
+                    return self._execute_request(
+                        api_id, body, path, http_method, retry_on_auth, throttle_retries + 1
+                    )
+            else:
+                self.rate_limiter.report_success(api_id)
+
+            return result_data
         
         except requests.exceptions.Timeout:
             logger.error(f"API 요청 시간 초과 ({api_id})")
@@ -613,4 +670,4 @@ class KiwoomRESTClient:
         self.close()
 
 
-__all__ = ['KiwoomRESTClient']
\ No newline at end of file
+__all__ = ['KiwoomRESTClient', 'build_request_url']
\ No newline at end of file
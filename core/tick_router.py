@@ -0,0 +1,253 @@
+"""
+core/tick_router.py
+실시간 시세 다중 구독자 라우터
+
+- (타입, 종목코드) 키로 구독자를 찾는 O(1) 라우팅 (종목 '*' = 해당 타입 전체, 타입 'ALL' = 전체)
+- 구독자마다 상한이 있는 큐 + 전용 소비 태스크
+  느린 구독자는 자기 큐에서 오래된 틱을 버릴 뿐, 수신 루프는 막히지 않는다
+- 타입별/종목별 처리량 카운터와 구독자별 전달/폐기/오류 카운터
+"""
+
+import asyncio
+import inspect
+import itertools
+import time
+from collections import defaultdict, deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.logger_new import get_logger
+
+logger = get_logger()
+
+ANY_STOCK = '*'
+ALL_TYPES = 'ALL'
+
+
+class TickSubscriber:
+    """
+    라우터 구독자 (상한 큐 + 소비 태스크)
+
+    큐가 가득 차면 가장 오래된 틱을 버린다 (시세는 최신 값이 중요).
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(
+        self,
+        callback: Callable[[Dict[str, Any]], Any],
+        data_type: str,
+        stock_code: str = ANY_STOCK,
+        maxsize: int = 1000,
+        name: Optional[str] = None
+    ):
+        self.id = next(self._ids)
+        self.callback = callback
+        self.data_type = data_type
+        self.stock_code = stock_code
+        self.name = name or getattr(callback, '__qualname__', repr(callback))
+        self.maxsize = maxsize
+
+        self.queue: deque = deque(maxlen=maxsize)
+        self.active = True
+        self._wakeup: Optional[asyncio.Event] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        # 카운터
+        self.received = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_depth = 0
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.data_type, self.stock_code
+
+    def offer(self, item: Dict[str, Any]):
+        """틱 적재 (블로킹 없음, 수신 루프에서 호출)"""
+        if not self.active:
+            return
+        if len(self.queue) == self.maxsize:
+            self.dropped += 1
+        self.queue.append(item)
+        self.received += 1
+        self.max_depth = max(self.max_depth, len(self.queue))
+        self._ensure_task()
+        self._idle.clear()
+        self._wakeup.set()
+
+    def _ensure_task(self):
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._idle = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        """큐 소비 루프"""
+        while self.active:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self.queue and self.active:
+                item = self.queue.popleft()
+                try:
+                    result = self.callback(item)
+                    if inspect.isawaitable(result):
+                        await result
+                    self.delivered += 1
+                except Exception as e:
+                    self.errors += 1
+                    logger.error(f"❌ 구독자 콜백 오류 ({self.name}): {e}")
+            self._idle.set()
+
+    async def join(self):
+        """큐가 빌 때까지 대기"""
+        if self._task is not None and not self._task.done() and not self._idle.is_set():
+            await self._idle.wait()
+
+    def close(self):
+        """구독 종료 (남은 틱은 버림)"""
+        self.active = False
+        self.queue.clear()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'type': self.data_type,
+            'stock_code': self.stock_code,
+            'received': self.received,
+            'delivered': self.delivered,
+            'dropped': self.dropped,
+            'errors': self.errors,
+            'queue_depth': len(self.queue),
+            'max_depth': self.max_depth,
+            'maxsize': self.maxsize,
+        }
+
+
+class TickRouter:
+    """
+    (타입, 종목코드) → 구독자 라우터
+
+    Usage:
+        router = TickRouter()
+        sub = router.add('0B', on_tick, stock_code='005930')
+        router.dispatch({'type': '0B', 'item': '005930', 'values': {...}})
+        router.remove(sub)
+    """
+
+    def __init__(self, default_maxsize: int = 1000):
+        self.default_maxsize = default_maxsize
+        self._routes: Dict[Tuple[str, str], Dict[int, TickSubscriber]] = {}
+
+        self.started_at = time.time()
+        self.total_messages = 0
+        self.unrouted = 0
+        self.by_type: Dict[str, int] = defaultdict(int)
+        self.by_stock: Dict[str, int] = defaultdict(int)
+
+    def add(
+        self,
+        data_type: str,
+        callback: Callable[[Dict[str, Any]], Any],
+        stock_code: Optional[str] = None,
+        maxsize: Optional[int] = None,
+        name: Optional[str] = None
+    ) -> TickSubscriber:
+        """
+        구독자 추가
+
+        Args:
+            data_type: 실시간 타입 ('0B', '0D', ... 또는 'ALL')
+            callback: 틱 콜백 (동기/비동기 모두 가능)
+            stock_code: 종목코드 (None이면 해당 타입 전체)
+            maxsize: 구독자 큐 상한 (None이면 기본값)
+            name: 통계 표시용 이름
+        """
+        subscriber = TickSubscriber(
+            callback,
+            data_type,
+            stock_code or ANY_STOCK,
+            maxsize or self.default_maxsize,
+            name
+        )
+        self._routes.setdefault(subscriber.key, {})[subscriber.id] = subscriber
+        logger.info(f"구독자 등록: {subscriber.name} ({data_type}/{subscriber.stock_code})")
+        return subscriber
+
+    def remove(self, subscriber: TickSubscriber) -> bool:
+        """구독자 제거"""
+        route = self._routes.get(subscriber.key)
+        if not route or subscriber.id not in route:
+            return False
+        del route[subscriber.id]
+        if not route:
+            del self._routes[subscriber.key]
+        subscriber.close()
+        return True
+
+    def count(self, data_type: str, stock_code: Optional[str] = None) -> int:
+        """정확히 (타입, 종목) 키에 등록된 구독자 수"""
+        return len(self._routes.get((data_type, stock_code or ANY_STOCK), ()))
+
+    def dispatch(self, item: Dict[str, Any]) -> int:
+        """
+        REAL 항목 1건 라우팅
+
+        Returns:
+            전달된 구독자 수
+        """
+        data_type = item.get('type', '')
+        stock_code = item.get('item', '')
+
+        self.total_messages += 1
+        self.by_type[data_type] += 1
+        self.by_stock[stock_code] += 1
+
+        delivered = 0
+        routes = self._routes
+        for key in ((data_type, stock_code), (data_type, ANY_STOCK),
+                    (ALL_TYPES, stock_code), (ALL_TYPES, ANY_STOCK)):
+            route = routes.get(key)
+            if route:
+                for subscriber in list(route.values()):
+                    subscriber.offer(item)
+                delivered += len(route)
+
+        if not delivered:
+            self.unrouted += 1
+        return delivered
+
+    def subscribers(self) -> List[TickSubscriber]:
+        return [s for route in self._routes.values() for s in route.values()]
+
+    async def drain(self, timeout: Optional[float] = None):
+        """모든 구독자 큐가 빌 때까지 대기"""
+        joins = [s.join() for s in self.subscribers()]
+        if joins:
+            await asyncio.wait_for(asyncio.gather(*joins), timeout=timeout)
+
+    def close(self):
+        """전체 구독자 종료"""
+        for subscriber in self.subscribers():
+            subscriber.close()
+        self._routes.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """처리량 통계"""
+        elapsed = max(time.time() - self.started_at, 1e-9)
+        return {
+            'total_messages': self.total_messages,
+            'messages_per_second': round(self.total_messages / elapsed, 2),
+            'unrouted': self.unrouted,
+            'by_type': dict(self.by_type),
+            'by_stock': dict(self.by_stock),
+            'subscribers': [s.get_stats() for s in self.subscribers()],
+        }
+
+
+__all__ = ['TickRouter', 'TickSubscriber', 'ANY_STOCK', 'ALL_TYPES']
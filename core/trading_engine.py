@@ -0,0 +1,475 @@
+"""
+core/trading_engine.py
+이벤트 기반 트레이딩 엔진
+
+- 보유 종목 체결(0B) 틱 → 청산 조건 즉시 판정 → 주문 전용 실행기에서 매도
+- 주문체결(00) 이벤트 → 계좌 갱신 작업 즉시 실행
+- 매도 요청 중인 종목은 체결/취소/거부가 확인되거나 미체결 목록에서 사라질 때까지 재매도하지 않음
+- 계좌 갱신 / Fast Scan / Deep Scan / AI Scan은 각자 주기와 전용 실행기(단일 스레드)에서 실행
+  이전 회차가 끝나지 않았으면 그 회차는 건너뛴다 (작업끼리 서로 막지 않음)
+- 틱 → 판정 → 주문 구간별 지연 통계
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+import numpy as np
+
+from utils.logger_new import get_logger
+
+logger = get_logger()
+
+ExitRule = Callable[[Dict[str, Any], float], Optional[str]]
+SellHandler = Callable[[Dict[str, Any], float, str], Any]
+
+# 주문체결(00) 이벤트의 매도 주문 최종 상태
+ORDER_FILLED = 'filled'
+ORDER_CANCELLED = 'cancelled'
+ORDER_REJECTED = 'rejected'
+
+
+def _to_int(value: Any) -> int:
+    try:
+        return int(float(str(value).replace(',', '').replace('+', '').strip() or 0))
+    except ValueError:
+        return 0
+
+
+def parse_order_state(values: Dict[str, Any]) -> Optional[str]:
+    """
+    주문체결(00) 실시간 값에서 매도 주문의 최종 상태 판별
+
+    907: 매도수구분(1: 매도), 913: 주문상태(접수/체결/확인), 902: 미체결수량,
+    905: 주문구분(매도취소 등), 919: 거부사유
+
+    Returns:
+        ORDER_FILLED / ORDER_CANCELLED / ORDER_REJECTED, 매수 주문이거나 진행 중이면 None
+    """
+    if str(values.get('907', '')).strip() != '1':
+        return None
+    status = str(values.get('913', '')).strip()
+    if str(values.get('919', '')).strip() or '거부' in status:
+        return ORDER_REJECTED
+    if status == '확인' and '취소' in str(values.get('905', '')):
+        return ORDER_CANCELLED
+    if status == '체결' and _to_int(values.get('902')) == 0:
+        return ORDER_FILLED
+    return None
+
+
+class LatencyTracker:
+    """구간별 지연 시간 (최근 window개 표본)"""
+
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self._samples: Dict[str, deque] = {}
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self.window)
+            samples.append(seconds)
+            self._counts[stage] = self._counts.get(stage, 0) + 1
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """{구간: {count, avg_ms, p50_ms, p95_ms, max_ms}}"""
+        with self._lock:
+            snapshot = {stage: (np.fromiter(samples, dtype=np.float64), self._counts[stage])
+                        for stage, samples in self._samples.items()}
+
+        stats = {}
+        for stage, (values, count) in snapshot.items():
+            ms = values * 1000
+            p50, p95 = np.percentile(ms, [50, 95])
+            stats[stage] = {
+                'count': count,
+                'avg_ms': round(float(ms.mean()), 3),
+                'p50_ms': round(float(p50), 3),
+                'p95_ms': round(float(p95), 3),
+                'max_ms': round(float(ms.max()), 3),
+            }
+        return stats
+
+
+@dataclass
+class ScheduledJob:
+    """주기 작업"""
+    name: str
+    interval: float
+    func: Callable[[], Any]
+    executor: str
+    next_run: float = 0.0
+    running: bool = False
+    runs: int = 0
+    skipped: int = 0
+    errors: int = 0
+    last_duration: float = 0.0
+    last_error: str = ''
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'interval': self.interval,
+            'executor': self.executor,
+            'running': self.running,
+            'runs': self.runs,
+            'skipped': self.skipped,
+            'errors': self.errors,
+            'last_duration_ms': round(self.last_duration * 1000, 1),
+            'last_error': self.last_error,
+        }
+
+
+class TradingEngine:
+    """
+    이벤트 기반 트레이딩 엔진
+
+    Usage:
+        engine = TradingEngine(exit_rule=bot_exit_rule, sell_handler=bot_sell)
+        engine.add_job('account', 30, bot.refresh_account)
+        engine.add_job('fast_scan', 10, scanner.run_fast_scan)
+
+        # WebSocket 콜백
+        engine.on_tick('005930', 71000)
+
+        engine.run_forever(lambda: bot.is_running)
+    """
+
+    def __init__(
+        self,
+        exit_rule: ExitRule,
+        sell_handler: SellHandler,
+        latency_window: int = 1000
+    ):
+        """
+        Args:
+            exit_rule: (포지션, 현재가) → 청산 사유 (없으면 None/'')
+            sell_handler: (포지션, 가격, 사유) → 매도 주문 실행 (주문하지 못했으면 False 반환)
+            latency_window: 지연 통계 표본 수
+        """
+        self.exit_rule = exit_rule
+        self.sell_handler = sell_handler
+        self.latency = LatencyTracker(latency_window)
+
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self.executors: Dict[str, ThreadPoolExecutor] = {}
+        self.running = False
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+
+        # 포지션 북 {종목코드: {'stock_code', 'stock_name', 'quantity', 'buy_price'}}
+        self.positions: Dict[str, Dict[str, Any]] = {}
+        self._pending_exits: Dict[str, Optional[float]] = {}   # 종목코드 → 매도 주문 완료 시각 (제출 중이면 None)
+        self._filled_exits: Set[str] = set()         # 전량 체결 통보 → 다음 계좌 갱신 때 해제
+        self._orders_sent: Dict[str, float] = {}     # 종목코드 → 주문 완료 시각 (체결 지연 측정용)
+        self.on_positions_changed: Optional[Callable[[Set[str], Set[str]], None]] = None
+
+        # 카운터
+        self.ticks = 0
+        self.exit_signals = 0
+        self.orders = 0
+        self.order_events = 0
+
+    # ------------------------------------------------------------------
+    # 주기 작업
+    # ------------------------------------------------------------------
+
+    def add_job(
+        self,
+        name: str,
+        interval: float,
+        func: Callable[[], Any],
+        executor: Optional[str] = None,
+        run_immediately: bool = True
+    ) -> ScheduledJob:
+        """
+        주기 작업 등록
+
+        Args:
+            name: 작업 이름
+            interval: 실행 간격 (초)
+            func: 작업 함수 (인자 없음)
+            executor: 실행기 이름 (None이면 작업 이름과 같은 전용 실행기)
+            run_immediately: 엔진 시작 직후 첫 실행 여부
+        """
+        job = ScheduledJob(
+            name=name,
+            interval=max(float(interval), 0.01),
+            func=func,
+            executor=executor or name,
+            next_run=0.0 if run_immediately else time.monotonic() + interval
+        )
+        self.jobs[name] = job
+        self._wakeup.set()
+        return job
+
+    def trigger(self, name: str):
+        """작업을 다음 스케줄러 회차에 바로 실행"""
+        job = self.jobs.get(name)
+        if job is not None:
+            job.next_run = 0.0
+            self._wakeup.set()
+
+    def _executor(self, name: str) -> ThreadPoolExecutor:
+        with self._lock:
+            executor = self.executors.get(name)
+            if executor is None:
+                executor = self.executors[name] = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix=f"engine-{name}"
+                )
+            return executor
+
+    def run_pending(self, now: Optional[float] = None) -> int:
+        """
+        실행 시각이 된 작업 제출
+
+        Returns:
+            제출한 작업 수
+        """
+        now = time.monotonic() if now is None else now
+        submitted = 0
+        for job in list(self.jobs.values()):
+            if job.next_run > now:
+                continue
+            job.next_run = now + job.interval
+            if job.running:
+                job.skipped += 1
+                continue
+            job.running = True
+            self._executor(job.executor).submit(self._run_job, job)
+            submitted += 1
+        return submitted
+
+    def _run_job(self, job: ScheduledJob):
+        started = time.perf_counter()
+        try:
+            job.func()
+        except Exception as e:
+            job.errors += 1
+            job.last_error = str(e)
+            logger.error(f"엔진 작업 오류 ({job.name}): {e}", exc_info=True)
+        finally:
+            job.last_duration = time.perf_counter() - started
+            job.runs += 1
+            job.running = False
+            self.latency.record(f'job:{job.name}', job.last_duration)
+
+    def _next_delay(self) -> float:
+        if not self.jobs:
+            return 1.0
+        delay = min(job.next_run for job in self.jobs.values()) - time.monotonic()
+        return min(max(delay, 0.0), 1.0)
+
+    def run_forever(self, should_continue: Callable[[], bool] = lambda: True):
+        """스케줄러 루프 (호출 스레드에서 실행, stop() 또는 should_continue()=False까지)"""
+        self.running = True
+        logger.info(f"트레이딩 엔진 시작: {', '.join(f'{j.name}={j.interval:g}s' for j in self.jobs.values())}")
+        try:
+            while self.running and should_continue():
+                self.run_pending()
+                self._wakeup.wait(timeout=self._next_delay())
+                self._wakeup.clear()
+        finally:
+            self.running = False
+
+    def stop(self, wait: bool = True):
+        """스케줄러 중지 + 실행기 종료"""
+        self.running = False
+        self._wakeup.set()
+        with self._lock:
+            executors = list(self.executors.values())
+            self.executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # 포지션 / 이벤트
+    # ------------------------------------------------------------------
+
+    def update_positions(self, positions: Iterable[Dict[str, Any]]) -> Tuple[Set[str], Set[str]]:
+        """
+        포지션 북 교체 (계좌 갱신 결과)
+
+        매도 요청 중인 종목은 보유가 사라졌거나 전량 체결 통보를 받았으면 해제한다.
+        부분 체결로 수량만 줄었으면 남은 주문이 아직 걸려 있으므로 유지한다
+        (미체결 목록 대사는 reconcile_exits).
+
+        Returns:
+            (추가된 종목, 제거된 종목)
+        """
+        book = {p['stock_code']: p for p in positions if p.get('quantity', 0) > 0}
+        with self._lock:
+            before = set(self.positions)
+            self.positions = book
+            for stock_code in list(self._pending_exits):
+                if stock_code not in book or stock_code in self._filled_exits:
+                    self._release_exit(stock_code)
+
+        added, removed = set(book) - before, before - set(book)
+        if (added or removed) and self.on_positions_changed:
+            try:
+                self.on_positions_changed(added, removed)
+            except Exception as e:
+                logger.error(f"포지션 변경 처리 오류: {e}")
+        return added, removed
+
+    def reconcile_exits(self, open_sell_codes: Iterable[str], checked_at: float) -> Set[str]:
+        """
+        미체결 매도 주문 목록과 대사
+
+        checked_at(조회 시작 시각, time.perf_counter 기준) 전에 주문을 마친 종목 중
+        미체결 목록에 없는 종목은 체결/취소/거부된 것이므로 해제한다.
+        조회 뒤에 나간 주문은 목록에 없을 수 있으므로 유지한다.
+
+        Returns:
+            해제한 종목
+        """
+        open_codes = set(open_sell_codes)
+        with self._lock:
+            released = {
+                stock_code for stock_code, sent_at in self._pending_exits.items()
+                if sent_at is not None and sent_at <= checked_at and stock_code not in open_codes
+            }
+            for stock_code in released:
+                self._release_exit(stock_code)
+        return released
+
+    def _release_exit(self, stock_code: str):
+        """매도 요청 해제 (락 보유 상태에서 호출)"""
+        self._pending_exits.pop(stock_code, None)
+        self._filled_exits.discard(stock_code)
+
+    def is_exit_pending(self, stock_code: str) -> bool:
+        return stock_code in self._pending_exits
+
+    def pending_exits(self) -> Set[str]:
+        with self._lock:
+            return set(self._pending_exits)
+
+    def on_tick(self, stock_code: str, price: float, received_at: Optional[float] = None) -> Optional[str]:
+        """
+        체결 틱 처리 (WebSocket 수신 루프에서 호출, 블로킹 없음)
+
+        Args:
+            stock_code: 종목코드
+            price: 체결가
+            received_at: 수신 시각 (time.perf_counter 기준, 없으면 지금)
+
+        Returns:
+            매도 요청 사유 (요청하지 않았으면 None)
+        """
+        received_at = time.perf_counter() if received_at is None else received_at
+        self.ticks += 1
+
+        position = self.positions.get(stock_code)
+        if position is None or stock_code in self._pending_exits:
+            return None
+
+        reason = self.exit_rule(position, price)
+        self.latency.record('tick_to_decision', time.perf_counter() - received_at)
+        if not reason:
+            return None
+
+        return reason if self.request_exit(position, price, reason, received_at) else None
+
+    def request_exit(
+        self,
+        position: Dict[str, Any],
+        price: float,
+        reason: str,
+        received_at: Optional[float] = None
+    ) -> bool:
+        """
+        매도 요청 (종목당 주문이 끝날 때까지 1회)
+
+        Returns:
+            주문 실행기에 제출했는지 여부
+        """
+        stock_code = position['stock_code']
+        decided_at = time.perf_counter()
+        with self._lock:
+            if stock_code in self._pending_exits:
+                return False
+            self._pending_exits[stock_code] = None
+
+        self.exit_signals += 1
+        logger.info(f"⚡ 청산 신호: {position.get('stock_name', stock_code)} @ {price:,.0f} - {reason}")
+        self._executor('orders').submit(
+            self._submit_exit, position, price, reason,
+            decided_at if received_at is None else received_at, decided_at
+        )
+        return True
+
+    def _submit_exit(self, position: Dict[str, Any], price: float, reason: str,
+                     received_at: float, decided_at: float):
+        stock_code = position['stock_code']
+        try:
+            placed = self.sell_handler(position, price, reason) is not False
+        except Exception as e:
+            logger.error(f"청산 주문 오류 ({stock_code}): {e}", exc_info=True)
+            placed = False
+        finally:
+            done = time.perf_counter()
+            self.latency.record('decision_to_order', done - decided_at)
+            self.latency.record('tick_to_order', done - received_at)
+
+        with self._lock:
+            if not placed:
+                # 걸린 주문이 없으므로 다음 신호에서 다시 매도
+                self._release_exit(stock_code)
+                return
+            if stock_code in self._pending_exits:
+                self._pending_exits[stock_code] = done
+        self.orders += 1
+        self._orders_sent[stock_code] = done
+
+    def on_order_event(self, stock_code: str = '', order_state: Optional[str] = None):
+        """
+        주문체결(00) 이벤트: 체결 지연 기록 + 매도 요청 상태 반영 + 계좌 갱신 즉시 실행
+
+        Args:
+            stock_code: 종목코드
+            order_state: parse_order_state() 결과 (취소/거부는 즉시 해제,
+                전량 체결은 보유 수량이 반영되는 다음 계좌 갱신 때 해제)
+        """
+        self.order_events += 1
+        sent_at = self._orders_sent.pop(stock_code, None) if stock_code else None
+        if sent_at is not None:
+            self.latency.record('order_to_fill', time.perf_counter() - sent_at)
+        if stock_code and order_state:
+            with self._lock:
+                if stock_code in self._pending_exits:
+                    if order_state == ORDER_FILLED:
+                        self._filled_exits.add(stock_code)
+                    else:
+                        self._release_exit(stock_code)
+        self.trigger('account')
+
+    # ------------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'running': self.running,
+            'ticks': self.ticks,
+            'exit_signals': self.exit_signals,
+            'orders': self.orders,
+            'order_events': self.order_events,
+            'positions': sorted(self.positions),
+            'pending_exits': sorted(self._pending_exits),
+            'jobs': {name: job.to_dict() for name, job in self.jobs.items()},
+            'latency': self.latency.get_stats(),
+        }
+
+
+__all__ = [
+    'TradingEngine', 'LatencyTracker', 'ScheduledJob', 'parse_order_state',
+    'ORDER_FILLED', 'ORDER_CANCELLED', 'ORDER_REJECTED',
+]
@@ -8,17 +8,24 @@ WebSocket 실시간 시세 매니저
 3. 로그인 응답 확인
 4. 구독 요청 전송 (REG)
 5. 실시간 데이터 수신 (REAL)
+
+수신은 receive_loop 하나에서만 한다:
+- REAL 데이터는 TickRouter로 (타입, 종목)별 구독자 큐에 분배
+- REG/REMOVE 응답은 trnm별 요청 순서로 대기 중인 요청에 전달
+- 연결/수신을 맡은 이벤트 루프(소유 루프) 밖에서 온 요청은 run_coroutine_threadsafe로 소유 루프에 넘긴다
 """
 
 import asyncio
 import websockets
 import json
 import time
-from typing import Dict, Any, Optional, Callable, List
+from collections import defaultdict, deque
+from typing import Dict, Any, Optional, Callable, List, Tuple
 from datetime import datetime
 
 from utils.logger_new import get_logger
 from config.constants import URLS
+from core.tick_router import TickRouter, TickSubscriber
 
 logger = get_logger()
 
@@ -49,7 +56,19 @@ class WebSocketManager:
         self.is_connected = False
         self.is_logged_in = False
         self.subscriptions = {}  # {grp_no: subscription_info}
-        self.callbacks = {}  # {type: callback_function}
+
+        # 실시간 틱 라우터: (타입, 종목) → 구독자 (구독자별 상한 큐)
+        self.router = TickRouter()
+
+        # subscribe_stream 전용 그룹과 (타입, 종목)별 구독자 참조 수
+        self.stream_grp_no = "90"
+        self._stream_refs: Dict[Tuple[str, str], int] = {}
+
+        # REG/REMOVE 응답 대기열 (응답에 상관 ID가 없어 trnm별 요청 순서로 매칭)
+        self._pending_acks: Dict[str, deque] = defaultdict(deque)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # 소켓을 소유한 이벤트 루프
+        self._receiving = False
+        self._reconnecting = False
 
         # 재연결 설정
         self.reconnect_delay = 5  # 재연결 대기 시간 (초)
@@ -68,6 +87,7 @@ class WebSocketManager:
         try:
             print(f"🔌 WebSocket 연결 시도: {self.ws_url}")
             logger.info(f"WebSocket 연결 시도: {self.ws_url}")
+            self._loop = asyncio.get_running_loop()
 
             # WebSocket 연결
             self.websocket = await websockets.connect(
@@ -194,27 +214,23 @@ class WebSocketManager:
             }
 
             print(f"📤 구독 요청 전송: {json.dumps(subscribe_request, ensure_ascii=False)}")
-            await self.websocket.send(json.dumps(subscribe_request))
             logger.info(f"📤 구독 요청 전송: 종목={stock_codes}, 타입={types}, grp_no={grp_no}")
 
-            # 구독 응답 대기 (최대 2초)
-            print("⏳ 구독 응답 대기 중...")
-            subscribe_response = await asyncio.wait_for(
-                self.websocket.recv(),
-                timeout=2.0
-            )
+            # 구독 응답 대기 (최대 2초, 수신 루프가 응답을 전달)
+            subscribe_data = await self._request(subscribe_request, timeout=2.0)
+
+            if subscribe_data is None:
+                print("⚠️ 구독 응답 타임아웃 (구독은 성공했을 수 있음)")
+                logger.warning("⚠️ 구독 응답 타임아웃 (구독은 성공했을 수 있음)")
+                # 구독 정보는 저장
+                self._remember_subscription(grp_no, stock_codes, types, refresh)
+                return True
 
-            subscribe_data = json.loads(subscribe_response)
             print(f"📥 구독 응답: {json.dumps(subscribe_data, ensure_ascii=False)}")
 
             if subscribe_data.get('return_code') == 0:
                 # 구독 정보 저장
-                self.subscriptions[grp_no] = {
-                    'stock_codes': stock_codes,
-                    'types': types,
-                    'refresh': refresh,
-                    'subscribed_at': datetime.now()
-                }
+                self._remember_subscription(grp_no, stock_codes, types, refresh)
                 print(f"✅ 구독 성공: {subscribe_data.get('return_msg', '')}")
                 logger.info(f"✅ 구독 성공: {subscribe_data.get('return_msg', '')}")
                 return True
@@ -223,32 +239,223 @@ class WebSocketManager:
                 logger.error(f"❌ 구독 실패 (코드 {subscribe_data.get('return_code')}): {subscribe_data.get('return_msg')}")
                 return False
 
-        except asyncio.TimeoutError:
-            print("⚠️ 구독 응답 타임아웃 (구독은 성공했을 수 있음)")
-            logger.warning("⚠️ 구독 응답 타임아웃 (구독은 성공했을 수 있음)")
-            # 구독 정보는 저장
-            self.subscriptions[grp_no] = {
-                'stock_codes': stock_codes,
-                'types': types,
-                'refresh': refresh,
-                'subscribed_at': datetime.now()
-            }
-            return True
         except Exception as e:
             print(f"❌ 구독 중 오류: {e}")
             logger.error(f"❌ 구독 중 오류: {e}")
             return False
 
-    def register_callback(self, data_type: str, callback: Callable[[Dict[str, Any]], None]):
+    def _remember_subscription(self, grp_no: str, stock_codes: List[str], types: List[str], refresh: str):
+        """구독 정보 저장 (refresh='1'이면 같은 그룹의 기존 종목/타입 유지)"""
+        existing = self.subscriptions.get(grp_no)
+        if existing and refresh == "1":
+            stock_codes = existing['stock_codes'] + [c for c in stock_codes if c not in existing['stock_codes']]
+            types = existing['types'] + [t for t in types if t not in existing['types']]
+
+        self.subscriptions[grp_no] = {
+            'stock_codes': list(stock_codes),
+            'types': list(types),
+            'refresh': refresh,
+            'subscribed_at': datetime.now()
+        }
+
+    async def _on_owner_loop(self, coro):
+        """
+        소유 루프에서 코루틴 실행
+
+        다른 스레드의 이벤트 루프(대시보드 등)에서 호출하면 소유 루프로 넘기고 wrap_future로 기다린다.
+        소유 루프가 없거나 돌고 있지 않으면(연결 전/테스트) 현재 루프에서 실행한다.
+        """
+        loop = self._loop
+        if loop is None or loop is asyncio.get_running_loop() or not loop.is_running():
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    async def _request(self, payload: Dict[str, Any], timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        REG/REMOVE 요청 전송 후 응답 대기
+
+        응답에는 상관 ID가 없으므로 trnm별 요청 순서(FIFO)로 매칭한다.
+        수신 루프가 돌고 있으면 루프가 응답을 넘겨주고, 아니면 직접 수신하면서
+        그 사이 도착한 메시지도 같은 처리기(_handle_message)로 넘긴다.
+        전송과 응답 대기는 항상 소유 루프에서 한다.
+
+        Returns:
+            응답 데이터 (타임아웃이면 None)
         """
-        실시간 데이터 콜백 등록
+        return await self._on_owner_loop(self._request_on_loop(payload, timeout))
+
+    async def _request_on_loop(self, payload: Dict[str, Any], timeout: float) -> Optional[Dict[str, Any]]:
+        trnm = payload['trnm']
+        future = asyncio.get_running_loop().create_future()
+        # 타임아웃된 요청도 대기열에 남겨 늦게 온 응답이 다음 요청에 붙지 않게 한다
+        self._pending_acks[trnm].append(future)
+
+        try:
+            await self.websocket.send(json.dumps(payload))
+
+            if self._receiving and not self._reconnecting:
+                return await asyncio.wait_for(future, timeout=timeout)
+
+            deadline = time.monotonic() + timeout
+            while not future.done():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError()
+                message = await asyncio.wait_for(self.websocket.recv(), timeout=remaining)
+                await self._handle_message(json.loads(message))
+            return future.result()
+
+        except asyncio.TimeoutError:
+            if not future.done():
+                future.cancel()
+            return None
+
+    def _resolve_ack(self, trnm: str, data: Dict[str, Any]):
+        """REG/REMOVE 응답을 가장 오래된 대기 요청에 전달"""
+        pending = self._pending_acks.get(trnm)
+        if not pending:
+            logger.debug(f"대기 요청 없는 {trnm} 응답: {data}")
+            return
+
+        # 요청은 소유 루프에서만 만들어지므로 같은 루프의 future
+        future = pending.popleft()
+        if not future.done():
+            future.set_result(data)
+
+    def _cancel_pending_acks(self):
+        """연결 종료 시 대기 요청 정리"""
+        for pending in self._pending_acks.values():
+            for future in pending:
+                if not future.done():
+                    future.cancel()
+        self._pending_acks.clear()
+
+    def register_callback(self, data_type: str, callback: Callable[[Dict[str, Any]], None]) -> TickSubscriber:
+        """
+        실시간 데이터 콜백 등록 (타입 전체 종목)
+
+        같은 타입에 여러 콜백을 등록할 수 있다.
 
         Args:
             data_type: 데이터 타입 (예: '0B', '0D', 'ALL')
-            callback: 콜백 함수 (data를 인자로 받음)
+            callback: 콜백 함수 (data를 인자로 받음, 동기/비동기)
+
+        Returns:
+            구독자 핸들 (remove_subscriber로 해제)
         """
-        self.callbacks[data_type] = callback
+        subscriber = self.router.add(data_type, callback, name=getattr(callback, '__name__', None))
         logger.info(f"콜백 등록: {data_type}")
+        return subscriber
+
+    def add_subscriber(
+        self,
+        data_type: str,
+        callback: Callable[[Dict[str, Any]], Any],
+        stock_code: Optional[str] = None,
+        maxsize: Optional[int] = None,
+        name: Optional[str] = None
+    ) -> TickSubscriber:
+        """
+        라우터 구독자 등록 (서버 구독은 하지 않음)
+
+        Args:
+            data_type: 데이터 타입
+            callback: 콜백 함수
+            stock_code: 종목코드 (None이면 타입 전체)
+            maxsize: 구독자 큐 상한
+            name: 통계 표시용 이름
+        """
+        return self.router.add(data_type, callback, stock_code=stock_code, maxsize=maxsize, name=name)
+
+    def remove_subscriber(self, subscriber: TickSubscriber) -> bool:
+        """라우터 구독자 해제"""
+        return self.router.remove(subscriber)
+
+    async def subscribe_stream(
+        self,
+        stock_code: str,
+        data_type: str,
+        callback: Callable[[Dict[str, Any]], Any],
+        maxsize: Optional[int] = None,
+        name: Optional[str] = None
+    ) -> Optional[TickSubscriber]:
+        """
+        종목 실시간 스트림 구독
+
+        서버 등록(REG)은 (타입, 종목)당 첫 구독자에서만 보내고,
+        이후 구독자는 라우터에만 추가된다.
+
+        Returns:
+            구독자 핸들 (서버 등록 실패 시 None)
+        """
+        return await self._on_owner_loop(
+            self._subscribe_stream(stock_code, data_type, callback, maxsize, name)
+        )
+
+    async def _subscribe_stream(self, stock_code, data_type, callback, maxsize, name) -> Optional[TickSubscriber]:
+        key = (data_type, stock_code)
+        if not self._stream_refs.get(key):
+            success = await self.subscribe(
+                stock_codes=[stock_code],
+                types=[data_type],
+                grp_no=self.stream_grp_no,
+                refresh="1"
+            )
+            if not success:
+                return None
+
+        self._stream_refs[key] = self._stream_refs.get(key, 0) + 1
+        return self.router.add(data_type, callback, stock_code=stock_code, maxsize=maxsize, name=name)
+
+    async def unsubscribe_stream(self, subscriber: TickSubscriber) -> bool:
+        """
+        종목 실시간 스트림 해제 (마지막 구독자면 서버 등록도 해지)
+        """
+        return await self._on_owner_loop(self._unsubscribe_stream(subscriber))
+
+    async def _unsubscribe_stream(self, subscriber: TickSubscriber) -> bool:
+        if not self.router.remove(subscriber):
+            return False
+
+        key = (subscriber.data_type, subscriber.stock_code)
+        refs = self._stream_refs.get(key, 0) - 1
+        if refs > 0:
+            self._stream_refs[key] = refs
+            return True
+
+        self._stream_refs.pop(key, None)
+        self._sync_stream_subscription()
+
+        if not self.is_connected or not self.is_logged_in:
+            return True
+
+        try:
+            response = await self._request({
+                "trnm": "REMOVE",
+                "grp_no": self.stream_grp_no,
+                "data": [{
+                    "item": [subscriber.stock_code],
+                    "type": [subscriber.data_type]
+                }]
+            }, timeout=2.0)
+            if response is not None and response.get('return_code') != 0:
+                logger.warning(f"⚠️ 스트림 해지 실패 {key}: {response.get('return_msg')}")
+                return False
+            return True
+        except Exception as e:
+            logger.error(f"❌ 스트림 해지 중 오류 {key}: {e}")
+            return False
+
+    def _sync_stream_subscription(self):
+        """스트림 그룹 구독 정보를 참조 수 기준으로 갱신 (재연결 시 재등록 대상)"""
+        if not self._stream_refs:
+            self.subscriptions.pop(self.stream_grp_no, None)
+            return
+
+        info = self.subscriptions.get(self.stream_grp_no)
+        if info:
+            info['stock_codes'] = sorted({code for _, code in self._stream_refs})
+            info['types'] = sorted({data_type for data_type, _ in self._stream_refs})
 
     async def receive_loop(self):
         """
@@ -263,6 +470,8 @@ class WebSocketManager:
 
         print("🔄 실시간 데이터 수신 시작")
         logger.info("🔄 실시간 데이터 수신 시작")
+        self._loop = asyncio.get_running_loop()
+        self._receiving = True
 
         try:
             message_count = 0
@@ -275,32 +484,7 @@ class WebSocketManager:
                     )
 
                     message_count += 1
-                    # JSON 파싱
-                    data = json.loads(message)
-                    trnm = data.get('trnm', '')
-
-                    print(f"📩 메시지 #{message_count} 수신: trnm={trnm}")
-
-                    # REAL 데이터인 경우 콜백 호출
-                    if trnm == 'REAL':
-                        print(f"   📊 REAL 데이터: {json.dumps(data, ensure_ascii=False)[:200]}...")
-                        await self._handle_real_data(data)
-                    elif trnm == 'SYSTEM':
-                        # 시스템 메시지
-                        code = data.get('code', '')
-                        msg = data.get('message', '')
-                        print(f"⚠️ 시스템 메시지 (코드 {code}): {msg}")
-                        logger.warning(f"⚠️ 시스템 메시지 (코드 {code}): {msg}")
-
-                        # 연결 종료 메시지인 경우 재연결 시도
-                        if code == 'R10004':
-                            print("❌ 접속 종료됨, 재연결 시도...")
-                            logger.error("❌ 접속 종료됨, 재연결 시도...")
-                            await self.reconnect()
-                    else:
-                        # 기타 메시지
-                        print(f"   기타 메시지: {json.dumps(data, ensure_ascii=False)[:200]}...")
-                        logger.debug(f"기타 메시지: {trnm}")
+                    await self._handle_message(json.loads(message))
 
                 except asyncio.TimeoutError:
                     # 타임아웃은 정상 (계속 수신 대기)
@@ -319,47 +503,55 @@ class WebSocketManager:
         except Exception as e:
             logger.error(f"❌ 수신 루프 중 오류: {e}")
         finally:
+            self._receiving = False
             logger.info("🔄 실시간 데이터 수신 종료")
 
+    async def _handle_message(self, data: Dict[str, Any]):
+        """
+        수신 메시지 처리 (receive_loop / 응답 대기 중 직접 수신 공용)
+
+        Args:
+            data: 파싱된 메시지
+        """
+        trnm = data.get('trnm', '')
+
+        if trnm == 'REAL':
+            await self._handle_real_data(data)
+        elif trnm in ('REG', 'REMOVE'):
+            self._resolve_ack(trnm, data)
+        elif trnm == 'PING':
+            # 서버 PING은 그대로 돌려보내야 연결이 유지됨
+            await self.websocket.send(json.dumps(data))
+        elif trnm == 'SYSTEM':
+            # 시스템 메시지
+            code = data.get('code', '')
+            msg = data.get('message', '')
+            print(f"⚠️ 시스템 메시지 (코드 {code}): {msg}")
+            logger.warning(f"⚠️ 시스템 메시지 (코드 {code}): {msg}")
+
+            # 연결 종료 메시지인 경우 재연결 시도
+            if code == 'R10004' and not self._reconnecting:
+                print("❌ 접속 종료됨, 재연결 시도...")
+                logger.error("❌ 접속 종료됨, 재연결 시도...")
+                await self.reconnect()
+        else:
+            # 기타 메시지
+            logger.debug(f"기타 메시지: {trnm} {json.dumps(data, ensure_ascii=False)[:200]}")
+
     async def _handle_real_data(self, data: Dict[str, Any]):
         """
-        REAL 데이터 처리 및 콜백 호출
+        REAL 데이터를 구독자 큐에 분배 (콜백은 구독자별 태스크에서 실행)
 
         Args:
             data: REAL 데이터
+                {
+                  "trnm": "REAL",
+                  "data": [{"type": "0B", "name": "주식체결", "item": "005930", "values": {...}}]
+                }
         """
         try:
-            # data 구조:
-            # {
-            #   "trnm": "REAL",
-            #   "data": [{
-            #       "type": "0B",
-            #       "name": "주식체결",
-            #       "item": "005930",
-            #       "values": {...}
-            #   }]
-            # }
-
-            data_list = data.get('data', [])
-            for item in data_list:
-                data_type = item.get('type', '')
-                stock_code = item.get('item', '')
-                values = item.get('values', {})
-
-                # 타입별 콜백 호출
-                if data_type in self.callbacks:
-                    try:
-                        await self.callbacks[data_type](item)
-                    except Exception as e:
-                        logger.error(f"❌ 콜백 실행 오류 ({data_type}): {e}")
-
-                # ALL 콜백 호출
-                if 'ALL' in self.callbacks:
-                    try:
-                        await self.callbacks['ALL'](item)
-                    except Exception as e:
-                        logger.error(f"❌ ALL 콜백 실행 오류: {e}")
-
+            for item in data.get('data', []):
+                self.router.dispatch(item)
         except Exception as e:
             logger.error(f"❌ REAL 데이터 처리 중 오류: {e}")
 
@@ -372,23 +564,28 @@ class WebSocketManager:
         self.reconnect_attempts += 1
         logger.info(f"🔄 재연결 시도 {self.reconnect_attempts}/{self.max_reconnect_attempts}")
 
-        # 기존 연결 종료
-        await self.disconnect()
-
-        # 대기
-        await asyncio.sleep(self.reconnect_delay)
-
-        # 재연결
-        success = await self.connect()
-        if success:
-            # 기존 구독 재등록
-            for grp_no, sub_info in self.subscriptions.items():
-                await self.subscribe(
-                    stock_codes=sub_info['stock_codes'],
-                    types=sub_info['types'],
-                    grp_no=grp_no,
-                    refresh=sub_info['refresh']
-                )
+        # 재연결 중 구독 응답은 직접 수신 (수신 루프가 이 호출 안에서 멈춰 있음)
+        self._reconnecting = True
+        try:
+            # 기존 연결 종료
+            await self.disconnect()
+
+            # 대기
+            await asyncio.sleep(self.reconnect_delay)
+
+            # 재연결 (라우터 구독자는 그대로 유지)
+            success = await self.connect()
+            if success:
+                # 기존 구독 재등록
+                for grp_no, sub_info in list(self.subscriptions.items()):
+                    await self.subscribe(
+                        stock_codes=sub_info['stock_codes'],
+                        types=sub_info['types'],
+                        grp_no=grp_no,
+                        refresh=sub_info['refresh']
+                    )
+        finally:
+            self._reconnecting = False
 
     async def disconnect(self):
         """WebSocket 연결 종료"""
@@ -402,6 +599,7 @@ class WebSocketManager:
             self.is_connected = False
             self.is_logged_in = False
             self.websocket = None
+            self._cancel_pending_acks()
 
     async def unsubscribe(self, grp_no: str) -> bool:
         """
@@ -423,8 +621,11 @@ class WebSocketManager:
                 "grp_no": grp_no
             }
 
-            await self.websocket.send(json.dumps(unsubscribe_request))
             logger.info(f"📤 구독 해지 요청 전송: grp_no={grp_no}")
+            response = await self._request(unsubscribe_request, timeout=2.0)
+            if response is not None and response.get('return_code') != 0:
+                logger.error(f"❌ 구독 해지 실패: {response.get('return_msg')}")
+                return False
 
             # 구독 정보 삭제
             if grp_no in self.subscriptions:
@@ -447,9 +648,19 @@ class WebSocketManager:
             'connected': self.is_connected,
             'logged_in': self.is_logged_in,
             'subscriptions': self.subscriptions,
-            'ws_url': self.ws_url
+            'ws_url': self.ws_url,
+            'streams': self.get_router_stats()
         }
 
+    def get_router_stats(self) -> Dict[str, Any]:
+        """
+        실시간 분배 통계
+
+        Returns:
+            타입별/종목별 처리량과 구독자별 전달/폐기/오류 수
+        """
+        return self.router.get_stats()
+
 
 async def test_websocket():
     """WebSocketManager 테스트"""
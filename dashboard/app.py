@@ -4,7 +4,7 @@ import sys
 import time
 import json
 import threading
-from datetime import datetime, timedelta
+from datetime import timedelta
 from pathlib import Path
 from typing import Dict, Any, List
 
@@ -16,7 +16,9 @@ import yaml
 BASE_DIR = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(BASE_DIR))
 
-REALTIME_UPDATE_INTERVAL = 3
+from utils.websocket_streaming import get_stream_publisher
+
+REALTIME_UPDATE_INTERVAL = 1  # status 채널 샘플링 간격 (변경이 있을 때만 전송)
 
 # Import config constants
 try:
@@ -58,6 +60,9 @@ bot_instance = None
 config_manager = None
 realtime_chart_manager = None
 
+# Server-side publisher: 상태는 한 번만 발행하고 구독 클라이언트에 델타로 팬아웃
+stream_publisher = get_stream_publisher()
+
 
 # ============================================================================
 # ROUTE REGISTRATION
@@ -125,25 +130,86 @@ def get_control_status() -> Dict[str, Any]:
 
 
 # ============================================================================
-# REAL-TIME UPDATE THREAD
+# REAL-TIME PUBLISHING
 # ============================================================================
 
+def _emit_to_client(sid: str, event: str, payload: Any):
+    """Publisher transport: Socket.IO emit to one client"""
+    socketio.emit(event, payload, to=sid)
+
+
+def _collect_status() -> Dict[str, Any]:
+    """Bot/control status for the 'status' channel"""
+    control = get_control_status()
+    status = {
+        'trading_enabled': control.get('trading_enabled', False),
+        'pause_buy': control.get('pause_buy', False),
+        'pause_sell': control.get('pause_sell', False),
+    }
+    if bot_instance is not None:
+        status['bot_running'] = getattr(bot_instance, 'is_running', False)
+        market_status = getattr(bot_instance, 'market_status', None) or {}
+        status['market_open'] = market_status.get('is_trading_hours', False)
+        status['market_status'] = market_status.get('market_status', '')
+    return status
+
+
 def realtime_update_thread():
-    """Background thread for pushing real-time updates"""
+    """Background thread: sample status and publish changes only"""
     while True:
-        time.sleep(3)  # Update every 3 seconds
-
         try:
-            # Push status update
-            control = get_control_status()
-            socketio.emit('status_update', {
-                'timestamp': datetime.now().isoformat(),
-                'trading_enabled': control.get('trading_enabled', False)
-            })
+            stream_publisher.publish('status', _collect_status())
         except Exception as e:
             print(f"Error in realtime update: {e}")
+        time.sleep(REALTIME_UPDATE_INTERVAL)
+
+
+def _parse_price(value: Any) -> int:
+    """Kiwoom 실시간 값 ('+71000', '-71000') → 절댓값 정수"""
+    try:
+        return abs(int(float(str(value).replace(',', ''))))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _publish_tick(data: Dict[str, Any]):
+    """0B 체결 틱 → 'ticks' / 'candles:{code}' 채널 발행"""
+    stock_code = data.get('item', '')
+    values = data.get('values', {})
+    price = _parse_price(values.get('10'))
+    if not stock_code or not price:
+        return
+
+    tick = {
+        'price': price,
+        'volume': _parse_price(values.get('15')),
+        'time': values.get('16', ''),
+    }
+    if '12' in values:
+        try:
+            tick['change_rate'] = float(values['12'])
+        except (TypeError, ValueError):
+            pass
+    stream_publisher.publish('ticks', {stock_code: tick})
+
+    if realtime_chart_manager is not None:
+        candle = realtime_chart_manager.get_current_candle(stock_code)
+        if candle:
+            stream_publisher.publish(f'candles:{stock_code}', {str(candle['timestamp']): candle})
+
+
+def _candle_snapshot(channel: str) -> Dict[str, Any]:
+    """'candles:{code}' 스냅샷 원천 (분봉 버퍼 전체)"""
+    if realtime_chart_manager is None:
+        return {}
+    stock_code = channel.split(':', 1)[1]
+    rows = realtime_chart_manager.get_minute_data(stock_code, None)
+    return {str(row['timestamp']): row for row in rows}
 
 
+stream_publisher.configure_channel('candles', min_interval=0.5, max_items=390, snapshot=_candle_snapshot)
+stream_publisher.start(_emit_to_client)
+
 # Start real-time update thread
 update_thread = threading.Thread(target=realtime_update_thread, daemon=True)
 update_thread.start()
@@ -214,6 +280,13 @@ def run_dashboard(bot=None, host: str = None, port: int = None, debug: bool = Fa
                 realtime_chart_manager = None
         else:
             print("⚠️ RealtimeMinuteChartManager not available")
+
+        # 대시보드 수와 무관하게 틱은 구독자 1개로만 받아 발행
+        try:
+            bot_instance.websocket_manager.add_subscriber('0B', _publish_tick, name='dashboard_stream')
+            print("✅ Dashboard tick stream initialized")
+        except Exception as e:
+            print(f"⚠️ Failed to initialize dashboard tick stream: {e}")
     else:
         print("⚠️ WebSocket manager not available, real-time minute charts disabled")
 
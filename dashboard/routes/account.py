@@ -6,6 +6,7 @@ from flask import Blueprint, jsonify
 from typing import Dict, Any
 from datetime import datetime
 from research.data_fetcher import is_nxt_hours
+from utils.data_cache import get_api_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,6 +16,9 @@ account_bp = Blueprint('account', __name__)
 # Global bot instance (will be set by main app)
 _bot_instance = None
 
+# 대시보드 폴링 요청 공용 캐시: 짧은 TTL 안의 동시 요청은 TR 1회로 합쳐진다 (single-flight)
+ACCOUNT_CACHE_TTL = 2
+
 
 def set_bot_instance(bot):
     """Set the bot instance for this module"""
@@ -22,6 +26,22 @@ def set_bot_instance(bot):
     _bot_instance = bot
 
 
+def _account_cache():
+    return get_api_cache().namespace('dashboard_account', ACCOUNT_CACHE_TTL)
+
+
+def _fetch_holdings():
+    """KRX+NXT 보유 종목 (여러 대시보드/엔드포인트가 같은 조회 결과 공유)"""
+    return _account_cache().get_or_set(
+        'holdings', lambda: _bot_instance.account_api.get_holdings(market_type="KRX+NXT")
+    )
+
+
+def _fetch_deposit():
+    """예수금 (여러 대시보드가 같은 조회 결과 공유)"""
+    return _account_cache().get_or_set('deposit', _bot_instance.account_api.get_deposit)
+
+
 @account_bp.route('/api/account')
 def get_account():
     """Get account information from real API"""
@@ -35,12 +55,12 @@ def get_account():
     try:
         if _bot_instance and hasattr(_bot_instance, 'account_api'):
             # 실제 API에서 데이터 가져오기 (테스트 모드에서도 가장 최근 데이터 사용)
-            deposit = _bot_instance.account_api.get_deposit()
+            deposit = _fetch_deposit()
 
             # v5.5.0: KRX+NXT 통합 조회로 중복 제거
             # 이전에는 KRX와 NXT를 각각 조회하여 같은 종목이 2번 카운트되는 버그 발생
             # API가 "KRX+NXT" 옵션을 지원하므로 한 번에 조회
-            holdings = _bot_instance.account_api.get_holdings(market_type="KRX+NXT") or []
+            holdings = _fetch_holdings() or []
 
             # 디버깅 로그
             if holdings:
@@ -219,7 +239,7 @@ def get_account_portfolio():
                 'message': 'Bot not initialized'
             })
 
-        holdings = _bot_instance.account_api.get_holdings(market_type="KRX+NXT")
+        holdings = _fetch_holdings()
 
         if not holdings:
             return jsonify({
@@ -314,7 +334,7 @@ def get_positions():
             return jsonify([])
 
         # v5.5.0: KRX+NXT 통합 조회
-        holdings = _bot_instance.account_api.get_holdings(market_type="KRX+NXT")
+        holdings = _fetch_holdings()
 
         if not holdings:
             print("[POSITIONS] 보유 종목 없음")
@@ -457,7 +477,7 @@ def get_real_holdings():
             })
 
         # v5.5.0: KRX+NXT 통합 조회
-        raw_holdings = _bot_instance.account_api.get_holdings(market_type="KRX+NXT")
+        raw_holdings = _fetch_holdings()
 
         if not raw_holdings:
             print("[HOLDINGS] 보유 종목 없음")
@@ -705,7 +725,7 @@ def get_optimization_summary():
             })
 
         optimizer = get_profit_optimizer()
-        holdings = _bot_instance.account_api.get_holdings(market_type="KRX+NXT")
+        holdings = _fetch_holdings()
 
         if not holdings:
             return jsonify({
@@ -687,6 +687,14 @@ def get_cache_stats():
         cache_mgr = get_cache_manager()
         stats = cache_mgr.get_stats()
 
+        # 공용 캐시 네임스페이스별 통계 (deep_scan 등)
+        from utils.data_cache import get_shared_cache
+        stats['shared_namespaces'] = get_shared_cache().get_namespace_stats()
+
+        # LLM 분석 영구 캐시 (히트/미스, 절약된 호출 시간)
+        from ai.analysis_cache import get_analysis_cache
+        stats['ai_analysis'] = get_analysis_cache().get_stats()
+
         return jsonify({
             'success': True,
             **stats
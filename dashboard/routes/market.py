@@ -273,9 +273,8 @@ def get_chart_data(stock_code: str):
                             candle_count = _realtime_chart_manager.charts[stock_code].get_candle_count()
                             if candle_count > 0:
                                 print(f"✅ Using real-time minute data ({candle_count} candles)")
-                                # Get requested number of minutes (default 60)
-                                minutes = int(timeframe) if timeframe == '1' else 60
-                                daily_data = _realtime_chart_manager.get_minute_data(stock_code, minutes=minutes)
+                                # 요청 주기의 실시간 봉 전체 (시간순 → 다른 소스와 같은 최신순)
+                                daily_data = _realtime_minute_rows(stock_code, timeframe)
                                 minute_data_available = True
                                 actual_timeframe = timeframe
                         else:
@@ -306,8 +305,7 @@ def get_chart_data(stock_code: str):
                                         if success:
                                             print(f"✅ {stock_code} added to real-time tracking")
                                             # Try to get data after subscription (might be empty initially)
-                                            minutes = int(timeframe) if timeframe == '1' else 60
-                                            daily_data = _realtime_chart_manager.get_minute_data(stock_code, minutes=minutes)
+                                            daily_data = _realtime_minute_rows(stock_code, timeframe)
                                             if daily_data and len(daily_data) > 0:
                                                 minute_data_available = True
                                                 actual_timeframe = timeframe
@@ -670,6 +668,50 @@ def remove_realtime_chart(stock_code):
         return error_response(str(e))
 
 
+def _realtime_minute_rows(stock_code: str, timeframe: str):
+    """실시간 분봉 (요청 주기로 집계된 봉, 최신순)"""
+    interval = int(timeframe) if timeframe in ('1', '3', '5', '15', '30', '60') else 1
+    rows = _realtime_chart_manager.get_minute_data(stock_code, minutes=None, interval=interval)
+    rows.reverse()
+    return rows
+
+
+@market_bp.route('/api/realtime_chart/<stock_code>')
+def get_realtime_chart_series(stock_code: str):
+    """Get real-time intraday bars and incremental indicators (no recomputation)"""
+    try:
+        if not _realtime_chart_manager:
+            return jsonify({
+                'success': False,
+                'error': '실시간 차트 관리자가 초기화되지 않았습니다'
+            })
+
+        if stock_code not in _realtime_chart_manager.charts:
+            return jsonify({
+                'success': False,
+                'error': f'{stock_code} 실시간 추적 중이 아닙니다'
+            })
+
+        interval = request.args.get('interval', 1, type=int)
+        count = request.args.get('count', 120, type=int)
+        chart = _realtime_chart_manager.charts[stock_code]
+        if interval not in chart.candles.intervals:
+            return jsonify({
+                'success': False,
+                'error': f'지원하지 않는 주기입니다: {interval}'
+            })
+
+        return jsonify({
+            'success': True,
+            'stock_code': stock_code,
+            'interval': interval,
+            'data': chart.get_minute_data(count, interval),
+            'indicators': chart.get_indicators(interval)
+        })
+    except Exception as e:
+        return error_response(str(e))
+
+
 @market_bp.route('/api/realtime_chart/status')
 def get_realtime_chart_status():
     """Get status of all real-time tracked stocks"""
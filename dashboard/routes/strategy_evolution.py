@@ -2,10 +2,10 @@
 전략 진화 현황 API
 """
 from flask import Blueprint, jsonify
-import sqlite3
 import json
 from datetime import datetime
 from utils.logger_new import get_logger
+from utils.sqlite_db import get_database
 
 logger = get_logger()  # Fix: get_logger()는 인자를 받지 않음
 
@@ -29,18 +29,15 @@ def get_status():
                 'note': '실행 명령: python run_strategy_optimizer.py --auto-deploy'
             })
 
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        db = get_database(DB_PATH)
 
         # 최신 세대 정보
-        cursor.execute("""
+        latest = db.query_one("""
             SELECT generation, best_fitness, avg_fitness, worst_fitness, created_at
             FROM generation_stats
             ORDER BY generation DESC
             LIMIT 1
         """)
-        latest = cursor.fetchone()
 
         if not latest:
             return jsonify({
@@ -50,10 +47,7 @@ def get_status():
             })
 
         # 전체 세대 수
-        cursor.execute("SELECT COUNT(*) as count FROM generation_stats")
-        total_generations = cursor.fetchone()['count']
-
-        conn.close()
+        total_generations = db.query_one("SELECT COUNT(*) as count FROM generation_stats")['count']
 
         return jsonify({
             'success': True,
@@ -86,18 +80,16 @@ def get_history():
                 'message': '진화 데이터가 없습니다'
             })
 
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        db = get_database(DB_PATH)
 
-        cursor.execute("""
+        rows = db.query("""
             SELECT generation, best_fitness, avg_fitness, worst_fitness, created_at
             FROM generation_stats
             ORDER BY generation ASC
         """)
 
         history = []
-        for row in cursor.fetchall():
+        for row in rows:
             history.append({
                 'generation': row['generation'],
                 'best_fitness': round(row['best_fitness'], 2),
@@ -106,8 +98,6 @@ def get_history():
                 'created_at': row['created_at']
             })
 
-        conn.close()
-
         return jsonify({
             'success': True,
             'history': history,
@@ -132,12 +122,10 @@ def get_best_strategy():
                 'message': '전략 진화 엔진이 실행되지 않았습니다'
             })
 
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        db = get_database(DB_PATH)
 
         # 최신 세대의 최고 점수 전략
-        cursor.execute("""
+        best = db.query_one("""
             SELECT es.id, es.generation, es.genes, fr.fitness_score,
                    fr.total_return_pct, fr.sharpe_ratio, fr.win_rate,
                    fr.max_drawdown_pct, fr.profit_factor, fr.total_trades
@@ -147,9 +135,6 @@ def get_best_strategy():
             LIMIT 1
         """)
 
-        best = cursor.fetchone()
-        conn.close()
-
         if not best:
             return jsonify({
                 'success': False,
@@ -185,11 +170,9 @@ def get_best_strategy():
 def get_generation_detail(generation: int):
     """특정 세대의 전략들 조회"""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        db = get_database(DB_PATH)
 
-        cursor.execute("""
+        rows = db.query("""
             SELECT es.id, es.genes, fr.fitness_score
             FROM evolved_strategies es
             JOIN fitness_results fr ON es.id = fr.strategy_id
@@ -198,15 +181,13 @@ def get_generation_detail(generation: int):
         """, (generation,))
 
         strategies = []
-        for row in cursor.fetchall():
+        for row in rows:
             strategies.append({
                 'id': row['id'],
                 'fitness_score': round(row['fitness_score'], 2),
                 'genes': json.loads(row['genes'])
             })
 
-        conn.close()
-
         return jsonify({
             'success': True,
             'generation': generation,
@@ -234,12 +215,10 @@ def get_deployment_status():
                 'message': '전략 진화 엔진이 실행되지 않았습니다'
             })
 
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        db = get_database(DB_PATH)
 
         # 최근 배포 가능한 최우수 전략들
-        cursor.execute("""
+        rows = db.query("""
             SELECT
                 gs.generation,
                 gs.best_fitness,
@@ -257,7 +236,7 @@ def get_deployment_status():
         """)
 
         deployable_strategies = []
-        for row in cursor.fetchall():
+        for row in rows:
             genes = json.loads(row['genes'])
             deployable_strategies.append({
                 'generation': row['generation'],
@@ -274,8 +253,6 @@ def get_deployment_status():
                 }
             })
 
-        conn.close()
-
         return jsonify({
             'success': True,
             'deployable_strategies': deployable_strategies,
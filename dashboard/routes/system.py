@@ -721,6 +721,46 @@ def get_anomalies():
         return error_response(str(e), status=500)
 
 
+@system_bp.route('/api/system/rate-limits')
+def get_rate_limits():
+    """REST API 호출 한도 사용 현황 (전역 + TR별)"""
+    try:
+        client = getattr(_bot_instance, 'client', None) if _bot_instance else None
+
+        if not client or not hasattr(client, 'get_rate_limit_stats'):
+            return jsonify({'success': False, 'message': 'REST 클라이언트 미연결'})
+
+        market_api = getattr(_bot_instance, 'market_api', None)
+        coalescing = market_api.get_coalescing_stats() if hasattr(market_api, 'get_coalescing_stats') else None
+
+        return jsonify({
+            'success': True,
+            'stats': client.get_rate_limit_stats(),
+            'coalescing': coalescing,
+            'timestamp': datetime.now().isoformat()
+        })
+    except Exception as e:
+        return error_response(str(e), status=500)
+
+
+@system_bp.route('/api/system/engine')
+def get_engine_stats():
+    """이벤트 기반 트레이딩 엔진 상태 (작업 주기, 틱→판정→주문 지연)"""
+    try:
+        engine = getattr(_bot_instance, 'trading_engine', None) if _bot_instance else None
+
+        if not engine:
+            return jsonify({'success': False, 'message': '트레이딩 엔진 미실행'})
+
+        return jsonify({
+            'success': True,
+            'stats': engine.get_stats(),
+            'timestamp': datetime.now().isoformat()
+        })
+    except Exception as e:
+        return error_response(str(e), status=500)
+
+
 # WebSocket Endpoints
 
 @system_bp.route('/api/websocket/subscriptions')
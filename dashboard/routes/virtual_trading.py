@@ -26,7 +26,8 @@ def init_virtual_trading_manager(bot=None, db_path: str = "data/virtual_trading.
         db_path: SQLite 데이터베이스 파일 경로
     """
     global virtual_manager, _bot_instance
-    virtual_manager = VirtualTradingManager(db_path)
+    # 봇이 이미 매니저를 만들었으면 재사용 (새로 만들어도 같은 DB면 장부는 공유됨)
+    virtual_manager = getattr(bot, 'virtual_trading_manager', None) or VirtualTradingManager(db_path)
     _bot_instance = bot
 
     if bot and hasattr(bot, 'data_fetcher'):
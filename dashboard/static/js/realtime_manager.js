@@ -2,6 +2,7 @@ class RealtimeDataManager {
     constructor() {
         this.socket = null;
         this.subscribers = new Map();
+        this.channelState = new Map();  // channel -> { seq, data }
         this.reconnectAttempts = 0;
         this.maxReconnectAttempts = 5;
         this.reconnectDelay = 2000;
@@ -79,6 +80,49 @@ class RealtimeDataManager {
         this.socket.on('alert', (data) => {
             this.notifySubscribers('alert', data);
         });
+
+        // 서버 퍼블리셔: 구독 직후 스냅샷, 이후 델타 묶음
+        this.socket.on('stream_snapshot', (snapshot) => {
+            this.channelState.set(snapshot.channel, { seq: snapshot.seq, data: snapshot.data || {} });
+            this.notifySubscribers(snapshot.channel, snapshot.data || {}, null);
+        });
+
+        this.socket.on('stream', (deltas) => {
+            for (const delta of deltas) {
+                this.applyDelta(delta);
+            }
+        });
+    }
+
+    applyDelta(delta) {
+        const state = this.channelState.get(delta.channel);
+        if (!state || delta.seq <= state.seq) return;
+
+        // seq가 끊기면 (큐 초과로 델타 유실) 재구독해서 스냅샷부터 다시 받음
+        if (delta.seq !== state.seq + 1) {
+            this.channelState.delete(delta.channel);
+            this.socket.emit('subscribe', { channel: delta.channel });
+            return;
+        }
+
+        const data = state.data;
+        for (const [key, value] of Object.entries(delta.set || {})) {
+            data[key] = value;
+        }
+        for (const [key, fields] of Object.entries(delta.patch || {})) {
+            data[key] = Object.assign(data[key] || {}, fields);
+        }
+        for (const key of delta.del || []) {
+            delete data[key];
+        }
+        state.seq = delta.seq;
+
+        this.notifySubscribers(delta.channel, data, delta);
+    }
+
+    getChannelState(channel) {
+        const state = this.channelState.get(channel);
+        return state ? state.data : null;
     }
 
     subscribe(channel, callback) {
@@ -102,6 +146,7 @@ class RealtimeDataManager {
 
         if (this.subscribers.get(channel).size === 0) {
             this.subscribers.delete(channel);
+            this.channelState.delete(channel);
 
             if (this.isConnected && this.socket) {
                 this.socket.emit('unsubscribe', { channel });
@@ -111,12 +156,12 @@ class RealtimeDataManager {
         console.log(`Unsubscribed from channel: ${channel}`);
     }
 
-    notifySubscribers(channel, data) {
+    notifySubscribers(channel, data, delta) {
         if (!this.subscribers.has(channel)) return;
 
         for (const callback of this.subscribers.get(channel)) {
             try {
-                callback(data);
+                callback(data, delta);
             } catch (error) {
                 console.error(`Error in subscriber callback for ${channel}:`, error);
             }
@@ -4,17 +4,36 @@ WebSocket connection handlers for real-time dashboard updates
 from flask import request
 from flask_socketio import emit
 
+from utils.websocket_streaming import get_stream_publisher
+
 
 def register_websocket_handlers(socketio):
     """Register all WebSocket event handlers"""
+    publisher = get_stream_publisher()
 
     @socketio.on('connect')
     def handle_connect():
         """Client connected"""
+        publisher.connect(request.sid)
         emit('connected', {'message': 'Connected to AutoTrade Pro'})
         print(f"Client connected: {request.sid}")
 
     @socketio.on('disconnect')
     def handle_disconnect():
         """Client disconnected"""
+        publisher.disconnect(request.sid)
         print(f"Client disconnected: {request.sid}")
+
+    @socketio.on('subscribe')
+    def handle_subscribe(data):
+        """Subscribe to a publisher channel (snapshot is sent immediately)"""
+        channel = (data or {}).get('channel')
+        if channel:
+            publisher.subscribe(request.sid, channel)
+
+    @socketio.on('unsubscribe')
+    def handle_unsubscribe(data):
+        """Unsubscribe from a publisher channel"""
+        channel = (data or {}).get('channel')
+        if channel:
+            publisher.unsubscribe(request.sid, channel)
@@ -91,6 +91,7 @@ from datetime import datetime
 from typing import Optional
 from sqlalchemy import (
     create_engine,
+    event,
     Column,
     Integer,
     String,
@@ -106,6 +107,7 @@ from sqlalchemy.orm import sessionmaker, relationship
 from pathlib import Path
 
 from utils.logger_new import get_logger
+from utils.sqlite_db import configure_connection
 
 from config.manager import get_config
 
@@ -402,6 +404,10 @@ class Database:
                 max_overflow=db_config.get('max_overflow', 10),
             )
 
+            # 풀의 모든 연결에 공용 PRAGMA 적용 (WAL, synchronous=NORMAL 등)
+            if db_type == 'sqlite':
+                event.listen(self._engine, 'connect', lambda dbapi_conn, _: configure_connection(dbapi_conn))
+
             # 테이블 생성 (인덱스 포함)
             Base.metadata.create_all(self._engine)
             logger.info("✅ 데이터베이스 테이블 및 인덱스 생성 완료")
@@ -1,5 +1,4 @@
 """AI Learning System"""
-import json
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Tuple, Any
@@ -9,6 +8,8 @@ from pathlib import Path
 from collections import defaultdict
 import logging
 
+from utils.journal_store import JournalStore
+
 logger = logging.getLogger(__name__)
 
 MIN_TRADES_FOR_ANALYSIS = 10
@@ -31,6 +32,13 @@ NORMAL_VOLATILITY_THRESHOLD = 0.20
 MIN_OPTIMIZATION_DATA = 5
 
 
+def _index_patterns(data: Dict[str, Any]) -> Dict[str, Any]:
+    """기존 스냅샷({'patterns': [...]}) → 패턴 id별 dict"""
+    if isinstance(data, dict) and isinstance(data.get('patterns'), list):
+        data['patterns'] = {p['id']: p for p in data['patterns']}
+    return data
+
+
 @dataclass
 class TradingPattern:
     id: str
@@ -71,6 +79,7 @@ class AILearningEngine:
         self.learning_data_file = Path('data/ai_learning_data.json')
         self.patterns_file = Path('data/ai_patterns.json')
         self._ensure_data_files()
+        self._patterns_store = JournalStore(self.patterns_file, compact_every=200, migrate=_index_patterns)
         self._load_learning_data()
 
     def _ensure_data_files(self):
@@ -81,22 +90,17 @@ class AILearningEngine:
 
     def _load_learning_data(self):
         try:
-            if self.patterns_file.exists():
-                with open(self.patterns_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if 'patterns' in data:
-                        self.patterns = [TradingPattern(**p) for p in data['patterns']]
-                    logger.info(f"Loaded {len(self.patterns)} learned patterns")
+            self.patterns = [TradingPattern(**p) for p in self._patterns_store.get('patterns', {}).values()]
+            logger.info(f"Loaded {len(self.patterns)} learned patterns")
         except Exception as e:
             logger.error(f"Error loading learning data: {e}")
 
-    def _save_learning_data(self):
+    def _save_learning_data(self, patterns: Optional[List[TradingPattern]] = None):
+        """패턴 id 단위로 저널 기록 (patterns 미지정 시 전체)"""
         try:
-            with open(self.patterns_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'patterns': [asdict(p) for p in self.patterns],
-                    'last_updated': datetime.now().isoformat()
-                }, f, ensure_ascii=False, indent=2)
+            with self._patterns_store.batch():
+                for pattern in (self.patterns if patterns is None else patterns):
+                    self._patterns_store.set(('patterns', pattern.id), asdict(pattern))
         except Exception as e:
             logger.error(f"Error saving learning data: {e}")
 
@@ -217,7 +221,7 @@ class AILearningEngine:
                     idx = self.patterns.index(existing[0])
                     self.patterns[idx] = pattern
 
-            self._save_learning_data()
+            self._save_learning_data(recognized_patterns)
 
         except Exception as e:
             logger.error(f"Error recognizing patterns: {e}")
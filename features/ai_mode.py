@@ -1,5 +1,4 @@
 """AI Mode - Autonomous Trading Agent"""
-import json
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Any, Tuple
@@ -9,10 +8,11 @@ from pathlib import Path
 import logging
 from enum import Enum
 
+from utils.journal_store import JournalStore
+
 logger = logging.getLogger(__name__)
 
 DECISIONS_TO_KEEP = 100
-DECISION_SAVE_INTERVAL = 10
 RECENT_DECISIONS_LIMIT = 50
 MIN_DECISIONS_FOR_OPTIMIZATION = 10
 REGIMES_TO_KEEP = 30
@@ -110,6 +110,8 @@ class AIAgent:
         self.strategies_file = Path('data/ai_strategies.json')
         self.decisions_file = Path('data/ai_decisions.json')
         self._ensure_data_files()
+        self._strategies_store = JournalStore(self.strategies_file, compact_every=100)
+        self._decisions_store = JournalStore(self.decisions_file)
         self._load_ai_state()
 
     def _ensure_data_files(self):
@@ -134,40 +136,31 @@ class AIAgent:
 
     def _load_ai_state(self):
         try:
-            if self.strategies_file.exists():
-                with open(self.strategies_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if 'strategies' in data:
-                        self.strategies = [AIStrategy(**s) for s in data['strategies']]
-                    logger.info(f"Loaded {len(self.strategies)} AI strategies")
-
-            if self.decisions_file.exists():
-                with open(self.decisions_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if 'decisions' in data:
-                        self.decisions_history = [AIDecision(**d) for d in data['decisions'][-DECISIONS_TO_KEEP:]]
-                    logger.info(f"Loaded {len(self.decisions_history)} AI decisions")
+            self.strategies = [AIStrategy(**s) for s in self._strategies_store.get('strategies', [])]
+            logger.info(f"Loaded {len(self.strategies)} AI strategies")
+
+            decisions = self._decisions_store.get('decisions', [])[-DECISIONS_TO_KEEP:]
+            self.decisions_history = [AIDecision(**d) for d in decisions]
+            logger.info(f"Loaded {len(self.decisions_history)} AI decisions")
 
         except Exception as e:
             logger.error(f"Error loading AI state: {e}")
 
     def _save_ai_state(self):
+        """Strategies changed in place -> one journal record (decisions are appended as they are made)"""
         try:
-            with open(self.strategies_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'strategies': [asdict(s) for s in self.strategies],
-                    'last_updated': datetime.now().isoformat()
-                }, f, ensure_ascii=False, indent=2)
-
-            with open(self.decisions_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'decisions': [asdict(d) for d in self.decisions_history[-DECISIONS_TO_KEEP:]],
-                    'last_updated': datetime.now().isoformat()
-                }, f, ensure_ascii=False, indent=2)
-
+            self._strategies_store.set('strategies', [asdict(s) for s in self.strategies])
         except Exception as e:
             logger.error(f"Error saving AI state: {e}")
 
+    def _record_decision(self, decision: AIDecision):
+        self.decisions_history.append(decision)
+        del self.decisions_history[:-DECISIONS_TO_KEEP]
+        try:
+            self._decisions_store.append('decisions', asdict(decision), limit=DECISIONS_TO_KEEP)
+        except Exception as e:
+            logger.error(f"Error saving AI decision: {e}")
+
     def enable_ai_mode(self):
         """Enable AI mode"""
         self.enabled = True
@@ -497,16 +490,13 @@ class AIAgent:
             )
 
             # Record decision
-            self.decisions_history.append(decision)
+            self._record_decision(decision)
             self.performance.total_decisions += 1
             self.performance.avg_decision_confidence = (
                 (self.performance.avg_decision_confidence * (self.performance.total_decisions - 1) + confidence)
                 / self.performance.total_decisions
             )
 
-            if len(self.decisions_history) % DECISION_SAVE_INTERVAL == 0:
-                self._save_ai_state()
-
             logger.info(f"AI Decision: {action.upper()} {stock_name} (confidence: {confidence:.0%})")
 
             return decision
@@ -18,8 +18,12 @@ from pathlib import Path
 from enum import Enum
 import logging
 
+from utils.journal_store import JournalStore
+
 logger = logging.getLogger(__name__)
 
+HISTORY_LIMIT = 100
+
 
 class NotificationPriority(Enum):
     """Notification priority levels"""
@@ -93,6 +97,7 @@ class NotificationManager:
         # Config file
         self.config_file = Path('config/notifications.json')
         self.history_file = Path('data/notifications.json')
+        self._history_store: Optional[JournalStore] = None
 
         self._load_config()
         self._load_history()
@@ -129,24 +134,29 @@ class NotificationManager:
             logger.error(f"Error saving notification config: {e}")
 
     def _load_history(self):
-        """Load notification history"""
+        """Load notification history (snapshot + journal replay)"""
         try:
-            if self.history_file.exists():
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.notifications = [Notification(**n) for n in data.get('notifications', [])][-100:]  # Keep last 100
+            self._history_store = JournalStore(self.history_file)
+            data = self._history_store.get('notifications', [])
+            self.notifications = [Notification(**n) for n in data][-HISTORY_LIMIT:]
         except Exception as e:
             logger.error(f"Error loading notification history: {e}")
 
+    def _append_history(self, notification: Notification):
+        """Append one notification to the history journal"""
+        if self._history_store is None:
+            return
+        try:
+            self._history_store.append('notifications', asdict(notification), limit=HISTORY_LIMIT)
+        except Exception as e:
+            logger.error(f"Error saving notification history: {e}")
+
     def _save_history(self):
-        """Save notification history"""
+        """Save notification history (after in-place edits such as read flags)"""
+        if self._history_store is None:
+            return
         try:
-            self.history_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'notifications': [asdict(n) for n in self.notifications[-100:]],
-                    'last_updated': datetime.now().isoformat()
-                }, f, ensure_ascii=False, indent=2)
+            self._history_store.set('notifications', [asdict(n) for n in self.notifications[-HISTORY_LIMIT:]])
         except Exception as e:
             logger.error(f"Error saving notification history: {e}")
 
@@ -208,7 +218,8 @@ class NotificationManager:
 
         notification.delivered = True
         self.notifications.append(notification)
-        self._save_history()
+        del self.notifications[:-HISTORY_LIMIT]
+        self._append_history(notification)
 
         logger.info(f"Notification sent: [{priority}] {title}")
 
@@ -14,7 +14,7 @@ import json
 import threading
 import time
 import numpy as np
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from dataclasses import dataclass, asdict, field
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -22,10 +22,28 @@ from collections import defaultdict
 import logging
 
 from config.constants import DELAYS
+from utils.journal_store import JournalStore
 
 logger = logging.getLogger(__name__)
 
 
+def _index_by_name(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Old full-rewrite snapshots kept lists; journaled state is keyed by name"""
+    if not isinstance(data, dict):
+        return {}
+    if isinstance(data.get('strategies'), list):
+        data['strategies'] = {s['name']: s for s in data['strategies']}
+    if isinstance(data.get('accounts'), list):
+        data['accounts'] = {a['strategy_name']: a for a in data['accounts']}
+    return data
+
+
+def _set_if_changed(store: JournalStore, key: Tuple[str, str], value: Dict[str, Any]) -> None:
+    """Journal value only if it differs from the stored (JSON-normalized) one"""
+    if json.loads(json.dumps(value, ensure_ascii=False, default=str)) != store.get(key):
+        store.set(key, value)
+
+
 @dataclass
 class VirtualPosition:
     """Virtual stock position"""
@@ -144,6 +162,9 @@ class PaperTradingEngine:
         self.trades_file = self.data_dir / 'trades.json'
 
         self._ensure_data_dir()
+        self._strategies_store = JournalStore(self.strategies_file, compact_every=100, migrate=_index_by_name)
+        self._accounts_store = JournalStore(self.accounts_file, compact_every=200, migrate=_index_by_name)
+        self._trades_store = JournalStore(self.trades_file)
         self._load_state()
         self._initialize_default_strategies()
 
@@ -152,57 +173,59 @@ class PaperTradingEngine:
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
     def _load_state(self):
-        """Load saved state from files"""
+        """Load saved state (snapshot + journal replay)"""
         try:
             # Load strategies
-            if self.strategies_file.exists():
-                with open(self.strategies_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    for s in data.get('strategies', []):
-                        self.strategies[s['name']] = StrategyConfig(**s)
-                logger.info(f"Loaded {len(self.strategies)} paper trading strategies")
-
-            # Load accounts
-            if self.accounts_file.exists():
-                with open(self.accounts_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    for a in data.get('accounts', []):
-                        # Reconstruct positions and trades
-                        positions = [VirtualPosition(**p) for p in a.get('positions', [])]
-                        trades = [VirtualTrade(**t) for t in a.get('trades', [])]
-                        a['positions'] = positions
-                        a['trades'] = trades
-                        self.accounts[a['strategy_name']] = VirtualAccount(**a)
-                logger.info(f"Loaded {len(self.accounts)} virtual accounts")
+            for s in self._strategies_store.get('strategies', {}).values():
+                self.strategies[s['name']] = StrategyConfig(**s)
+            logger.info(f"Loaded {len(self.strategies)} paper trading strategies")
+
+            # Load accounts (trades live in their own append-only journal)
+            for name, stored in self._accounts_store.get('accounts', {}).items():
+                a = dict(stored)
+                legacy_trades = a.pop('trades', None)
+                trades = self._trades_store.get(('trades', name))
+                if trades is None and legacy_trades:
+                    # Old accounts.json kept trades inline -> move them once
+                    self._trades_store.set(('trades', name), legacy_trades)
+                    trades = legacy_trades
+                a['positions'] = [VirtualPosition(**p) for p in a.get('positions', [])]
+                a['trades'] = [VirtualTrade(**t) for t in trades or []]
+                self.accounts[name] = VirtualAccount(**a)
+            logger.info(f"Loaded {len(self.accounts)} virtual accounts")
 
         except Exception as e:
             logger.error(f"Error loading paper trading state: {e}")
 
     def _save_state(self):
-        """Save state to files"""
+        """
+        Save strategies and account summaries (trades are journaled as they happen)
+
+        Only entries that differ from the stored state are journaled, so an
+        idle iteration writes nothing.
+        """
         try:
-            # Save strategies
-            with open(self.strategies_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'strategies': [asdict(s) for s in self.strategies.values()],
-                    'last_updated': datetime.now().isoformat()
-                }, f, ensure_ascii=False, indent=2)
-
-            # Save accounts
-            with open(self.accounts_file, 'w', encoding='utf-8') as f:
-                accounts_data = []
-                for account in self.accounts.values():
-                    acc_dict = asdict(account)
-                    accounts_data.append(acc_dict)
+            with self._strategies_store.batch():
+                for strategy in self.strategies.values():
+                    _set_if_changed(self._strategies_store, ('strategies', strategy.name), asdict(strategy))
 
-                json.dump({
-                    'accounts': accounts_data,
-                    'last_updated': datetime.now().isoformat()
-                }, f, ensure_ascii=False, indent=2)
+            with self._accounts_store.batch():
+                for name, account in self.accounts.items():
+                    acc_dict = asdict(account)
+                    acc_dict.pop('trades')
+                    _set_if_changed(self._accounts_store, ('accounts', name), acc_dict)
 
         except Exception as e:
             logger.error(f"Error saving paper trading state: {e}")
 
+    def _record_trade(self, account: VirtualAccount, trade: VirtualTrade):
+        """Append a trade to the account and its journal"""
+        account.trades.append(trade)
+        try:
+            self._trades_store.append(('trades', account.strategy_name), asdict(trade))
+        except Exception as e:
+            logger.error(f"Error saving paper trade: {e}")
+
     def _initialize_default_strategies(self):
         """Initialize default strategies if none exist"""
         if len(self.strategies) > 0:
@@ -518,7 +541,7 @@ class PaperTradingEngine:
 
         # Update account
         account.positions.append(position)
-        account.trades.append(trade)
+        self._record_trade(account, trade)
         account.current_balance -= total_cost
         account.total_trades += 1
         account.last_updated = datetime.now().isoformat()
@@ -598,7 +621,7 @@ class PaperTradingEngine:
         )
 
         # Update account
-        account.trades.append(trade)
+        self._record_trade(account, trade)
         account.current_balance += total_proceeds
         account.last_updated = datetime.now().isoformat()
 
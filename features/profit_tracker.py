@@ -6,7 +6,8 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-import json
+
+from utils.journal_store import JournalStore
 
 
 @dataclass
@@ -95,44 +96,36 @@ class ProfitTracker:
         self.performance_file = data_dir / 'performance_cache.json'
 
         self._trades: List[TradeRecord] = []
+        self._store = JournalStore(
+            self.trades_file,
+            migrate=lambda data: {'trades': data} if isinstance(data, list) else data,
+        )
         self._load_trades()
 
     def _load_trades(self):
-        """저장된 거래 기록 로드"""
-        if self.trades_file.exists():
-            try:
-                with open(self.trades_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self._trades = [
-                        TradeRecord(
-                            trade_id=t['trade_id'],
-                            stock_code=t['stock_code'],
-                            stock_name=t['stock_name'],
-                            action=t['action'],
-                            quantity=t['quantity'],
-                            price=t['price'],
-                            timestamp=datetime.fromisoformat(t['timestamp']),
-                            profit_loss=t.get('profit_loss'),
-                            profit_loss_percent=t.get('profit_loss_percent')
-                        )
-                        for t in data
-                    ]
-            except Exception as e:
-                print(f"거래 기록 로드 실패: {e}")
-
-    def _save_trades(self):
-        """거래 기록 저장"""
+        """저장된 거래 기록 로드 (스냅샷 + 저널 재생)"""
         try:
-            self.data_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.trades_file, 'w', encoding='utf-8') as f:
-                json.dump([t.to_dict() for t in self._trades], f, ensure_ascii=False, indent=2)
+            self._trades = [
+                TradeRecord(
+                    trade_id=t['trade_id'],
+                    stock_code=t['stock_code'],
+                    stock_name=t['stock_name'],
+                    action=t['action'],
+                    quantity=t['quantity'],
+                    price=t['price'],
+                    timestamp=datetime.fromisoformat(t['timestamp']),
+                    profit_loss=t.get('profit_loss'),
+                    profit_loss_percent=t.get('profit_loss_percent')
+                )
+                for t in self._store.get('trades', [])
+            ]
         except Exception as e:
-            print(f"거래 기록 저장 실패: {e}")
+            print(f"거래 기록 로드 실패: {e}")
 
     def add_trade(self, trade: TradeRecord):
-        """거래 추가"""
+        """거래 추가 (저널에 한 줄 이어쓰기)"""
         self._trades.append(trade)
-        self._save_trades()
+        self._store.append('trades', trade.to_dict())
 
     def get_trades(self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> List[TradeRecord]:
         """
@@ -6,6 +6,7 @@ from .trend import sma, ema, calculate_trend
 from .momentum import rsi, macd, stochastic, calculate_momentum_score
 from .volatility import bollinger_bands, atr, calculate_volatility_score
 from .volume import volume_sma, obv, volume_ratio
+from .pipeline import compute_indicators, optimizer_indicator_columns, get_or_compute
 
 __all__ = [
     # Trend indicators
@@ -15,5 +16,7 @@ __all__ = [
     # Volatility indicators
     'bollinger_bands', 'atr', 'calculate_volatility_score',
     # Volume indicators
-    'volume_sma', 'obv', 'volume_ratio'
+    'volume_sma', 'obv', 'volume_ratio',
+    # Columnar pipeline
+    'compute_indicators', 'optimizer_indicator_columns', 'get_or_compute'
 ]
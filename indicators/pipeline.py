@@ -0,0 +1,174 @@
+"""
+Columnar Indicator Pipeline
+OHLCV 배열에서 지표를 한 번에 계산 (NumPy/pandas 벡터 연산)
+
+- compute_indicators(): 패키지 지표(SMA/EMA/RSI/MACD/Bollinger/ATR/OBV) 일괄 계산
+- optimizer_indicator_columns(): HistoricalOptimizer용 ma5/ma20/std_20/rsi/volume_ratio 컬럼
+- get_or_compute(): (종목, 기간) 단위 메모이제이션 (공용 LRUCache 'indicators' 네임스페이스)
+"""
+from typing import Callable, Dict, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .trend import sma, ema
+from .momentum import rsi, macd
+from .volatility import bollinger_bands, atr
+from .volume import obv, volume_sma
+
+
+def _as_array(values) -> np.ndarray:
+    """float64 1차원 배열 변환"""
+    return np.asarray(values, dtype=np.float64).ravel()
+
+
+def compute_indicators(close,
+                       high=None,
+                       low=None,
+                       volume=None,
+                       sma_periods=(5, 20, 60),
+                       ema_periods=(12, 26),
+                       rsi_period: int = 14,
+                       bb_period: int = 20,
+                       bb_std: float = 2.0,
+                       atr_period: int = 14) -> Dict[str, np.ndarray]:
+    """
+    OHLCV 배열에서 패키지 지표를 한 번에 계산
+
+    Args:
+        close: 종가 배열
+        high: 고가 배열 (ATR용, 선택)
+        low: 저가 배열 (ATR용, 선택)
+        volume: 거래량 배열 (OBV/거래량 이동평균용, 선택)
+        sma_periods: SMA 기간 목록
+        ema_periods: EMA 기간 목록
+        rsi_period: RSI 기간
+        bb_period: 볼린저 밴드 기간
+        bb_std: 볼린저 밴드 표준편차 배수
+        atr_period: ATR 기간
+
+    Returns:
+        {컬럼명: 배열} (값이 없는 구간은 NaN, 입력과 길이 동일)
+    """
+    close_s = pd.Series(_as_array(close))
+    columns: Dict[str, np.ndarray] = {'close': close_s.to_numpy()}
+
+    for period in sma_periods:
+        columns[f'sma_{period}'] = sma(close_s, period).to_numpy()
+    for period in ema_periods:
+        columns[f'ema_{period}'] = ema(close_s, period).to_numpy()
+
+    columns[f'rsi_{rsi_period}'] = rsi(close_s, rsi_period).to_numpy()
+
+    macd_line, signal_line, histogram = macd(close_s)
+    columns['macd'] = macd_line.to_numpy()
+    columns['macd_signal'] = signal_line.to_numpy()
+    columns['macd_hist'] = histogram.to_numpy()
+
+    upper, middle, lower = bollinger_bands(close_s, period=bb_period, std_dev=bb_std)
+    columns['bb_upper'] = upper.to_numpy()
+    columns['bb_middle'] = middle.to_numpy()
+    columns['bb_lower'] = lower.to_numpy()
+
+    if high is not None and low is not None:
+        columns[f'atr_{atr_period}'] = atr(
+            pd.Series(_as_array(high)), pd.Series(_as_array(low)), close_s, atr_period
+        ).to_numpy()
+
+    if volume is not None:
+        volume_s = pd.Series(_as_array(volume))
+        columns['obv'] = obv(close_s, volume_s).to_numpy()
+        columns['volume_sma_20'] = volume_sma(volume_s, 20).to_numpy()
+
+    return columns
+
+
+def optimizer_indicator_columns(close, volume) -> Dict[str, np.ndarray]:
+    """
+    HistoricalOptimizer.calculate_indicators와 같은 정의의 컬럼을 벡터로 계산
+
+    - ma20/std_20: 현재 포함 직전 21개 종가 평균/모집단 표준편차 (i < 20이면 종가/0)
+    - ma5: 현재 포함 직전 6개 종가 평균 (i < 5이면 종가)
+    - rsi: 직전 14개 변화량 중 상승분 평균 / 비상승분 평균 (i < 14이면 50)
+    - price_change_percent: 전일 대비 등락률 (첫 봉 0)
+    - volume_ratio: 거래량 / 직전 20개 평균 거래량 (i < 20이면 1)
+
+    Returns:
+        {컬럼명: 배열}
+    """
+    close = _as_array(close)
+    volume = _as_array(volume)
+    n = len(close)
+
+    ma20 = close.copy()
+    std_20 = np.zeros(n)
+    ma5 = close.copy()
+    rsi_values = np.full(n, 50.0)
+    price_change = np.zeros(n)
+    vol_ratio = np.ones(n)
+
+    if n > 20:
+        windows = sliding_window_view(close, 21)
+        ma20[20:] = windows.mean(axis=1)
+        std_20[20:] = windows.std(axis=1)
+
+        vol_windows = sliding_window_view(volume[:-1], 20)
+        avg_vol = vol_windows.mean(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            vol_ratio[20:] = np.where(avg_vol > 0, volume[20:] / avg_vol, 1.0)
+
+    if n > 5:
+        ma5[5:] = sliding_window_view(close, 6).mean(axis=1)
+
+    if n > 1:
+        diffs = np.diff(close)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            price_change[1:] = diffs / close[:-1] * 100
+
+        if n > 14:
+            diff_windows = sliding_window_view(diffs, 14)
+            up = diff_windows > 0
+            gain_cnt = up.sum(axis=1)
+            loss_cnt = 14 - gain_cnt
+            gain_sum = np.where(up, diff_windows, 0.0).sum(axis=1)
+            loss_sum = np.where(up, 0.0, -diff_windows).sum(axis=1)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                avg_gain = np.where(gain_cnt > 0, gain_sum / np.maximum(gain_cnt, 1), 0.0)
+                avg_loss = np.where(loss_cnt > 0, loss_sum / np.maximum(loss_cnt, 1), 1.0)
+                rs = np.where(avg_loss != 0, avg_gain / np.where(avg_loss != 0, avg_loss, 1.0), 0.0)
+            rsi_values[14:] = 100 - (100 / (1 + rs))
+
+    return {
+        'ma20': ma20,
+        'std_20': std_20,
+        'ma5': ma5,
+        'rsi': rsi_values,
+        'price_change_percent': price_change,
+        'volume_ratio': vol_ratio,
+    }
+
+
+def get_or_compute(key: Hashable, compute: Callable[[], object], ttl_seconds: Optional[int] = 3600):
+    """
+    (종목, 기간) 키 단위 지표 메모이제이션
+
+    같은 키를 동시에 요청해도 compute는 한 번만 실행된다.
+
+    Args:
+        key: 캐시 키 (예: ('005930', '2024-01-01', '2024-12-31', 250))
+        compute: 지표 계산 함수
+        ttl_seconds: 유효 시간 (초)
+    """
+    from utils.data_cache import get_namespace_cache
+
+    cache = get_namespace_cache('indicators', default_ttl_seconds=ttl_seconds)
+    return cache.get_or_set(repr(key), compute, ttl_seconds=ttl_seconds)
+
+
+__all__ = [
+    'compute_indicators',
+    'optimizer_indicator_columns',
+    'get_or_compute',
+]
@@ -34,18 +34,16 @@ def obv(close: pd.Series, volume: pd.Series) -> pd.Series:
     Returns:
         OBV values
     """
-    obv_values = pd.Series(index=close.index, dtype=float)
-    obv_values.iloc[0] = volume.iloc[0]
-
-    for i in range(1, len(close)):
-        if close.iloc[i] > close.iloc[i - 1]:
-            obv_values.iloc[i] = obv_values.iloc[i - 1] + volume.iloc[i]
-        elif close.iloc[i] < close.iloc[i - 1]:
-            obv_values.iloc[i] = obv_values.iloc[i - 1] - volume.iloc[i]
-        else:
-            obv_values.iloc[i] = obv_values.iloc[i - 1]
+    if len(close) == 0:
+        return pd.Series(index=close.index, dtype=float)
+
+    # 상승일 +거래량, 하락일 -거래량, 보합 0 → 누적합 (첫 값은 첫날 거래량)
+    direction = np.sign(np.diff(close.to_numpy(dtype=float)))
+    signed_volume = np.empty(len(close), dtype=float)
+    signed_volume[0] = volume.iloc[0]
+    signed_volume[1:] = direction * volume.to_numpy(dtype=float)[1:]
 
-    return obv_values
+    return pd.Series(np.cumsum(signed_volume), index=close.index, dtype=float)
 
 
 def volume_ratio(current_volume: int, avg_volume: float) -> float:
@@ -4,10 +4,11 @@
 
 용도: data/strategy_evolution.db가 없을 때 자동으로 생성
 """
-import sqlite3
 import os
 from pathlib import Path
 
+from utils.sqlite_db import connect
+
 DB_PATH = "data/strategy_evolution.db"
 
 
@@ -19,7 +20,7 @@ def init_evolution_database():
 
     print(f"📊 진화 데이터베이스 초기화 중: {DB_PATH}")
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = connect(DB_PATH)  # WAL 등 공용 PRAGMA 적용
     cursor = conn.cursor()
 
     # 1. 진화된 전략 테이블
@@ -7,29 +7,32 @@ import subprocess
 import asyncio
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+from utils.startup_profiler import get_startup_profiler
+
+startup_profiler = get_startup_profiler()
+if startup_profiler.enabled:
+    startup_profiler.install_import_hook()
+
+# 무거운 모듈(DB/ORM, REST·WebSocket 클라이언트, 전략·AI·가상매매)은
+# 해당 컴포넌트를 초기화하는 메서드 안에서 import한다 (시작 시간 단축)
 from config.manager import get_config
 from config.constants import DELAYS, URLS, HOST, PORTS
 from utils.logger_new import get_logger
-from database import get_db_session, Trade, Position, PortfolioSnapshot
-from core import KiwoomRESTClient
-from core.websocket_manager import WebSocketManager
-from api import AccountAPI, MarketAPI, OrderAPI
-from research import Screener, DataFetcher
-from research.scanner_pipeline import ScannerPipeline
-from strategy.scoring_system import ScoringSystem
-from strategy.dynamic_risk_manager import DynamicRiskManager
-from strategy import PortfolioManager
+from core.trading_engine import TradingEngine, parse_order_state
 from utils.activity_monitor import get_monitor
 from utils.alert_manager import get_alert_manager
 from utils.data_cache import get_api_cache
+from utils.websocket_streaming import get_stream_publisher
 from utils.trading_date import is_any_trading_hours
-from virtual_trading import VirtualTrader, TradeLogger, VirtualTradingManager, VirtualTradingScheduler
+
+if TYPE_CHECKING:
+    from ai.review_executor import AIReviewExecutor
 
 logger = get_logger()
 
@@ -75,6 +78,7 @@ class AutoTradingBot:
         self.account_api = None
         self.market_api = None
         self.order_api = None
+        self.algo_executor = None
         self.data_fetcher = None
 
         self.scanner = None
@@ -82,6 +86,7 @@ class AutoTradingBot:
         self.dynamic_risk_manager = None
         self.portfolio_manager = None
         self.analyzer = None
+        self.ai_review_executor = None
 
         self.split_order_executor = None
         self.smart_money_manager = None
@@ -98,11 +103,24 @@ class AutoTradingBot:
         self.virtual_trading_manager = None
         self.virtual_trading_scheduler = None
 
+        # 이벤트 기반 엔진 (틱/주문체결 이벤트 + 작업별 주기)
+        self.trading_engine = None
+        self.latest_holdings = []
+        self.pause_buy = False
+        self.pause_sell = False
+        self._ws_loop = None
+        self._position_streams = {}
+        self._control_mtime = None
+
         self.monitor = get_monitor()
         self.alert_manager = get_alert_manager()
         self.cache = get_api_cache()
 
         self.db_session = None
+        # 자동화/AI 학습/가상매매는 백그라운드에서 초기화 (완료 시 set)
+        self._optional_components_ready = threading.Event()
+        self._emergency_monitoring_lock = threading.Lock()
+        self._emergency_monitoring_started = False
 
         self.ai_approved_candidates = []
         self.scan_progress = {
@@ -145,14 +163,20 @@ class AutoTradingBot:
             self.test_mode_active = False
 
     def _initialize_components(self):
+        profiler = startup_profiler
+        profiler.lap('모듈 import')
         try:
             logger.info("데이터베이스 초기화 중...")
+            from database import get_db_session
             self.db_session = get_db_session()
             logger.info("데이터베이스 초기화 완료")
+            profiler.lap('데이터베이스')
 
             logger.info("REST API 클라이언트 초기화 중...")
+            from core.rest_client import KiwoomRESTClient
             self.client = KiwoomRESTClient()
             logger.info("REST API 클라이언트 초기화 완료")
+            profiler.lap('REST API 클라이언트')
 
             logger.info("OpenAPI 클라이언트 초기화 중...")
             try:
@@ -259,35 +283,42 @@ class AutoTradingBot:
             except Exception as e:
                 logger.warning(f"OpenAPI 클라이언트 사용 불가: {e}")
                 self.openapi_client = None
+            profiler.lap('OpenAPI 클라이언트')
 
             logger.info("WebSocket 초기화 중...")
             try:
                 if self.client.token:
+                    from core.websocket_manager import WebSocketManager
                     self.websocket_manager = WebSocketManager(
                         access_token=self.client.token,
                         base_url=self.client.base_url
                     )
 
-                    async def on_price_update(data):
-                        try:
-                            stock_code = data.get('item', '')
-                            values = data.get('values', {})
-                            price = int(values.get('10', '0'))
-                            logger.debug(f"실시간 가격: {stock_code} = {price:,}")
-                        except Exception as e:
-                            logger.error(f"가격 데이터 처리 오류: {e}")
-
-                    self.websocket_manager.register_callback('0B', on_price_update)
+                    # 주문체결(00) → 엔진 이벤트 (보유 종목 체결(0B)은 포지션 변경 시 종목별 구독)
+                    self.websocket_manager.register_callback('00', self._on_order_event)
 
                     def start_websocket():
                         try:
                             loop = asyncio.new_event_loop()
                             asyncio.set_event_loop(loop)
                             connected = loop.run_until_complete(self.websocket_manager.connect())
-                            if connected:
-                                logger.info("WebSocket 자동 연결 완료")
+                            if not connected:
+                                return
+                            logger.info("WebSocket 자동 연결 완료")
+
+                            loop.run_until_complete(
+                                self.websocket_manager.subscribe([''], ['00'], grp_no='91')
+                            )
+                            # 수신 루프를 띄운 채 루프 유지 (다른 스레드는 run_coroutine_threadsafe로 구독 요청)
+                            self._ws_loop = loop
+                            loop.create_task(self.websocket_manager.receive_loop())
+                            # 루프가 돌기 시작한 뒤 기존 보유 종목 구독 (run_forever 전에는 is_running()이 False)
+                            loop.call_soon(self._reconcile_position_streams)
+                            loop.run_forever()
                         except Exception as e:
                             logger.error(f"WebSocket 연결 오류: {e}")
+                        finally:
+                            self._ws_loop = None
 
                     ws_thread = threading.Thread(target=start_websocket, daemon=True)
                     ws_thread.start()
@@ -299,13 +330,20 @@ class AutoTradingBot:
             except Exception as e:
                 logger.warning(f"WebSocket 초기화 실패: {e}")
                 self.websocket_manager = None
+            profiler.lap('WebSocket')
 
             logger.info("API 모듈 초기화 중...")
+            from api import AccountAPI, MarketAPI, OrderAPI
+            from api.algo_order_executor import AlgoOrderExecutor
+            from research.data_fetcher import DataFetcher
             self.account_api = AccountAPI(self.client)
             self.market_api = MarketAPI(self.client)
             self.order_api = OrderAPI(self.client)
+            # 알고리즘 주문(TWAP/VWAP/아이스버그) - 체결은 주문체결(00) 이벤트로 대사
+            self.algo_executor = AlgoOrderExecutor(self.order_api, self.market_api)
             self.data_fetcher = DataFetcher(self.client)
             logger.info("API 모듈 초기화 완료")
+            profiler.lap('API 모듈')
 
             logger.info("AI 분석기 초기화 중...")
             try:
@@ -339,149 +377,212 @@ class AutoTradingBot:
                 self.sentiment_analyzer = None
                 logger.warning("Mock 분석기 사용 중")
 
+            self.ai_review_executor = self._build_ai_review_executor()
+            profiler.lap('AI 분석기')
+
+            logger.info("점수 계산 시스템 초기화 중...")
+            from strategy.scoring_system import ScoringSystem
+            self.scoring_system = ScoringSystem(market_api=self.market_api)
+            logger.info("점수 계산 시스템 초기화 완료")
+            profiler.lap('점수 계산 시스템')
+
             logger.info("스캐닝 파이프라인 초기화 중...")
+            from research.screener import Screener
+            from research.scanner_pipeline import ScannerPipeline
             screener = Screener(self.client)
             self.scanner = ScannerPipeline(
                 market_api=self.market_api,
                 screener=screener,
-                ai_analyzer=self.analyzer
+                ai_analyzer=self.analyzer,
+                scoring_system=self.scoring_system
             )
             logger.info("스캐닝 파이프라인 초기화 완료")
-
-            logger.info("점수 계산 시스템 초기화 중...")
-            self.scoring_system = ScoringSystem(market_api=self.market_api)
-            logger.info("점수 계산 시스템 초기화 완료")
+            profiler.lap('스캐닝 파이프라인')
 
             logger.info("리스크 관리자 초기화 중...")
+            from strategy.dynamic_risk_manager import DynamicRiskManager
             initial_capital = self._get_initial_capital()
             self.dynamic_risk_manager = DynamicRiskManager(initial_capital=initial_capital)
             logger.info("리스크 관리자 초기화 완료")
+            profiler.lap('리스크 관리자')
 
             logger.info("포트폴리오 관리자 초기화 중...")
+            from strategy.portfolio_manager import PortfolioManager
             self.portfolio_manager = PortfolioManager(self.client)
             logger.info("포트폴리오 관리자 초기화 완료")
+            profiler.lap('포트폴리오 관리자')
 
-            logger.info("자동화 시스템 초기화 중...")
-            try:
-                from strategy.split_order_executor import SplitOrderExecutor
-                from strategy.smart_money_manager import get_smart_money_manager
-                from strategy.emergency_manager import get_emergency_manager
-                from strategy.liquidity_splitter import get_liquidity_splitter
-                from utils.cache_manager import get_cache_manager
-
-                # Split order executor
-                self.split_order_executor = SplitOrderExecutor(
-                    order_api=self.order_api,
-                    data_fetcher=self.data_fetcher
-                )
-                logger.info("  ✅ Split order executor")
+            self._initialize_control_file()
+            self._restore_state()
+            profiler.lap('제어 파일/상태 복원')
 
-                # Smart money manager
-                # Fix: Pydantic BaseModel을 dict로 변환
-                if hasattr(self.config, 'automation_features'):
-                    automation_config = self.config.automation_features.model_dump() if hasattr(self.config.automation_features, 'model_dump') else {}
-                else:
-                    automation_config = {}
-                self.smart_money_manager = get_smart_money_manager(automation_config)
-                logger.info("  ✅ Smart money manager")
-
-                # Emergency manager
-                self.emergency_manager = get_emergency_manager(
-                    config=automation_config,
-                    order_api=self.order_api,
-                    data_fetcher=self.data_fetcher
-                )
-                logger.info("  ✅ Emergency manager")
+            # 매매 루프에 필수가 아닌 서브시스템은 백그라운드 초기화
+            threading.Thread(
+                target=self._initialize_optional_components,
+                name='optional-components-init',
+                daemon=True
+            ).start()
 
-                # Liquidity splitter
-                self.liquidity_splitter = get_liquidity_splitter(automation_config)
-                logger.info("  ✅ Liquidity splitter")
+            self.is_initialized = True
+            logger.info("핵심 컴포넌트 초기화 성공 (자동화/AI 학습/가상매매는 백그라운드 초기화 중)")
 
-                # Cache manager
-                self.cache_manager = get_cache_manager()
-                logger.info("  ✅ Cache manager")
+            self.monitor.log_activity('system', 'AutoTrade Pro started', level='success')
+            profiler.report()
 
-                logger.info("자동화 시스템 초기화 완료")
+        except Exception as e:
+            logger.error(f"컴포넌트 초기화 실패: {e}", exc_info=True)
+            raise
 
-            except Exception as e:
-                logger.warning(f"자동화 시스템 초기화 실패: {e}")
-                logger.warning("자동화 기능은 제한적으로 작동합니다")
+    def _initialize_optional_components(self):
+        """자동화/AI 학습/가상매매 시스템 초기화 (백그라운드 스레드)
 
-            logger.info("AI 학습 시스템 초기화 중...")
-            try:
-                from ai.split_order_ai import get_split_order_ai
-                from ai.parameter_optimizer import get_parameter_optimizer
-                from ai.self_learning_system import get_self_learning_system
+        각 속성은 완전히 준비된 뒤에만 할당한다 (메인 루프는 None이면 건너뜀).
+        """
+        started = time.perf_counter()
+        try:
+            self._initialize_automation()
+            self._initialize_learning_systems()
+            self._initialize_virtual_trading()
+        finally:
+            elapsed = time.perf_counter() - started
+            startup_profiler.record_component('선택 서브시스템 (백그라운드)', elapsed)
+            self._optional_components_ready.set()
+            logger.info(f"선택 서브시스템 초기화 완료 ({elapsed:.1f}초)")
+            # start()가 대기 시간을 넘겨 먼저 진행했으면 여기서 비상 모니터링 시작
+            if self.is_running:
+                self._start_emergency_monitoring()
+
+    def _start_emergency_monitoring(self):
+        """비상 모니터링 시작 (start()와 백그라운드 초기화 중 먼저 준비된 쪽에서 한 번만)"""
+        with self._emergency_monitoring_lock:
+            if self._emergency_monitoring_started or not self.emergency_manager:
+                return
+            self._emergency_monitoring_started = True
+        try:
+            logger.info("비상 모니터링 시스템 시작 중...")
+            self.emergency_manager.start_monitoring(self)
+            logger.info("비상 모니터링 시스템 시작 완료")
+            print("🚨 Emergency monitoring: Active")
+        except Exception as e:
+            logger.error(f"비상 모니터링 시작 실패: {e}", exc_info=True)
 
-                # Split order AI
-                self.split_order_ai = get_split_order_ai()
-                logger.info("  ✅ Split order AI")
+    def _initialize_automation(self):
+        logger.info("자동화 시스템 초기화 중...")
+        try:
+            from strategy.split_order_executor import SplitOrderExecutor
+            from strategy.smart_money_manager import get_smart_money_manager
+            from strategy.emergency_manager import get_emergency_manager
+            from strategy.liquidity_splitter import get_liquidity_splitter
+            from utils.cache_manager import get_cache_manager
+
+            # Split order executor
+            self.split_order_executor = SplitOrderExecutor(
+                order_api=self.order_api,
+                data_fetcher=self.data_fetcher
+            )
+            logger.info("  ✅ Split order executor")
 
-                # Parameter optimizer
-                self.parameter_optimizer = get_parameter_optimizer()
-                logger.info("  ✅ Parameter optimizer")
+            # Smart money manager
+            # Fix: Pydantic BaseModel을 dict로 변환
+            if hasattr(self.config, 'automation_features'):
+                automation_config = self.config.automation_features.model_dump() if hasattr(self.config.automation_features, 'model_dump') else {}
+            else:
+                automation_config = {}
+            self.smart_money_manager = get_smart_money_manager(automation_config)
+            logger.info("  ✅ Smart money manager")
+
+            # Emergency manager
+            self.emergency_manager = get_emergency_manager(
+                config=automation_config,
+                order_api=self.order_api,
+                data_fetcher=self.data_fetcher
+            )
+            logger.info("  ✅ Emergency manager")
 
-                # Self-learning system
-                self.self_learning_system = get_self_learning_system()
-                logger.info("  ✅ Self-learning system")
+            # Liquidity splitter
+            self.liquidity_splitter = get_liquidity_splitter(automation_config)
+            logger.info("  ✅ Liquidity splitter")
 
-                logger.info("AI 학습 시스템 초기화 완료")
-                logger.info(f"  📚 학습된 경험: {self.self_learning_system.stats.total_experiences}개")
-                logger.info(f"  🎯 학습된 상태: {len(self.self_learning_system.q_table)}개")
+            # Cache manager
+            self.cache_manager = get_cache_manager()
+            logger.info("  ✅ Cache manager")
 
-            except Exception as e:
-                logger.warning(f"AI 학습 시스템 초기화 실패: {e}")
-                logger.warning("AI 학습 기능은 제한적으로 작동합니다")
+            logger.info("자동화 시스템 초기화 완료")
 
-            logger.info("가상매매 시스템 초기화 중...")
-            try:
-                virtual_initial_cash = 10_000_000
-                logger.info(f"가상매매 초기 자본금: {virtual_initial_cash:,}원")
+        except Exception as e:
+            logger.warning(f"자동화 시스템 초기화 실패: {e}")
+            logger.warning("자동화 기능은 제한적으로 작동합니다")
 
-                self.virtual_trader = VirtualTrader(initial_cash=virtual_initial_cash)
-                self.trade_logger = TradeLogger()
+    def _initialize_learning_systems(self):
+        logger.info("AI 학습 시스템 초기화 중...")
+        try:
+            from ai.split_order_ai import get_split_order_ai
+            from ai.parameter_optimizer import get_parameter_optimizer
+            from ai.self_learning_system import get_self_learning_system
 
-                loaded_count = self.trade_logger.load_historical_trades(days=7)
-                if loaded_count > 0:
-                    logger.info(f"{loaded_count}건의 과거 거래 기록 로드됨")
+            # Split order AI
+            self.split_order_ai = get_split_order_ai()
+            logger.info("  ✅ Split order AI")
 
-                self.virtual_trader.load_all_states()
+            # Parameter optimizer
+            self.parameter_optimizer = get_parameter_optimizer()
+            logger.info("  ✅ Parameter optimizer")
 
-                # 가상매매 매니저 초기화 (DB 기반)
-                self.virtual_trading_manager = VirtualTradingManager()
-                logger.info("가상매매 매니저 초기화 완료")
+            # Self-learning system
+            self.self_learning_system = get_self_learning_system()
+            logger.info("  ✅ Self-learning system")
 
-                # 가상매매 슬롯 자동 생성 (10개)
-                self._auto_initialize_virtual_trading_slots()
+            logger.info("AI 학습 시스템 초기화 완료")
+            logger.info(f"  📚 학습된 경험: {self.self_learning_system.stats.total_experiences}개")
+            logger.info(f"  🎯 학습된 상태: {len(self.self_learning_system.q_table)}개")
 
-                # 가상매매 스케줄러 초기화 및 시작
-                if self.data_fetcher and self.virtual_trading_manager:
-                    self.virtual_trading_scheduler = VirtualTradingScheduler(
-                        virtual_manager=self.virtual_trading_manager,
-                        data_fetcher=self.data_fetcher
-                    )
-                    self.virtual_trading_scheduler.start()
-                    logger.info("가상매매 스케줄러 시작 완료 (실시간 업데이트, 자동 손절/익절)")
+        except Exception as e:
+            logger.warning(f"AI 학습 시스템 초기화 실패: {e}")
+            logger.warning("AI 학습 기능은 제한적으로 작동합니다")
 
-                logger.info("가상매매 시스템 초기화 완료")
-            except Exception as e:
-                logger.warning(f"가상매매 시스템 초기화 실패: {e}")
-                self.virtual_trader = None
-                self.trade_logger = None
-                self.virtual_trading_manager = None
-                self.virtual_trading_scheduler = None
+    def _initialize_virtual_trading(self):
+        logger.info("가상매매 시스템 초기화 중...")
+        try:
+            from virtual_trading import VirtualTrader, TradeLogger, VirtualTradingManager, VirtualTradingScheduler
 
-            self._initialize_control_file()
-            self._restore_state()
+            virtual_initial_cash = 10_000_000
+            logger.info(f"가상매매 초기 자본금: {virtual_initial_cash:,}원")
 
-            self.is_initialized = True
-            logger.info("모든 컴포넌트 초기화 성공")
+            # 상태 로드가 끝난 뒤 할당 (메인 루프가 반쯤 로드된 계좌를 보지 않도록)
+            virtual_trader = VirtualTrader(initial_cash=virtual_initial_cash)
+            trade_logger = TradeLogger()
 
-            self.monitor.log_activity('system', 'AutoTrade Pro started', level='success')
+            loaded_count = trade_logger.load_historical_trades(days=7)
+            if loaded_count > 0:
+                logger.info(f"{loaded_count}건의 과거 거래 기록 로드됨")
+
+            virtual_trader.load_all_states()
+            self.trade_logger = trade_logger
+            self.virtual_trader = virtual_trader
+
+            # 가상매매 매니저 초기화 (DB 기반)
+            self.virtual_trading_manager = VirtualTradingManager()
+            logger.info("가상매매 매니저 초기화 완료")
 
+            # 가상매매 슬롯 자동 생성 (10개)
+            self._auto_initialize_virtual_trading_slots()
+
+            # 가상매매 스케줄러 초기화 및 시작
+            if self.data_fetcher and self.virtual_trading_manager:
+                self.virtual_trading_scheduler = VirtualTradingScheduler(
+                    virtual_manager=self.virtual_trading_manager,
+                    data_fetcher=self.data_fetcher
+                )
+                self.virtual_trading_scheduler.start()
+                logger.info("가상매매 스케줄러 시작 완료 (실시간 업데이트, 자동 손절/익절)")
+
+            logger.info("가상매매 시스템 초기화 완료")
         except Exception as e:
-            logger.error(f"컴포넌트 초기화 실패: {e}", exc_info=True)
-            raise
+            logger.warning(f"가상매매 시스템 초기화 실패: {e}")
+            self.virtual_trader = None
+            self.trade_logger = None
+            self.virtual_trading_manager = None
+            self.virtual_trading_scheduler = None
 
     def _get_initial_capital(self) -> int:
         try:
@@ -684,16 +785,18 @@ class AutoTradingBot:
             logger.info(f"대시보드 서버 시작됨: http://{HOST}:{PORTS['dashboard']}")
             print(f"📊 Dashboard: {URLS['dashboard']}")
 
-            if self.emergency_manager:
-                try:
-                    logger.info("비상 모니터링 시스템 시작 중...")
-                    self.emergency_manager.start_monitoring(self)
-                    logger.info("비상 모니터링 시스템 시작 완료")
-                    print("🚨 Emergency monitoring: Active")
-                except Exception as e:
-                    logger.warning(f"비상 모니터링 시작 실패: {e}")
+            # 비상 관리자는 백그라운드 초기화 결과 (매매 루프 전에 준비)
+            if not self._optional_components_ready.wait(timeout=60):
+                logger.error(
+                    "선택 서브시스템 초기화 대기 시간 초과 - 비상 모니터링 없이 매매 루프 시작, "
+                    "초기화가 끝나는 즉시 비상 모니터링을 시작합니다"
+                )
+            self._start_emergency_monitoring()
 
-            self._main_loop()
+            if self._get_cycle_setting('event_driven', True):
+                self._run_event_engine()
+            else:
+                self._main_loop()
         except KeyboardInterrupt:
             logger.info("사용자가 중단함")
             print("\n사용자가 중단함")
@@ -709,6 +812,13 @@ class AutoTradingBot:
         logger.info("오토트레이드 프로 중단 중...")
         self.is_running = False
 
+        if self.trading_engine:
+            try:
+                self.trading_engine.stop(wait=True)
+                logger.info("트레이딩 엔진 중지 완료")
+            except Exception as e:
+                logger.warning(f"트레이딩 엔진 중지 실패: {e}")
+
         if self.emergency_manager:
             try:
                 logger.info("비상 모니터링 중지 중...")
@@ -733,7 +843,12 @@ class AutoTradingBot:
 
         if self.websocket_manager:
             try:
-                asyncio.run(self.websocket_manager.disconnect())
+                loop = self._ws_loop
+                if loop and loop.is_running():
+                    asyncio.run_coroutine_threadsafe(self.websocket_manager.disconnect(), loop).result(timeout=5)
+                    loop.call_soon_threadsafe(loop.stop)
+                else:
+                    asyncio.run(self.websocket_manager.disconnect())
                 logger.info("WebSocket 연결 해제됨")
             except Exception as e:
                 logger.warning(f"WebSocket 연결 해제 실패: {e}")
@@ -807,6 +922,11 @@ class AutoTradingBot:
         try:
             import json
             if self.control_file.exists():
+                # 변경되지 않았으면 다시 읽지 않음
+                mtime = self.control_file.stat().st_mtime
+                if mtime == self._control_mtime:
+                    return
+                self._control_mtime = mtime
                 with open(self.control_file, 'r') as f:
                     control = json.load(f)
                 self.is_running = control.get('run', True)
@@ -816,9 +936,8 @@ class AutoTradingBot:
             logger.warning(f"제어 파일 읽기 실패: {e}")
 
     def _check_trading_hours(self) -> bool:
-        from research.analyzer import Analyzer
-        analyzer = Analyzer(self.client)
-        market_status = analyzer.get_market_status()
+        from utils.trading_calendar import get_trading_calendar
+        market_status = get_trading_calendar().market_status()
 
         self.market_status = market_status
 
@@ -840,7 +959,8 @@ class AutoTradingBot:
 
         return True
 
-    def _update_account_info(self):
+    def _update_account_info(self) -> bool:
+        """계좌 정보 갱신 (실패 시 False, latest_holdings는 이전 값 유지)"""
         try:
             deposit = self.account_api.get_deposit()
             holdings = self.account_api.get_holdings()
@@ -849,6 +969,7 @@ class AutoTradingBot:
             cash = int(str(deposit.get('100stk_ord_alow_amt', '0')).replace(',', '')) if deposit else 0
             stock_value = sum(int(str(h.get('eval_amt', 0)).replace(',', '')) for h in holdings) if holdings else 0
 
+            self.latest_holdings = holdings or []
             self.portfolio_manager.update_portfolio(holdings, cash)
 
             total_capital = deposit_total + stock_value
@@ -856,17 +977,53 @@ class AutoTradingBot:
 
             logger.info(f"계좌: 예수금={deposit_total:,}원, 현금={cash:,}원, 주식={stock_value:,}원, 합계={total_capital:,}원, 포지션={len(holdings)}개")
 
+            self._publish_account(deposit_total, cash, stock_value, holdings)
+            return True
+
         except Exception as e:
             logger.error(f"계좌 정보 업데이트 실패: {e}")
+            return False
+
+    def _publish_account(self, deposit_total, cash, stock_value, holdings):
+        """대시보드 'account' / 'positions' 채널 발행 (변경분만 전송됨)"""
+        publisher = get_stream_publisher()
+        publisher.publish('account', {
+            'deposit': deposit_total,
+            'cash': cash,
+            'stock_value': stock_value,
+            'total_assets': deposit_total + stock_value,
+            'position_count': len(holdings or []),
+        })
+
+        positions = {}
+        for holding in holdings or []:
+            try:
+                stock_code = holding.get('stk_cd', '')
+                if stock_code.startswith('A'):
+                    stock_code = stock_code[1:]
+                buy_price = int(holding.get('avg_prc', 0))
+                current_price = int(holding.get('cur_prc', 0))
+                positions[stock_code] = {
+                    'stock_name': holding.get('stk_nm'),
+                    'quantity': int(holding.get('rmnd_qty', 0)),
+                    'buy_price': buy_price,
+                    'current_price': current_price,
+                    'eval_amount': int(str(holding.get('eval_amt', 0)).replace(',', '')),
+                    'profit_rate': round((current_price - buy_price) / buy_price * 100, 2) if buy_price > 0 else 0,
+                }
+            except (TypeError, ValueError) as e:
+                logger.warning(f"포지션 발행 변환 실패: {e}")
+        publisher.publish('positions', positions, replace=True)
 
-    def _check_sell_signals(self):
+    def _check_sell_signals(self, holdings=None):
         logger.info("매도 신호 확인 중...")
 
         if self.market_status.get('is_test_mode'):
             logger.info("테스트 모드: 실제 보유 종목으로 매도 로직 실행")
 
         try:
-            holdings = self.account_api.get_holdings()
+            if holdings is None:
+                holdings = self.account_api.get_holdings()
 
             if not holdings:
                 logger.info("보유 종목 없음")
@@ -897,26 +1054,246 @@ class AutoTradingBot:
                     profit_loss_amount=profit_loss
                 )
 
-                thresholds = self.dynamic_risk_manager.get_exit_thresholds(buy_price)
-
-                should_sell = False
-                sell_reason = ""
+                sell_reason = self._get_exit_reason(buy_price, current_price)
 
-                if current_price >= thresholds['take_profit']:
-                    should_sell = True
-                    sell_reason = f"익절 ({thresholds['take_profit']:,}원)"
-                elif current_price <= thresholds['stop_loss']:
-                    should_sell = True
-                    sell_reason = f"손절 ({thresholds['stop_loss']:,}원)"
-
-                if should_sell:
+                if sell_reason:
                     logger.info(f"매도 신호: {stock_name} - {sell_reason}")
-                    self._execute_sell(stock_code, stock_name, quantity, current_price, profit_loss, profit_loss_rate, sell_reason)
+                    if self.trading_engine:
+                        # 틱 경로와 같은 주문 실행기 사용 (종목당 중복 매도 방지)
+                        self.trading_engine.request_exit(
+                            self._to_position(stock_code, stock_name, quantity, buy_price),
+                            current_price,
+                            sell_reason
+                        )
+                    else:
+                        self._execute_sell(stock_code, stock_name, quantity, current_price, profit_loss, profit_loss_rate, sell_reason)
 
         except Exception as e:
             logger.error(f"매도 신호 확인 실패: {e}")
 
-    def _run_scanning_pipeline(self):
+    def _get_exit_reason(self, buy_price, current_price) -> str:
+        thresholds = self.dynamic_risk_manager.get_exit_thresholds(buy_price)
+
+        if current_price >= thresholds['take_profit']:
+            return f"익절 ({thresholds['take_profit']:,}원)"
+        if current_price <= thresholds['stop_loss']:
+            return f"손절 ({thresholds['stop_loss']:,}원)"
+        return ""
+
+    @staticmethod
+    def _to_position(stock_code, stock_name, quantity, buy_price) -> dict:
+        return {
+            'stock_code': stock_code,
+            'stock_name': stock_name,
+            'quantity': quantity,
+            'buy_price': buy_price,
+        }
+
+    def _positions_from_holdings(self, holdings) -> list:
+        positions = []
+        for holding in holdings or []:
+            try:
+                stock_code = holding.get('stk_cd', '')
+                if stock_code.startswith('A'):
+                    stock_code = stock_code[1:]
+                positions.append(self._to_position(
+                    stock_code,
+                    holding.get('stk_nm'),
+                    int(holding.get('rmnd_qty', 0)),
+                    int(holding.get('avg_prc', 0))
+                ))
+            except (TypeError, ValueError) as e:
+                logger.warning(f"보유 종목 변환 실패: {e}")
+        return positions
+
+    def _build_ai_review_executor(self) -> 'AIReviewExecutor':
+        ai_config = getattr(self.config, 'ai', None) or {}
+        if isinstance(ai_config, dict):
+            concurrency = ai_config.get('review_concurrency', 3)
+            deadline = ai_config.get('review_deadline_seconds', 45.0)
+        else:
+            concurrency = getattr(ai_config, 'review_concurrency', 3)
+            deadline = getattr(ai_config, 'review_deadline_seconds', 45.0)
+        from ai.review_executor import AIReviewExecutor
+        return AIReviewExecutor(self.analyzer, max_concurrency=concurrency, deadline=deadline)
+
+    # ------------------------------------------------------------------
+    # 이벤트 기반 엔진
+    # ------------------------------------------------------------------
+
+    def _get_cycle_setting(self, key, default):
+        try:
+            if isinstance(self.config.main_cycle, dict):
+                return self.config.main_cycle.get(key, default)
+            return getattr(self.config.main_cycle, key, default)
+        except Exception:
+            return default
+
+    def _build_trading_engine(self) -> TradingEngine:
+        engine = TradingEngine(exit_rule=self._on_tick_exit_rule, sell_handler=self._sell_position)
+        engine.on_positions_changed = self._sync_position_streams
+
+        engine.add_job('control', self._get_cycle_setting('control_check_interval', 5), self._read_control_file)
+        engine.add_job('market_status', self._get_cycle_setting('market_status_interval', 60), self._check_trading_hours)
+        engine.add_job('account', self._get_cycle_setting('account_refresh_interval', 30), self._engine_account_cycle)
+        engine.add_job('fast_scan', self.scanner.fast_scan_interval, self._engine_fast_scan)
+        engine.add_job('deep_scan', self.scanner.deep_scan_interval, self._engine_deep_scan)
+        engine.add_job('ai_scan', self.scanner.ai_scan_interval, self._engine_ai_scan)
+        return engine
+
+    def _run_event_engine(self):
+        self._read_control_file()
+        self._check_trading_hours()
+        self.trading_engine = self._build_trading_engine()
+        self.trading_engine.run_forever(lambda: self.is_running)
+
+    def _on_tick_exit_rule(self, position, price) -> str:
+        if self.pause_sell:
+            return ""
+        return self._get_exit_reason(position['buy_price'], price)
+
+    def _sell_position(self, position, price, reason):
+        quantity = position['quantity']
+        buy_price = position['buy_price']
+        profit_loss = int((price - buy_price) * quantity)
+        profit_loss_rate = ((price - buy_price) / buy_price) * 100 if buy_price > 0 else 0
+        return self._execute_sell(
+            position['stock_code'], position['stock_name'], quantity, int(price),
+            profit_loss, profit_loss_rate, reason
+        )
+
+    def _on_position_tick(self, data):
+        """보유 종목 체결(0B) → 엔진 (WebSocket 루프에서 실행)"""
+        received_at = time.perf_counter()
+        try:
+            price = abs(int(data.get('values', {}).get('10', '0')))
+            if price and self.trading_engine:
+                self.trading_engine.on_tick(data.get('item', ''), price, received_at)
+        except Exception as e:
+            logger.error(f"가격 데이터 처리 오류: {e}")
+
+    def _on_order_event(self, data):
+        """주문체결(00) → 알고리즘 주문 체결 대사 + 엔진 (계좌 즉시 갱신)"""
+        if self.algo_executor:
+            try:
+                self.algo_executor.on_order_event(data)
+            except Exception as e:
+                logger.error(f"알고리즘 주문 체결 대사 오류: {e}")
+        if not self.trading_engine:
+            return
+        values = data.get('values', {})
+        stock_code = str(values.get('9001', '') or data.get('item', ''))
+        if stock_code.startswith('A'):
+            stock_code = stock_code[1:]
+        self.trading_engine.on_order_event(stock_code, parse_order_state(values))
+
+    def _sync_position_streams(self, added, removed):
+        """보유 종목 변경 → 종목별 체결(0B) 스트림 구독/해지"""
+        loop = self._ws_loop
+        if not self.websocket_manager or not loop or not loop.is_running():
+            return
+
+        async def sync():
+            for stock_code in removed:
+                subscriber = self._position_streams.pop(stock_code, None)
+                if subscriber:
+                    await self.websocket_manager.unsubscribe_stream(subscriber)
+            for stock_code in added:
+                if stock_code in self._position_streams:
+                    continue
+                subscriber = await self.websocket_manager.subscribe_stream(
+                    stock_code, '0B', self._on_position_tick, name=f"exit:{stock_code}"
+                )
+                if subscriber:
+                    self._position_streams[stock_code] = subscriber
+
+        future = asyncio.run_coroutine_threadsafe(sync(), loop)
+        future.add_done_callback(self._on_stream_sync_done)
+
+    @staticmethod
+    def _on_stream_sync_done(future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"보유 종목 스트림 구독 동기화 실패: {future.exception()}")
+
+    def _reconcile_position_streams(self):
+        """보유 종목과 구독 중인 0B 스트림 대사 (놓친 변경/실패한 구독 재시도)"""
+        if not self.trading_engine:
+            return
+        held = set(self.trading_engine.positions)
+        subscribed = set(self._position_streams.copy())
+        if held != subscribed:
+            self._sync_position_streams(held - subscribed, subscribed - held)
+
+    def _engine_account_cycle(self):
+        account_updated = self._update_account_info()
+        if account_updated:
+            self.trading_engine.update_positions(self._positions_from_holdings(self.latest_holdings))
+            self._reconcile_exit_orders()
+            self._reconcile_position_streams()
+        else:
+            # 이전 회차 보유 목록으로 대사/매도하지 않음
+            logger.warning("계좌 갱신 실패: 이번 회차 포지션 대사와 매도 확인을 건너뜁니다")
+
+        if self.virtual_trader:
+            try:
+                price_data = self._get_virtual_trading_prices()
+                if price_data:
+                    self.virtual_trader.update_all_prices(price_data)
+                self.virtual_trader.check_sell_conditions(price_data)
+            except Exception as e:
+                logger.warning(f"Virtual trading update failed: {e}")
+
+        if not account_updated:
+            self._print_statistics()
+            return
+
+        # 틱이 없는 종목(미구독/장외)을 위한 REST 기준 확인
+        if not self.pause_sell:
+            self._check_sell_signals(self.latest_holdings)
+
+        self._save_portfolio_snapshot()
+        self._print_statistics()
+
+    def _reconcile_exit_orders(self):
+        """매도 요청 중인 종목을 미체결 매도 주문 목록과 대사 (체결/취소/거부된 주문 해제)"""
+        if not self.trading_engine.pending_exits():
+            return
+        checked_at = time.perf_counter()
+        result = self.account_api.get_outstanding_orders(order_type='1')
+        if result is None:
+            return  # 조회 실패 시 해제하지 않음
+
+        open_codes = set()
+        for order in result.get('oso', []) or []:
+            try:
+                if int(str(order.get('oso_qty', 0)).replace(',', '') or 0) > 0:
+                    open_codes.add(str(order.get('stk_cd', '')).lstrip('A').replace('_NX', ''))
+            except ValueError:
+                continue
+        released = self.trading_engine.reconcile_exits(open_codes, checked_at)
+        if released:
+            logger.info(f"미체결 매도 없음 → 매도 요청 해제: {', '.join(sorted(released))}")
+
+    def _engine_fast_scan(self):
+        if self.pause_buy or not self.portfolio_manager.can_add_position():
+            return
+        self.scanner.run_fast_scan()
+
+    def _engine_deep_scan(self):
+        if self.pause_buy or not self.scanner.fast_scan_results:
+            return
+        if self.scanner.run_deep_scan():
+            # 새 최종 후보 → AI 검토 바로 실행
+            self.trading_engine.trigger('ai_scan')
+
+    def _engine_ai_scan(self):
+        candidates = list(self.scanner.deep_scan_results)
+        if self.pause_buy or not candidates:
+            return
+        self._run_scanning_pipeline(candidates)
+
+    def _run_scanning_pipeline(self, candidates=None):
+        from ai.review_executor import ReviewRequest
         try:
             can_add = self.portfolio_manager.can_add_position()
             positions = self.portfolio_manager.get_positions()
@@ -936,16 +1313,17 @@ class AutoTradingBot:
             print("시장 스캔 파이프라인")
             print("="*80)
 
-            candidates = self.scanner.scan_market()
+            if candidates is None:
+                candidates = self.scanner.scan_market()
 
             if not candidates:
                 print("스캔 완료: 후보 종목 없음")
                 logger.info("스캔 완료: 후보 종목 없음")
                 return
 
-            candidate_scores = {}
+            stocks_data = []
             for candidate in candidates:
-                stock_data = {
+                stocks_data.append({
                     'stock_code': candidate.code,
                     'stock_name': candidate.name,
                     'current_price': candidate.price,
@@ -961,9 +1339,11 @@ class AutoTradingBot:
                     'top_broker_net_buy': getattr(candidate, 'top_broker_net_buy', 0),
                     'execution_intensity': getattr(candidate, 'execution_intensity', None),
                     'program_net_buy': getattr(candidate, 'program_net_buy', None),
-                }
+                })
 
-                scoring_result = self.scoring_system.calculate_score(stock_data, scan_type='default')
+            batch = self.scoring_system.calculate_scores_batch(stocks_data, scan_type='default')
+            candidate_scores = {}
+            for candidate, scoring_result in zip(candidates, batch.to_results()):
                 candidate_scores[candidate.code] = scoring_result
                 candidate.final_score = scoring_result.total_score
 
@@ -977,8 +1357,17 @@ class AutoTradingBot:
                 percentage = (c.final_score / 440) * 100
                 print(f"   {rank}. {c.name} - {c.final_score:.0f}점 ({percentage:.0f}%)")
 
+            get_stream_publisher().publish('scan', {
+                'candidates': [
+                    {'stock_code': c.code, 'stock_name': c.name, 'price': c.price,
+                     'change_rate': c.rate, 'score': c.final_score}
+                    for c in top5
+                ],
+            })
+
             portfolio_info = "No positions"
 
+            review_requests = []
             for idx, candidate in enumerate(top5[:3], 1):
                 print(f"\n[{idx}/3] {candidate.name} ({candidate.code})")
 
@@ -1032,11 +1421,20 @@ class AutoTradingBot:
                     }
                 }
 
-                ai_analysis = self.analyzer.analyze_stock(
-                    stock_data,
-                    score_info=score_info,
-                    portfolio_info=portfolio_info
-                )
+                review_requests.append(ReviewRequest(candidate.code, stock_data, score_info, portfolio_info))
+
+            # 상위 후보 AI 분석 동시 실행 (마감 초과분은 점수 기준 판단)
+            outcomes = self.ai_review_executor.review(review_requests)
+
+            for idx, candidate in enumerate(top5[:3], 1):
+                scoring_result = candidate_scores[candidate.code]
+                outcome = outcomes[candidate.code]
+                ai_analysis = outcome.analysis
+
+                print(f"\n[{idx}/3] {candidate.name} ({candidate.code})")
+                if outcome.is_fallback:
+                    print(f"   AI 검토 {outcome.status} → 점수 기준 판단")
+
                 ai_signal = ai_analysis.get('signal', 'hold')
                 split_strategy = ai_analysis.get('split_strategy', '')
 
@@ -1067,6 +1465,7 @@ class AutoTradingBot:
                     }
                     self.ai_approved_candidates.insert(0, buy_candidate)
                     self.ai_approved_candidates = self.ai_approved_candidates[:10]
+                    get_stream_publisher().publish('scan', {'ai_approved': list(self.ai_approved_candidates)})
 
                 buy_approved = (
                     (ai_signal == 'buy' and scoring_result.total_score >= 250) or
@@ -1268,6 +1667,7 @@ class AutoTradingBot:
             if order_result:
                 order_no = order_result.get('order_no', '')
 
+                from database import Trade
                 trade = Trade(
                     stock_code=stock_code,
                     stock_name=stock_name,
@@ -1307,7 +1707,7 @@ class AutoTradingBot:
         try:
             if self.market_status.get('can_cancel_only'):
                 logger.warning(f"{self.market_status['market_type']}: 신규 매도 주문 불가")
-                return
+                return False
 
             # 호가 분석 기반 최적 매도 가격 계산
             optimal_price = self._get_optimal_sell_price(stock_code, price)
@@ -1356,6 +1756,7 @@ class AutoTradingBot:
             if order_result:
                 order_no = order_result.get('order_no', '')
 
+                from database import Trade
                 trade = Trade(
                     stock_code=stock_code,
                     stock_name=stock_name,
@@ -1388,14 +1789,19 @@ class AutoTradingBot:
                     f'{stock_name} sell: {quantity}@{optimal_price:,} (P/L: {profit_loss:+,})',
                     level=log_level
                 )
+                return True
+
+            return False
 
         except Exception as e:
             logger.error(f"매도 실행 실패: {e}", exc_info=True)
+            return False
 
     def _save_portfolio_snapshot(self):
         try:
             summary = self.portfolio_manager.get_portfolio_summary()
 
+            from database import PortfolioSnapshot
             snapshot = PortfolioSnapshot(
                 total_capital=summary['total_assets'],
                 cash=summary['cash'],
@@ -1,12 +1,40 @@
 """
 research 패키지
 데이터 조회 및 분석 모듈
+
+패키지 속성은 처음 접근할 때 해당 모듈을 import한다 (PEP 562).
 """
-from .data_fetcher import DataFetcher
-from .analyzer import Analyzer
-from .screener import Screener
-
-from .quant_screener import QuantScreener, StockFactors
+import importlib
+from typing import TYPE_CHECKING
+
+# 공개 이름 → 정의 모듈
+_LAZY_EXPORTS = {
+    'DataFetcher': '.data_fetcher',
+    'Analyzer': '.analyzer',
+    'Screener': '.screener',
+    'QuantScreener': '.quant_screener',
+    'StockFactors': '.quant_screener',
+}
+
+if TYPE_CHECKING:
+    from .data_fetcher import DataFetcher
+    from .analyzer import Analyzer
+    from .screener import Screener
+    from .quant_screener import QuantScreener, StockFactors
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 # 기존 코드 호환성을 위한 Research 클래스
 class Research:
@@ -15,6 +43,10 @@ class Research:
     """
     
     def __init__(self, client):
+        from .data_fetcher import DataFetcher
+        from .analyzer import Analyzer
+        from .screener import Screener
+
         self.client = client
         self.fetcher = DataFetcher(client)
         self.analyzer = Analyzer(client)
@@ -80,7 +112,7 @@ __all__ = [
     'DataFetcher',
     'Analyzer',
     'Screener',
-    
+    
     'QuantScreener',
     'StockFactors',
 ]
\ No newline at end of file
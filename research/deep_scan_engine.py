@@ -0,0 +1,243 @@
+"""
+research/deep_scan_engine.py
+Deep Scan 동시 조회 엔진
+
+후보 종목별 API 호출(투자자, 호가, 기관추이, 일봉, 증권사 5개, 체결강도,
+프로그램매매)을 하나의 작업 목록으로 펼쳐 제한된 워커 풀에서 동시에 실행한다.
+각 호출은 KiwoomRESTClient의 RateLimiter(전역 + api-id별 토큰 버킷)를 통과하므로,
+전체 처리량은 직렬 지연이 아니라 증권사 호출 한도에 의해 결정된다.
+
+TR 호출 정의(TRCall)가 있는 작업은 비동기 클라이언트가 주어지면 request_many로
+한 번에 보내고(같은 RateLimiter 공유), 나머지는 워커 풀에서 실행한다.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.logger_new import get_logger
+from core.rate_limiter import ApiRateBudget
+from api.market.tr_call import TRCall
+
+logger = get_logger()
+
+
+@dataclass
+class EnrichmentTask:
+    """Deep Scan 개별 조회 작업"""
+    key: str                      # 결과 키 (예: 'investor', 'firm_001')
+    api_id: str                   # 키움 TR id (예: 'ka10059')
+    fetch: Callable[[], Any]      # 실제 API 호출 (워커 풀 경로)
+    call: Optional[TRCall] = None  # request_many 일괄 호출용 정의 (없으면 fetch만 사용)
+
+
+# 후보 1종목에 대한 조회 작업 목록을 만드는 함수
+TaskBuilder = Callable[[Any], List[EnrichmentTask]]
+
+
+class DeepScanEngine:
+    """
+    Deep Scan 동시 조회 엔진
+
+    Usage:
+        engine = DeepScanEngine(max_workers=8)
+        results = engine.run(candidates, lambda c: [
+            EnrichmentTask('investor', 'ka10059', lambda: market_api.get_investor_data(c.code)),
+            EnrichmentTask('bid_ask', 'ka10004', lambda: market_api.get_bid_ask(c.code)),
+        ])
+        results['005930']['investor']  # 조회 결과 (실패 시 None)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        budget: Optional[ApiRateBudget] = None,
+        budget_timeout: float = 30.0,
+        async_client=None
+    ):
+        """
+        Args:
+            max_workers: 동시 실행 워커 수 (일괄 호출의 동시 실행 수도 동일)
+            budget: 엔진 측 api-id별 호출 예산 (워커 풀 작업에만 적용,
+                    None이면 REST 클라이언트의 RateLimiter에만 맡김)
+            budget_timeout: 예산 획득 최대 대기 시간 (초)
+            async_client: AsyncKiwoomRESTClient (None이면 모든 작업을 워커 풀에서 실행)
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.budget = budget
+        self.budget_timeout = budget_timeout
+        self.async_client = async_client
+
+        # 마지막 실행 통계
+        self.last_stats: Dict[str, Any] = {}
+
+    def _execute(self, task: EnrichmentTask) -> Any:
+        """예산 획득 후 작업 실행"""
+        if self.budget is not None and not self.budget.acquire(task.api_id, timeout=self.budget_timeout):
+            raise TimeoutError(f"{task.api_id} 호출 예산 대기 시간 초과")
+        return task.fetch()
+
+    def _run_batched(self, batched: List[tuple], results: Dict[str, Dict[str, Any]]) -> int:
+        """
+        TRCall 작업을 request_many로 일괄 실행 후 파싱
+
+        Returns:
+            실패 건수
+        """
+        try:
+            responses = self.async_client.request_many_sync(
+                [task.call.spec for _, task in batched],
+                max_concurrency=self.max_workers
+            )
+        except Exception as e:
+            logger.warning(f"Deep Scan 일괄 조회 실패 ({len(batched)}건): {e}")
+            for code, task in batched:
+                results[code][task.key] = None
+            return len(batched)
+
+        errors = 0
+        for (code, task), response in zip(batched, responses):
+            try:
+                results[code][task.key] = task.call.parse(response)
+            except Exception as e:
+                errors += 1
+                results[code][task.key] = None
+                logger.debug(f"Deep Scan 조회 실패 ({code}, {task.key}/{task.api_id}): {e}")
+        return errors
+
+    def run(self, candidates: List[Any], build_tasks: TaskBuilder) -> Dict[str, Dict[str, Any]]:
+        """
+        후보 종목 전체의 조회 작업을 동시에 실행
+
+        Args:
+            candidates: 후보 종목 리스트 (code 속성 필요)
+            build_tasks: 후보 → 조회 작업 목록 함수
+
+        Returns:
+            {종목코드: {작업키: 결과}} (예외가 난 작업의 결과는 None)
+        """
+        results: Dict[str, Dict[str, Any]] = {c.code: {} for c in candidates}
+        if not candidates:
+            return results
+
+        start_time = time.time()
+        errors = 0
+        total = 0
+
+        batched = []
+        threaded = []
+        for candidate in candidates:
+            for task in build_tasks(candidate):
+                if self.async_client is not None and task.call is not None:
+                    batched.append((candidate.code, task))
+                else:
+                    threaded.append((candidate.code, task))
+        total = len(batched) + len(threaded)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='deep-scan') as executor:
+            futures = [
+                (code, task, executor.submit(self._execute, task))
+                for code, task in threaded
+            ]
+
+            # 워커 풀이 도는 동안 일괄 호출 실행
+            if batched:
+                errors += self._run_batched(batched, results)
+
+            for code, task, future in futures:
+                try:
+                    results[code][task.key] = future.result()
+                except Exception as e:
+                    errors += 1
+                    results[code][task.key] = None
+                    logger.debug(f"Deep Scan 조회 실패 ({code}, {task.key}/{task.api_id}): {e}")
+
+        elapsed = time.time() - start_time
+        self.last_stats = {
+            'candidates': len(candidates),
+            'calls': total,
+            'batched': len(batched),
+            'errors': errors,
+            'elapsed': elapsed,
+            'calls_per_second': total / elapsed if elapsed > 0 else 0.0,
+        }
+        logger.info(
+            f"🔬 Deep Scan 동시 조회: {len(candidates)}종목, {total}건 "
+            f"(일괄 {len(batched)}건, 실패 {errors}건, {elapsed:.2f}초, 워커 {self.max_workers}개)"
+        )
+
+        return results
+
+
+def build_deep_scan_tasks(
+    market_api,
+    candidate,
+    major_firms: List[tuple],
+    firm_days: int = 5,
+    daily_period: int = 20,
+    include_trend: bool = True
+) -> List[EnrichmentTask]:
+    """
+    표준 Deep Scan 조회 작업 목록 생성
+
+    Args:
+        market_api: MarketAPI 인스턴스
+        candidate: 후보 종목
+        major_firms: [(증권사코드, 증권사명), ...]
+        firm_days: 증권사별 매매 조회 일수
+        daily_period: 일봉 조회 기간
+        include_trend: 기관매매추이(ka10045) 조회 여부
+
+    Returns:
+        조회 작업 목록 (체결강도/프로그램매매는 호출 측 캐시 확인 후 추가)
+
+    Note:
+        NXT 시간대의 호가는 _NX 코드를 먼저 시도한 뒤 기본 코드로 재조회해야 하므로
+        TRCall 없이 워커 풀에서 조회한다.
+    """
+    from utils.trading_date import is_nxt_hours
+
+    code = candidate.code
+
+    tasks = [
+        EnrichmentTask(
+            'investor', 'ka10059',
+            lambda: market_api.get_investor_data(code),
+            call=market_api.investor_trading_call(code)
+        ),
+        EnrichmentTask(
+            'bid_ask', 'ka10004',
+            lambda: market_api.get_bid_ask(code),
+            call=None if is_nxt_hours() else market_api.orderbook_call(code)
+        ),
+        # ScannerPipeline이 쓰던 get_daily_price(days=N)는 get_daily_chart(period=N)의 별칭이므로
+        # 같은 TR(ka10081), 같은 행 형식({'close', 'open', 'volume', ...}, 최신순)이다.
+        EnrichmentTask(
+            'daily', 'ka10081',
+            lambda: market_api.get_daily_chart(code, period=daily_period),
+            call=market_api.daily_chart_call(code, period=daily_period)
+        ),
+    ]
+
+    if include_trend:
+        tasks.append(EnrichmentTask(
+            'trend', 'ka10045',
+            lambda: market_api.get_institutional_trading_trend(code, days=5, price_type='buy'),
+            call=market_api.institutional_trading_trend_call(code, days=5, price_type='buy')
+        ))
+
+    for firm_code, _ in major_firms:
+        tasks.append(EnrichmentTask(
+            f'firm_{firm_code}', 'ka10078',
+            lambda firm_code=firm_code: market_api.get_securities_firm_trading(
+                firm_code=firm_code,
+                stock_code=code,
+                days=firm_days
+            ),
+            call=market_api.securities_firm_trading_call(firm_code, code, days=firm_days)
+        ))
+
+    return tasks
+
+
+__all__ = ['DeepScanEngine', 'EnrichmentTask', 'build_deep_scan_tasks']
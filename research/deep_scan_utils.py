@@ -4,18 +4,19 @@ research/deep_scan_utils.py
 
 모든 스캔 전략에서 사용하는 Deep Scan 로직을 공통화
 """
-import time
 from typing import List, Optional, Dict
-from datetime import datetime
 
 from utils.logger_new import get_logger
+from utils.data_cache import get_namespace_cache
 from research.scanner_pipeline import StockCandidate
+from research.deep_scan_engine import DeepScanEngine, EnrichmentTask, build_deep_scan_tasks
+from core.async_rest_client import get_shared_async_client
 
 logger = get_logger()
 
-# Deep Scan 데이터 캐시 (메모리 기반)
-_deep_scan_cache = {}
+# Deep Scan 데이터 캐시 (공용 LRUCache의 'deep_scan' 네임스페이스)
 CACHE_TTL_SECONDS = 300  # 5분
+_deep_scan_cache = get_namespace_cache('deep_scan', default_ttl_seconds=CACHE_TTL_SECONDS)
 
 
 def _calculate_rsi(prices: List[float], period: int = 14) -> Optional[float]:
@@ -91,37 +92,31 @@ def _calculate_bollinger_bands(prices: List[float], period: int = 20) -> Optiona
 
 def _get_from_cache(cache_key: str) -> Optional[Dict]:
     """캐시에서 데이터 조회"""
-    global _deep_scan_cache
+    return _deep_scan_cache.get(cache_key)
 
-    if cache_key not in _deep_scan_cache:
-        return None
-
-    entry = _deep_scan_cache[cache_key]
-    timestamp = entry['timestamp']
 
-    # TTL 체크
-    if (datetime.now() - timestamp).total_seconds() > CACHE_TTL_SECONDS:
-        del _deep_scan_cache[cache_key]
-        return None
+def _save_to_cache(cache_key: str, data: Dict, ttl_seconds: int = CACHE_TTL_SECONDS):
+    """캐시에 데이터 저장 (종목 코드 태그로 종목 단위 무효화 가능)"""
+    code = cache_key.rsplit('_', 1)[-1]
+    _deep_scan_cache.set(cache_key, data, ttl_seconds=ttl_seconds, tags=[f"stock:{code}"])
 
-    return entry['data']
 
-
-def _save_to_cache(cache_key: str, data: Dict):
-    """캐시에 데이터 저장"""
-    global _deep_scan_cache
-
-    _deep_scan_cache[cache_key] = {
-        'data': data,
-        'timestamp': datetime.now()
-    }
+# 주요 증권사 (ka10078 조회 대상)
+MAJOR_FIRMS = [
+    ('001', '한국투자'),
+    ('003', '미래에셋'),
+    ('030', 'NH투자'),
+    ('005', '삼성'),
+    ('038', 'KB증권'),
+]
 
 
 def enrich_candidates_with_deep_scan(
     candidates: List[StockCandidate],
     market_api,
     max_candidates: int = 20,
-    verbose: bool = True
+    verbose: bool = True,
+    engine: Optional[DeepScanEngine] = None
 ) -> List[StockCandidate]:
     """
      모든 스캔 전략에서 사용하는 Deep Scan 공통 로직
@@ -130,16 +125,20 @@ def enrich_candidates_with_deep_scan(
     1. 기관/외국인 매매 데이터 (ka10059)
     2. 호가 데이터 (ka10004)
     3. 기관매매추이 (ka10045)
-    4. 일봉 데이터 - 평균거래량, 변동성 (ka10006)
+    4. 일봉 데이터 - 평균거래량, 변동성 (ka10081)
     5. 증권사별 매매 (ka10078)
     6. 체결강도 (ka10047)
     7. 프로그램매매 (ka90013)
 
+    모든 종목의 조회는 DeepScanEngine으로 동시에 실행되고,
+    결과 반영은 종목 순서대로 진행된다.
+
     Args:
         candidates: 후보 종목 리스트
         market_api: MarketAPI 인스턴스
         max_candidates: Deep Scan할 최대 종목 수
         verbose: 상세 로그 출력 여부
+        engine: 동시 조회 엔진 (None이면 기본 설정 + 공용 비동기 클라이언트로 생성)
 
     Returns:
         enrichment된 후보 종목 리스트
@@ -151,14 +150,39 @@ def enrich_candidates_with_deep_scan(
         print(f"\n🔬 Deep Scan 실행 중 (상위 {min(len(candidates), max_candidates)}개)...")
 
     top_candidates = candidates[:max_candidates]
+    engine = engine or DeepScanEngine(
+        async_client=get_shared_async_client(getattr(market_api, 'client', None))
+    )
+
+    def build_tasks(candidate: StockCandidate) -> List[EnrichmentTask]:
+        code = candidate.code
+        tasks = build_deep_scan_tasks(market_api, candidate, MAJOR_FIRMS, firm_days=5)
+
+        # 체결강도/프로그램매매는 캐시에 없을 때만 조회
+        if _get_from_cache(f"execution_{code}") is None:
+            tasks.append(EnrichmentTask(
+                'execution', 'ka10047', lambda: market_api.get_execution_intensity(code),
+                call=market_api.execution_intensity_call(code)
+            ))
+        if _get_from_cache(f"program_{code}") is None:
+            tasks.append(EnrichmentTask(
+                'program', 'ka90013', lambda: market_api.get_program_trading(code),
+                call=market_api.program_trading_call(code)
+            ))
+
+        return tasks
+
+    scan_results = engine.run(top_candidates, build_tasks)
 
     for idx, candidate in enumerate(top_candidates, 1):
         try:
+            data = scan_results.get(candidate.code, {})
+
             if verbose:
                 print(f"   [{idx}/{len(top_candidates)}] {candidate.name} ({candidate.code})")
 
-            # 1. 기관/외국인 매매 데이터 조회 (ka10059)
-            investor_data = market_api.get_investor_data(candidate.code)
+            # 1. 기관/외국인 매매 데이터 (ka10059)
+            investor_data = data.get('investor')
             if investor_data:
                 candidate.institutional_net_buy = investor_data.get('기관_순매수', 0)
                 candidate.foreign_net_buy = investor_data.get('외국인_순매수', 0)
@@ -168,8 +192,8 @@ def enrich_candidates_with_deep_scan(
                 candidate.institutional_net_buy = 0
                 candidate.foreign_net_buy = 0
 
-            # 2. 호가 데이터 조회 (ka10004)
-            bid_ask_data = market_api.get_bid_ask(candidate.code)
+            # 2. 호가 데이터 (ka10004)
+            bid_ask_data = data.get('bid_ask')
             if bid_ask_data:
                 bid_total = bid_ask_data.get('매수_총잔량', 1)
                 ask_total = bid_ask_data.get('매도_총잔량', 1)
@@ -179,12 +203,8 @@ def enrich_candidates_with_deep_scan(
             else:
                 candidate.bid_ask_ratio = 0
 
-            # 3. 기관매매추이 조회 (ka10045) - 5일 트렌드
-            trend_data = market_api.get_institutional_trading_trend(
-                candidate.code,
-                days=5,
-                price_type='buy'
-            )
+            # 3. 기관매매추이 (ka10045) - 5일 트렌드
+            trend_data = data.get('trend')
             if trend_data:
                 candidate.institutional_trend = trend_data
                 if verbose:
@@ -193,8 +213,8 @@ def enrich_candidates_with_deep_scan(
                 if verbose:
                     print(f"      기관추이: 데이터 없음")
 
-            # 4. 일봉 데이터 조회 (ka10006) - 평균거래량 & 변동성
-            daily_data = market_api.get_daily_chart(candidate.code, period=20)
+            # 4. 일봉 데이터 (ka10081) - 평균거래량 & 변동성
+            daily_data = data.get('daily')
             if daily_data and len(daily_data) > 1:
                 # 평균 거래량 (20일)
                 volumes = [d.get('volume', 0) for d in daily_data if d.get('volume')]
@@ -248,53 +268,33 @@ def enrich_candidates_with_deep_scan(
                 candidate.macd = None
                 candidate.bollinger_bands = None
 
-            # 5. 증권사별매매 조회 (ka10078)
-            major_firms = [
-                ('001', '한국투자'),
-                ('003', '미래에셋'),
-                ('030', 'NH투자'),
-                ('005', '삼성'),
-                ('038', 'KB증권'),
-            ]
-
+            # 5. 증권사별매매 (ka10078)
             buy_count = 0
             total_net_buy = 0
 
-            for firm_code, firm_name in major_firms:
-                try:
-                    firm_data = market_api.get_securities_firm_trading(
-                        firm_code=firm_code,
-                        stock_code=candidate.code,
-                        days=5
-                    )
-
-                    if firm_data and len(firm_data) > 0:
-                        latest = firm_data[0]
-                        net_qty = latest.get('net_qty', 0)
+            for firm_code, firm_name in MAJOR_FIRMS:
+                firm_data = data.get(f'firm_{firm_code}')
+
+                if firm_data and len(firm_data) > 0:
+                    latest = firm_data[0]
+                    net_qty = latest.get('net_qty', 0)
+                    if verbose:
+                        print(f"         └ {firm_name}: net_qty={net_qty:,}주", end="")
+
+                    if net_qty > 0:
+                        buy_count += 1
+                        total_net_buy += net_qty
                         if verbose:
-                            print(f"         └ {firm_name}: net_qty={net_qty:,}주", end="")
-
-                        if net_qty > 0:
-                            buy_count += 1
-                            total_net_buy += net_qty
-                            if verbose:
-                                print(f" ✅ 순매수")
-                        elif net_qty < 0:
-                            if verbose:
-                                print(f" ⚠️ 순매도")
-                        else:
-                            if verbose:
-                                print(f" - 변동없음")
+                            print(f" ✅ 순매수")
+                    elif net_qty < 0:
+                        if verbose:
+                            print(f" ⚠️ 순매도")
                     else:
                         if verbose:
-                            print(f"         └ {firm_name}: 데이터 없음")
-
-                    time.sleep(0.05)
-
-                except Exception as e:
+                            print(f" - 변동없음")
+                else:
                     if verbose:
-                        print(f"         └ {firm_name}: 오류 - {e}")
-                    continue
+                        print(f"         └ {firm_name}: 데이터 없음")
 
             candidate.top_broker_buy_count = buy_count
             candidate.top_broker_net_buy = total_net_buy
@@ -305,7 +305,7 @@ def enrich_candidates_with_deep_scan(
                 else:
                     print(f"      증권사: 순매수 없음")
 
-            # 6. 체결강도 조회 (ka10047) - 캐시 우선
+            # 6. 체결강도 (ka10047) - 캐시 우선
             cache_key_exec = f"execution_{candidate.code}"
             cached_exec = _get_from_cache(cache_key_exec)
 
@@ -317,7 +317,7 @@ def enrich_candidates_with_deep_scan(
                     else:
                         print(f"      체결강도: 값 없음 [캐시]")
             else:
-                execution_data = market_api.get_execution_intensity(candidate.code)
+                execution_data = data.get('execution')
                 if execution_data:
                     candidate.execution_intensity = execution_data.get('execution_intensity')
                     _save_to_cache(cache_key_exec, execution_data)
@@ -330,7 +330,7 @@ def enrich_candidates_with_deep_scan(
                     if verbose:
                         print(f"      체결강도: 데이터 없음")
 
-            # 7. 프로그램매매 조회 (ka90013) - 캐시 우선
+            # 7. 프로그램매매 (ka90013) - 캐시 우선
             cache_key_prog = f"program_{candidate.code}"
             cached_prog = _get_from_cache(cache_key_prog)
 
@@ -342,7 +342,7 @@ def enrich_candidates_with_deep_scan(
                     else:
                         print(f"      프로그램매매: 값 없음 [캐시]")
             else:
-                program_data = market_api.get_program_trading(candidate.code)
+                program_data = data.get('program')
                 if program_data:
                     candidate.program_net_buy = program_data.get('program_net_buy')
                     _save_to_cache(cache_key_prog, program_data)
@@ -355,8 +355,6 @@ def enrich_candidates_with_deep_scan(
                     if verbose:
                         print(f"      프로그램매매: 데이터 없음")
 
-            time.sleep(0.1)  # API 호출 간격
-
         except Exception as e:
             logger.error(f"Deep Scan 오류 ({candidate.name}): {e}")
             if verbose:
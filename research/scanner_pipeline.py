@@ -10,16 +10,23 @@ from datetime import datetime, time as dt_time
 from pathlib import Path
 import json
 
+import numpy as np
+
 from utils.logger_new import get_logger
 
 from config.manager import get_config
+from utils.data_cache import get_namespace_cache
+from research.deep_scan_engine import DeepScanEngine, EnrichmentTask, build_deep_scan_tasks
+from core.async_rest_client import get_shared_async_client
 
 
 logger = get_logger()
 
 
-_deep_scan_cache = {}
+# Deep Scan 캐시 (공용 LRUCache의 'deep_scan_pipeline' 네임스페이스)
+# deep_scan_utils('deep_scan', 5분)와 키가 같으므로 네임스페이스를 분리해 1분 TTL 유지
 CACHE_TTL_SECONDS = 60
+_deep_scan_cache = get_namespace_cache('deep_scan_pipeline', default_ttl_seconds=CACHE_TTL_SECONDS)
 
 
 @dataclass
@@ -138,6 +145,12 @@ class ScannerPipeline:
         self.deep_max_candidates = get_scan_value('deep_scan', 'max_candidates', 20)
         self.ai_max_candidates = get_scan_value('ai_scan', 'max_candidates', 5)
 
+        # Deep Scan 동시 조회 엔진 (api-id별 호출 예산 적용, TR 호출은 request_many로 일괄 전송)
+        self.deep_scan_engine = DeepScanEngine(
+            max_workers=get_scan_value('deep_scan', 'max_workers', 8),
+            async_client=get_shared_async_client(getattr(market_api, 'client', None))
+        )
+
         # 스캔 상태
         self.last_fast_scan = 0
         self.last_deep_scan = 0
@@ -214,13 +227,22 @@ class ScannerPipeline:
                 print(f"🔍 DEBUG: price 타입={type(first.get('price'))}, 값={first.get('price')}")
                 print(f"🔍 DEBUG: rate 타입={type(first.get('rate'))}, 값={first.get('rate')}")
 
-            # 거래량 기준 정렬
+            # 전체 종목 440점 배치 스코어링 (스코어링 시스템이 있을 때)
+            universe_scores = self._score_universe(candidates)
+
+            # 점수(없으면 0) → 거래대금 순 정렬
             print("📍 거래량 정렬 시작...")
-            candidates = sorted(
-                candidates,
-                key=lambda x: float(x.get('volume', 0)) * float(x.get('price', 0)),  # 거래대금
+            order = sorted(
+                range(len(candidates)),
+                key=lambda i: (
+                    universe_scores[i] if universe_scores is not None else 0.0,
+                    float(candidates[i].get('volume', 0)) * float(candidates[i].get('price', 0)),  # 거래대금
+                ),
                 reverse=True
             )
+            candidates = [candidates[i] for i in order]
+            if universe_scores is not None:
+                universe_scores = [float(universe_scores[i]) for i in order]
             print("📍 거래량 정렬 완료")
 
             # 최대 개수 제한
@@ -243,6 +265,8 @@ class ScannerPipeline:
                     )
 
                     candidate.fast_scan_score = self._calculate_fast_score(candidate)
+                    if universe_scores is not None:
+                        candidate.fast_scan_breakdown['universe_score'] = universe_scores[idx]
                     stock_candidates.append(candidate)
                 except Exception as e:
                     print(f"  ❌ 에러 발생: {stock.get('name')} - {e}")
@@ -297,6 +321,33 @@ class ScannerPipeline:
             logger.error(f"Fast Scan 실패: {e}", exc_info=True)
             return []
 
+    def _score_universe(self, stocks: List[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """
+        스크리닝된 전체 종목 440점 배치 스코어링 (가격/거래량/등락률 기준)
+
+        Returns:
+            입력 순서 점수 배열 (스코어링 시스템이 없거나 실패하면 None)
+        """
+        if self.scoring_system is None or not stocks:
+            return None
+        try:
+            def column(key):
+                return np.array([float(s.get(key) or 0) for s in stocks], dtype=np.float64)
+
+            columns = {
+                'stock_code': np.array([s.get('code', '') for s in stocks], dtype=object),
+                'current_price': column('price'),
+                'volume': column('volume'),
+                'change_rate': column('rate'),
+            }
+            started = time.perf_counter()
+            scores = self.scoring_system.calculate_scores_batch(columns=columns).total
+            logger.info(f"전체 종목 배치 스코어링: {len(stocks)}종목 {(time.perf_counter() - started) * 1000:.1f}ms")
+            return scores
+        except Exception as e:
+            logger.warning(f"전체 종목 배치 스코어링 실패: {e}")
+            return None
+
     def _calculate_fast_score(self, candidate: StockCandidate) -> float:
         """
         Fast Scan 점수 계산
@@ -361,14 +412,53 @@ class ScannerPipeline:
             deep_config = self.scan_config.get('deep_scan', {})
             scan_time = datetime.now()
 
+            # 주요 증권사 코드 (상위 5개)
+            major_firms = [
+                ("040", "KB증권"),
+                ("039", "교보증권"),
+                ("001", "한국투자증권"),
+                ("003", "미래에셋증권"),
+                ("005", "삼성증권")
+            ]
+
+            def build_tasks(candidate: StockCandidate) -> List[EnrichmentTask]:
+                code = candidate.code
+                tasks = build_deep_scan_tasks(
+                    self.market_api,
+                    candidate,
+                    major_firms,
+                    firm_days=1,  # 당일만 조회
+                    daily_period=20,
+                    include_trend=False
+                )
+
+                # 체결강도/프로그램매매는 캐시에 없을 때만 조회
+                if self._get_from_cache(f"execution_{code}") is None:
+                    tasks.append(EnrichmentTask(
+                        'execution', 'ka10047',
+                        lambda: self.market_api.get_execution_intensity(stock_code=code),
+                        call=self.market_api.execution_intensity_call(stock_code=code)
+                    ))
+                if self._get_from_cache(f"program_{code}") is None:
+                    tasks.append(EnrichmentTask(
+                        'program', 'ka90013',
+                        lambda: self.market_api.get_program_trading(stock_code=code),
+                        call=self.market_api.program_trading_call(stock_code=code)
+                    ))
+
+                return tasks
+
+            # 전 종목 API 호출을 동시에 실행 (api-id별 호출 예산 적용)
+            scan_results = self.deep_scan_engine.run(candidates, build_tasks)
+
             # 각 종목에 대해 심층 분석
             for candidate in candidates:
                 try:
                     print(f"📍 Deep Scan: {candidate.name} ({candidate.code})")
+                    data = scan_results.get(candidate.code, {})
 
-                    # 기관/외국인 매매 데이터 조회
-                    print(f"   📊 투자자 매매 조회 중...")
-                    investor_data = self.market_api.get_investor_data(candidate.code)
+                    # 기관/외국인 매매 데이터
+                    investor_data = data.get('investor')
 
                     if investor_data:
                         inst_buy = investor_data.get('기관_순매수', 0)
@@ -381,9 +471,8 @@ class ScannerPipeline:
                         candidate.institutional_net_buy = 0
                         candidate.foreign_net_buy = 0
 
-                    # 호가 데이터 조회
-                    print(f"   📊 호가 조회 중...")
-                    bid_ask_data = self.market_api.get_bid_ask(candidate.code)
+                    # 호가 데이터
+                    bid_ask_data = data.get('bid_ask')
 
                     if bid_ask_data:
                         bid_total = bid_ask_data.get('매수_총잔량', 1)
@@ -394,10 +483,9 @@ class ScannerPipeline:
                         print(f"   ⚠️  호가 데이터 없음")
                         candidate.bid_ask_ratio = 0
 
-                    # 일봉 데이터 조회 (평균 거래량, 변동성 계산)
-                    print(f"   📊 일봉 데이터 조회 중...")
+                    # 일봉 데이터 (평균 거래량, 변동성 계산)
                     try:
-                        daily_data = self.market_api.get_daily_price(candidate.code, days=20)
+                        daily_data = data.get('daily')
                         if daily_data and len(daily_data) > 0:
                             # 평균 거래량 (20일)
                             volumes = [row.get('volume', 0) for row in daily_data]
@@ -417,59 +505,34 @@ class ScannerPipeline:
                         else:
                             print(f"   ⚠️  일봉 데이터 없음")
                     except Exception as e:
-                        print(f"   ⚠️  일봉 데이터 조회 실패: {e}")
-                        logger.debug(f"일봉 데이터 조회 실패: {e}")
+                        print(f"   ⚠️  일봉 데이터 처리 실패: {e}")
+                        logger.debug(f"일봉 데이터 처리 실패: {e}")
 
-                    # 증권사별 매매동향 조회 (주요 증권사 5개)
-                    print(f"   📊 증권사별 매매동향 조회 중...")
-                    try:
-                        # 주요 증권사 코드 (상위 5개)
-                        major_firms = [
-                            ("040", "KB증권"),
-                            ("039", "교보증권"),
-                            ("001", "한국투자증권"),
-                            ("003", "미래에셋증권"),
-                            ("005", "삼성증권")
-                        ]
-
-                        broker_buy_count = 0
-                        broker_net_buy_total = 0
-
-                        for firm_code, firm_name in major_firms:
-                            try:
-                                firm_data = self.market_api.get_securities_firm_trading(
-                                    firm_code=firm_code,
-                                    stock_code=candidate.code,
-                                    days=1  # 당일만 조회
-                                )
-
-                                if firm_data and len(firm_data) > 0:
-                                    # 최근 데이터 (당일)
-                                    recent = firm_data[0]
-                                    net_qty = recent.get('net_qty', 0)
-
-                                    if net_qty > 0:  # 순매수인 경우
-                                        broker_buy_count += 1
-                                        broker_net_buy_total += net_qty
-
-                                time.sleep(0.05)  # API 호출 간격
-                            except Exception as e:
-                                logger.debug(f"증권사 {firm_name} 데이터 조회 실패: {e}")
-                                continue
-
-                        candidate.top_broker_buy_count = broker_buy_count
-                        candidate.top_broker_net_buy = broker_net_buy_total
-
-                        if broker_buy_count > 0:
-                            print(f"   ✓ 증권사: {broker_buy_count}/5개 순매수, 총 {broker_net_buy_total:,}주")
-                        else:
-                            print(f"   ⚠️  증권사: 순매수 없음")
-                    except Exception as e:
-                        print(f"   ⚠️  증권사 데이터 조회 실패: {e}")
-                        logger.debug(f"증권사 데이터 조회 실패: {e}")
+                    # 증권사별 매매동향 (주요 증권사 5개)
+                    broker_buy_count = 0
+                    broker_net_buy_total = 0
 
-                    # 체결강도 조회 (ka10047) - 캐시 우선
-                    print(f"   📊 체결강도 조회 중...")
+                    for firm_code, firm_name in major_firms:
+                        firm_data = data.get(f'firm_{firm_code}')
+
+                        if firm_data and len(firm_data) > 0:
+                            # 최근 데이터 (당일)
+                            recent = firm_data[0]
+                            net_qty = recent.get('net_qty', 0)
+
+                            if net_qty > 0:  # 순매수인 경우
+                                broker_buy_count += 1
+                                broker_net_buy_total += net_qty
+
+                    candidate.top_broker_buy_count = broker_buy_count
+                    candidate.top_broker_net_buy = broker_net_buy_total
+
+                    if broker_buy_count > 0:
+                        print(f"   ✓ 증권사: {broker_buy_count}/5개 순매수, 총 {broker_net_buy_total:,}주")
+                    else:
+                        print(f"   ⚠️  증권사: 순매수 없음")
+
+                    # 체결강도 (ka10047) - 캐시 우선
                     cache_key_exec = f"execution_{candidate.code}"
                     cached_exec = self._get_from_cache(cache_key_exec)
 
@@ -477,23 +540,16 @@ class ScannerPipeline:
                         candidate.execution_intensity = cached_exec.get('execution_intensity')
                         print(f"   ✓ 체결강도: {candidate.execution_intensity:.1f} [캐시]" if candidate.execution_intensity else "   ⚠️  체결강도: 0 [캐시]")
                     else:
-                        try:
-                            execution_data = self.market_api.get_execution_intensity(
-                                stock_code=candidate.code
-                            )
-
-                            if execution_data:
-                                candidate.execution_intensity = execution_data.get('execution_intensity')
-                                self._save_to_cache(cache_key_exec, execution_data)
-                                print(f"   ✓ 체결강도: {candidate.execution_intensity:.1f}" if candidate.execution_intensity else "   ⚠️  체결강도: 0")
-                            else:
-                                print(f"   ⚠️  체결강도 데이터 없음")
-                        except Exception as e:
-                            print(f"   ⚠️  체결강도 조회 실패 (캐시도 없음): {e}")
-                            logger.debug(f"체결강도 조회 실패: {e}")
-
-                    # 프로그램매매 조회 (ka90013) - 캐시 우선
-                    print(f"   📊 프로그램매매 조회 중...")
+                        execution_data = data.get('execution')
+
+                        if execution_data:
+                            candidate.execution_intensity = execution_data.get('execution_intensity')
+                            self._save_to_cache(cache_key_exec, execution_data)
+                            print(f"   ✓ 체결강도: {candidate.execution_intensity:.1f}" if candidate.execution_intensity else "   ⚠️  체결강도: 0")
+                        else:
+                            print(f"   ⚠️  체결강도 데이터 없음")
+
+                    # 프로그램매매 (ka90013) - 캐시 우선
                     cache_key_prog = f"program_{candidate.code}"
                     cached_prog = self._get_from_cache(cache_key_prog)
 
@@ -501,27 +557,19 @@ class ScannerPipeline:
                         candidate.program_net_buy = cached_prog.get('program_net_buy')
                         print(f"   ✓ 프로그램순매수: {candidate.program_net_buy:,}원 [캐시]" if candidate.program_net_buy else "   ⚠️  프로그램순매수: 0원 [캐시]")
                     else:
-                        try:
-                            program_data = self.market_api.get_program_trading(
-                                stock_code=candidate.code
-                            )
-
-                            if program_data:
-                                candidate.program_net_buy = program_data.get('program_net_buy')
-                                self._save_to_cache(cache_key_prog, program_data)
-                                print(f"   ✓ 프로그램순매수: {candidate.program_net_buy:,}원" if candidate.program_net_buy else "   ⚠️  프로그램순매수: 0원")
-                            else:
-                                print(f"   ⚠️  프로그램매매 데이터 없음")
-                        except Exception as e:
-                            print(f"   ⚠️  프로그램매매 조회 실패 (캐시도 없음): {e}")
-                            logger.debug(f"프로그램매매 조회 실패: {e}")
+                        program_data = data.get('program')
+
+                        if program_data:
+                            candidate.program_net_buy = program_data.get('program_net_buy')
+                            self._save_to_cache(cache_key_prog, program_data)
+                            print(f"   ✓ 프로그램순매수: {candidate.program_net_buy:,}원" if candidate.program_net_buy else "   ⚠️  프로그램순매수: 0원")
+                        else:
+                            print(f"   ⚠️  프로그램매매 데이터 없음")
 
                     # Deep Scan 점수 계산
                     candidate.deep_scan_score = self._calculate_deep_score(candidate)
                     candidate.deep_scan_time = scan_time
 
-                    time.sleep(0.1)  # API 호출 간격
-
                 except Exception as e:
                     print(f"   ❌ 오류: {e}")
                     logger.error(f"종목 {candidate.code} Deep Scan 실패: {e}", exc_info=True)
@@ -823,30 +871,12 @@ class ScannerPipeline:
 
     def _get_from_cache(self, cache_key: str) -> Optional[Dict]:
         """캐시에서 데이터 조회"""
-        global _deep_scan_cache
-
-        if cache_key not in _deep_scan_cache:
-            return None
-
-        entry = _deep_scan_cache[cache_key]
-        timestamp = entry['timestamp']
-
-        # TTL 체크
-        if (datetime.now() - timestamp).total_seconds() > CACHE_TTL_SECONDS:
-            # 만료됨 - 삭제
-            del _deep_scan_cache[cache_key]
-            return None
-
-        return entry['data']
+        return _deep_scan_cache.get(cache_key)
 
     def _save_to_cache(self, cache_key: str, data: Dict):
-        """캐시에 데이터 저장"""
-        global _deep_scan_cache
-
-        _deep_scan_cache[cache_key] = {
-            'data': data,
-            'timestamp': datetime.now()
-        }
+        """캐시에 데이터 저장 (종목 코드 태그로 종목 단위 무효화 가능)"""
+        code = cache_key.rsplit('_', 1)[-1]
+        _deep_scan_cache.set(cache_key, data, ttl_seconds=CACHE_TTL_SECONDS, tags=[f"stock:{code}"])
 
     def _load_learning_data(self):
         """가상매매 학습 데이터 로드"""
@@ -6,31 +6,81 @@ v5.0 Changes:
 - Consolidated RiskManager into DynamicRiskManager
 - Position now imported from core (standardized)
 - PositionManager still available for backward compatibility
+
+패키지 속성은 처음 접근할 때 해당 모듈을 import한다 (PEP 562).
 """
-from .base_strategy import BaseStrategy
-from .momentum_strategy import MomentumStrategy
-from .portfolio_manager import PortfolioManager
-from .dynamic_risk_manager import DynamicRiskManager, RiskMode, RiskModeConfig
+import importlib
+from typing import TYPE_CHECKING
+
+# 공개 이름 → 정의 모듈
+_LAZY_EXPORTS = {
+    'BaseStrategy': '.base_strategy',
+    'MomentumStrategy': '.momentum_strategy',
+    'PortfolioManager': '.portfolio_manager',
+    'DynamicRiskManager': '.dynamic_risk_manager',
+    'RiskMode': '.dynamic_risk_manager',
+    'RiskModeConfig': '.dynamic_risk_manager',
+    # v4.0 Advanced Strategies
+    'TrailingStopManager': '.trailing_stop_manager',
+    'TrailingStopState': '.trailing_stop_manager',
+    'VolatilityBreakoutStrategy': '.volatility_breakout_strategy',
+    'BreakoutState': '.volatility_breakout_strategy',
+    'PairsTradingStrategy': '.pairs_trading_strategy',
+    'PairState': '.pairs_trading_strategy',
+    'KellyCriterion': '.kelly_criterion',
+    'KellyParameters': '.kelly_criterion',
+    'InstitutionalFollowingStrategy': '.institutional_following_strategy',
+    'InstitutionalData': '.institutional_following_strategy',
+    # v4.2: Position from core (standardized), PositionManager from local
+    'Position': 'core',
+    'PositionManager': '.position_manager',
+    'get_position_manager': '.position_manager',
+    'SignalChecker': '.signal_checker',
+    'SignalType': '.signal_checker',
+    'TradingSignalValidator': '.signal_checker',
+}
 
-# v4.0 Advanced Strategies
-try:
+# numpy 등 의존성이 없거나 이름이 없으면 None으로 대체되는 v4.0 전략 모듈
+_OPTIONAL_MODULES = {
+    '.trailing_stop_manager',
+    '.volatility_breakout_strategy',
+    '.pairs_trading_strategy',
+    '.kelly_criterion',
+    '.institutional_following_strategy',
+}
+
+if TYPE_CHECKING:
+    from .base_strategy import BaseStrategy
+    from .momentum_strategy import MomentumStrategy
+    from .portfolio_manager import PortfolioManager
+    from .dynamic_risk_manager import DynamicRiskManager, RiskMode, RiskModeConfig
     from .trailing_stop_manager import TrailingStopManager, TrailingStopState
     from .volatility_breakout_strategy import VolatilityBreakoutStrategy, BreakoutState
     from .pairs_trading_strategy import PairsTradingStrategy, PairState
     from .kelly_criterion import KellyCriterion, KellyParameters
     from .institutional_following_strategy import InstitutionalFollowingStrategy, InstitutionalData
-except ImportError:
-    # numpy 등 의존성 없을 때
-    TrailingStopManager = TrailingStopState = None
-    VolatilityBreakoutStrategy = BreakoutState = None
-    PairsTradingStrategy = PairState = None
-    KellyCriterion = KellyParameters = None
-    InstitutionalFollowingStrategy = InstitutionalData = None
-
-# v4.2: Position from core (standardized), PositionManager from local
-from core import Position  # v4.2: Use standard Position
-from .position_manager import PositionManager, get_position_manager
-from .signal_checker import SignalChecker, SignalType, TradingSignalValidator
+    from core import Position
+    from .position_manager import PositionManager, get_position_manager
+    from .signal_checker import SignalChecker, SignalType, TradingSignalValidator
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except (ImportError, AttributeError):
+        if module_name not in _OPTIONAL_MODULES:
+            raise
+        value = None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     'BaseStrategy',
@@ -57,4 +107,4 @@ __all__ = [
     'SignalChecker',
     'SignalType',
     'TradingSignalValidator',
-]
\ No newline at end of file
+]
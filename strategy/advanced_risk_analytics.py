@@ -15,6 +15,7 @@ from scipy import stats
 import math
 
 from utils.logger_new import get_logger
+from utils.monte_carlo import MonteCarloEngine
 
 logger = get_logger()
 
@@ -124,7 +125,8 @@ class AdvancedRiskAnalytics:
         std_return: float,
         time_horizon: int = 1,
         num_simulations: int = 10000,
-        confidence_level: Optional[float] = None
+        confidence_level: Optional[float] = None,
+        seed: Optional[int] = None
     ) -> Tuple[float, List[float]]:
         """
         Calculate Value at Risk using Monte Carlo simulation
@@ -136,30 +138,24 @@ class AdvancedRiskAnalytics:
             time_horizon: Time horizon in days
             num_simulations: Number of simulations to run
             confidence_level: Confidence level
+            seed: Random seed for reproducible runs
 
         Returns:
             (VaR value, simulated final values)
         """
         conf_level = confidence_level or self.confidence_level
 
-        # Run simulations
-        simulated_values = []
-
-        for _ in range(num_simulations):
-            # Simulate returns for each day in horizon
-            portfolio_value = current_value
-
-            for _ in range(time_horizon):
-                # Random return from normal distribution
-                daily_return = np.random.normal(mean_return, std_return)
-                portfolio_value *= (1 + daily_return)
-
-            simulated_values.append(portfolio_value)
+        # Run simulations (num_simulations x time_horizon matrix, chunked)
+        engine = MonteCarloEngine(seed=seed)
+        final_values = engine.terminal_values(
+            current_value, time_horizon, num_simulations,
+            mean=mean_return, std=std_return
+        )
 
         # Calculate VaR from simulated values
-        sorted_values = sorted(simulated_values)
-        var_index = int((1 - conf_level) * len(sorted_values))
-        var_value = sorted_values[var_index]
+        var_index = int((1 - conf_level) * num_simulations)
+        var_value = float(np.partition(final_values, var_index)[var_index])
+        simulated_values = final_values.tolist()
 
         # VaR as loss from current value
         var = current_value - var_value
@@ -459,7 +455,9 @@ class AdvancedRiskAnalytics:
         mean_return: float,
         std_return: float,
         time_horizon: int = 252,
-        num_simulations: int = 1000
+        num_simulations: int = 1000,
+        seed: Optional[int] = None,
+        sample_paths: int = 0
     ) -> Dict[str, Any]:
         """
         Run Monte Carlo simulation for portfolio projection
@@ -470,51 +468,44 @@ class AdvancedRiskAnalytics:
             std_return: Standard deviation of returns
             time_horizon: Number of days to simulate
             num_simulations: Number of simulation paths
+            seed: Random seed for reproducible runs
+            sample_paths: Number of full paths to include (0 = summary only)
 
         Returns:
             Simulation results with statistics
+            ('sample_paths' only when sample_paths > 0)
         """
         logger.info(
             f"Running Monte Carlo: {num_simulations:,} simulations "
             f"over {time_horizon} days"
         )
 
-        all_paths = []
-
-        for _ in range(num_simulations):
-            path = [initial_value]
-
-            for _ in range(time_horizon):
-                # Random return
-                daily_return = np.random.normal(mean_return, std_return)
-                new_value = path[-1] * (1 + daily_return)
-                path.append(new_value)
-
-            all_paths.append(path)
-
-        # Convert to numpy array for analysis
-        all_paths = np.array(all_paths)
-
-        # Calculate statistics for final values
-        final_values = all_paths[:, -1]
+        engine = MonteCarloEngine(seed=seed)
+        final_values = engine.terminal_values(
+            initial_value, time_horizon, num_simulations,
+            path_sample=sample_paths, mean=mean_return, std=std_return
+        )
+        summary = engine.summarize(final_values, initial_value)
 
         results = {
             'initial_value': initial_value,
             'num_simulations': num_simulations,
             'time_horizon': time_horizon,
-            'mean_final_value': np.mean(final_values),
-            'median_final_value': np.median(final_values),
-            'std_final_value': np.std(final_values),
-            'min_final_value': np.min(final_values),
-            'max_final_value': np.max(final_values),
-            'percentile_5': np.percentile(final_values, 5),
-            'percentile_25': np.percentile(final_values, 25),
-            'percentile_75': np.percentile(final_values, 75),
-            'percentile_95': np.percentile(final_values, 95),
-            'probability_profit': (final_values > initial_value).sum() / num_simulations,
-            'paths': all_paths.tolist()  # All simulation paths
+            'mean_final_value': summary['mean'],
+            'median_final_value': summary['median'],
+            'std_final_value': summary['std'],
+            'min_final_value': summary['min'],
+            'max_final_value': summary['max'],
+            'percentile_5': summary['percentile_5'],
+            'percentile_25': summary['percentile_25'],
+            'percentile_75': summary['percentile_75'],
+            'percentile_95': summary['percentile_95'],
+            'probability_profit': summary['probability_profit'],
         }
 
+        if sample_paths > 0:
+            results['sample_paths'] = engine.last_sample_paths.tolist()
+
         logger.info(
             f"Monte Carlo Results: "
             f"Mean={results['mean_final_value']:,.0f}, "
@@ -0,0 +1,432 @@
+"""
+strategy/batch_scoring.py
+10가지 기준 스코어링 배치(벡터화) 계산
+
+- 후보 전체를 컬럼(NumPy 배열)으로 바꿔 10개 기준 + 리스크 + 과거 성과를 한 번에 계산
+- 기준별 구간 점수는 ScoringSystem._score_* 와 같은 규칙 (np.select)
+- 결과는 입력 순서 그대로, 필요하면 ScoringResult 리스트로 변환
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# 숫자 컬럼 (없거나 변환 불가하면 NaN)
+NUMERIC_COLUMNS = (
+    'current_price', 'volume', 'avg_volume', 'change_rate', 'momentum_rate',
+    'institutional_net_buy', 'foreign_net_buy', 'bid_ask_ratio',
+    'execution_intensity', 'top_broker_buy_count', 'program_net_buy',
+    'rsi', 'bb_position', 'ma5', 'ma20', 'volatility', 'trend_points',
+)
+
+# 불리언 컬럼 (없으면 False)
+BOOL_COLUMNS = ('macd_positive', 'is_trending_theme', 'has_positive_news')
+
+_REQUIRED_COLUMNS = frozenset(NUMERIC_COLUMNS + BOOL_COLUMNS + ('stock_code',))
+
+# ScoringResult 필드 / 가중치 키 순서
+CRITERIA = (
+    ('volume_surge', 'volume_surge_score'),
+    ('price_momentum', 'price_momentum_score'),
+    ('institutional_buying', 'institutional_buying_score'),
+    ('bid_strength', 'bid_strength_score'),
+    ('execution_intensity', 'execution_intensity_score'),
+    ('broker_activity', 'broker_activity_score'),
+    ('program_trading', 'program_trading_score'),
+    ('technical_indicators', 'technical_indicators_score'),
+    ('theme_news', 'theme_news_score'),
+    ('volatility_pattern', 'volatility_pattern_score'),
+)
+
+
+def _num(value: Any) -> float:
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _trend_points(trend: Any) -> float:
+    """ka10045 기관매매추이 → 0/5/10점 (첫 시리즈의 최근 값 기준)"""
+    if not trend or not isinstance(trend, dict):
+        return 0.0
+    try:
+        for values in trend.values():
+            if isinstance(values, list) and len(values) > 0:
+                recent = values[0]
+                points = 0.0
+                orgn_net = recent.get('orgn_netslmt', '0')
+                if orgn_net and not str(orgn_net).startswith('-'):
+                    points += 5.0
+                for_net = recent.get('for_netslmt', '0')
+                if for_net and not str(for_net).startswith('-'):
+                    points += 5.0
+                return points
+    except (AttributeError, TypeError):
+        pass
+    return 0.0
+
+
+def _macd_positive(stock: Dict[str, Any]) -> bool:
+    if stock.get('macd_bullish_crossover', False):
+        return True
+    macd = stock.get('macd')
+    if isinstance(macd, dict):
+        return (macd.get('macd', 0) or 0) > 0
+    if isinstance(macd, (int, float)):
+        return macd > 0
+    return False
+
+
+def build_columns(stocks: Sequence[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    종목 dict 리스트 → 스코어링 컬럼
+
+    Args:
+        stocks: calculate_score와 같은 형식의 종목 데이터
+
+    Returns:
+        {컬럼명: 배열} (+ 'stock_code' 문자열 배열)
+    """
+    get = [s.get for s in stocks]
+    columns = {
+        name: np.array([_num(g(name)) for g in get], dtype=np.float64)
+        for name in ('current_price', 'volume', 'avg_volume', 'change_rate',
+                     'institutional_net_buy', 'foreign_net_buy', 'bid_ask_ratio',
+                     'execution_intensity', 'top_broker_buy_count', 'program_net_buy',
+                     'rsi', 'ma5', 'ma20', 'volatility')
+    }
+    # 가격 모멘텀은 change_rate가 없으면 rate 사용
+    columns['momentum_rate'] = np.array(
+        [_num(s['change_rate'] if 'change_rate' in s else s.get('rate')) for s in stocks],
+        dtype=np.float64
+    )
+    columns['bb_position'] = np.array([
+        _num(s['bollinger_bands'].get('position') if isinstance(s.get('bollinger_bands'), dict)
+             else s.get('bb_position'))
+        for s in stocks
+    ], dtype=np.float64)
+    columns['trend_points'] = np.array([_trend_points(g('institutional_trend')) for g in get], dtype=np.float64)
+    columns['macd_positive'] = np.array([_macd_positive(s) for s in stocks], dtype=bool)
+    columns['is_trending_theme'] = np.array([bool(g('is_trending_theme')) for g in get], dtype=bool)
+    columns['has_positive_news'] = np.array([bool(g('has_positive_news')) for g in get], dtype=bool)
+    columns['stock_code'] = np.array([str(g('stock_code') or '') for g in get], dtype=object)
+    return columns
+
+
+def complete_columns(columns: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """
+    일부 컬럼만 있는 입력을 채움 (숫자 → NaN, 불리언 → False)
+
+    Fast Scan처럼 가격/거래량/등락률만 있는 전체 종목 배치에 사용.
+    """
+    lengths = {len(v) for v in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"컬럼 길이가 다릅니다: {sorted(lengths)}")
+    n = lengths.pop() if lengths else 0
+
+    result = {}
+    for name in NUMERIC_COLUMNS:
+        value = columns.get(name)
+        result[name] = np.full(n, np.nan) if value is None else np.asarray(value, dtype=np.float64)
+    if 'momentum_rate' not in columns and 'change_rate' in columns:
+        result['momentum_rate'] = result['change_rate']
+    for name in BOOL_COLUMNS:
+        value = columns.get(name)
+        result[name] = np.zeros(n, dtype=bool) if value is None else np.asarray(value, dtype=bool)
+    codes = columns.get('stock_code')
+    result['stock_code'] = np.full(n, '', dtype=object) if codes is None else np.asarray(codes, dtype=object)
+    return result
+
+
+@dataclass
+class BatchScores:
+    """배치 스코어링 결과 (입력 순서)"""
+
+    stock_codes: np.ndarray
+    breakdown: Dict[str, np.ndarray]   # 가중치 적용된 기준별 점수
+    risk: np.ndarray
+    historical: np.ndarray
+    total: np.ndarray
+    max_score: float = 440.0
+    details: Dict[str, Any] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.total)
+
+    @property
+    def percentage(self) -> np.ndarray:
+        return self.total / self.max_score * 100 if self.max_score > 0 else np.zeros_like(self.total)
+
+    def top(self, n: int) -> np.ndarray:
+        """총점 상위 n개 인덱스 (내림차순, 동점은 입력 순서)"""
+        n = min(n, len(self.total))
+        if n <= 0:
+            return np.empty(0, dtype=np.int64)
+        order = np.argsort(-self.total, kind='stable')
+        return order[:n]
+
+    def result(self, i: int):
+        """i번째 종목 ScoringResult"""
+        from strategy.scoring_system import ScoringResult
+
+        result = ScoringResult(max_score=self.max_score)
+        for key, attr in CRITERIA:
+            setattr(result, attr, float(self.breakdown[key][i]))
+        result.risk_score = float(self.risk[i])
+        result.historical_performance_score = float(self.historical[i])
+        result.total_score = float(self.total[i])
+        result.time_adjusted_score = result.total_score
+        result.details = dict(self.details)
+        result.calculate_percentage()
+        return result
+
+    def to_results(self) -> List[Any]:
+        return [self.result(i) for i in range(len(self))]
+
+
+class BatchScorer:
+    """
+    10가지 기준 벡터화 스코어러
+
+    Usage:
+        scorer = BatchScorer(config.scoring.get('criteria', {}))
+        cols = build_columns(stocks)
+        raw = scorer.raw_scores(cols)          # 가중치 적용 전 기준별 점수
+        scores = scorer.score(cols, weights)   # BatchScores
+    """
+
+    def __init__(self, criteria_config: Optional[Dict[str, Any]] = None):
+        self.criteria_config = criteria_config or {}
+
+    def _cfg(self, name: str) -> Dict[str, Any]:
+        return self.criteria_config.get(name, {}) or {}
+
+    @staticmethod
+    def _fill(values: np.ndarray, default: float = 0.0) -> np.ndarray:
+        return np.where(np.isnan(values), default, values)
+
+    # ------------------------------------------------------------------
+    # 기준별 점수 (가중치 적용 전)
+    # ------------------------------------------------------------------
+
+    def volume_surge(self, c: Dict[str, np.ndarray]) -> np.ndarray:
+        m = self._cfg('volume_surge').get('weight', 60)
+        volume = self._fill(c['volume'])
+        avg = c['avg_volume']
+        has_avg = avg > 0   # NaN은 False
+        ratio = np.divide(volume, avg, out=np.zeros_like(volume), where=has_avg)
+
+        by_ratio = np.select(
+            [ratio >= 5.0, ratio >= 3.0, ratio >= 2.0, ratio >= 1.0],
+            [m, m * 0.75, m * 0.5, m * 0.25], 0.0
+        )
+        by_volume = np.select(
+            [volume >= 5_000_000, volume >= 2_000_000, volume >= 1_000_000, volume >= 500_000],
+            [m * 0.8, m * 0.6, m * 0.4, m * 0.2], 0.0
+        )
+        return np.where(has_avg, by_ratio, by_volume)
+
+    def price_momentum(self, c: Dict[str, np.ndarray]) -> np.ndarray:
+        m = self._cfg('price_momentum').get('weight', 60)
+        rate = self._fill(c['momentum_rate'])
+        return np.select(
+            [rate >= 10.0, rate >= 7.0, rate >= 5.0, rate >= 3.0, rate >= 2.0, rate >= 1.0],
+            [m, m * 0.85, m * 0.7, m * 0.55, m * 0.4, m * 0.25], 0.0
+        )
+
+    def institutional_buying(self, c: Dict[str, np.ndarray]) -> np.ndarray:
+        config = self._cfg('institutional_buying')
+        m = config.get('weight', 60)
+        min_net_buy = config.get('min_net_buy', 10_000_000)
+        inst = self._fill(c['institutional_net_buy'])
+        foreign = self._fill(c['foreign_net_buy'])
+
+        score = np.select(
+            [inst >= min_net_buy * 5, inst >= min_net_buy * 3, inst >= min_net_buy],
+            [40.0, 30.0, 20.0], 0.0
+        )
+        score += np.select([foreign >= min_net_buy, foreign >= min_net_buy * 0.5], [10.0, 5.0], 0.0)
+        score += self._fill(c['trend_points'])
+        return np.minimum(score, m)
+
+    def bid_strength(self, c: Dict[str, np.ndarray]) -> np.ndarray:
+        m = self._cfg('bid_strength').get('weight', 40)
+        ratio = self._fill(c['bid_ask_ratio'])
+        return np.select(
+            [ratio >= 1.5, ratio >= 1.2, ratio >= 0.8, ratio >= 0.5],
+            [m, m * 0.75, m * 0.5, m * 0.25], 0.0
+        )
+
+    def execution_intensity(self, c: Dict[str, np.ndarray]) -> np.ndarray:
+        config = self._cfg('execution_intensity')
+        m = config.get('weight', 40)
+        min_value = config.get('min_value', 50)
+        value = c['execution_intensity']   # NaN/0 → 모든 조건 False 또는 min_value 미만
+        return np.select(
+            [value >= min_value * 3.0, value >= min_value * 2.0, value >= min_value * 1.4,
+             (value >= min_value) & (value != 0)],
+            [m, m * 0.75, m * 0.5, m * 0.25], 0.0
+        )
+
+    def broker_activity(self, c: Dict[str, np.ndarray]) -> np.ndarray:
+        config = self._cfg('broker_activity')
+        m = config.get('weight', 40)
+        top_brokers = config.get('top_brokers', 5)
+        count = self._fill(c['top_broker_buy_count'])
+        return np.select(
+            [count >= top_brokers, count >= top_brokers * 0.6, count >= top_brokers * 0.4, count >= 1],
+            [m, m * 0.67, m * 0.33, m * 0.17], 0.0
+        )
+
+    def program_trading(self, c: Dict[str, np.ndarray]) -> np.ndarray:
+        m = self._cfg('program_trading').get('weight', 40)
+        value = c['program_net_buy']
+        return np.select(
+            [value >= 5_000_000, value >= 3_000_000, value >= 1_000_000, value >= 100_000],
+            [m, m * 0.75, m * 0.5, m * 0.25], 0.0
+        )
+
+    def technical_indicators(self, c: Dict[str, np.ndarray]) -> np.ndarray:
+        config = self._cfg('technical_indicators')
+        m = config.get('weight', 40)
+        rsi_w = config.get('rsi_weight', 0.375)
+        macd_w = config.get('macd_weight', 0.375)
+        bb_w = config.get('bb_weight', 0.125)
+        ma_w = config.get('ma_weight', 0.125)
+
+        rate = self._fill(c['change_rate'])
+        rsi = c['rsi']
+        has_rsi = ~np.isnan(rsi)
+
+        # RSI (없으면 상승률로 추정)
+        rsi_score = np.where((rsi >= 30) & (rsi <= 70), m * rsi_w, 0.0)
+        rsi_estimate = np.select(
+            [(rate >= 0.5) & (rate <= 20.0), rate > 0],
+            [m * rsi_w * np.minimum(rate / 10.0, 1.0), m * 0.25], 0.0
+        )
+        score = np.where(has_rsi, rsi_score, rsi_estimate)
+
+        # MACD (없으면 거래량+상승률로 추정)
+        volume = self._fill(c['volume'])
+        macd_estimate = np.select([(rate > 0) & (volume > 500_000), rate > 0], [m * 0.3, m * 0.2], 0.0)
+        score += np.where(c['macd_positive'], m * macd_w, macd_estimate)
+
+        # 볼린저밴드
+        bb = c['bb_position']
+        score += np.select(
+            [(bb >= 0.2) & (bb <= 0.8), np.abs(rate) < 15],
+            [m * bb_w, m * 0.1], 0.0
+        )
+
+        # 이동평균
+        ma5, ma20 = self._fill(c['ma5']), self._fill(c['ma20'])
+        price = self._fill(c['current_price'])
+        score += np.select(
+            [(ma5 != 0) & (ma20 != 0) & (ma5 > ma20), price >= 1000],
+            [m * ma_w, m * 0.1], 0.0
+        )
+        return score
+
+    def market_momentum(self, c: Dict[str, np.ndarray]) -> np.ndarray:
+        m = self._cfg('theme_news').get('weight', 40)
+        rate = self._fill(c['change_rate'])
+        volume = self._fill(c['volume'])
+        avg = c['avg_volume']
+        has_avg = avg > 0
+        ratio = np.divide(volume, avg, out=np.zeros_like(volume), where=has_avg)
+
+        volume_part = np.select(
+            [(ratio >= 2.0) & (rate >= 3.0), (ratio >= 1.5) & (rate >= 1.5), (ratio >= 1.2) | (rate >= 0.5)],
+            [m * 0.4, m * 0.25, m * 0.125], 0.0
+        )
+        volume_part = np.where(has_avg, volume_part, 0.0)
+        score = np.where(c['is_trending_theme'], m * 0.5, volume_part)
+
+        inst = self._fill(c['institutional_net_buy'])
+        price_part = np.select(
+            [(rate >= 5.0) & (inst >= 1_000_000), (rate >= 2.0) & (inst >= 500_000),
+             (rate >= 0.5) | (inst >= 100_000)],
+            [m * 0.4, m * 0.25, m * 0.125], 0.0
+        )
+        score += np.where(c['has_positive_news'], m * 0.5, price_part)
+        return score
+
+    def volatility_pattern(self, c: Dict[str, np.ndarray]) -> np.ndarray:
+        config = self._cfg('volatility_pattern')
+        m = config.get('weight', 20)
+        low = config.get('min_volatility', 0.02)
+        high = config.get('max_volatility', 0.15)
+        vol = c['volatility']
+
+        mid = (low + high) / 2
+        half = (high - low) / 2
+        in_range = (vol >= low) & (vol <= high)
+        ratio = 1 - np.abs(vol - mid) / half if half > 0 else np.ones_like(vol)
+        return np.where(in_range, m * ratio, 0.0)
+
+    # ------------------------------------------------------------------
+    # 합산
+    # ------------------------------------------------------------------
+
+    def raw_scores(self, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """기준별 점수 (가중치 적용 전)"""
+        c = columns
+        return {
+            'volume_surge': self.volume_surge(c),
+            'price_momentum': self.price_momentum(c),
+            'institutional_buying': self.institutional_buying(c),
+            'bid_strength': self.bid_strength(c),
+            'execution_intensity': self.execution_intensity(c),
+            'broker_activity': self.broker_activity(c),
+            'program_trading': self.program_trading(c),
+            'technical_indicators': self.technical_indicators(c),
+            'theme_news': self.market_momentum(c),
+            'volatility_pattern': self.volatility_pattern(c),
+        }
+
+    def score(
+        self,
+        columns: Dict[str, np.ndarray],
+        weights: Dict[str, float],
+        risk: Optional[np.ndarray] = None,
+        historical: Optional[np.ndarray] = None,
+        max_score: float = 440.0
+    ) -> BatchScores:
+        """
+        가중치 적용 + 리스크/과거 성과 합산
+
+        Args:
+            columns: build_columns / complete_columns 결과
+            weights: 기준별 가중치 (CRITERIA 키)
+            risk: 종목별 리스크 점수 (없으면 0)
+            historical: 종목별 과거 성과 점수 (없으면 0)
+        """
+        if not _REQUIRED_COLUMNS <= columns.keys():
+            columns = complete_columns(columns)
+        n = len(columns['volume'])
+
+        breakdown = {
+            key: raw * weights.get(key, 1.0)
+            for key, raw in self.raw_scores(columns).items()
+        }
+        risk = np.zeros(n) if risk is None else np.asarray(risk, dtype=np.float64)
+        historical = np.zeros(n) if historical is None else np.asarray(historical, dtype=np.float64)
+
+        total = risk + historical
+        for values in breakdown.values():
+            total = total + values
+
+        return BatchScores(
+            stock_codes=columns['stock_code'],
+            breakdown=breakdown,
+            risk=risk,
+            historical=historical,
+            total=total,
+            max_score=max_score,
+        )
+
+
+__all__ = ['BatchScorer', 'BatchScores', 'build_columns', 'complete_columns', 'CRITERIA']
@@ -11,13 +11,14 @@ Enhanced Features:
 """
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, time as dt_time
 from pathlib import Path
 import hashlib
 import json
+import numpy as np
 import yaml
 
+from strategy.batch_scoring import BatchScorer, BatchScores, build_columns
 from utils.logger_new import get_logger
 from utils.data_cache import get_api_cache
 from config.manager import get_config
@@ -111,6 +112,8 @@ class ScoringSystem:
         self.stock_history = {}
         self._load_historical_data()
 
+        self.batch_scorer = BatchScorer(self.criteria_config)
+
         logger.info("📊 10가지 기준 스코어링 시스템 초기화 완료")
 
         # YAML 설정 파일에서 가중치 로드
@@ -261,12 +264,7 @@ class ScoringSystem:
 
         result = ScoringResult()
 
-        weights = self.scan_type_weights.get(scan_type, self.scan_type_weights['default'])
-
-        time_weights = self._get_time_based_weights()
-        for key in time_weights:
-            if key in weights:
-                weights[key] *= time_weights[key]
+        weights = self._get_weights(scan_type)
 
         # 1. 거래량 급증 (60점)
         result.volume_surge_score = self._score_volume_surge(stock_data) * weights['volume_surge']
@@ -338,6 +336,52 @@ class ScoringSystem:
 
         return result
 
+    def calculate_scores_batch(
+        self,
+        stocks_data: Optional[List[Dict[str, Any]]] = None,
+        scan_type: str = 'default',
+        columns: Optional[Dict[str, np.ndarray]] = None
+    ) -> BatchScores:
+        """
+        다중 종목 벡터화 스코어링 (입력 순서 유지)
+
+        10가지 기준 + 리스크 + 과거 성과를 NumPy 배열 연산으로 한 번에 계산한다.
+        종목별 점수 규칙은 calculate_score와 같다.
+
+        Args:
+            stocks_data: 종목 데이터 리스트 (calculate_score와 같은 형식)
+            scan_type: 스캔 타입
+            columns: 이미 컬럼으로 준비된 데이터 (stocks_data 대신, 일부 컬럼만 있어도 됨)
+
+        Returns:
+            BatchScores (total / breakdown / percentage 배열, to_results()로 ScoringResult 변환)
+        """
+        if columns is None:
+            columns = build_columns(stocks_data or [])
+
+        risk = None
+        if self.risk_manager and stocks_data:
+            risk = np.fromiter(
+                (self._calculate_risk_score(stock) for stock in stocks_data),
+                dtype=np.float64, count=len(stocks_data)
+            )
+
+        historical = None
+        codes = columns.get('stock_code')
+        if self.stock_history and codes is not None:
+            historical = np.fromiter(
+                (self._get_historical_performance_score(code) for code in codes),
+                dtype=np.float64, count=len(codes)
+            )
+
+        return self.batch_scorer.score(
+            columns,
+            self._get_weights(scan_type),
+            risk=risk,
+            historical=historical,
+            max_score=ScoringResult.max_score
+        )
+
     def calculate_scores_parallel(
         self,
         stocks_data: List[Dict[str, Any]],
@@ -345,57 +389,25 @@ class ScoringSystem:
         max_workers: int = 4
     ) -> List[Dict[str, Any]]:
         """
-        다중 종목 병렬 스코어링
+        다중 종목 스코어링 (calculate_scores_batch 기반)
 
         Args:
             stocks_data: 종목 데이터 리스트
             scan_type: 스캔 타입
-            max_workers: 최대 워커 수 (기본 4)
+            max_workers: 사용하지 않음 (하위 호환용)
 
         Returns:
-            스코어링 결과 리스트 (원본 데이터 + 점수)
+            스코어링 결과 리스트 (원본 데이터 + 'scoring_result', 입력 순서)
         """
         if not stocks_data:
             return []
 
-        results = []
-
-        # 단일 종목이면 병렬 처리 불필요
-        if len(stocks_data) == 1:
-            stock = stocks_data[0]
-            score = self.calculate_score(stock, scan_type)
-            stock['scoring_result'] = score
-            return stocks_data
-
-        logger.info(f"🚀 병렬 스코어링 시작: {len(stocks_data)}개 종목 (워커 {max_workers}개)")
-
-        # 병렬 처리
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # 작업 제출
-            future_to_stock = {
-                executor.submit(self.calculate_score, stock, scan_type): stock
-                for stock in stocks_data
-            }
-
-            # 결과 수집
-            for future in as_completed(future_to_stock):
-                stock = future_to_stock[future]
-                try:
-                    score = future.result()
-                    stock['scoring_result'] = score
-                    results.append(stock)
-                except Exception as e:
-                    logger.error(f"스코어링 실패: {stock.get('name', 'Unknown')} - {e}")
-                    # 실패한 종목도 포함 (점수 0)
-                    stock['scoring_result'] = ScoringResult()
-                    results.append(stock)
-
-        # 원래 순서 유지를 위해 정렬
-        results.sort(key=lambda x: stocks_data.index(x) if x in stocks_data else 999)
+        batch = self.calculate_scores_batch(stocks_data, scan_type)
+        for stock, result in zip(stocks_data, batch.to_results()):
+            stock['scoring_result'] = result
 
-        logger.info(f"✅ 병렬 스코어링 완료: {len(results)}개 종목")
-
-        return results
+        logger.info(f"✅ 배치 스코어링 완료: {len(stocks_data)}개 종목")
+        return stocks_data
 
     def _score_volume_surge(self, stock_data: Dict[str, Any]) -> float:
         """
@@ -964,6 +976,16 @@ class ScoringSystem:
         """
         return scoring_result.total_score >= threshold
 
+    def _get_weights(self, scan_type: str) -> Dict[str, float]:
+        """스캔 타입 가중치 × 시간대 가중치 (설정 원본은 변경하지 않음)"""
+        weights = dict(self.scan_type_weights.get(scan_type, self.scan_type_weights['default']))
+
+        time_weights = self._get_time_based_weights()
+        for key in time_weights:
+            if key in weights:
+                weights[key] *= time_weights[key]
+        return weights
+
     def _get_time_based_weights(self) -> Dict[str, float]:
         """시간대별 가중치 반환"""
         now = datetime.now().time()
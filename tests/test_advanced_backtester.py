@@ -0,0 +1,98 @@
+"""
+AdvancedBacktester 테스트
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from ai.advanced_backtester import AdvancedBacktester, _BarWindow
+
+
+def _make_bars(closes, start=datetime(2024, 1, 1), skip=()):
+    """일봉 리스트 생성 (skip 인덱스는 거래 없음)"""
+    return [
+        {'date': (start + timedelta(days=i)).isoformat(), 'close': close}
+        for i, close in enumerate(closes) if i not in skip
+    ]
+
+
+class TestBarWindow:
+    """_BarWindow 뷰 테스트"""
+
+    def test_list_like_access(self):
+        """len/인덱싱/슬라이싱/반복이 리스트 앞부분과 동일"""
+        bars = list(range(10))
+        window = _BarWindow(bars, 6)
+
+        assert len(window) == 6
+        assert window[-1] == 5
+        assert window[-3:] == [3, 4, 5]
+        assert list(window) == bars[:6]
+        with pytest.raises(IndexError):
+            window[6]
+
+
+class TestAdvancedBacktester:
+    """AdvancedBacktester 테스트"""
+
+    def test_strategy_sees_only_past_bars(self):
+        """전략은 현재 날짜까지의 봉만 받음"""
+        data = {
+            'A': _make_bars([100, 101, 102, 103, 104]),
+            'B': _make_bars([50, 51, 52, 53, 54], skip={1, 2}),
+        }
+        seen = []
+
+        def strategy(bt, current):
+            seen.append({code: len(bars) for code, bars in current.items()})
+            assert all(bar['date'] <= bt.current_time.isoformat() for bars in current.values() for bar in bars)
+            return []
+
+        AdvancedBacktester().run_backtest(strategy, data)
+
+        assert seen == [
+            {'A': 1, 'B': 1},
+            {'A': 2, 'B': 1},
+            {'A': 3, 'B': 1},
+            {'A': 4, 'B': 2},
+            {'A': 5, 'B': 3},
+        ]
+
+    def test_unsorted_input_uses_latest_bar(self):
+        """입력 순서와 무관하게 마지막 봉이 가장 최근 날짜"""
+        bars = _make_bars([100, 110, 120])
+        data = {'A': [bars[2], bars[0], bars[1]]}
+        closes = []
+
+        def strategy(bt, current):
+            closes.append(current['A'][-1]['close'])
+            return []
+
+        AdvancedBacktester().run_backtest(strategy, data)
+
+        assert closes == [100, 110, 120]
+
+    def test_buy_and_close_at_end(self):
+        """첫날 매수 후 마지막 봉 가격으로 청산"""
+        data = {'A': _make_bars([1000, 1100, 1200])}
+
+        def strategy(bt, current):
+            if not bt.has_position('A'):
+                return [{'action': 'buy', 'stock_code': 'A', 'quantity': 10}]
+            return []
+
+        result = AdvancedBacktester(commission_rate=0, slippage_rate=0, tax_rate=0).run_backtest(strategy, data)
+
+        assert result.total_trades == 1
+        assert result.trades[0].exit_price == 1200
+        assert result.final_capital == pytest.approx(10000000 + 2000)
+
+    def test_date_range_filter(self):
+        """start_date/end_date 범위만 시뮬레이션"""
+        data = {'A': _make_bars(list(range(100, 110)))}
+        result = AdvancedBacktester().run_backtest(
+            lambda bt, current: [], data,
+            start_date=datetime(2024, 1, 3), end_date=datetime(2024, 1, 6)
+        )
+
+        assert [d for d, _ in result.equity_curve] == [datetime(2024, 1, d) for d in range(3, 7)]
@@ -0,0 +1,137 @@
+"""
+AI 검토 동시 실행기 / GeminiAnalyzer 병렬 크로스체크 테스트 (로컬 스텁 모델)
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from ai.analysis_cache import AnalysisCache
+from ai.gemini_analyzer import GeminiAnalyzer
+from ai.review_executor import AIReviewExecutor, ReviewRequest
+
+
+def _stock(code):
+    return {'stock_code': code, 'stock_name': code, 'current_price': 10000, 'change_rate': 3.0}
+
+
+class StubAnalyzer:
+    """종목별 지연/신호를 지정하는 스텁 분석기"""
+
+    def __init__(self, delays, signal='buy'):
+        self.delays = delays
+        self.signal = signal
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def analyze_stock(self, stock_data, score_info=None, portfolio_info=None):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            delay = self.delays.get(stock_data['stock_code'], 0.0)
+            if delay < 0:
+                raise RuntimeError("model error")
+            time.sleep(delay)
+            return {'signal': self.signal, 'reasons': ['stub']}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class StubModel:
+    """generate_content 응답 스텁"""
+
+    def __init__(self, signal, delay=0.0):
+        self.signal = signal
+        self.delay = delay
+        self.timeouts = []
+
+    def generate_content(self, prompt, request_options=None):
+        self.timeouts.append(request_options['timeout'])
+        time.sleep(self.delay)
+        text = f'{{"signal": "{self.signal}", "confidence": "Medium", "reasons": ["stub"], "risks": []}}'
+        return SimpleNamespace(candidates=[SimpleNamespace(finish_reason=1)], text=text)
+
+
+def _gemini(model_2_0, model_2_5):
+    analyzer = GeminiAnalyzer(api_key='test', enable_cross_check=True, analysis_cache=AnalysisCache(':memory:'))
+    analyzer.is_initialized = True
+    analyzer.model_2_0 = model_2_0
+    analyzer.model_2_5 = model_2_5
+    analyzer._prepare_stock_prompt = lambda *args: 'prompt'
+    return analyzer
+
+
+class TestAIReviewExecutor:
+    """AIReviewExecutor 테스트"""
+
+    def test_concurrent_with_cap(self):
+        """동시 실행 수 제한 안에서 병렬 실행, 요청 순서 유지"""
+        codes = [f'{i:06d}' for i in range(6)]
+        analyzer = StubAnalyzer({code: 0.1 for code in codes})
+        executor = AIReviewExecutor(analyzer, max_concurrency=3, deadline=5.0)
+
+        started = time.monotonic()
+        outcomes = executor.review([ReviewRequest(code, _stock(code)) for code in codes])
+        elapsed = time.monotonic() - started
+
+        assert list(outcomes) == codes
+        assert all(o.status == 'ok' and o.analysis['signal'] == 'buy' for o in outcomes.values())
+        assert analyzer.peak == 3
+        assert elapsed < 0.5
+
+    def test_deadline_falls_back_to_score_only(self):
+        """마감을 넘긴 분석은 기다리지 않고 hold(점수 기준 판단)로 대체"""
+        analyzer = StubAnalyzer({'SLOW': 2.0, 'FAIL': -1})
+        executor = AIReviewExecutor(analyzer, max_concurrency=3, deadline=0.3)
+
+        started = time.monotonic()
+        outcomes = executor.review([ReviewRequest(c, _stock(c)) for c in ('FAST', 'SLOW', 'FAIL')])
+
+        assert time.monotonic() - started < 1.0
+        assert outcomes['FAST'].status == 'ok'
+        assert outcomes['SLOW'].status == 'timeout'
+        assert outcomes['SLOW'].analysis['signal'] == 'hold'
+        assert outcomes['FAIL'].status == 'error'
+        assert executor.last_stats['timed_out'] == 1
+
+    def test_async_analyzer(self):
+        """코루틴 analyze_stock도 지원"""
+        class AsyncAnalyzer:
+            async def analyze_stock(self, stock_data, score_info=None, portfolio_info=None):
+                return {'signal': 'sell'}
+
+        outcomes = AIReviewExecutor(AsyncAnalyzer()).review([ReviewRequest('A', _stock('A'))])
+        assert outcomes['A'].analysis == {'signal': 'sell'}
+
+
+class TestGeminiCrossCheck:
+    """GeminiAnalyzer 병렬 크로스체크 테스트"""
+
+    def test_models_run_in_parallel(self):
+        """두 모델을 동시에 호출 (직렬 합계보다 빠름)"""
+        analyzer = _gemini(StubModel('buy', 0.2), StubModel('buy', 0.2))
+
+        started = time.monotonic()
+        result = analyzer.analyze_stock(_stock('005930'), score_info={'score': 300})
+
+        assert time.monotonic() - started < 0.35
+        assert result['signal'] == 'buy'
+        assert result['cross_check']['agreement'] is True
+
+    def test_straggler_model_dropped_at_deadline(self):
+        """마감 시각까지 응답하지 않은 모델은 제외하고 나머지 결과 사용"""
+        slow = StubModel('sell', 3.0)
+        analyzer = _gemini(slow, StubModel('buy'))
+
+        started = time.monotonic()
+        result = analyzer.analyze_stock(
+            _stock('000660'), score_info={'score': 300}, deadline=time.monotonic() + 1.0
+        )
+
+        assert time.monotonic() - started < 2.0
+        assert result['signal'] == 'buy'
+        assert result['cross_check']['model_2_0_failed'] is True
+        assert slow.timeouts[0] <= 1.0
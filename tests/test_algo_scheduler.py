@@ -0,0 +1,218 @@
+"""
+알고리즘 주문 스케줄러 (AlgoScheduler) 테스트
+"""
+
+import pytest
+
+from api.algo_order_executor import AlgoOrderExecutor, OrderSide
+from api.algo_scheduler import AlgoScheduler, SimulatedExchange
+
+
+class FakeClock:
+    """수동으로 진행하는 단조 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def _advance(scheduler, clock, until, step=1.0):
+    while clock.now < until:
+        clock.now = min(until, clock.now + step)
+        scheduler.run_pending()
+
+
+class TestAlgoScheduler:
+    """AlgoScheduler 테스트"""
+
+    def test_twap_slices_and_arrival_slippage(self, clock):
+        """TWAP 균등 분할 + 도착가 대비 슬리피지"""
+        exchange = SimulatedExchange()
+        exchange.set_market('005930', 10000, 1000)
+        scheduler = AlgoScheduler(exchange, clock=clock)
+
+        parent = scheduler.submit('T1', 'TWAP', '005930', 'buy', 100, duration_seconds=100, num_slices=4)
+        scheduler.run_pending()
+        exchange.set_market('005930', 10100, 2000)
+        _advance(scheduler, clock, 100)
+
+        summary = parent.summary()
+        assert summary['status'] == 'completed'
+        assert summary['num_slices'] == 4
+        assert [f['quantity'] for f in parent.fills] == [25, 25, 25, 25]
+        assert summary['average_price'] == 10075
+        assert summary['slippage_vs_arrival_bps'] == 75.0
+        assert summary['market_vwap'] == 10100
+
+    def test_partial_fill_rolls_into_next_slice(self, clock):
+        """만료된 슬라이스 미체결분은 취소 후 다음 슬라이스로 이월"""
+        exchange = SimulatedExchange(fill_ratio=0.5)
+        exchange.set_market('005930', 10000)
+        scheduler = AlgoScheduler(exchange, clock=clock, slice_timeout=5)
+
+        parent = scheduler.submit('T2', 'TWAP', '005930', 'sell', 100, duration_seconds=40, num_slices=2)
+        scheduler.run_pending()
+        assert parent.working_quantity == 25
+
+        _advance(scheduler, clock, 20)
+        assert exchange.cancelled == ['SIM000001']
+        assert exchange.orders['SIM000002']['quantity'] == 75
+
+        _advance(scheduler, clock, 40)
+        assert parent.status == 'expired'
+        assert parent.filled_quantity == 25 + 37
+
+    def test_many_parents_one_scheduler(self, clock):
+        """수백 개의 모주문을 스레드 하나로 동시 진행"""
+        exchange = SimulatedExchange()
+        exchange.set_market('000660', 5000)
+        scheduler = AlgoScheduler(exchange, clock=clock)
+
+        parents = [
+            scheduler.submit(f'P{i}', 'TWAP', '000660', 'buy', 10 + i, duration_seconds=60, num_slices=3)
+            for i in range(300)
+        ]
+        _advance(scheduler, clock, 60)
+
+        assert not scheduler.active
+        assert all(p.status == 'completed' and p.filled_quantity == p.total_quantity for p in parents)
+
+    def test_iceberg_places_next_slice_on_fill(self, clock):
+        """아이스버그: 노출 수량 체결 시에만 다음 슬라이스"""
+        exchange = SimulatedExchange(auto_fill=False)
+        exchange.set_market('005930', 10000)
+        scheduler = AlgoScheduler(exchange, clock=clock, slice_timeout=60)
+
+        parent = scheduler.submit('I1', 'ICEBERG', '005930', 'buy', 25, display_quantity=10, limit_price=9900)
+        scheduler.run_pending()
+        scheduler.run_pending()
+        assert list(exchange.orders) == ['SIM000001']
+        assert exchange.orders['SIM000001']['price'] == 9900
+
+        exchange.fill('SIM000001', 10, 9900)
+        scheduler.run_pending()
+        exchange.fill('SIM000002', 10, 9900)
+        scheduler.run_pending()
+        assert exchange.orders['SIM000003']['quantity'] == 5
+
+        exchange.fill('SIM000003', 5, 9900)
+        assert parent.status == 'completed'
+        assert parent.summary()['average_price'] == 9900
+
+    def test_cancel_and_amend(self, clock):
+        """취소 시 작업 중 자식 주문 취소, 수량 정정은 남은 슬라이스에 반영"""
+        exchange = SimulatedExchange(auto_fill=False)
+        exchange.set_market('005930', 10000)
+        scheduler = AlgoScheduler(exchange, clock=clock, slice_timeout=5)
+
+        parent = scheduler.submit('A1', 'TWAP', '005930', 'buy', 100, duration_seconds=40, num_slices=4)
+        scheduler.run_pending()
+        exchange.fill('SIM000001', 25)
+
+        assert scheduler.amend('A1', total_quantity=55)
+        _advance(scheduler, clock, 10)
+        assert exchange.orders['SIM000002']['quantity'] == 10
+
+        assert scheduler.cancel('A1')
+        assert 'SIM000002' in exchange.cancelled
+        assert parent.status == 'cancelled'
+        assert not scheduler.cancel('A1')
+
+    def test_order_event_reconciliation(self, clock):
+        """주문체결(00) 이벤트 → 주문번호로 체결 반영, 선도착 체결 버퍼링, 초과 체결 무시"""
+        exchange = SimulatedExchange(auto_fill=False)
+        exchange.set_market('005930', 10000)
+        scheduler = AlgoScheduler(exchange, clock=clock)
+
+        scheduler.on_order_event({'values': {'9203': 'SIM000001', '914': '+10050', '915': '30'}})
+        parent = scheduler.submit('R1', 'ICEBERG', '005930', 'buy', 100, display_quantity=40)
+        scheduler.run_pending()
+        assert parent.filled_quantity == 30
+
+        scheduler.on_order_event({'values': {'9203': 'SIM000001', '914': '10050', '915': '30'}})
+        assert parent.filled_quantity == 40
+        assert parent.fills[-1]['price'] == 10050
+
+    def test_unconfirmed_cancel_keeps_quantity_working(self, clock):
+        """취소 미확인 수량은 주문 상태 조회로 확인될 때까지 작업 중으로 유지"""
+        exchange = SimulatedExchange(auto_fill=False, accept_cancels=False)
+        exchange.set_market('005930', 10000)
+        scheduler = AlgoScheduler(exchange, clock=clock, slice_timeout=5, retry_interval=2)
+
+        parent = scheduler.submit('C1', 'ICEBERG', '005930', 'buy', 20, display_quantity=10)
+        scheduler.run_pending()
+        _advance(scheduler, clock, 5)
+        assert parent.children['SIM000001'].status == 'cancelling'
+        assert parent.working_quantity == 10
+        assert list(exchange.orders) == ['SIM000001']
+
+        # 체결 이벤트 유실 → 상태 조회로 체결 반영, 취소 확인 후 다음 슬라이스
+        exchange.orders['SIM000001']['filled'] = 4
+        exchange.accept_cancels = True
+        _advance(scheduler, clock, 7)
+        assert parent.filled_quantity == 4
+        assert parent.children['SIM000001'].status == 'cancelled'
+        assert exchange.orders['SIM000002']['quantity'] == 10
+
+    def test_cancel_never_confirmed_finishes_as_error(self, clock):
+        """취소가 끝내 확인되지 않으면 모주문은 ERROR로 종료"""
+        exchange = SimulatedExchange(auto_fill=False, accept_cancels=False)
+        exchange.set_market('005930', 10000)
+        scheduler = AlgoScheduler(exchange, clock=clock, slice_timeout=5, retry_interval=1, max_retries=2)
+
+        parent = scheduler.submit('C2', 'TWAP', '005930', 'buy', 10, duration_seconds=5, num_slices=1)
+        _advance(scheduler, clock, 20)
+        assert parent.status == 'error'
+        assert parent.working_quantity == 10
+
+    def test_rejected_slices_retry_then_error(self, clock):
+        """거부된 슬라이스는 재시도, 연속 거부가 한도를 넘으면 ERROR"""
+        exchange = SimulatedExchange()
+        exchange.set_market('005930', 10000)
+        place = exchange.place
+        rejects = [2]
+
+        def flaky_place(*args):
+            if rejects[0]:
+                rejects[0] -= 1
+                return None
+            return place(*args)
+
+        exchange.place = flaky_place
+        scheduler = AlgoScheduler(exchange, clock=clock, retry_interval=1, max_retries=3)
+        parent = scheduler.submit('J1', 'ICEBERG', '005930', 'buy', 10, display_quantity=10)
+        _advance(scheduler, clock, 5)
+        assert parent.status == 'completed'
+        assert parent.slices_sent == 3
+
+        rejects[0] = 100
+        parent = scheduler.submit('J2', 'ICEBERG', '005930', 'buy', 10, display_quantity=10)
+        _advance(scheduler, clock, 20)
+        assert parent.status == 'error'
+        assert parent.slices_sent == 3
+
+
+class TestAlgoOrderExecutor:
+    """AlgoOrderExecutor 스케줄러 연동 테스트"""
+
+    def test_execute_blocks_until_done(self):
+        """execute_*는 스케줄러 스레드 완료까지 대기 후 요약 반환"""
+        exchange = SimulatedExchange()
+        exchange.set_market('005930', 10000)
+        executor = AlgoOrderExecutor(None, None, scheduler=AlgoScheduler(exchange))
+        try:
+            summary = executor.execute_iceberg('005930', 30, 10, OrderSide.SELL)
+        finally:
+            executor.scheduler.stop()
+
+        assert summary['status'] == 'completed'
+        assert summary['executed_quantity'] == 30
+        assert executor.get_completed_algorithms()[0]['algo_id'] == summary['algo_id']
+        assert executor.get_active_algorithms() == []
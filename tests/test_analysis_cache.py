@@ -0,0 +1,97 @@
+"""
+LLM 분석 영구 캐시 (AnalysisCache) 테스트
+"""
+
+import time
+from types import SimpleNamespace
+
+from ai.analysis_cache import AnalysisCache, make_cache_key
+from ai.gemini_analyzer import GeminiAnalyzer
+
+
+class CountingModel:
+    """호출 횟수를 세는 generate_content 스텁"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_content(self, prompt, request_options=None):
+        self.calls += 1
+        text = '{"signal": "buy", "score": 7, "confidence": "High", "reasons": ["stub"], "risks": []}'
+        return SimpleNamespace(candidates=[SimpleNamespace(finish_reason=1)], text=text)
+
+
+def _stock():
+    return {'stock_code': '005930', 'stock_name': '삼성전자', 'current_price': 70000,
+            'change_rate': 2.5, 'volume': 1_000_000}
+
+
+class TestAnalysisCache:
+    """AnalysisCache 테스트"""
+
+    def test_survives_restart(self, tmp_path):
+        """같은 DB 파일을 다시 열어도 결과 유지 + 절약 시간 통계"""
+        db = str(tmp_path / 'ai.db')
+        key = make_cache_key('prompt', 'gemini-2.5-flash', 'v1')
+
+        AnalysisCache(db).set(key, {'signal': 'buy'}, latency=2.5)
+        reopened = AnalysisCache(db)
+
+        assert reopened.get(key) == {'signal': 'buy'}
+        stats = reopened.get_stats()
+        assert stats['hits'] == 1
+        assert stats['saved_latency_seconds'] == 2.5
+
+    def test_key_depends_on_prompt_model_and_version(self):
+        """프롬프트/모델/템플릿 버전 중 하나라도 다르면 다른 키"""
+        base = make_cache_key('prompt', 'model', 'v1')
+        assert base == make_cache_key('prompt', 'model', 'v1')
+        assert base != make_cache_key('prompt2', 'model', 'v1')
+        assert base != make_cache_key('prompt', 'model2', 'v1')
+        assert base != make_cache_key('prompt', 'model', 'v2')
+
+    def test_ttl_expiry(self):
+        """TTL이 지나면 미스 + 만료 카운트"""
+        cache = AnalysisCache(':memory:', ttl_seconds=0.05)
+        cache.set('k', {'signal': 'hold'})
+        time.sleep(0.1)
+
+        assert cache.get('k') is None
+        assert cache.get_stats()['expirations'] == 1
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """상한 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        cache = AnalysisCache(':memory:', max_entries=2)
+        cache.set('a', {'v': 1})
+        time.sleep(0.01)
+        cache.set('b', {'v': 2})
+        time.sleep(0.01)
+        cache.get('a')
+        time.sleep(0.01)
+        cache.set('c', {'v': 3})
+
+        assert cache.get('b') is None
+        assert cache.get('a') == {'v': 1}
+        assert cache.get('c') == {'v': 3}
+        assert cache.get_stats()['evictions'] == 1
+
+
+class TestGeminiAnalysisCache:
+    """GeminiAnalyzer 캐시 연동 테스트"""
+
+    def test_identical_prompt_reuses_result(self):
+        """같은 프롬프트는 재호출하지 않고, 포트폴리오 등 내용이 바뀌면 다시 호출"""
+        model = CountingModel()
+        analyzer = GeminiAnalyzer(api_key='test', analysis_cache=AnalysisCache(':memory:'))
+        analyzer.is_initialized = True
+        analyzer.model = model
+
+        first = analyzer.analyze_stock(_stock(), score_info={'score': 300}, portfolio_info='보유 없음')
+        second = analyzer.analyze_stock(_stock(), score_info={'score': 300}, portfolio_info='보유 없음')
+        assert model.calls == 1
+        assert second['signal'] == first['signal'] == 'buy'
+
+        analyzer.analyze_stock(_stock(), score_info={'score': 300}, portfolio_info='삼성전자 10주')
+        assert model.calls == 2
+        assert analyzer.analysis_cache.get_stats()['hits'] == 1
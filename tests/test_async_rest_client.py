@@ -0,0 +1,150 @@
+"""
+AsyncKiwoomRESTClient 테스트
+
+로컬 aiohttp 서버로 응답 순서, 토큰 갱신 단일화, 한도 초과 재시도를 검증한다.
+"""
+import asyncio
+import datetime
+import json
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+from aiohttp import web
+
+from core.async_rest_client import AsyncKiwoomRESTClient
+from core.rate_limiter import RateLimiter
+
+
+class FakeKiwoomServer:
+    """토큰 발급/조회 API를 흉내내는 테스트 서버"""
+
+    def __init__(self, throttle_first: int = 0):
+        self.token_requests = 0
+        self.api_requests = 0
+        self.throttle_remaining = throttle_first
+        self.valid_tokens = set()
+
+    async def issue_token(self, request):
+        self.token_requests += 1
+        await asyncio.sleep(0.05)  # 발급 지연 동안 다른 요청이 몰리도록
+        token = f"token-{self.token_requests}"
+        self.valid_tokens.add(token)
+        expires = datetime.datetime.now() + datetime.timedelta(hours=1)
+        return web.json_response({'token': token, 'expires_dt': expires.strftime('%Y%m%d%H%M%S')})
+
+    async def query(self, request):
+        self.api_requests += 1
+        auth = request.headers.get('authorization', '')
+        if auth.replace('Bearer ', '') not in self.valid_tokens:
+            return web.Response(status=401, text='unauthorized')
+        if self.throttle_remaining > 0:
+            self.throttle_remaining -= 1
+            return web.Response(status=429, headers={'Retry-After': '0'}, text='too many requests')
+
+        body = json.loads(await request.text())
+        await asyncio.sleep(0.01 * (int(body['seq']) % 3))  # 응답 순서를 섞음
+        return web.json_response({
+            'return_code': 0,
+            'api_id': request.headers.get('api-id'),
+            'seq': body['seq'],
+        })
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post('/oauth2/token', self.issue_token)
+        app.router.add_post('/api/dostk/{path}', self.query)
+        return app
+
+
+def _run_with_server(server: FakeKiwoomServer, scenario, **client_kwargs):
+    """테스트 서버를 띄우고 scenario(client)를 실행"""
+
+    async def main():
+        runner = web.AppRunner(server.app())
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        limiter = RateLimiter(global_rate=1000, global_burst=1000, default_rate=1000, default_burst=1000)
+        client = AsyncKiwoomRESTClient(
+            f"http://127.0.0.1:{port}", 'appkey', 'secret',
+            rate_limiter=limiter, **client_kwargs
+        )
+        try:
+            return await scenario(client)
+        finally:
+            await client.close()
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+class TestAsyncKiwoomRESTClient:
+    """AsyncKiwoomRESTClient 테스트"""
+
+    def test_request_many_preserves_order(self):
+        """request_many는 입력 순서대로 결과를 반환"""
+        server = FakeKiwoomServer()
+        specs = [('ka10081', {'seq': i}, 'chart') for i in range(12)]
+
+        results = _run_with_server(server, lambda c: c.request_many(specs))
+
+        assert [r['seq'] for r in results] == list(range(12))
+        assert all(r['api_id'] == 'ka10081' for r in results)
+
+    def test_concurrent_requests_issue_single_token(self):
+        """동시에 시작한 요청들도 토큰은 한 번만 발급"""
+        server = FakeKiwoomServer()
+
+        async def scenario(client):
+            return await asyncio.gather(
+                *(client.request('ka10001', {'seq': i}, 'stkinfo') for i in range(10))
+            )
+
+        results = _run_with_server(server, scenario)
+
+        assert all(r['return_code'] == 0 for r in results)
+        assert server.token_requests == 1
+
+    def test_expired_token_refreshed_once(self):
+        """서버가 토큰을 거부하면 401을 받은 요청들이 한 번의 재발급만 기다림"""
+        server = FakeKiwoomServer()
+
+        async def scenario(client):
+            client.token = 'revoked'
+            client.token_expiry = datetime.datetime.now() + datetime.timedelta(hours=1)
+            results = await client.request_many([('ka10001', {'seq': i}, 'stkinfo') for i in range(8)])
+            return results, client.token_refreshes
+
+        results, refreshes = _run_with_server(server, scenario)
+
+        assert all(r['return_code'] == 0 for r in results)
+        assert server.token_requests == 1
+        assert refreshes == 1
+
+    def test_throttled_request_retried(self):
+        """429 응답은 호출 예산에 보고한 뒤 재시도"""
+        server = FakeKiwoomServer(throttle_first=2)
+
+        result = _run_with_server(
+            server,
+            lambda c: c.request('ka10001', {'seq': 0}, 'stkinfo'),
+            max_retries=3
+        )
+
+        assert result['return_code'] == 0
+        assert server.api_requests == 3
+
+    def test_throttle_retries_exhausted(self):
+        """재시도 한도를 넘기면 -429 응답"""
+        server = FakeKiwoomServer(throttle_first=10)
+
+        result = _run_with_server(
+            server,
+            lambda c: c.request('ka10001', {'seq': 0}, 'stkinfo'),
+            max_retries=1
+        )
+
+        assert result['return_code'] == -429
@@ -0,0 +1,96 @@
+"""
+BatchScorer / ScoringSystem.calculate_scores_batch (벡터화 스코어링) 테스트
+"""
+import numpy as np
+import pytest
+
+from strategy.batch_scoring import BatchScorer, build_columns
+from strategy.scoring_system import ScoringSystem
+
+
+def _universe(n=300, seed=11):
+    """결측값이 섞인 합성 후보"""
+    rng = np.random.default_rng(seed)
+
+    def maybe(value, p=0.3):
+        return None if rng.random() < p else value
+
+    stocks = []
+    for i in range(n):
+        stock = {
+            'stock_code': f'{i:06d}',
+            'stock_name': f'S{i}',
+            'current_price': float(rng.choice([500, 5000, 70000])),
+            'volume': int(rng.integers(0, 8_000_000)),
+            'change_rate': float(rng.uniform(-5, 25)),
+            'institutional_net_buy': int(rng.integers(-1e8, 1e8)),
+            'foreign_net_buy': int(rng.integers(-2e7, 2e7)),
+            'bid_ask_ratio': float(rng.uniform(0, 2)),
+            'avg_volume': maybe(float(rng.integers(1, 3_000_000))),
+            'execution_intensity': maybe(float(rng.uniform(0, 200))),
+            'top_broker_buy_count': int(rng.integers(0, 7)),
+            'program_net_buy': maybe(int(rng.integers(-1e7, 1e7))),
+            'volatility': maybe(float(rng.uniform(0, 0.2))),
+            'rsi': maybe(float(rng.uniform(0, 100)), 0.5),
+            'macd': maybe({'macd': float(rng.normal())}, 0.5),
+            'bb_position': maybe(float(rng.uniform(0, 1)), 0.5),
+            'ma5': maybe(float(rng.uniform(90, 110)), 0.5),
+            'ma20': float(rng.uniform(90, 110)),
+            'is_trending_theme': bool(rng.random() < 0.1),
+            'has_positive_news': bool(rng.random() < 0.1),
+        }
+        if rng.random() < 0.5:
+            stock['institutional_trend'] = {'data': [{
+                'orgn_netslmt': str(rng.choice(['-100', '0', '250', ''])),
+                'for_netslmt': str(rng.choice(['-5', '10'])),
+            }]}
+        stocks.append(stock)
+    return stocks
+
+
+@pytest.fixture
+def scoring():
+    system = ScoringSystem(enable_cache=False)
+    system.stock_history = {'000003': {'total_trades': 4, 'win_rate': 75, 'avg_pnl': 60000}}
+    return system
+
+
+class TestBatchScoring:
+    """벡터화 점수 = 종목별 점수"""
+
+    def test_matches_per_stock_scoring(self, scoring, capsys):
+        """10개 기준 + 과거 성과가 calculate_score와 같고 입력 순서 유지"""
+        stocks = _universe()
+        batch = scoring.calculate_scores_batch(stocks, scan_type='volume_based')
+        expected = [scoring.calculate_score(s, scan_type='volume_based') for s in stocks]
+        capsys.readouterr()
+
+        results = batch.to_results()
+        assert [r.to_dict() for r in results] == pytest.approx([e.to_dict() for e in expected])
+        np.testing.assert_allclose(batch.total, [e.total_score for e in expected])
+        assert batch.historical[3] == 15.0
+        assert list(batch.stock_codes[:3]) == ['000000', '000001', '000002']
+
+    def test_weights_not_mutated_between_calls(self, scoring, monkeypatch):
+        """시간대 가중치를 곱해도 설정 원본 가중치는 그대로"""
+        monkeypatch.setattr(scoring, '_get_time_based_weights', lambda: {'volume_surge': 1.5})
+        before = dict(scoring.scan_type_weights['default'])
+        scoring.calculate_scores_batch(_universe(5))
+        scoring.calculate_scores_batch(_universe(5))
+        assert scoring.scan_type_weights['default'] == before
+
+    def test_partial_columns_and_top(self, scoring):
+        """가격/거래량/등락률만 있는 전체 종목 배치 + 상위 N개 인덱스"""
+        columns = {
+            'stock_code': np.array(['A', 'B', 'C', 'D'], dtype=object),
+            'current_price': np.array([1000, 900, 50000, 2000.0]),
+            'volume': np.array([6e6, 1e5, 2.5e6, 6e6]),
+            'change_rate': np.array([12.0, 0.0, 3.2, 12.0]),
+        }
+        batch = scoring.calculate_scores_batch(columns=columns)
+        assert batch.top(2).tolist() == [0, 3]
+        assert batch.breakdown['execution_intensity'].tolist() == [0, 0, 0, 0]
+
+        raw = BatchScorer().raw_scores(build_columns([{'volume': 6e6, 'change_rate': 12.0, 'current_price': 1000}]))
+        assert raw['volume_surge'][0] == pytest.approx(48)
+        assert raw['price_momentum'][0] == pytest.approx(60)
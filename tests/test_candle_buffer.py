@@ -0,0 +1,135 @@
+"""
+CandleRingBuffer / MultiIntervalCandles / RealtimeMinuteChart 테스트
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.candle_buffer import CandleRingBuffer, IncrementalIndicators, MultiIntervalCandles
+from core.realtime_minute_chart import RealtimeMinuteChart
+
+
+def _ticks(count=200, seed=5):
+    """09:00부터 분당 2~3건 합성 체결"""
+    rng = np.random.default_rng(seed)
+    start = datetime(2024, 3, 4, 9, 0)
+    price = 70000.0
+    ticks = []
+    for i in range(count):
+        minute = start + timedelta(minutes=i // 3 + (i % 7 == 0))
+        price = round(price * (1 + rng.normal(0, 0.002)))
+        ticks.append((minute, price, float(rng.integers(1, 100))))
+    ticks.sort(key=lambda t: t[0])
+    return ticks
+
+
+def _reference_rsi(closes, period=14):
+    """Wilder RSI 기준 구현"""
+    changes = np.diff(closes)
+    gains, losses = np.maximum(changes, 0), np.maximum(-changes, 0)
+    avg_gain, avg_loss = gains[:period].mean(), losses[:period].mean()
+    for gain, loss in zip(gains[period:], losses[period:]):
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+class TestCandleRingBuffer:
+    """링 버퍼 테스트"""
+
+    def test_eviction_keeps_latest_contiguous(self):
+        """용량 초과 시 오래된 봉이 빠지고 최근 N개는 시간순 뷰"""
+        buf = CandleRingBuffer(4)
+        for i in range(10):
+            buf.append(i, 100 + i, 1)
+        buf.update_last(120, 5)
+
+        cols = buf.last(3)
+        assert len(buf) == 4
+        assert cols['timestamp'].tolist() == [7, 8, 9]
+        assert cols['close'].tolist() == [107, 108, 120]
+        assert cols['high'][-1] == 120 and cols['volume'][-1] == 6
+        # 복사 없는 뷰
+        assert np.shares_memory(cols['close'], buf._ohlcv)
+
+
+class TestMultiIntervalCandles:
+    """다중 주기 집계 테스트"""
+
+    @pytest.fixture
+    def ticks(self):
+        return _ticks()
+
+    def test_rollups_match_resample(self, ticks):
+        """3/5/15분봉이 pandas resample 결과와 동일"""
+        candles = MultiIntervalCandles(capacity=100)
+        for minute, price, volume in ticks:
+            candles.on_tick(minute, price, volume)
+
+        df = pd.DataFrame(ticks, columns=['dt', 'price', 'volume']).set_index('dt')
+        for interval in (1, 3, 5, 15):
+            expected = df.resample(f'{interval}min').agg(
+                {'price': ['first', 'max', 'min', 'last'], 'volume': 'sum'}
+            ).dropna()
+            cols = candles.last(interval)
+            assert len(cols['close']) == len(expected)
+            np.testing.assert_allclose(cols['open'], expected[('price', 'first')])
+            np.testing.assert_allclose(cols['high'], expected[('price', 'max')])
+            np.testing.assert_allclose(cols['low'], expected[('price', 'min')])
+            np.testing.assert_allclose(cols['close'], expected[('price', 'last')])
+            np.testing.assert_allclose(cols['volume'], expected[('volume', 'sum')])
+
+    def test_indicators_match_full_recompute(self, ticks):
+        """증분 EMA/RSI/VWAP이 전체 재계산 값과 동일"""
+        candles = MultiIntervalCandles(intervals=(1,), capacity=100)
+        for minute, price, volume in ticks:
+            candles.on_tick(minute, price, volume)
+
+        closes = pd.Series(candles.last(1)['close'].copy())
+        closed = candles.indicators(1, live=False)
+        live = candles.indicators(1)
+
+        assert closed['ema_12'] == pytest.approx(closes[:-1].ewm(span=12, adjust=False).mean().iloc[-1])
+        assert live['ema_26'] == pytest.approx(closes.ewm(span=26, adjust=False).mean().iloc[-1])
+        assert live['rsi_14'] == pytest.approx(_reference_rsi(closes.to_numpy()))
+
+        prices = np.array([t[1] for t in ticks])
+        volumes = np.array([t[2] for t in ticks])
+        assert live['vwap'] == pytest.approx((prices * volumes).sum() / volumes.sum())
+
+    def test_late_tick_ignored_and_session_reset(self):
+        """지난 봉의 늦은 체결은 무시, 날짜가 바뀌면 VWAP 초기화"""
+        candles = MultiIntervalCandles(intervals=(1, 5))
+        candles.on_tick(datetime(2024, 3, 4, 9, 6), 100, 10)
+        assert candles.on_tick(datetime(2024, 3, 4, 9, 5), 90, 10) is True   # 5분봉은 반영
+        assert candles.count(1) == 1
+
+        candles.on_tick(datetime(2024, 3, 5, 9, 0), 200, 1)
+        assert candles.vwap == 200
+        assert IncrementalIndicators().values()['rsi_14'] is None
+
+
+class TestRealtimeMinuteChart:
+    """실시간 분봉 차트 테스트"""
+
+    def test_tick_callback_builds_rollups(self):
+        """체결 콜백으로 1분/5분봉과 지표 조회"""
+        chart = RealtimeMinuteChart('005930', websocket_manager=None)
+
+        async def feed():
+            for hhmmss, price in [('090001', 100), ('090130', 110), ('090459', 90), ('090500', 95)]:
+                await chart._on_tick({'values': {'10': str(price), '15': '10', '16': hhmmss}})
+
+        asyncio.run(feed())
+
+        assert chart.get_candle_count() == 4
+        assert chart.get_current_candle()['close'] == 95
+        five = chart.get_minute_data(10, interval=5)
+        assert [(c['time'], c['open'], c['high'], c['low'], c['close']) for c in five] == [
+            ('090000', 100, 110, 90, 90), ('090500', 95, 95, 95, 95)
+        ]
+        assert chart.get_series(5)['volume'].tolist() == [30, 10]
+        assert chart.get_indicators(5)['vwap'] == pytest.approx(98.75)
@@ -0,0 +1,171 @@
+"""
+LRUCache / CacheNamespace 테스트
+"""
+import threading
+import time
+
+import pytest
+
+from utils.data_cache import LRUCache
+
+
+@pytest.fixture
+def cache():
+    """테스트용 소형 캐시"""
+    return LRUCache(max_size=5, max_memory_mb=1, default_ttl_seconds=60)
+
+
+class TestLRUCacheBounds:
+    """용량/만료 테스트"""
+
+    def test_evicts_least_recently_used(self, cache):
+        """개수 상한 초과 시 가장 오래 안 쓴 키 제거"""
+        for i in range(5):
+            cache.set(f"k{i}", i)
+        cache.get("k0")
+        cache.set("k5", 5)
+
+        assert cache.get("k0") == 0
+        assert cache.get("k1") is None
+        assert cache.get_stats().total_evictions == 1
+
+    def test_memory_bound(self):
+        """메모리 상한 초과 시 제거"""
+        cache = LRUCache(max_size=100, max_memory_mb=1)
+        blob = b"x" * (400 * 1024)
+        for i in range(4):
+            cache.set(f"blob{i}", blob)
+
+        assert cache.get_stats().memory_usage_bytes <= 1024 * 1024
+        assert cache.get("blob0") is None
+
+    def test_periodic_cleanup_reclaims_unread_keys(self):
+        """읽히지 않은 만료 키도 set() 시 주기 정리로 회수"""
+        cache = LRUCache(max_size=100, default_ttl_seconds=1, cleanup_interval_seconds=0)
+        cache.set("old", 1, ttl_seconds=0.01)
+        time.sleep(0.02)
+        cache.set("new", 2)
+
+        stats = cache.get_stats()
+        assert stats.entry_count == 1
+        assert stats.total_expirations == 1
+
+
+class TestLRUCacheInvalidation:
+    """태그/프리픽스 무효화 테스트"""
+
+    def test_invalidate_by_prefix(self, cache):
+        """프리픽스 무효화"""
+        cache.set("deep_scan:execution_005930", 1)
+        cache.set("deep_scan:program_005930", 2)
+        cache.set("score:005930", 3)
+
+        assert cache.invalidate_by_prefix("deep_scan:") == 2
+        assert cache.get("score:005930") == 3
+
+    def test_invalidate_by_tag(self, cache):
+        """태그 무효화"""
+        cache.set("a", 1, tags=["stock:005930"])
+        cache.set("b", 2, tags=["stock:000660"])
+
+        assert cache.invalidate_by_tag("stock:005930") == 1
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+
+class TestLRUCacheStampede:
+    """get_or_set 스탬피드 방지 테스트"""
+
+    def test_factory_runs_once_under_concurrency(self, cache):
+        """동시에 같은 키를 요청해도 factory는 한 번만 실행"""
+        calls = []
+
+        def factory():
+            calls.append(1)
+            time.sleep(0.05)
+            return {'value': 42}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_set("hot", factory)))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert all(r == {'value': 42} for r in results)
+        assert cache._key_locks == {}
+
+    def test_key_lock_kept_while_callers_wait(self, cache):
+        """대기 중인 호출이 남아 있으면 키 락을 지우지 않아 새 호출도 같은 락에 줄을 섬"""
+        release = threading.Event()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            release.wait(2)
+            return None  # 저장하지 않음 → 대기자는 차례로 factory 실행
+
+        threads = [threading.Thread(target=cache.get_or_set, args=("slow", factory)) for _ in range(3)]
+        for t in threads:
+            t.start()
+        deadline = time.time() + 2
+        while cache._key_locks.get("slow", [None, 0])[1] < 3 and time.time() < deadline:
+            time.sleep(0.005)
+        slot = cache._key_locks["slow"]
+        assert slot[1] == 3
+
+        release.set()
+        threads[0].join(0.1)
+        # 첫 호출이 끝나도 대기자가 있으면 같은 락 유지
+        if any(t.is_alive() for t in threads):
+            assert cache._key_locks.get("slow") is slot
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 3
+        assert cache._key_locks == {}
+
+    def test_none_result_not_cached(self, cache):
+        """factory가 None이면 저장하지 않음"""
+        calls = []
+        cache.get_or_set("missing", lambda: calls.append(1))
+        cache.get_or_set("missing", lambda: calls.append(1))
+
+        assert len(calls) == 2
+
+
+class TestCacheNamespace:
+    """네임스페이스 뷰 테스트"""
+
+    def test_namespace_stats(self, cache):
+        """네임스페이스별 히트/미스 통계"""
+        deep = cache.namespace("deep_scan", default_ttl_seconds=300)
+        score = cache.namespace("score")
+
+        deep.set("execution_005930", {'execution_intensity': 120.0})
+        deep.get("execution_005930")
+        deep.get("program_005930")
+        score.get("005930")
+
+        stats = cache.get_namespace_stats()
+        assert stats["deep_scan"]["hits"] == 1
+        assert stats["deep_scan"]["misses"] == 1
+        assert stats["deep_scan"]["entries"] == 1
+        assert stats["score"]["misses"] == 1
+        assert deep.get_stats()["hit_rate"] == 0.5
+
+    def test_namespace_invalidate_is_scoped(self, cache):
+        """네임스페이스 무효화는 다른 네임스페이스에 영향 없음"""
+        deep = cache.namespace("deep_scan")
+        other = cache.namespace("other")
+        deep.set("execution_005930", 1)
+        other.set("execution_005930", 2)
+
+        deep.invalidate()
+
+        assert deep.get("execution_005930") is None
+        assert other.get("execution_005930") == 2
@@ -0,0 +1,162 @@
+"""
+Deep Scan 동시 조회 엔진 테스트
+"""
+
+import threading
+import time
+
+import pytest
+
+from api.market.tr_call import TRCall
+from core.rate_limiter import TokenBucket, ApiRateBudget
+from research.deep_scan_engine import DeepScanEngine, EnrichmentTask
+from research.scanner_pipeline import StockCandidate
+
+
+class TestTokenBucket:
+    """TokenBucket 테스트"""
+
+    def test_burst_then_wait(self):
+        """버스트 용량 소진 후에는 대기 시간 반환"""
+        bucket = TokenBucket(rate=10.0, capacity=2)
+
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() > 0.0
+
+    def test_acquire_timeout(self):
+        """타임아웃 내에 토큰이 없으면 실패"""
+        bucket = TokenBucket(rate=1.0, capacity=1)
+        bucket.acquire()
+
+        assert bucket.acquire(timeout=0.01) is False
+
+    def test_invalid_rate(self):
+        """rate가 0 이하이면 예외"""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestDeepScanEngine:
+    """DeepScanEngine 테스트"""
+
+    @pytest.fixture
+    def candidates(self):
+        return [
+            StockCandidate(code=f'{i:06d}', name=f'종목{i}', price=10000, volume=100000, rate=3.0)
+            for i in range(10)
+        ]
+
+    def test_results_keyed_by_code(self, candidates):
+        """종목코드/작업키별 결과 반환"""
+        engine = DeepScanEngine(max_workers=4, budget=ApiRateBudget(default_rate=1000))
+
+        results = engine.run(candidates, lambda c: [
+            EnrichmentTask('price', 'ka10001', lambda: c.code),
+            EnrichmentTask('double', 'ka10002', lambda: c.price * 2),
+        ])
+
+        assert set(results) == {c.code for c in candidates}
+        for c in candidates:
+            assert results[c.code] == {'price': c.code, 'double': 20000}
+
+    def test_failed_task_is_none(self, candidates):
+        """실패한 작업은 None, 나머지는 정상 처리"""
+        engine = DeepScanEngine(max_workers=2, budget=ApiRateBudget(default_rate=1000))
+
+        def boom():
+            raise RuntimeError('API 오류')
+
+        results = engine.run(candidates[:2], lambda c: [
+            EnrichmentTask('ok', 'ka10001', lambda: 1),
+            EnrichmentTask('fail', 'ka10002', boom),
+        ])
+
+        assert results[candidates[0].code] == {'ok': 1, 'fail': None}
+        assert engine.last_stats['errors'] == 2
+
+    def test_calls_run_concurrently(self, candidates):
+        """지연이 있는 호출도 워커 수만큼 동시에 진행"""
+        engine = DeepScanEngine(max_workers=10, budget=ApiRateBudget(default_rate=1000))
+        active = []
+        peak = [0]
+        lock = threading.Lock()
+
+        def slow_call():
+            with lock:
+                active.append(1)
+                peak[0] = max(peak[0], len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+
+        start = time.monotonic()
+        engine.run(candidates, lambda c: [EnrichmentTask('slow', 'ka10001', slow_call)])
+        elapsed = time.monotonic() - start
+
+        assert peak[0] > 1
+        assert elapsed < 0.05 * len(candidates)
+
+    def test_tr_calls_sent_with_request_many(self, candidates):
+        """TRCall 작업은 request_many 한 번으로 보내고, 나머지는 워커 풀에서 실행"""
+
+        class FakeAsyncClient:
+            def __init__(self):
+                self.batches = []
+
+            def request_many_sync(self, specs, max_concurrency=None, timeout=None):
+                self.batches.append(list(specs))
+                return [{'return_code': 0, 'stk_cd': body['stk_cd']} for _, body, _ in specs]
+
+        aclient = FakeAsyncClient()
+        engine = DeepScanEngine(max_workers=4, async_client=aclient)
+
+        def fetch_should_not_run():
+            raise AssertionError('일괄 호출 대상은 fetch를 쓰지 않아야 함')
+
+        results = engine.run(candidates, lambda c: [
+            EnrichmentTask(
+                'investor', 'ka10059', fetch_should_not_run,
+                call=TRCall('ka10059', {'stk_cd': c.code}, 'stkinfo', lambda r: r['stk_cd'])
+            ),
+            EnrichmentTask('trend', 'ka10045', lambda: 'thread'),
+        ])
+
+        assert len(aclient.batches) == 1
+        assert [spec[0] for spec in aclient.batches[0]] == ['ka10059'] * len(candidates)
+        for c in candidates:
+            assert results[c.code] == {'investor': c.code, 'trend': 'thread'}
+        assert engine.last_stats['batched'] == len(candidates)
+
+    def test_batch_failure_sets_none(self, candidates):
+        """일괄 호출 자체가 실패하면 해당 작업 결과는 모두 None"""
+
+        class BrokenAsyncClient:
+            def request_many_sync(self, specs, max_concurrency=None, timeout=None):
+                raise RuntimeError('loop closed')
+
+        engine = DeepScanEngine(max_workers=2, async_client=BrokenAsyncClient())
+
+        results = engine.run(candidates[:2], lambda c: [
+            EnrichmentTask('daily', 'ka10081', lambda: [], call=TRCall('ka10081', {}, 'chart', lambda r: r)),
+        ])
+
+        assert results[candidates[0].code] == {'daily': None}
+        assert engine.last_stats['errors'] == 2
+
+
+class TestDeepScanCache:
+    """Deep Scan 캐시 네임스페이스 테스트"""
+
+    def test_pipeline_and_utils_cache_do_not_collide(self):
+        """키가 같아도 파이프라인(1분)과 deep_scan_utils(5분) 캐시는 분리"""
+        from research import deep_scan_utils, scanner_pipeline
+
+        key = 'execution_999990'
+        deep_scan_utils._save_to_cache(key, {'source': 'utils'})
+        try:
+            assert scanner_pipeline._deep_scan_cache.get(key) is None
+            assert scanner_pipeline._deep_scan_cache.default_ttl_seconds == 60
+            assert deep_scan_utils._get_from_cache(key) == {'source': 'utils'}
+        finally:
+            deep_scan_utils._deep_scan_cache.delete(key)
@@ -0,0 +1,103 @@
+"""
+세대 단위 적합도 평가기 (PopulationFitnessEvaluator) 테스트
+"""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai.fitness_evaluator import PopulationFitnessEvaluator, build_dataset, buy_mask, simulate_gene
+from ai.strategy_optimizer import StrategyGene
+
+
+def _frame(seed, days=20):
+    """5분봉 합성 데이터"""
+    rng = np.random.default_rng(seed)
+    stamps = [
+        ts for day in pd.bdate_range('2025-03-03', periods=days)
+        for ts in pd.date_range(day + pd.Timedelta(hours=9), periods=78, freq='5min')
+    ]
+    close = 50000 * np.cumprod(1 + rng.normal(0, 0.004, len(stamps)))
+    volume = rng.lognormal(10, 0.5, len(stamps))
+    return pd.DataFrame({'datetime': stamps, 'close': close.round(), 'volume': volume.round()})
+
+
+DATA = {'A': _frame(1), 'B': _frame(2).iloc[::2]}
+
+
+def _fitness(total_return_pct, sharpe_ratio, win_rate, max_drawdown_pct, profit_factor):
+    return total_return_pct
+
+
+def _genes(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        StrategyGene(buy_rsi_min=float(rng.uniform(15, 35)), buy_rsi_max=float(rng.uniform(40, 70)),
+                     use_macd=False, use_bollinger=False, buy_volume_ratio_min=0.0,
+                     min_price=0, max_price=1e9).to_dict()
+        for _ in range(n)
+    ]
+
+
+class TestEvaluationDataset:
+    """평가 데이터셋 테스트"""
+
+    def test_aligned_read_only_arrays(self):
+        """종목별 봉을 합집합 시각에 정렬, 봉 없는 칸은 NaN, 쓰기 불가"""
+        dataset = build_dataset(DATA, 'k')
+
+        assert dataset.codes == ('A', 'B')
+        assert dataset.columns['close'].shape == (len(DATA['A']), 2)
+        assert np.isnan(dataset.columns['close'][1, 1])
+        assert dataset.day_ends.sum() == 20
+        with pytest.raises(ValueError):
+            dataset.columns['close'][0, 0] = 1
+
+    def test_price_filter_in_buy_mask(self):
+        """가격 범위 밖 종목은 매수 후보에서 제외"""
+        dataset = build_dataset(DATA, 'k')
+        gene = _genes(1)[0]
+        gene.update(buy_rsi_min=0, buy_rsi_max=100, max_price=0)
+        assert not buy_mask(gene, dataset).any()
+
+
+class TestPopulationFitnessEvaluator:
+    """PopulationFitnessEvaluator 테스트"""
+
+    def test_loads_once_and_memoizes(self):
+        """분봉 간격별 데이터 1회 로드, 같은 유전자는 재평가 없음"""
+        calls = []
+
+        def source(codes, start, end, interval):
+            calls.append(interval)
+            return DATA
+
+        evaluator = PopulationFitnessEvaluator(source, _fitness, max_workers=1)
+        genes = _genes(4)
+        end = datetime(2025, 4, 1)
+
+        first = evaluator.evaluate(genes + genes[:1], ['A', 'B'], end=end)
+        assert calls == ['5']
+        assert evaluator.last_stats['evaluated'] == 4
+        assert first[0] == first[4]
+
+        second = evaluator.evaluate(genes, ['A', 'B'], end=end)
+        assert calls == ['5']
+        assert evaluator.last_stats['memo_hits'] == 4
+        assert second == first[:4]
+
+    def test_process_pool_matches_serial(self):
+        """프로세스 풀 평가 결과 = 현재 프로세스 평가 결과"""
+        genes = _genes(6, seed=1)
+        end = datetime(2025, 4, 1)
+        serial = PopulationFitnessEvaluator(lambda *args: DATA, _fitness, max_workers=1).evaluate(genes, ['A', 'B'], end=end)
+        parallel = PopulationFitnessEvaluator(lambda *args: DATA, _fitness, max_workers=3).evaluate(genes, ['A', 'B'], end=end)
+
+        assert parallel == serial
+        assert any(metrics['total_trades'] > 0 for _, metrics in serial)
+
+    def test_empty_data(self):
+        """데이터가 없으면 거래 없음 지표"""
+        metrics = simulate_gene(_genes(1)[0], build_dataset({}, 'k'))
+        assert metrics['total_trades'] == 0
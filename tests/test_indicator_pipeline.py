@@ -0,0 +1,130 @@
+"""
+indicators.pipeline 테스트
+
+벡터 계산 결과가 기존 캔들 루프 정의와 같은지 검증한다.
+"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators.pipeline import compute_indicators, optimizer_indicator_columns
+from indicators.volume import obv
+from virtual_trading.historical_optimizer import HistoricalOptimizer
+
+
+def _reference_columns(candles):
+    """기존 HistoricalOptimizer.calculate_indicators 루프 정의"""
+    rows = []
+    for i, candle in enumerate(candles):
+        row = {}
+        if i >= 20:
+            prices = [c['close'] for c in candles[i-20:i+1]]
+            row['ma20'] = np.mean(prices)
+            row['std_20'] = np.std(prices)
+        else:
+            row['ma20'] = candle['close']
+            row['std_20'] = 0
+        row['ma5'] = np.mean([c['close'] for c in candles[i-5:i+1]]) if i >= 5 else candle['close']
+        if i >= 14:
+            gains, losses = [], []
+            for j in range(i-14, i):
+                change = candles[j+1]['close'] - candles[j]['close']
+                if change > 0:
+                    gains.append(change)
+                else:
+                    losses.append(abs(change))
+            avg_gain = np.mean(gains) if gains else 0
+            avg_loss = np.mean(losses) if losses else 1
+            rs = avg_gain / avg_loss if avg_loss != 0 else 0
+            row['rsi'] = 100 - (100 / (1 + rs))
+        else:
+            row['rsi'] = 50
+        row['price_change_percent'] = (
+            (candle['close'] - candles[i-1]['close']) / candles[i-1]['close'] * 100 if i >= 1 else 0
+        )
+        if i >= 20:
+            avg_vol = np.mean([c['volume'] for c in candles[i-20:i]])
+            row['volume_ratio'] = candle['volume'] / avg_vol if avg_vol > 0 else 1
+        else:
+            row['volume_ratio'] = 1.0
+        rows.append(row)
+    return rows
+
+
+@pytest.fixture
+def candles():
+    """보합/거래량 0 구간이 섞인 일봉"""
+    rng = np.random.default_rng(7)
+    price = 10000.0
+    result = []
+    for i in range(120):
+        price = max(100.0, price + rng.choice([-100.0, 0.0, 100.0]))
+        result.append({
+            'timestamp': datetime(2024, 1, 1) + timedelta(days=i),
+            'close': price,
+            'volume': float(rng.integers(0, 3) * 1000),
+        })
+    return result
+
+
+class TestOptimizerColumns:
+    """HistoricalOptimizer 지표 컬럼 테스트"""
+
+    def test_matches_reference_loop(self, candles):
+        """벡터 결과가 기존 루프 정의와 동일"""
+        columns = optimizer_indicator_columns(
+            [c['close'] for c in candles], [c['volume'] for c in candles]
+        )
+        expected = _reference_columns(candles)
+
+        for name in expected[0]:
+            assert columns[name] == pytest.approx([row[name] for row in expected]), name
+
+    def test_short_series(self):
+        """지표 기간보다 짧은 입력"""
+        columns = optimizer_indicator_columns([100.0, 110.0], [1000.0, 1000.0])
+
+        assert columns['ma20'].tolist() == [100.0, 110.0]
+        assert columns['rsi'].tolist() == [50.0, 50.0]
+        assert columns['price_change_percent'][1] == pytest.approx(10.0)
+
+    def test_memoized_per_stock_and_range(self, candles):
+        """같은 (종목, 기간)은 재계산 없이 같은 결과"""
+        optimizer = HistoricalOptimizer(strategy_class=None)
+
+        first = optimizer.calculate_indicators(candles, stock_code='TEST_MEMO')
+        second = optimizer.calculate_indicators(candles, stock_code='TEST_MEMO')
+
+        assert first == second
+        assert first[-1]['current_price'] == candles[-1]['close']
+
+
+class TestPackageIndicators:
+    """패키지 지표 일괄 계산 테스트"""
+
+    def test_obv_matches_loop(self, candles):
+        """벡터 OBV가 누적 루프 정의와 동일"""
+        close = pd.Series([c['close'] for c in candles])
+        volume = pd.Series([c['volume'] for c in candles])
+
+        expected = [volume.iloc[0]]
+        for i in range(1, len(close)):
+            if close.iloc[i] > close.iloc[i - 1]:
+                expected.append(expected[-1] + volume.iloc[i])
+            elif close.iloc[i] < close.iloc[i - 1]:
+                expected.append(expected[-1] - volume.iloc[i])
+            else:
+                expected.append(expected[-1])
+
+        assert obv(close, volume).tolist() == pytest.approx(expected)
+
+    def test_compute_indicators_columns(self, candles):
+        """모든 컬럼이 입력 길이와 같음"""
+        close = [c['close'] for c in candles]
+        columns = compute_indicators(close, high=close, low=close, volume=[c['volume'] for c in candles])
+
+        for name in ('sma_5', 'sma_20', 'ema_12', 'rsi_14', 'macd', 'bb_upper', 'atr_14', 'obv'):
+            assert len(columns[name]) == len(candles), name
+        assert columns['sma_5'][-1] == pytest.approx(np.mean(close[-5:]))
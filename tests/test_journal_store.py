@@ -0,0 +1,130 @@
+"""
+저널 기반 상태 저장소 (JournalStore) 테스트
+"""
+
+import json
+from datetime import datetime
+
+from features.paper_trading import PaperTradingEngine
+from features.profit_tracker import ProfitTracker, TradeRecord
+from utils.journal_store import JournalStore
+
+
+class TestJournalStore:
+    """JournalStore 테스트"""
+
+    def test_appends_are_replayed(self, tmp_path):
+        """변경은 저널에 한 줄씩 쌓이고 재시작 시 재생"""
+        path = tmp_path / 'state.json'
+        store = JournalStore(path)
+        for i in range(5):
+            store.append('items', {'n': i}, limit=3)
+        store.set(('nested', 'a', 'b'), 1.5)
+
+        assert not path.exists()
+        assert len(store.journal_path.read_text().splitlines()) == 6
+
+        reloaded = JournalStore(path)
+        assert reloaded.get('items') == [{'n': 2}, {'n': 3}, {'n': 4}]
+        assert reloaded.get(('nested', 'a', 'b')) == 1.5
+
+    def test_batch_is_one_record(self, tmp_path):
+        """batch 블록의 변경은 저널 한 줄"""
+        store = JournalStore(tmp_path / 'state.json')
+        with store.batch():
+            store.set('x', 1)
+            store.set('y', 2)
+
+        assert len(store.journal_path.read_text().splitlines()) == 1
+        assert JournalStore(tmp_path / 'state.json').data == {'x': 1, 'y': 2}
+
+    def test_torn_tail_is_dropped(self, tmp_path):
+        """쓰다 만 마지막 줄은 무시하고 잘라냄"""
+        path = tmp_path / 'state.json'
+        store = JournalStore(path)
+        store.set('a', 1)
+        store.set('b', 2)
+        store.close()
+        with open(store.journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"s": 3, "ops": [["set", ["c"]')
+
+        reloaded = JournalStore(path)
+        assert reloaded.data == {'a': 1, 'b': 2}
+        reloaded.set('c', 3)
+        assert JournalStore(path).data == {'a': 1, 'b': 2, 'c': 3}
+
+    def test_missing_newline_is_restored(self, tmp_path):
+        """줄바꿈만 빠진 마지막 레코드는 유지하고 다음 레코드는 새 줄에 기록"""
+        path = tmp_path / 'state.json'
+        store = JournalStore(path)
+        store.set('a', 1)
+        store.close()
+        store.journal_path.write_text('{"s":1,"ops":[["set",["a"],1]]}\n{"s":2,"ops":[["set",["b"],2]]}')
+
+        reloaded = JournalStore(path)
+        assert reloaded.data == {'a': 1, 'b': 2}
+        reloaded.set('c', 3)
+        assert JournalStore(path).data == {'a': 1, 'b': 2, 'c': 3}
+
+    def test_compaction_and_stale_journal(self, tmp_path):
+        """압축 후 스냅샷만 남고, 스냅샷에 반영된 저널 레코드는 재적용하지 않음"""
+        path = tmp_path / 'state.json'
+        store = JournalStore(path, compact_every=3)
+        for i in range(4):
+            store.append('items', i)
+
+        assert json.loads(path.read_text())['items'] == [0, 1, 2]
+        assert len(store.journal_path.read_text().splitlines()) == 1
+
+        # 스냅샷 교체 직후 저널 삭제 전에 중단된 상황 재현
+        stale = '{"s":2,"ops":[["append",["items"],1]]}\n'
+        store.journal_path.write_text(stale + store.journal_path.read_text())
+        assert JournalStore(path).get('items') == [0, 1, 2, 3]
+
+    def test_migrate_legacy_snapshot(self, tmp_path):
+        """기존 전체 덮어쓰기 파일을 migrate로 읽음"""
+        path = tmp_path / 'trade_history.json'
+        path.write_text(json.dumps([{'id': 1}]))
+        store = JournalStore(path, migrate=lambda data: {'trades': data})
+        assert store.get('trades') == [{'id': 1}]
+
+
+class TestProfitTrackerJournal:
+    """ProfitTracker 저널 저장 테스트"""
+
+    def test_add_trade_appends_and_reloads(self, tmp_path):
+        """거래 추가 = 저널 한 줄, 재시작 시 기존 목록 형식 + 저널 합쳐 로드"""
+        (tmp_path / 'trade_history.json').write_text(json.dumps([
+            TradeRecord('t0', '005930', '삼성전자', 'buy', 1, 70000, datetime(2025, 1, 2, 9, 0)).to_dict()
+        ]))
+        tracker = ProfitTracker(data_dir=tmp_path)
+        tracker.add_trade(TradeRecord('t1', '005930', '삼성전자', 'sell', 1, 71000,
+                                      datetime(2025, 1, 2, 10, 0), profit_loss=1000))
+
+        assert len((tmp_path / 'trade_history.json.journal').read_text().splitlines()) == 1
+        trades = ProfitTracker(data_dir=tmp_path).get_trades()
+        assert [t.trade_id for t in trades] == ['t0', 't1']
+        assert trades[1].profit_loss == 1000
+
+
+class TestPaperTradingJournal:
+    """PaperTradingEngine 저널 저장 테스트"""
+
+    def test_save_state_journals_only_changes(self, tmp_path, monkeypatch):
+        """변경 없는 저장은 저널에 아무것도 쓰지 않고, 바뀐 계좌만 기록"""
+        monkeypatch.chdir(tmp_path)
+        engine = PaperTradingEngine()
+        engine._save_state()
+        accounts_journal = engine._accounts_store.journal_path
+        strategies_journal = engine._strategies_store.journal_path
+        before = (accounts_journal.read_text(), strategies_journal.read_text())
+
+        engine._save_state()
+        assert (accounts_journal.read_text(), strategies_journal.read_text()) == before
+
+        name = next(iter(engine.accounts))
+        engine.accounts[name].current_balance -= 1000
+        engine._save_state()
+        record = json.loads(accounts_journal.read_text().splitlines()[-1])
+        assert [op[1] for op in record['ops']] == [['accounts', name]]
+        assert strategies_journal.read_text() == before[1]
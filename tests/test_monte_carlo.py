@@ -0,0 +1,98 @@
+"""
+utils.monte_carlo 공용 Monte Carlo 엔진 테스트
+"""
+import numpy as np
+import pytest
+
+from utils.monte_carlo import MonteCarloEngine
+from virtual_trading.historical_optimizer import HistoricalOptimizer
+
+
+class TestMonteCarloEngine:
+    """엔진 단위 테스트"""
+
+    def test_seed_reproducible(self):
+        """같은 시드면 같은 결과"""
+        a = MonteCarloEngine(seed=7).terminal_values(100.0, 20, 500, mean=0.001, std=0.02)
+        b = MonteCarloEngine(seed=7).terminal_values(100.0, 20, 500, mean=0.001, std=0.02)
+
+        assert np.array_equal(a, b)
+
+    def test_chunking_keeps_distribution(self):
+        """청크 크기를 줄여도 개수와 분포가 유지됨"""
+        engine = MonteCarloEngine(seed=1, max_chunk_bytes=8 * 50 * 30)
+        finals = engine.terminal_values(100.0, 50, 4000, mean=0.0, std=0.01)
+
+        assert engine.chunk_rows(50) == 30
+        assert finals.shape == (4000,)
+        assert np.log(finals / 100).std() == pytest.approx(0.01 * np.sqrt(50), rel=0.1)
+
+    def test_bootstrap_draws_from_sample(self):
+        """부트스트랩 수익률은 표본 값만 사용"""
+        sample = [-0.05, 0.0, 0.1]
+        for method in ('bootstrap', 'block_bootstrap'):
+            for chunk in MonteCarloEngine(seed=3).iter_returns(12, 100, sample=sample, method=method, block_size=4):
+                assert chunk.shape == (100, 12)
+                assert set(np.unique(chunk)) <= set(sample)
+
+    def test_block_bootstrap_keeps_order(self):
+        """블록 안에서는 원래 순서가 유지됨"""
+        sample = np.arange(10, dtype=float)
+        chunk = next(MonteCarloEngine(seed=5).iter_returns(
+            8, 50, sample=sample, method='block_bootstrap', block_size=4
+        ))
+        first_block = chunk[:, :4]
+
+        assert np.all((np.diff(first_block, axis=1) % 10) == 1)
+
+    def test_path_sample(self):
+        """요청한 개수만 경로를 보관하고 최종값과 일치"""
+        engine = MonteCarloEngine(seed=2, max_chunk_bytes=8 * 10 * 3)
+        finals = engine.terminal_values(100.0, 10, 20, path_sample=5, mean=0.0, std=0.01)
+
+        paths = engine.last_sample_paths
+        assert paths.shape == (5, 11)
+        assert paths[:, 0].tolist() == [100.0] * 5
+        assert paths[:, -1] == pytest.approx(finals[:5])
+
+
+@pytest.fixture
+def analytics():
+    """AdvancedRiskAnalytics (scipy 필요)"""
+    pytest.importorskip('scipy')
+    from strategy.advanced_risk_analytics import AdvancedRiskAnalytics
+    return AdvancedRiskAnalytics()
+
+
+class TestMonteCarloCallers:
+    """호출부 결과 형식 테스트"""
+
+    def test_risk_analytics_summary_without_paths(self, analytics):
+        """기본 결과에는 전체 경로가 없음"""
+        result = analytics.run_monte_carlo_simulation(1_000_000, 0.0005, 0.02, time_horizon=60, seed=11)
+
+        assert 'paths' not in result and 'sample_paths' not in result
+        assert result['percentile_5'] < result['median_final_value'] < result['percentile_95']
+
+        sampled = analytics.run_monte_carlo_simulation(
+            1_000_000, 0.0005, 0.02, time_horizon=60, seed=11, sample_paths=3
+        )
+        assert len(sampled['sample_paths']) == 3
+        assert sampled['mean_final_value'] == result['mean_final_value']
+
+    def test_var_monte_carlo(self, analytics):
+        """VaR는 하위 분위 손실"""
+        var, values = analytics.calculate_var_monte_carlo(
+            1_000_000, 0.0, 0.02, num_simulations=2000, confidence_level=0.95, seed=4
+        )
+
+        assert len(values) == 2000
+        assert var == pytest.approx(1_000_000 - np.sort(values)[100])
+
+    def test_optimizer_bootstrap(self):
+        """손익 합산 부트스트랩"""
+        trades = [{'pnl': 100.0}, {'pnl': -50.0}, {'pnl': 20.0}]
+        result = HistoricalOptimizer(strategy_class=None).monte_carlo_simulation(trades, 2000, seed=9)
+
+        assert result['mean_return'] == pytest.approx(70.0, abs=5.0)
+        assert result['cvar_95'] <= result['var_95'] <= result['percentile_95']
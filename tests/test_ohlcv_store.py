@@ -0,0 +1,117 @@
+"""
+utils.ohlcv_store 컬럼형 OHLCV 저장소 테스트
+"""
+import numpy as np
+import pytest
+
+from utils.ohlcv_store import HistoricalDataLoader, OHLCVStore, normalize_interval
+
+
+def _daily_bars(days, close_offset=0):
+    return [
+        {'date': f'202403{day:02d}', 'open': 100, 'high': 110, 'low': 90,
+         'close': day + close_offset, 'volume': 1000}
+        for day in days
+    ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return OHLCVStore(str(tmp_path / 'ohlcv'))
+
+
+class TestOHLCVStore:
+    """저장소 테스트"""
+
+    def test_append_and_range(self, store):
+        """이어쓰기 후 구간 조회 (끝 포함)"""
+        assert store.append_bars('005930', 'D', _daily_bars(range(1, 6))) == 5
+        assert store.append_bars('005930', 'daily', _daily_bars(range(6, 11))) == 5
+
+        cols = store.range('005930', 'daily', '20240303', '20240305')
+
+        assert cols['close'].tolist() == [3.0, 4.0, 5.0]
+        assert str(cols['timestamp'][0]) == '2024-03-03T00:00:00'
+        assert isinstance(cols['close'], np.memmap)
+
+    def test_overlap_merges_and_overwrites(self, store):
+        """과거 구간이 섞이면 병합, 같은 시각은 새 값 유지"""
+        store.append_bars('A', 5, _daily_bars(range(5, 10)))
+        added = store.append_bars('A', '5m', _daily_bars(range(1, 7), close_offset=100))
+
+        assert added == 4
+        assert store.range('A', 5)['close'].tolist() == [101, 102, 103, 104, 105, 106, 7, 8, 9]
+
+    def test_uncommitted_bytes_ignored(self, store, tmp_path):
+        """meta에 반영되지 않은 잔여 바이트는 무시되고 다음 append에서 잘림"""
+        store.append_bars('B', 'D', _daily_bars(range(1, 4)))
+        with open(tmp_path / 'ohlcv' / 'daily' / 'B' / 'close.f8', 'ab') as f:
+            f.write(np.array([999.0]).tobytes())
+
+        reopened = OHLCVStore(str(tmp_path / 'ohlcv'))
+        assert reopened.range('B', 'D')['close'].tolist() == [1.0, 2.0, 3.0]
+
+        reopened.append_bars('B', 'D', _daily_bars([4]))
+        assert reopened.range('B', 'D')['close'].tolist() == [1.0, 2.0, 3.0, 4.0]
+
+    def test_normalize_interval(self):
+        assert normalize_interval('D') == 'daily'
+        assert normalize_interval(15) == '15m'
+        with pytest.raises(ValueError):
+            normalize_interval('weekly')
+
+
+class TestHistoricalDataLoader:
+    """로더 테스트"""
+
+    def test_fetch_only_missing_range(self, store):
+        """조회 완료 구간은 다시 fetch하지 않음"""
+        loader = HistoricalDataLoader(store)
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return _daily_bars(range(1, 21))
+
+        first = loader.load_frame('C', 'D', '20240301', '20240310', fetch=fetch)
+        second = loader.load_candles('C', 'D', '20240305', '20240315', fetch=fetch)
+        loader.load('C', 'D', '20240302', '20240312', fetch=fetch)
+
+        assert len(calls) == 2
+        assert len(first) == 10 and list(first.columns[:2]) == ['datetime', 'open']
+        assert second[0]['timestamp'].day == 5 and second[-1]['close'] == 15.0
+
+    def test_covered_range_follows_returned_bars(self, store):
+        """빈 응답은 조회 완료로 기록하지 않고, 받은 봉의 첫~마지막 구간만 기록"""
+        loader = HistoricalDataLoader(store)
+
+        assert loader.ingest('E', 'D', [], '20240301', '20240331') == 0
+        assert not store.covers('E', 'D', '20240301', '20240331')
+
+        loader.ingest('E', 'D', _daily_bars(range(10, 16)), '20240301', '20240331')
+        assert store.covers('E', 'D', '20240310', '20240315')
+        assert not store.covers('E', 'D', '20240301', '20240315')
+        assert not store.covers('E', 'D', '20240310', '20240316')
+
+    def test_chart_api_load_history(self, store):
+        """ChartDataAPI.load_history는 일봉 API 결과를 저장소에 채움"""
+        from api.market.chart_data import ChartDataAPI
+
+        class FakeClient:
+            requests = 0
+
+            def request(self, api_id, body, path):
+                FakeClient.requests += 1
+                return {'return_code': 0, 'stk_dt_pole_chart_qry': [
+                    {'dt': f'202403{d:02d}', 'open_pric': '100', 'high_pric': '110',
+                     'low_pric': '90', 'cur_prc': f'-{d}', 'trde_qty': '10'}
+                    for d in range(1, 11)
+                ]}
+
+        api = ChartDataAPI(FakeClient())
+        loader = HistoricalDataLoader(store)
+        cols = api.load_history('D1', 'daily', '20240302', '20240304', loader=loader)
+        api.load_history('D1', 'daily', '20240302', '20240304', loader=loader)
+
+        assert cols['close'].tolist() == [2.0, 3.0, 4.0]
+        assert FakeClient.requests == 1
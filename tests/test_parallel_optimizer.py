@@ -0,0 +1,122 @@
+"""
+ParallelGridExecutor / HistoricalOptimizer 병렬 그리드 서치 테스트
+"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from virtual_trading.historical_optimizer import HistoricalOptimizer
+from virtual_trading.parallel_optimizer import ParallelGridExecutor, expand_grid
+
+
+class ThresholdStrategy:
+    """RSI/거래량 임계값 전략 (워커에서 import 가능하도록 최상위 정의)"""
+
+    def __init__(self, params):
+        self.params = dict(params)
+
+    def update_params(self, params):
+        self.params = dict(params)
+
+    def analyze(self, market_data):
+        if market_data['rsi'] < self.params['rsi'] and market_data['volume_ratio'] > self.params['vol']:
+            return 'buy'
+        return None
+
+
+PARAM_GRID = {'rsi': [30, 40, 50, 60], 'vol': [0.5, 1.0, 1.5]}
+
+
+@pytest.fixture(scope='module')
+def market_data():
+    """지표가 계산된 합성 일봉"""
+    rng = np.random.default_rng(3)
+    price = 10000.0
+    candles = []
+    for i in range(300):
+        price *= 1 + rng.normal(0, 0.02)
+        candles.append({
+            'timestamp': datetime(2023, 1, 1) + timedelta(days=i),
+            'close': price,
+            'volume': float(rng.integers(500, 1500)),
+        })
+    return HistoricalOptimizer(ThresholdStrategy).calculate_indicators(candles)
+
+
+def _summary(results):
+    return [(r['params'], r['return_rate'], r['total_trades']) for r in results]
+
+
+class TestParallelGridExecutor:
+    """병렬 실행기 테스트"""
+
+    def test_parallel_matches_serial(self, market_data):
+        """프로세스 풀 결과가 직렬 결과와 순서까지 동일"""
+        serial = ParallelGridExecutor(ThresholdStrategy, max_workers=1).grid_search(market_data, PARAM_GRID)
+        parallel = ParallelGridExecutor(ThresholdStrategy, max_workers=2, chunk_size=2).grid_search(market_data, PARAM_GRID)
+
+        assert len(serial) == 12
+        assert _summary(parallel) == _summary(serial)
+
+    def test_checkpoint_resume(self, market_data, tmp_path):
+        """체크포인트에 있는 조합은 다시 실행하지 않음"""
+        path = tmp_path / 'grid.jsonl'
+        first = ParallelGridExecutor(ThresholdStrategy, max_workers=1, checkpoint_path=str(path))
+        expected = first.grid_search(market_data, PARAM_GRID)
+
+        lines = path.read_text(encoding='utf-8').splitlines()
+        assert len(lines) == 12
+        # 중단 상황 재현: 절반만 남기고 마지막 줄은 잘림
+        path.write_text('\n'.join(lines[:6]) + '\n' + lines[6][:20], encoding='utf-8')
+
+        resumed = ParallelGridExecutor(ThresholdStrategy, max_workers=1, checkpoint_path=str(path))
+        results = resumed.grid_search(market_data, PARAM_GRID)
+
+        assert resumed.last_stats['restored'] == 6
+        assert _summary(results) == _summary(expected)
+
+    def test_checkpoint_ignores_other_grid(self, market_data, tmp_path):
+        """그리드가 다르면 체크포인트를 사용하지 않음"""
+        path = tmp_path / 'grid.jsonl'
+        ParallelGridExecutor(ThresholdStrategy, max_workers=1, checkpoint_path=str(path)).grid_search(
+            market_data, {'rsi': [30], 'vol': [1.0]}
+        )
+
+        executor = ParallelGridExecutor(ThresholdStrategy, max_workers=1, checkpoint_path=str(path))
+        executor.grid_search(market_data, PARAM_GRID)
+
+        assert executor.last_stats['restored'] == 0
+
+    def test_pruning_drops_worst_half(self, market_data):
+        """표본 평가 하위 조합은 전체 평가에서 제외"""
+        executor = ParallelGridExecutor(
+            ThresholdStrategy, max_workers=1, prune_ratio=0.5, prune_min_combinations=4
+        )
+        results = executor.grid_search(market_data, PARAM_GRID)
+
+        assert executor.last_stats['pruned'] == 6
+        assert len(results) == 6
+
+
+class TestHistoricalOptimizerWalkForward:
+    """워크포워드 분석 테스트"""
+
+    def test_walk_forward_parallel_matches_serial(self, market_data):
+        """병렬 워크포워드 결과가 직렬과 동일"""
+        serial = HistoricalOptimizer(ThresholdStrategy).walk_forward_analysis(
+            market_data, PARAM_GRID, train_size=120, test_size=60
+        )
+        parallel = HistoricalOptimizer(ThresholdStrategy, max_workers=2).walk_forward_analysis(
+            market_data, PARAM_GRID, train_size=120, test_size=60
+        )
+
+        assert serial['num_periods'] == 2
+        assert [r['best_params'] for r in parallel['results']] == [r['best_params'] for r in serial['results']]
+        assert parallel['avg_return_rate'] == pytest.approx(serial['avg_return_rate'])
+
+    def test_expand_grid_order(self):
+        """조합 순서는 itertools.product와 동일"""
+        assert expand_grid({'a': [1, 2], 'b': ['x', 'y']}) == [
+            {'a': 1, 'b': 'x'}, {'a': 1, 'b': 'y'}, {'a': 2, 'b': 'x'}, {'a': 2, 'b': 'y'}
+        ]
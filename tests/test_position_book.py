@@ -0,0 +1,136 @@
+"""
+가상매매 인메모리 포지션 장부 (PositionBook) 테스트
+"""
+
+from virtual_trading.manager import VirtualTradingManager
+from virtual_trading.position_book import BookPosition, PositionBook, STOP_LOSS, TAKE_PROFIT
+
+
+def _position(position_id, code='005930', stop=None, target=None, price=10000):
+    return BookPosition(
+        id=position_id, strategy_id=1, stock_code=code, stock_name=code,
+        quantity=10, avg_price=price, current_price=price,
+        stop_loss_price=stop, take_profit_price=target,
+    )
+
+
+class TestPositionBook:
+    """PositionBook 테스트"""
+
+    def test_mark_finds_only_crossed_triggers(self):
+        """시세 하나로 교차한 손절/익절만 발동, 다른 종목은 영향 없음"""
+        book = PositionBook()
+        book.add(_position(1, stop=9500, target=11000))
+        book.add(_position(2, stop=9000, target=10500))
+        book.add(_position(3, stop=9800))
+        book.add(_position(4, code='000660', stop=20000))
+
+        rows, triggers = book.mark('005930', 9600)
+        assert sorted(rows) == [(1, 9600), (2, 9600), (3, 9600)]
+        assert [(t.kind, t.position.id) for t in triggers] == [(STOP_LOSS, 3)]
+        assert book.get(4).current_price == 10000
+
+        _, triggers = book.mark('005930', 10700)
+        assert [(t.kind, t.position.id) for t in triggers] == [(TAKE_PROFIT, 2)]
+
+        # 2번은 익절로 이미 발동(손절까지 해제)했으므로 1번만
+        _, triggers = book.mark('005930', 8000)
+        assert [(t.kind, t.position.id) for t in triggers] == [(STOP_LOSS, 1)]
+
+    def test_triggers_fire_once_until_rearmed(self):
+        """발동한 트리거는 해제, rearm 시 다시 발동"""
+        book = PositionBook()
+        book.add(_position(1, stop=9500, target=11000))
+
+        assert len(book.mark('005930', 9400)[1]) == 1
+        assert book.mark('005930', 9300)[1] == []
+
+        book.rearm(1)
+        assert [t.kind for t in book.mark('005930', 9300)[1]] == [STOP_LOSS]
+
+    def test_remove_unindexes_position(self):
+        """제거한 포지션은 종목 색인과 트리거에서 빠짐"""
+        book = PositionBook()
+        book.add(_position(1, stop=9500))
+        book.add(_position(2, stop=9500))
+        assert book.remove(1).id == 1
+
+        rows, triggers = book.mark('005930', 9000)
+        assert rows == [(2, 9000)]
+        assert [t.position.id for t in triggers] == [2]
+
+        book.remove(2)
+        assert book.codes() == []
+        assert book.mark('005930', 8000) == ([], [])
+
+
+class TestManagerPositionBook:
+    """VirtualTradingManager 장부 연동 테스트"""
+
+    def test_price_update_triggers_sell_and_persists(self, tmp_path):
+        """시세 갱신 → 트리거 발동 → 매도, 현재가는 DB에 비동기 반영"""
+        manager = VirtualTradingManager(str(tmp_path / 'vt.db'))
+        strategy_id = manager.create_strategy('book', initial_capital=10_000_000)
+        stop_id = manager.execute_buy(strategy_id, '005930', '삼성전자', 10, 70000,
+                                      stop_loss_percent=5, take_profit_percent=10, use_split=False)
+        hold_id = manager.execute_buy(strategy_id, '000660', 'SK하이닉스', 5, 150000,
+                                      stop_loss_percent=5, take_profit_percent=10, use_split=False)
+
+        manager.update_prices({'005930': 66000, '000660': 149000})
+        stored = {p['id']: p['current_price'] for p in manager.db.get_open_positions()}
+        assert stored == {stop_id: 66000, hold_id: 149000}
+
+        orders = manager.check_stop_loss_take_profit()
+        assert [(o['position_id'], o['type']) for o in orders] == [(stop_id, 'stop_loss')]
+        assert manager.check_stop_loss_take_profit() == []
+        assert [p['id'] for p in manager.get_positions()] == [hold_id]
+        assert manager.get_position_codes() == ['000660']
+
+        # 재시작 시 DB 활성 포지션으로 장부 복원
+        manager.close()
+        reopened = VirtualTradingManager(str(tmp_path / 'vt.db'))
+        assert reopened.book is not manager.book
+        assert [p.id for p in reopened.book.positions()] == [hold_id]
+        assert reopened.book.get(hold_id).current_price == 149000
+        reopened.close()
+
+    def test_managers_on_same_db_sell_once(self, tmp_path):
+        """같은 DB의 매니저 둘(main/대시보드)은 장부를 공유하고 한 번만 매도"""
+        db_path = str(tmp_path / 'vt.db')
+        bot_manager = VirtualTradingManager(db_path)
+        dashboard_manager = VirtualTradingManager(db_path)
+        assert dashboard_manager.book is bot_manager.book
+
+        strategy_id = bot_manager.create_strategy('shared', initial_capital=10_000_000)
+        position_id = bot_manager.execute_buy(strategy_id, '005930', '삼성전자', 10, 70000,
+                                              stop_loss_percent=5, take_profit_percent=10, use_split=False)
+
+        dashboard_manager.update_prices({'005930': 66000})
+        assert [o['position_id'] for o in bot_manager.check_stop_loss_take_profit()] == [position_id]
+        assert dashboard_manager.check_stop_loss_take_profit() == []
+        assert dashboard_manager.execute_sell(position_id, 66000, use_split=False) is None
+
+        # 장부를 거치지 않고 DB를 직접 닫아도 두 번째 청산은 무시
+        assert bot_manager.db.close_position(position_id, 66000) is None
+        sells = [t for t in bot_manager.get_trade_history(strategy_id) if t['side'] == 'sell']
+        assert len(sells) == 1
+        bot_manager.close()
+
+    def test_unprocessed_sell_keeps_position_armed(self, tmp_path, monkeypatch):
+        """매도가 처리되지 않고 DB 포지션이 열려 있으면 장부에 남아 다시 발동"""
+        manager = VirtualTradingManager(str(tmp_path / 'vt.db'))
+        strategy_id = manager.create_strategy('retry', initial_capital=10_000_000)
+        position_id = manager.execute_buy(strategy_id, '005930', '삼성전자', 10, 70000,
+                                          stop_loss_percent=5, take_profit_percent=10, use_split=False)
+
+        monkeypatch.setattr(manager.db, 'close_position', lambda position_id, sell_price: None)
+        manager.update_prices({'005930': 66000})
+        assert manager.check_stop_loss_take_profit() == []
+        assert manager.execute_sell(position_id, 66000, sell_ratio=0.5) is None
+        assert position_id in manager.book
+
+        monkeypatch.undo()
+        manager.update_prices({'005930': 65000})
+        assert [o['position_id'] for o in manager.check_stop_loss_take_profit()] == [position_id]
+        assert position_id not in manager.book
+        manager.close()
@@ -0,0 +1,132 @@
+"""
+RateLimiter (전역 + TR별 토큰 버킷) 테스트
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from core.rate_limiter import RateLimiter, create_rate_limiter_from_config
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트"""
+
+    @pytest.fixture
+    def limiter(self):
+        return RateLimiter(global_rate=100, global_burst=100, default_rate=10, default_burst=2)
+
+    def test_per_api_burst(self, limiter):
+        """TR별 버스트 소진 후 같은 TR은 대기, 다른 TR은 즉시 통과"""
+        assert limiter.try_acquire('ka10081') == 0.0
+        assert limiter.try_acquire('ka10081') == 0.0
+        assert limiter.try_acquire('ka10081') > 0.0
+
+        assert limiter.try_acquire('ka10059') == 0.0
+
+    def test_global_bucket_limits_all_apis(self):
+        """전역 버킷은 모든 TR 합산 호출을 제한"""
+        limiter = RateLimiter(global_rate=1, global_burst=2, default_rate=100, default_burst=100)
+
+        assert limiter.try_acquire('ka10081') == 0.0
+        assert limiter.try_acquire('ka10059') == 0.0
+        assert limiter.try_acquire('ka10004') > 0.0
+
+    def test_acquire_is_fifo(self):
+        """같은 TR 대기자는 도착 순서대로 토큰을 받음"""
+        limiter = RateLimiter(global_rate=1000, default_rate=50, default_burst=1)
+        limiter.acquire('ka10078')
+
+        order = []
+
+        def worker(idx):
+            limiter.acquire('ka10078')
+            order.append(idx)
+
+        threads = []
+        for idx in range(5):
+            t = threading.Thread(target=worker, args=(idx,))
+            t.start()
+            threads.append(t)
+            time.sleep(0.005)
+
+        for t in threads:
+            t.join(timeout=2)
+
+        assert order == [0, 1, 2, 3, 4]
+
+    def test_acquire_timeout(self):
+        """타임아웃 내에 차례가 오지 않으면 실패"""
+        limiter = RateLimiter(global_rate=1000, default_rate=1, default_burst=1)
+        limiter.acquire('ka10081')
+
+        assert limiter.acquire('ka10081', timeout=0.02) is False
+
+    def test_async_acquire_joins_fifo(self):
+        """코루틴 대기자도 같은 대기열에 줄을 서서 뒤에 온 스레드에 밀리지 않음"""
+        limiter = RateLimiter(global_rate=1000, default_rate=20, default_burst=1)
+        limiter.acquire('ka10078')
+        order = []
+
+        def worker():
+            limiter.acquire('ka10078')
+            order.append('thread')
+
+        async def main():
+            waiter = asyncio.ensure_future(limiter.acquire_async('ka10078'))
+            await asyncio.sleep(0.01)
+            thread = threading.Thread(target=worker)
+            thread.start()
+            assert await waiter is True
+            order.append('async')
+            await asyncio.get_running_loop().run_in_executor(None, thread.join, 2)
+
+        asyncio.run(main())
+        assert order == ['async', 'thread']
+        assert limiter.get_stats()['apis']['ka10078']['waiting'] == 0
+
+    def test_async_acquire_timeout(self):
+        """코루틴 대기도 타임아웃 시 실패하고 대기열에서 빠짐"""
+        limiter = RateLimiter(global_rate=1000, default_rate=1, default_burst=1)
+        limiter.acquire('ka10081')
+
+        assert asyncio.run(limiter.acquire_async('ka10081', timeout=0.02)) is False
+        assert limiter.get_stats()['apis']['ka10081']['waiting'] == 0
+
+    def test_throttle_backoff_and_recovery(self, limiter):
+        """429 보고 시 속도 감소 + 대기, 성공 보고 시 점진 복구"""
+        limiter.report_throttled('ka10081', retry_after=0.5)
+
+        stats = limiter.get_stats()['apis']['ka10081']
+        assert stats['current_rate'] == pytest.approx(5.0)
+        assert stats['throttled'] == 1
+        assert stats['backoff_remaining'] > 0
+        assert limiter.try_acquire('ka10081') > 0.0
+
+        for _ in range(20):
+            limiter.report_success('ka10081')
+
+        assert limiter.get_stats()['apis']['ka10081']['current_rate'] == pytest.approx(10.0)
+
+    def test_stats_quota_usage(self, limiter):
+        """호출 수/한도 사용률 통계"""
+        limiter.acquire('ka10081')
+        limiter.acquire('ka10081')
+
+        stats = limiter.get_stats()
+        api_stats = stats['apis']['ka10081']
+
+        assert api_stats['total_calls'] == 2
+        assert api_stats['calls_last_minute'] == 2
+        assert api_stats['quota_usage_pct'] == pytest.approx(2 / (10 * 60) * 100, abs=0.1)
+        assert stats['global']['total_calls'] == 2
+
+    def test_default_tr_rate_below_global(self):
+        """기본 설정에서 TR별 한도가 전역 한도보다 낮아 둘 다 적용됨"""
+        limiter = create_rate_limiter_from_config()
+        limiter.try_acquire('ka10081')
+        stats = limiter.get_stats()
+
+        assert stats['apis']['ka10081']['base_rate'] < stats['global']['base_rate']
@@ -0,0 +1,156 @@
+"""
+SingleFlightGroup / CoalescingClient 테스트
+"""
+import threading
+import time
+from unittest.mock import MagicMock
+
+from api.market.single_flight import (
+    CoalescingClient,
+    SingleFlightGroup,
+    get_coalescing_client,
+    normalize_body,
+)
+
+
+class SlowClient:
+    """호출 횟수를 세는 느린 클라이언트"""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def request(self, api_id, body, path, http_method="POST"):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return {'return_code': 0, 'api_id': api_id, 'data': [dict(body)]}
+
+
+class TestNormalizeBody:
+    """body 정규화 테스트"""
+
+    def test_key_order_and_value_type_ignored(self):
+        """키 순서와 숫자/문자열 차이는 같은 키"""
+        assert normalize_body({'stk_cd': '005930', 'cnt': 20}) == normalize_body({'cnt': '20', 'stk_cd': '005930'})
+
+    def test_different_values_differ(self):
+        """값이 다르면 다른 키"""
+        assert normalize_body({'stk_cd': '005930'}) != normalize_body({'stk_cd': '000660'})
+
+
+class TestSingleFlightGroup:
+    """SingleFlightGroup 테스트"""
+
+    def test_concurrent_identical_requests_share_one_call(self):
+        """동시에 들어온 동일 요청은 한 번만 호출"""
+        client = SlowClient()
+        coalescing = CoalescingClient(client, SingleFlightGroup(freshness={}))
+        results = []
+
+        def worker():
+            results.append(coalescing.request('ka10081', {'stk_cd': '005930'}, 'chart'))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert client.calls == 1
+        assert len(results) == 8
+        assert all(r['return_code'] == 0 for r in results)
+        assert coalescing.group.get_stats()['coalesced'] == 7
+
+    def test_results_are_independent_copies(self):
+        """한 호출자가 응답을 수정해도 다른 호출자에게 영향 없음"""
+        client = SlowClient(delay=0)
+        coalescing = CoalescingClient(client, SingleFlightGroup(freshness={'ka10081': 10.0}))
+
+        first = coalescing.request('ka10081', {'stk_cd': '005930'}, 'chart')
+        first['data'].clear()
+        second = coalescing.request('ka10081', {'stk_cd': '005930'}, 'chart')
+
+        assert client.calls == 1
+        assert second['data'] == [{'stk_cd': '005930'}]
+
+    def test_freshness_window_expires(self):
+        """유효 시간이 지나면 다시 호출"""
+        client = SlowClient(delay=0)
+        coalescing = CoalescingClient(client, SingleFlightGroup(freshness={'ka10004': 0.05}))
+
+        coalescing.request('ka10004', {'stk_cd': '005930'}, 'mrkcond')
+        coalescing.request('ka10004', {'stk_cd': '005930'}, 'mrkcond')
+        assert client.calls == 1
+
+        time.sleep(0.08)
+        coalescing.request('ka10004', {'stk_cd': '005930'}, 'mrkcond')
+        assert client.calls == 2
+
+    def test_error_responses_not_reused(self):
+        """실패 응답은 유효 시간 캐시에 저장하지 않음"""
+        client = MagicMock()
+        client.request.return_value = {'return_code': -102, 'return_msg': 'timeout'}
+        coalescing = CoalescingClient(client, SingleFlightGroup(freshness={'ka10081': 10.0}))
+
+        coalescing.request('ka10081', {'stk_cd': '005930'}, 'chart')
+        coalescing.request('ka10081', {'stk_cd': '005930'}, 'chart')
+
+        assert client.request.call_count == 2
+
+    def test_exception_propagates_to_waiters(self):
+        """리더의 예외는 대기 중인 호출자에게도 전달"""
+        started = threading.Event()
+
+        def failing():
+            started.set()
+            time.sleep(0.05)
+            raise RuntimeError("boom")
+
+        group = SingleFlightGroup(freshness={})
+        errors = []
+
+        def worker():
+            try:
+                group.do(('k',), 'ka10081', failing)
+            except RuntimeError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=worker)
+        leader.start()
+        started.wait()
+        follower = threading.Thread(target=worker)
+        follower.start()
+        leader.join()
+        follower.join()
+
+        assert len(errors) == 2
+
+    def test_invalidate_by_api_id(self):
+        """TR 단위 무효화"""
+        client = SlowClient(delay=0)
+        coalescing = CoalescingClient(client, SingleFlightGroup(freshness={'ka10081': 10.0, 'ka10080': 10.0}))
+
+        coalescing.request('ka10081', {'stk_cd': '005930'}, 'chart')
+        coalescing.request('ka10080', {'stk_cd': '005930'}, 'chart')
+        coalescing.group.invalidate('ka10081')
+        coalescing.request('ka10081', {'stk_cd': '005930'}, 'chart')
+        coalescing.request('ka10080', {'stk_cd': '005930'}, 'chart')
+
+        assert client.calls == 3
+
+
+class TestGetCoalescingClient:
+    """클라이언트별 그룹 공유 테스트"""
+
+    def test_same_client_shares_group(self):
+        """같은 클라이언트로 만든 래퍼는 같은 그룹 사용"""
+        client = SlowClient(delay=0)
+        assert get_coalescing_client(client).group is get_coalescing_client(client).group
+
+    def test_attribute_delegation(self):
+        """request 외 속성은 원본 클라이언트로 위임"""
+        client = SlowClient(delay=0)
+        client.token = 'abc'
+        assert get_coalescing_client(client).token == 'abc'
@@ -0,0 +1,153 @@
+"""
+공용 SQLite 접근 계층 (utils.sqlite_db) 테스트
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from utils.sqlite_db import SQLiteDatabase, connect, get_database
+from virtual_trading.models import VirtualTradingDB
+from virtual_trading.trade_logger import TradeLogger
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = SQLiteDatabase(str(tmp_path / 'test.db'), commit_interval=0.2)
+    database.executescript('CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, price REAL);')
+    yield database
+    database.close()
+
+
+class TestSQLiteDatabase:
+    """SQLiteDatabase 테스트"""
+
+    def test_pragmas_applied(self, db, tmp_path):
+        """WAL + synchronous=NORMAL, 일회성 connect()도 같은 설정"""
+        with db.connection() as conn:
+            assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+            assert conn.execute('PRAGMA synchronous').fetchone()[0] == 1
+            assert conn.execute('PRAGMA busy_timeout').fetchone()[0] == 5000
+
+        other = connect(str(tmp_path / 'script.db'))
+        assert other.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+        other.close()
+
+    def test_writes_are_group_committed(self, db):
+        """연속 write는 트랜잭션 하나로 커밋되고 query는 대기 중인 쓰기를 먼저 반영"""
+        for i in range(200):
+            db.write('INSERT INTO items (name, price) VALUES (?, ?)', (f'item{i}', i))
+        db.write_many('UPDATE items SET price = ? WHERE id = ?', [(1000.0, 1), (2000.0, 2)])
+
+        assert db.query_one('SELECT COUNT(*) FROM items')[0] == 200
+        assert db.query_one('SELECT price FROM items WHERE id = 2')['price'] == 2000.0
+        assert db.stats['commits'] == 1
+        assert db.stats['statements'] == 202
+
+    def test_failed_statement_does_not_drop_batch(self, db):
+        """묶음 안의 실패한 문장만 버리고 나머지는 커밋"""
+        db.write('INSERT INTO items (id, name) VALUES (?, ?)', (1, 'a'))
+        db.write('INSERT INTO missing_table (x) VALUES (?)', (1,))
+        db.write('UPDATE items SET name = ? WHERE id = ?', ('b', 1))
+
+        assert db.query_one('SELECT name FROM items WHERE id = 1')['name'] == 'b'
+        assert db.stats['failed'] == 1
+
+    def test_transaction_rollback_and_executemany(self, db):
+        """transaction()은 예외 시 롤백, executemany는 완료 후 반환"""
+        assert db.executemany('INSERT INTO items (name) VALUES (?)', [('x',), ('y',)]) == 2
+
+        with pytest.raises(sqlite3.IntegrityError):
+            with db.transaction() as conn:
+                conn.execute('DELETE FROM items')
+                conn.execute('INSERT INTO items (id, name) VALUES (1, ?)', ('dup',))
+                conn.execute('INSERT INTO items (id, name) VALUES (1, ?)', ('dup',))
+
+        assert [r['name'] for r in db.query('SELECT name FROM items ORDER BY id')] == ['x', 'y']
+
+    def test_connection_per_thread_is_reused(self, db):
+        """스레드마다 연결 하나를 계속 재사용"""
+        seen = []
+        barrier = threading.Barrier(3)
+
+        def worker():
+            with db.connection() as first, db.connection() as second:
+                seen.append((id(first), first is second))
+                barrier.wait()  # 세 스레드가 동시에 살아 있는 동안 비교
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert all(same for _, same in seen)
+        assert len({conn_id for conn_id, _ in seen}) == 3
+
+    def test_dead_thread_connections_are_closed(self, db):
+        """요청마다 새 스레드를 만들어도 종료된 스레드의 연결은 닫혀 누적되지 않음"""
+        opened = []
+
+        def worker():
+            with db.connection() as conn:
+                opened.append(conn)
+                conn.execute('SELECT 1')
+
+        for _ in range(5):
+            t = threading.Thread(target=worker)
+            t.start()
+            t.join()
+        # 픽스처(메인 스레드) 연결 + 마지막 작업 스레드 연결 (다음 연결을 열 때 닫힘)
+        assert len(db._connections) == 2
+        assert db._connections[1][1] is opened[-1]
+        for conn in opened[:-1]:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute('SELECT 1')
+
+    def test_registry_shares_instance(self, tmp_path):
+        """같은 파일은 인스턴스(쓰기 스레드) 하나를 공유, ':memory:'는 매번 새로"""
+        path = tmp_path / 'shared.db'
+        first = get_database(str(path))
+        assert get_database(str(tmp_path / '.' / 'shared.db')) is first
+        assert get_database(':memory:') is not get_database(':memory:')
+        first.close()
+        assert get_database(str(path)) is not first
+
+
+class TestVirtualTradingStorage:
+    """가상매매 저장소 공용 계층 연동 테스트"""
+
+    def test_position_round_trip_and_batch_price_update(self, tmp_path):
+        """포지션 열기/현재가 일괄 갱신/닫기"""
+        vt = VirtualTradingDB(str(tmp_path / 'vt.db'))
+        strategy_id = vt.create_strategy('s1', initial_capital=1_000_000)
+        assert vt.create_strategy('s1') == strategy_id
+
+        p1 = vt.open_position(strategy_id, '005930', '삼성전자', 10, 70000)
+        p2 = vt.open_position(strategy_id, '000660', 'SK하이닉스', 2, 150000)
+        vt.update_position_prices([(p1, 71000), (p2, 149000)])
+
+        prices = {p['id']: p['current_price'] for p in vt.get_open_positions(strategy_id)}
+        assert prices == {p1: 71000, p2: 149000}
+        assert vt.get_all_strategies()[0]['position_count'] == 2
+
+        assert vt.close_position(p1, 72000) == 20000
+        strategy = vt.get_all_strategies()[0]
+        assert strategy['position_count'] == 1
+        assert strategy['win_count'] == 1
+        assert len(vt.get_trade_history(strategy_id)) == 3
+        vt.close()
+
+    def test_trade_logger_writes_visible_to_queries(self, tmp_path):
+        """TradeLogger 그룹 커밋 쓰기 후 조회"""
+        trade_logger = TradeLogger(str(tmp_path / 'trades.db'))
+        for pnl in (1000, -500, 2000):
+            trade_logger.log_trade({
+                'strategy': 'momentum', 'stock_code': '005930', 'stock_name': '삼성전자',
+                'type': 'SELL', 'quantity': 1, 'price': 70000, 'realized_pnl': pnl,
+            })
+
+        trades = trade_logger.get_recent_trades(limit=10, strategy='momentum')
+        assert len(trades) == 3
+        assert trade_logger.get_trade_analysis('momentum')['win_rate'] == pytest.approx(2 / 3)
@@ -0,0 +1,71 @@
+"""
+지연 패키지 import / 시작 시간 프로파일러 테스트
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from utils.startup_profiler import StartupProfiler
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _loaded_after(code):
+    """새 인터프리터에서 code 실행 후 sys.modules 이름 목록"""
+    script = f"import sys; sys.path.insert(0, {str(ROOT)!r}); {code}; print('\\n'.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, '-c', script], capture_output=True, text=True, check=True, cwd=ROOT
+    ).stdout
+    return set(output.split())
+
+
+class TestLazyPackages:
+    """패키지 __init__ 지연 export 테스트"""
+
+    def test_package_import_does_not_load_submodules(self):
+        """import ai / strategy / research만으로는 하위 모듈을 로드하지 않음"""
+        loaded = _loaded_after('import ai, strategy, research')
+
+        assert 'ai.gemini_analyzer' not in loaded
+        assert 'ai.backtesting' not in loaded
+        assert 'strategy.portfolio_manager' not in loaded
+        assert 'research.data_fetcher' not in loaded
+
+    def test_attribute_access_loads_module(self):
+        """속성에 처음 접근할 때 정의 모듈을 import"""
+        import ai
+        import strategy
+        from ai.review_executor import AIReviewExecutor
+
+        assert ai.AIReviewExecutor is AIReviewExecutor
+        assert strategy.PortfolioManager.__module__ == 'strategy.portfolio_manager'
+        assert 'AIReviewExecutor' in dir(ai)
+
+
+class TestStartupProfiler:
+    """StartupProfiler 테스트"""
+
+    def test_records_import_time(self):
+        """훅 설치 후 import된 모듈의 자체/누적 시간 기록"""
+        profiler = StartupProfiler(enabled=True)
+        sys.modules.pop('colorsys', None)
+        profiler.install_import_hook()
+        try:
+            import colorsys  # noqa: F401
+        finally:
+            profiler.remove_import_hook()
+
+        own, total = profiler.imports['colorsys']
+        assert 0 <= own <= total
+        assert sys.modules['colorsys'].__spec__.loader.__class__.__name__ != '_TimedLoader'
+
+    def test_lap_and_budget_report(self):
+        """lap 구간 기록 + 예산 초과 시 느린 구간 포함 보고"""
+        profiler = StartupProfiler(budget_seconds=0.0)
+        profiler.lap('A')
+        profiler.record_component('B', 5.0)
+
+        assert [name for name, _ in profiler.components] == ['A', 'B']
+        assert profiler.slowest_components(1)[0] == ('B', 5.0)
+        assert '예산' in profiler.format_report()
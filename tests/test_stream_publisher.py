@@ -0,0 +1,124 @@
+"""
+StreamPublisher (대시보드 퍼블리시 파이프라인) 테스트
+"""
+import pytest
+
+from utils.websocket_streaming import StreamPublisher, WebSocketStreamManager
+
+
+class FakeTransport:
+    """transport(client_id, event, payload) 기록"""
+
+    def __init__(self):
+        self.sent = []
+
+    def __call__(self, client_id, event, payload):
+        self.sent.append((client_id, event, payload))
+
+    def events(self, client_id, event):
+        return [p for c, e, p in self.sent if c == client_id and e == event]
+
+
+@pytest.fixture
+def publisher():
+    publisher = StreamPublisher(WebSocketStreamManager())
+    publisher.transport = FakeTransport()
+    publisher.configure_channel('ticks', min_interval=1.0)
+    return publisher
+
+
+def _apply(state, delta):
+    """클라이언트(realtime_manager.js)와 같은 델타 적용"""
+    state.update(delta.get('set', {}))
+    for key, fields in delta.get('patch', {}).items():
+        state.setdefault(key, {}).update(fields)
+    for key in delta.get('del', []):
+        state.pop(key, None)
+
+
+class TestDeltaEncoding:
+    """델타 인코딩 테스트"""
+
+    def test_only_changed_fields_sent(self, publisher):
+        """변경 없는 발행은 무시, dict 값은 바뀐 필드만 patch"""
+        publisher.connect('a')
+        publisher.publish('positions', {'005930': {'price': 100, 'qty': 10}, '000660': {'price': 5, 'qty': 1}})
+        publisher.flush(now=10)
+        publisher.subscribe('a', 'positions')
+
+        assert publisher.publish('positions', {'005930': {'price': 100, 'qty': 10}}) is False
+        publisher.publish('positions', {'005930': {'price': 101, 'qty': 10}}, replace=True)
+        publisher.flush(now=20)
+
+        (delta,), = publisher.transport.events('a', 'stream')
+        assert delta == {'channel': 'positions', 'seq': 2, 'patch': {'005930': {'price': 101}}, 'del': ['000660']}
+
+    def test_snapshot_plus_deltas_rebuild_state(self, publisher):
+        """구독 스냅샷 + 이후 델타 적용 = 서버 상태"""
+        publisher.connect('a')
+        publisher.publish('positions', {'A': {'x': 1}})
+        publisher.subscribe('a', 'positions')
+        snapshot, = publisher.transport.events('a', 'stream_snapshot')
+        client = dict(snapshot['data'])
+
+        for now, updates in enumerate([{'A': {'x': 2, 'y': 1}}, {'B': 3}, {'A': {'x': 2, 'y': 5}}], 1):
+            publisher.publish('positions', updates)
+            publisher.flush(now=now * 10)
+        publisher.remove('positions', ['B'])
+        publisher.flush(now=100)
+
+        for batch in publisher.transport.events('a', 'stream'):
+            for delta in batch:
+                _apply(client, delta)
+        assert client == publisher.get_state('positions') == {'A': {'x': 2, 'y': 5}}
+
+
+class TestFanOut:
+    """팬아웃 / 스로틀링 테스트"""
+
+    def test_throttle_coalesces_to_latest(self, publisher):
+        """min_interval 안의 여러 틱은 최신 값 델타 1건으로"""
+        publisher.connect('a')
+        publisher.subscribe('a', 'ticks')
+
+        publisher.publish('ticks', {'005930': {'price': 1}})
+        assert publisher.flush(now=100) == 1
+        for price in (2, 3, 4):
+            publisher.publish('ticks', {'005930': {'price': price}})
+            assert publisher.flush(now=100.5) == 0
+        assert publisher.flush(now=101.2) == 1
+
+        deltas = [d for batch in publisher.transport.events('a', 'stream') for d in batch]
+        assert [d['seq'] for d in deltas] == [1, 2]
+        assert deltas[1]['patch'] == {'005930': {'price': 4}}
+
+    def test_published_once_for_many_clients(self, publisher):
+        """클라이언트 수와 무관하게 델타는 한 번 생성, 구독자에게만 전달"""
+        for sid in ('a', 'b', 'c'):
+            publisher.connect(sid)
+            publisher.subscribe(sid, 'ticks')
+        publisher.connect('idle')
+
+        publisher.publish('ticks', {'005930': {'price': 1}})
+        assert publisher.flush(now=100) == 1
+        assert publisher.stats['deltas'] == 1
+
+        for sid in ('a', 'b', 'c'):
+            assert len(publisher.transport.events(sid, 'stream')) == 1
+        assert publisher.transport.events('idle', 'stream') == []
+
+    def test_snapshot_source_and_max_items(self, publisher):
+        """빈 채널은 snapshot 원천으로 채우고, max_items 초과 키는 삭제"""
+        publisher.configure_channel(
+            'candles', min_interval=0, max_items=2,
+            snapshot=lambda channel: {'1': 'a', '2': 'b'} if channel == 'candles:005930' else {}
+        )
+        publisher.subscribe('x', 'candles:005930')
+        snapshot, = publisher.transport.events('x', 'stream_snapshot')
+        assert snapshot['data'] == {'1': 'a', '2': 'b'}
+
+        publisher.publish('candles:005930', {'3': 'c'})
+        publisher.flush(now=1)
+        (delta,), = publisher.transport.events('x', 'stream')
+        assert delta['set']['3'] == 'c' and delta['del'] == ['1']
+        assert publisher.get_state('candles:005930') == {'2': 'b', '3': 'c'}
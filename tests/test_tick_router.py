@@ -0,0 +1,201 @@
+"""
+TickRouter / WebSocketManager 실시간 분배 테스트
+
+실제 서버 대신 REG/REMOVE에 응답하는 가짜 WebSocket을 사용한다.
+"""
+import asyncio
+import json
+
+from core.tick_router import TickRouter
+from core.websocket_manager import WebSocketManager
+from core.realtime_minute_chart import RealtimeMinuteChartManager
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def tick(stock_code, price=70000, data_type='0B', time_str='093000'):
+    return {'type': data_type, 'item': stock_code, 'values': {'10': str(price), '15': '10', '16': time_str}}
+
+
+class FakeWebSocket:
+    """REG/REMOVE 요청에 응답하고, 응답 앞에 REAL 메시지를 끼워 넣는 가짜 연결"""
+
+    def __init__(self, real_before_ack=None):
+        self.sent = []
+        self.inbox = asyncio.Queue()
+        self.real_before_ack = real_before_ack or []
+
+    async def send(self, message):
+        data = json.loads(message)
+        self.sent.append(data)
+        if data['trnm'] in ('REG', 'REMOVE'):
+            for item in self.real_before_ack:
+                await self.inbox.put(json.dumps({'trnm': 'REAL', 'data': [item]}))
+            await self.inbox.put(json.dumps({'trnm': data['trnm'], 'return_code': 0, 'return_msg': ''}))
+
+    async def recv(self):
+        return await self.inbox.get()
+
+    async def close(self):
+        pass
+
+    def push_real(self, *items):
+        self.inbox.put_nowait(json.dumps({'trnm': 'REAL', 'data': list(items)}))
+
+
+def make_manager(ws):
+    manager = WebSocketManager('token', base_url='https://mockapi.kiwoom.com')
+    manager.websocket = ws
+    manager.is_connected = True
+    manager.is_logged_in = True
+    return manager
+
+
+class TestTickRouter:
+    """라우터 단위 테스트"""
+
+    def test_routes_by_type_and_stock(self):
+        """(타입, 종목) 구독자와 타입 전체 구독자에게만 전달"""
+        async def main():
+            router = TickRouter()
+            got = {'a': [], 'b': [], 'all_0b': [], 'all': []}
+            router.add('0B', got['a'].append, stock_code='A')
+            router.add('0B', got['b'].append, stock_code='B')
+            router.add('0B', got['all_0b'].append)
+            router.add('ALL', got['all'].append)
+
+            router.dispatch(tick('A'))
+            router.dispatch(tick('B'))
+            router.dispatch(tick('A', data_type='0D'))
+            await router.drain(timeout=1)
+            return router, got
+
+        router, got = run(main())
+        assert [t['item'] for t in got['a']] == ['A']
+        assert [t['item'] for t in got['b']] == ['B']
+        assert len(got['all_0b']) == 2 and len(got['all']) == 3
+        stats = router.get_stats()
+        assert stats['by_type'] == {'0B': 2, '0D': 1}
+        assert stats['by_stock'] == {'A': 2, 'B': 1}
+
+    def test_slow_consumer_drops_oldest(self):
+        """느린 구독자는 오래된 틱을 버리고, 분배와 다른 구독자는 막히지 않음"""
+        async def main():
+            router = TickRouter()
+            fast, slow = [], []
+
+            async def slow_callback(item):
+                await asyncio.sleep(0.01)
+                slow.append(item['values']['10'])
+
+            router.add('0B', fast.append, stock_code='A')
+            slow_sub = router.add('0B', slow_callback, stock_code='A', maxsize=3)
+
+            for price in range(100):
+                router.dispatch(tick('A', price=price))
+            await router.drain(timeout=2)
+            return fast, slow, slow_sub
+
+        fast, slow, slow_sub = run(main())
+        assert len(fast) == 100
+        assert slow_sub.dropped >= 96
+        assert slow[-1] == '99'
+
+
+class TestWebSocketManagerRouting:
+    """WebSocketManager 분배/응답 매칭 테스트"""
+
+    def test_subscribe_ack_matched_inside_receive_loop(self):
+        """수신 루프 실행 중 구독해도 응답 가로채기 없이 REAL은 구독자에게 전달"""
+        async def main():
+            ws = FakeWebSocket(real_before_ack=[tick('005930')])
+            manager = make_manager(ws)
+            received = []
+            manager.register_callback('0B', received.append)
+            loop_task = asyncio.create_task(manager.receive_loop())
+            await asyncio.sleep(0)
+
+            ok = await manager.subscribe(['005930'], ['0B'], grp_no='1')
+            await manager.router.drain(timeout=1)
+
+            manager.is_connected = False
+            await loop_task
+            return ok, received, manager
+
+        ok, received, manager = run(main())
+        assert ok is True
+        assert [t['item'] for t in received] == ['005930']
+        assert manager.subscriptions['1']['stock_codes'] == ['005930']
+
+    def test_stream_refcount_and_chart_isolation(self):
+        """종목별 차트가 서로 덮어쓰지 않고, 서버 등록/해지는 종목당 1회"""
+        async def main():
+            ws = FakeWebSocket()
+            manager = make_manager(ws)
+            charts = RealtimeMinuteChartManager(manager)
+            assert await charts.add_stock('A')
+            assert await charts.add_stock('B')
+            extra = await manager.subscribe_stream('A', '0B', lambda item: None)
+
+            loop_task = asyncio.create_task(manager.receive_loop())
+            ws.push_real(tick('A', 100), tick('B', 200), tick('A', 101, time_str='093100'))
+            await asyncio.sleep(0.05)
+            await manager.router.drain(timeout=1)
+
+            counts = {code: charts.charts[code].get_candle_count() for code in ('A', 'B')}
+            await charts.remove_stock('A')
+            removes_after_first = sum(1 for m in ws.sent if m['trnm'] == 'REMOVE')
+            await manager.unsubscribe_stream(extra)
+
+            manager.is_connected = False
+            await loop_task
+            return ws, manager, counts, removes_after_first
+
+        ws, manager, counts, removes_after_first = run(main())
+        regs = [m for m in ws.sent if m['trnm'] == 'REG']
+        assert [m['data'][0]['item'] for m in regs] == [['A'], ['B']]
+        assert counts == {'A': 2, 'B': 1}
+        assert removes_after_first == 0
+        assert ws.sent[-1]['trnm'] == 'REMOVE' and ws.sent[-1]['data'][0]['item'] == ['A']
+        assert manager.subscriptions[manager.stream_grp_no]['stock_codes'] == ['B']
+
+    def test_request_from_other_loop_runs_on_owner_loop(self):
+        """다른 스레드 이벤트 루프에서 구독해도 요청/응답 매칭과 참조 수 갱신은 소유 루프에서"""
+        import threading
+
+        async def main():
+            ws = FakeWebSocket()
+            manager = make_manager(ws)
+            loop_task = asyncio.create_task(manager.receive_loop())
+            await asyncio.sleep(0)
+            owner = threading.get_ident()
+            send = ws.send
+            send_threads = []
+
+            async def recording_send(message):
+                send_threads.append(threading.get_ident())
+                await send(message)
+
+            ws.send = recording_send
+            result = {}
+
+            def other_thread():
+                async def subscribe():
+                    return await manager.subscribe_stream('005930', '0B', lambda item: None)
+                result['subscriber'] = asyncio.run(subscribe())
+                result['ok'] = asyncio.run(manager.subscribe(['000660'], ['0B'], grp_no='2'))
+
+            thread = threading.Thread(target=other_thread)
+            thread.start()
+            await asyncio.get_running_loop().run_in_executor(None, thread.join)
+
+            manager.is_connected = False
+            await loop_task
+            return manager, result, send_threads, owner
+
+        manager, result, send_threads, owner = run(main())
+        assert result['subscriber'] is not None and result['ok'] is True
+        assert send_threads == [owner, owner]
+        assert manager._stream_refs == {('0B', '005930'): 1}
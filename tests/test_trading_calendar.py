@@ -0,0 +1,84 @@
+"""
+KRX 거래일 캘린더 (TradingCalendar) 테스트
+"""
+
+from datetime import date, datetime, time
+
+import pytest
+
+from utils.trading_calendar import MarketSession, TradingCalendar
+
+
+@pytest.fixture
+def calendar():
+    return TradingCalendar(start=date(2024, 1, 1), end=date(2026, 12, 31))
+
+
+class TestTradingDays:
+    """거래일 테이블 테스트"""
+
+    def test_holidays_and_weekends(self, calendar):
+        """주말/설 연휴는 휴장, 평일은 거래일"""
+        assert calendar.is_trading_day(date(2025, 1, 31))
+        assert not calendar.is_trading_day(date(2025, 1, 28))   # 설 연휴
+        assert not calendar.is_trading_day(date(2025, 2, 1))    # 토요일
+
+    def test_previous_trading_days_skip_holidays(self, calendar):
+        """이전 N 거래일은 연휴를 건너뜀 (최근 날짜부터)"""
+        days = calendar.previous_trading_days(3, date(2025, 1, 31))
+        assert days == [date(2025, 1, 31), date(2025, 1, 24), date(2025, 1, 23)]
+        assert calendar.previous_trading_day(date(2025, 1, 31)) == date(2025, 1, 24)
+        assert calendar.next_trading_day(date(2025, 1, 24)) == date(2025, 1, 31)
+
+    def test_range_queries(self, calendar):
+        """기간 내 거래일 목록/개수"""
+        days = calendar.trading_days_between(date(2025, 1, 20), date(2025, 2, 2))
+        assert days[0] == date(2025, 1, 20)
+        assert days[-1] == date(2025, 1, 31)
+        assert len(days) == calendar.count_trading_days(date(2025, 1, 20), date(2025, 2, 2)) == 6
+
+    def test_last_trading_date(self, calendar):
+        """08:00 이전/휴장일은 직전 거래일"""
+        assert calendar.last_trading_date(datetime(2025, 1, 31, 7, 59)) == date(2025, 1, 24)
+        assert calendar.last_trading_date(datetime(2025, 1, 31, 8, 0)) == date(2025, 1, 31)
+        assert calendar.last_trading_date(datetime(2025, 2, 2, 12, 0)) == date(2025, 1, 31)
+
+
+class TestSessions:
+    """세션 조회 테스트"""
+
+    @pytest.mark.parametrize('at, session', [
+        (time(7, 59), MarketSession.CLOSED),
+        (time(8, 0), MarketSession.PRE_MARKET),
+        (time(8, 55), MarketSession.PRE_MARKET_CLOSE),
+        (time(9, 0), MarketSession.REGULAR),
+        (time(15, 25), MarketSession.CLOSING_AUCTION),
+        (time(15, 35), MarketSession.NXT_BREAK),
+        (time(19, 59), MarketSession.AFTER_HOURS),
+        (time(20, 0), MarketSession.CLOSED),
+    ])
+    def test_regular_day(self, calendar, at, session):
+        assert calendar.session_at(datetime.combine(date(2025, 1, 31), at)).session == session
+
+    def test_special_session_day(self, calendar):
+        """수능일은 10:00 개장 / 16:30 폐장"""
+        day = date(2025, 11, 13)
+        assert calendar.session_at(datetime.combine(day, time(9, 30))).session == MarketSession.PRE_MARKET
+        assert calendar.session_at(datetime.combine(day, time(16, 0))).session == MarketSession.REGULAR
+
+    def test_current_session_cached_until_boundary(self, calendar):
+        """세션 경계 전까지 같은 객체 재사용, 경계를 넘으면 재계산"""
+        first = calendar.current_session(datetime(2025, 1, 31, 10, 0))
+        assert calendar.current_session(datetime(2025, 1, 31, 15, 19)) is first
+        assert first.end == datetime(2025, 1, 31, 15, 20)
+
+        after = calendar.current_session(datetime(2025, 1, 31, 15, 20))
+        assert after.session == MarketSession.CLOSING_AUCTION
+
+    def test_market_status_on_holiday(self, calendar):
+        """휴장일은 종가 테스트 모드 + 다음 개장 시각은 연휴 이후"""
+        status = calendar.market_status(datetime(2025, 1, 28, 10, 0))
+        assert status['is_test_mode'] is True
+        assert status['market_status'] == '휴장일 (종가 테스트 모드)'
+        assert status['next_open'] == '2025-01-31 08:00:00'
+        assert status['current_time'] == '10:00:00'
@@ -0,0 +1,169 @@
+"""
+TradingEngine (이벤트 기반 트레이딩 엔진) 테스트
+"""
+import threading
+import time
+
+import pytest
+
+from core.trading_engine import (
+    LatencyTracker, ORDER_CANCELLED, ORDER_FILLED, ORDER_REJECTED, TradingEngine, parse_order_state,
+)
+
+
+def _position(code='005930', buy_price=70000, quantity=10):
+    return {'stock_code': code, 'stock_name': code, 'quantity': quantity, 'buy_price': buy_price}
+
+
+def _stop_loss_rule(position, price):
+    """매수가 -3% 손절"""
+    return '손절' if price <= position['buy_price'] * 0.97 else None
+
+
+@pytest.fixture
+def engine():
+    sells = []
+    sold = threading.Event()
+
+    def sell(position, price, reason):
+        sells.append((position['stock_code'], price, reason))
+        sold.set()
+
+    engine = TradingEngine(exit_rule=_stop_loss_rule, sell_handler=sell)
+    engine.sells = sells
+    engine.sold = sold
+    yield engine
+    engine.stop()
+
+
+class TestTickExit:
+    """틱 기반 청산 테스트"""
+
+    def test_tick_breach_sells_once(self, engine):
+        """손절선 이탈 틱에서 즉시 1회 매도 + 지연 기록"""
+        engine.update_positions([_position()])
+
+        assert engine.on_tick('005930', 69000) is None
+        assert engine.on_tick('000660', 10) is None        # 미보유 종목
+        assert engine.on_tick('005930', 67000) == '손절'
+        assert engine.on_tick('005930', 66000) is None     # 계좌 갱신 전 중복 매도 방지
+
+        assert engine.sold.wait(2)
+        engine.stop()
+        assert engine.sells == [('005930', 67000, '손절')]
+
+        latency = engine.get_stats()['latency']
+        assert latency['tick_to_decision']['count'] == 2
+        assert latency['tick_to_order']['count'] == 1
+
+    def test_pending_exit_held_until_order_finishes(self, engine):
+        """부분 체결/시간 경과로는 해제하지 않고, 보유 소멸 또는 전량 체결 후 계좌 갱신 때 해제"""
+        changes = []
+        engine.on_positions_changed = lambda added, removed: changes.append((added, removed))
+
+        engine.update_positions([_position()])
+        engine.on_tick('005930', 60000)
+        assert engine.sold.wait(2)
+        engine.update_positions([_position()])
+        assert engine.is_exit_pending('005930')
+
+        # 부분 체결: 남은 주문이 걸려 있으므로 유지
+        engine.update_positions([_position(quantity=4), _position('000660', 100000)])
+        assert engine.is_exit_pending('005930')
+        assert engine.on_tick('005930', 59000) is None
+
+        # 전량 체결 통보 → 수량 반영되는 다음 계좌 갱신 때 해제
+        engine.on_order_event('005930', ORDER_FILLED)
+        assert engine.is_exit_pending('005930')
+        engine.update_positions([_position(quantity=4), _position('000660', 100000)])
+        assert not engine.is_exit_pending('005930')
+
+        engine.on_tick('005930', 60000)
+        engine.update_positions([_position('000660', 100000)])
+        assert not engine.is_exit_pending('005930')
+        assert changes == [({'005930'}, set()), ({'000660'}, set()), (set(), {'005930'})]
+
+    def test_cancel_reject_and_open_orders_release_exit(self, engine):
+        """취소/거부 통보, 미체결 목록에서 사라진 주문은 해제 (조회 후에 나간 주문은 유지)"""
+        engine.update_positions([_position()])
+        engine.on_tick('005930', 60000)
+        assert engine.sold.wait(2)
+        engine.stop()
+
+        engine.on_order_event('005930', ORDER_CANCELLED)
+        assert not engine.is_exit_pending('005930')
+
+        engine.request_exit(_position(), 60000, '손절')
+        engine._executor('orders').submit(lambda: None).result(2)
+        engine.on_order_event('005930', ORDER_REJECTED)
+        assert not engine.is_exit_pending('005930')
+
+        checked_at = time.perf_counter()
+        engine.request_exit(_position(), 60000, '손절')
+        engine._executor('orders').submit(lambda: None).result(2)
+        assert engine.reconcile_exits(set(), checked_at) == set()
+        assert engine.reconcile_exits({'005930'}, time.perf_counter()) == set()
+        assert engine.reconcile_exits(set(), time.perf_counter()) == {'005930'}
+
+    def test_failed_sell_releases_exit(self, engine):
+        """매도 주문이 나가지 않았으면(False/예외) 다음 신호에서 다시 매도"""
+        engine.sell_handler = lambda position, price, reason: False
+        engine.update_positions([_position()])
+        engine.on_tick('005930', 60000)
+        engine._executor('orders').submit(lambda: None).result(2)
+
+        assert not engine.is_exit_pending('005930')
+        assert engine.orders == 0
+
+
+class TestScheduledJobs:
+    """주기 작업 테스트"""
+
+    def test_jobs_run_on_own_executors_without_overlap(self, engine):
+        """느린 작업은 다른 작업을 막지 않고, 실행 중이면 그 회차를 건너뜀"""
+        release = threading.Event()
+        fast_runs = []
+
+        engine.add_job('slow', 0.01, lambda: release.wait(2))
+        engine.add_job('fast', 0.01, lambda: fast_runs.append(time.monotonic()))
+
+        worker = threading.Thread(target=engine.run_forever, daemon=True)
+        worker.start()
+        deadline = time.monotonic() + 2
+        while len(fast_runs) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        engine.stop()
+        worker.join(2)
+
+        assert len(fast_runs) >= 3
+        assert engine.jobs['slow'].skipped > 0
+
+    def test_order_event_triggers_account_job(self, engine):
+        """주문체결 이벤트는 계좌 작업을 즉시 실행 대상으로"""
+        engine.add_job('account', 3600, lambda: None, run_immediately=False)
+        assert engine.run_pending() == 0
+
+        engine.on_order_event('005930')
+        assert engine.run_pending() == 1
+
+
+def test_parse_order_state():
+    """주문체결(00) 값 → 매도 주문 최종 상태 (매수/진행 중은 None)"""
+    assert parse_order_state({'907': '1', '913': '체결', '902': '0'}) == ORDER_FILLED
+    assert parse_order_state({'907': '1', '913': '체결', '902': '3'}) is None
+    assert parse_order_state({'907': '1', '913': '확인', '905': '매도취소'}) == ORDER_CANCELLED
+    assert parse_order_state({'907': '1', '913': '접수', '919': '주문가능수량 부족'}) == ORDER_REJECTED
+    assert parse_order_state({'907': '2', '913': '체결', '902': '0'}) is None
+
+
+def test_latency_tracker_percentiles():
+    """구간별 지연 백분위"""
+    tracker = LatencyTracker(window=100)
+    for ms in range(1, 101):
+        tracker.record('tick_to_order', ms / 1000)
+
+    stats = tracker.get_stats()['tick_to_order']
+    assert stats['count'] == 100
+    assert stats['max_ms'] == pytest.approx(100)
+    assert stats['p50_ms'] == pytest.approx(50.5)
@@ -0,0 +1,63 @@
+"""
+WebSocketStreamManager (우선순위 큐 / 백프레셔 / 대기 클라이언트) 테스트
+"""
+import json
+
+from utils.websocket_streaming import MessagePriority, WebSocketStreamManager
+
+
+class TestQueues:
+    """우선순위 큐 / 백프레셔 테스트"""
+
+    def test_priority_order_and_backpressure(self):
+        """가득 차면 낮은 우선순위의 오래된 메시지부터 버리고, 꺼낼 때는 우선순위 순"""
+        manager = WebSocketStreamManager(max_message_queue=3)
+        manager.register_connection('a')
+        manager.subscribe('a', 'ch')
+
+        manager.broadcast('ch', 'low-1', MessagePriority.LOW)
+        manager.broadcast('ch', 'low-2', MessagePriority.LOW)
+        manager.broadcast('ch', 'high-1', MessagePriority.HIGH)
+        manager.broadcast('ch', 'critical', MessagePriority.CRITICAL)   # low-1 버림
+        manager.broadcast('ch', 'normal', MessagePriority.NORMAL)       # low-2 버림
+        assert manager.broadcast('ch', 'low-3', MessagePriority.LOW) == 0  # 더 낮은 것이 없으면 새 메시지를 버림
+
+        messages = manager.get_pending_messages('a', 10)
+        assert [m.data for m in messages] == ['critical', 'high-1', 'normal']
+        assert manager.stats['backpressure_events'] == 3
+        assert manager.get_connection_stats('a')['messages_dropped'] == 3
+        assert manager.pending_clients() == []
+
+    def test_broadcast_shares_one_encoded_message(self):
+        """구독자 전원이 같은 메시지 객체와 JSON을 공유, 만료 메시지는 제외"""
+        manager = WebSocketStreamManager()
+        for sid in ('a', 'b'):
+            manager.register_connection(sid)
+            manager.subscribe(sid, 'ticks')
+
+        assert manager.broadcast('ticks', {'price': 1}) == 2
+        manager.broadcast('ticks', {'price': 0}, ttl_seconds=-1)
+
+        a, = manager.get_pending_messages('a')
+        b, = manager.get_pending_messages('b')
+        assert a is b and a.encoded is b.encoded
+        assert json.loads(a.encoded)['data'] == {'price': 1}
+
+        manager.unsubscribe('b', 'ticks')
+        assert manager.channels['ticks'] == frozenset({'a'})
+
+    def test_ready_set_tracks_pending_clients(self):
+        """큐를 비운 클라이언트는 대기 목록에서 빠지고, 새 메시지가 오면 다시 들어감"""
+        manager = WebSocketStreamManager()
+        manager.register_connection('a')
+        manager.subscribe('a', 'ticks')
+
+        manager.broadcast('ticks', {'price': 1})
+        manager.broadcast('ticks', {'price': 2})
+        assert len(manager.get_pending_messages('a', 1)) == 1
+        assert manager.pending_clients() == ['a']
+        assert len(manager.get_pending_messages('a', 1)) == 1
+        assert manager.pending_clients() == []
+
+        manager.broadcast('ticks', {'price': 3})
+        assert manager.pending_clients() == ['a']
@@ -10,16 +10,17 @@ Intelligent Cache Manager
 - 캐시 크기 제한 (최대 1000개)
 - 캐시 히트율 모니터링
 - 데이터 타입별 최적화된 TTL 설정
+
+저장소는 utils.data_cache.LRUCache (개수/메모리 상한, 스탬피드 방지, 네임스페이스 통계)
 """
 import logging
 from typing import Any, Optional, Callable, Dict
-from datetime import datetime, timedelta
 from functools import wraps
 import hashlib
 import json
-import threading
 
 from utils.base_manager import BaseManager
+from utils.data_cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
@@ -37,29 +38,6 @@ class CacheTTL:
     NEVER_EXPIRE = 0         # 만료 없음
 
 
-class CacheEntry:
-    """캐시 엔트리"""
-
-    def __init__(self, value: Any, ttl_seconds: int):
-        self.value = value
-        self.created_at = datetime.now()
-        self.ttl_seconds = ttl_seconds
-        self.hit_count = 0
-        self.last_access = datetime.now()
-
-    def is_expired(self) -> bool:
-        """만료 여부"""
-        if self.ttl_seconds <= 0:
-            return False  # 무제한
-        return datetime.now() > self.created_at + timedelta(seconds=self.ttl_seconds)
-
-    def access(self) -> Any:
-        """값 접근"""
-        self.hit_count += 1
-        self.last_access = datetime.now()
-        return self.value
-
-
 class CacheManager(BaseManager):
     """
     지능형 캐시 관리자
@@ -72,31 +50,26 @@ class CacheManager(BaseManager):
     - 데이터 타입별 최적화된 TTL
     """
 
-    def __init__(self, max_size: int = 1000, default_ttl: int = 60):
+    def __init__(self, max_size: int = 1000, default_ttl: int = 60, max_memory_mb: int = 64):
         """
         Args:
             max_size: 최대 캐시 크기 (기본: 1000)
             default_ttl: 기본 TTL 초 (기본: 60초)
+            max_memory_mb: 최대 메모리 사용량 (MB)
         """
         super().__init__(name="CacheManager")
         self.max_size = max_size
         self.default_ttl = default_ttl
 
-        self._cache: dict[str, CacheEntry] = {}
-        self._lock = threading.RLock()
-
-        # 통계
-        self.hits = 0
-        self.misses = 0
-        self.evictions = 0
-        self.expirations = 0
+        self._cache = LRUCache(
+            max_size=max_size,
+            max_memory_mb=max_memory_mb,
+            default_ttl_seconds=default_ttl
+        )
 
         self.initialized = True
         self.logger.info(f"🚀 CacheManager 초기화 완료 - Max Size: {max_size}, Default TTL: {default_ttl}s")
 
-        # 자동 정리 스레드 시작
-        self._start_cleanup_thread()
-
     def get(self, key: str) -> Optional[Any]:
         """
         캐시에서 값 조회
@@ -107,28 +80,9 @@ class CacheManager(BaseManager):
         Returns:
             값 (없으면 None)
         """
-        with self._lock:
-            entry = self._cache.get(key)
-
-            if entry is None:
-                self.misses += 1
-                logger.debug(f"❌ Cache miss: {key}")
-                return None
-
-            # 만료 체크
-            if entry.is_expired():
-                del self._cache[key]
-                self.misses += 1
-                self.expirations += 1
-                logger.debug(f"⏰ Cache expired: {key}")
-                return None
-
-            # 히트
-            self.hits += 1
-            logger.debug(f"✅ Cache hit: {key} (hits: {entry.hit_count + 1})")
-            return entry.access()
-
-    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        return self._cache.get(key)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[list] = None):
         """
         캐시에 값 저장
 
@@ -136,14 +90,9 @@ class CacheManager(BaseManager):
             key: 키
             value: 값
             ttl: TTL (초), None이면 기본값 사용
+            tags: 태그 목록 (invalidate_by_tag용)
         """
-        with self._lock:
-            # 크기 체크
-            if len(self._cache) >= self.max_size:
-                self._evict_lru()
-
-            ttl = ttl if ttl is not None else self.default_ttl
-            self._cache[key] = CacheEntry(value, ttl)
+        self._cache.set(key, value, ttl_seconds=ttl, tags=tags)
 
     def delete(self, key: str) -> bool:
         """
@@ -155,22 +104,26 @@ class CacheManager(BaseManager):
         Returns:
             삭제 성공 여부
         """
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                return True
-            return False
+        return self._cache.delete(key)
 
     def clear(self):
         """전체 캐시 삭제"""
-        with self._lock:
-            self._cache.clear()
-            logger.info("Cache cleared")
+        self._cache.clear()
+
+    def invalidate_by_prefix(self, prefix: str) -> int:
+        """키 프리픽스로 무효화"""
+        return self._cache.invalidate_by_prefix(prefix)
+
+    def invalidate_by_tag(self, tag: str) -> int:
+        """태그로 무효화"""
+        return self._cache.invalidate_by_tag(tag)
 
     def get_or_set(self, key: str, factory: Callable, ttl: Optional[int] = None) -> Any:
         """
         캐시에서 값을 가져오거나, 없으면 factory로 생성하여 저장
 
+        같은 키에 대한 동시 호출은 factory를 한 번만 실행한다.
+
         Args:
             key: 키
             factory: 값 생성 함수
@@ -179,15 +132,7 @@ class CacheManager(BaseManager):
         Returns:
             값
         """
-        value = self.get(key)
-
-        if value is not None:
-            return value
-
-        # 캐시 미스 - 새로 생성
-        value = factory()
-        self.set(key, value, ttl)
-        return value
+        return self._cache.get_or_set(key, factory, ttl_seconds=ttl)
 
     def get_stats(self) -> dict:
         """
@@ -204,68 +149,30 @@ class CacheManager(BaseManager):
                 - total_requests: 총 요청 수
                 - evictions: LRU 제거 횟수
                 - expirations: 만료 삭제 횟수
+                - memory_mb: 메모리 사용량 (MB)
+                - namespaces: 키 프리픽스("ns:")별 통계
         """
-        with self._lock:
-            total_requests = self.hits + self.misses
-            hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
-            usage_percent = (len(self._cache) / self.max_size * 100) if self.max_size > 0 else 0
-
-            return {
-                'size': len(self._cache),
-                'max_size': self.max_size,
-                'usage_percent': round(usage_percent, 2),
-                'hits': self.hits,
-                'misses': self.misses,
-                'hit_rate': round(hit_rate, 2),
-                'total_requests': total_requests,
-                'evictions': self.evictions,
-                'expirations': self.expirations
-            }
-
-    def _evict_lru(self):
-        """LRU 제거 (가장 오래 사용 안 된 항목)"""
-        if not self._cache:
-            return
-
-        # 가장 오래 사용 안 된 항목 찾기
-        lru_key = min(
-            self._cache.keys(),
-            key=lambda k: self._cache[k].last_access
-        )
+        stats = self._cache.get_stats()
+        total_requests = stats.total_hits + stats.total_misses
+        usage_percent = (stats.entry_count / self.max_size * 100) if self.max_size > 0 else 0
 
-        del self._cache[lru_key]
-        self.evictions += 1
-        logger.debug(f"🗑️  LRU evicted: {lru_key} (total evictions: {self.evictions})")
+        return {
+            'size': stats.entry_count,
+            'max_size': self.max_size,
+            'usage_percent': round(usage_percent, 2),
+            'hits': stats.total_hits,
+            'misses': stats.total_misses,
+            'hit_rate': round(stats.hit_rate * 100, 2),
+            'total_requests': total_requests,
+            'evictions': stats.total_evictions,
+            'expirations': stats.total_expirations,
+            'memory_mb': round(stats.memory_usage_bytes / 1024 / 1024, 2),
+            'namespaces': self._cache.get_namespace_stats(),
+        }
 
     def _cleanup_expired(self):
         """만료된 항목 정리"""
-        with self._lock:
-            expired_keys = [
-                key for key, entry in self._cache.items()
-                if entry.is_expired()
-            ]
-
-            for key in expired_keys:
-                del self._cache[key]
-                self.expirations += 1
-
-            if expired_keys:
-                logger.debug(f"🧹 Cleaned up {len(expired_keys)} expired entries (total expirations: {self.expirations})")
-
-    def _start_cleanup_thread(self):
-        """정리 스레드 시작"""
-        def cleanup_loop():
-            while True:
-                try:
-                    self._cleanup_expired()
-                except Exception as e:
-                    logger.error(f"Cleanup error: {e}")
-
-                # 60초마다 정리
-                threading.Event().wait(60)
-
-        thread = threading.Thread(target=cleanup_loop, daemon=True)
-        thread.start()
+        self._cache.cleanup_expired()
 
     def initialize(self) -> bool:
         """초기화"""
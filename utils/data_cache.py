@@ -1,12 +1,19 @@
 """
 Advanced Data Caching System - v5.12
 Multi-level caching with LRU, TTL, and intelligent invalidation
+
+LRUCache가 프로세스 공용 캐시 엔진:
+- 개수/메모리 상한 기반 LRU 제거 + 주기적 만료 정리
+- 태그/프리픽스 단위 무효화
+- get_or_set() 스탬피드 방지 (같은 키는 한 번만 계산)
+- 네임스페이스("ns:key")별 히트/미스 통계
+utils.cache_manager.CacheManager, utils.redis_cache의 메모리 폴백도 이 엔진을 사용한다.
 """
 from dataclasses import dataclass
 from typing import Any, Optional, Dict, Callable, List
 from datetime import datetime, timedelta
 from collections import OrderedDict
-from threading import RLock
+from threading import RLock, Lock
 import json
 import hashlib
 import pickle
@@ -41,6 +48,13 @@ class CacheStats:
     memory_usage_bytes: int
     entry_count: int
     uptime_seconds: float
+    total_expirations: int = 0
+
+
+def _namespace_of(key: str) -> str:
+    """키의 네임스페이스 ("ns:rest" → "ns", 구분자 없으면 "")"""
+    head, sep, _ = key.partition(':')
+    return head if sep else ''
 
 
 class LRUCache:
@@ -50,26 +64,37 @@ class LRUCache:
     """
 
     def __init__(self, max_size: int = 1000, max_memory_mb: int = 100,
-                 default_ttl_seconds: int = 300):
+                 default_ttl_seconds: int = 300, cleanup_interval_seconds: int = 60):
         """
         Args:
             max_size: 최대 엔트리 수
             max_memory_mb: 최대 메모리 사용량 (MB)
-            default_ttl_seconds: 기본 TTL (초)
+            default_ttl_seconds: 기본 TTL (초, 0 이하면 만료 없음)
+            cleanup_interval_seconds: set() 시 만료 엔트리 일괄 정리 주기 (초)
         """
         self.max_size = max_size
         self.max_memory_bytes = max_memory_mb * 1024 * 1024
         self.default_ttl_seconds = default_ttl_seconds
+        self.cleanup_interval_seconds = cleanup_interval_seconds
 
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self._lock = RLock()
 
+        # get_or_set 스탬피드 방지용 키별 락 {key: [락, 참조 수]}
+        # 참조 수는 락을 쥐었거나 기다리는 호출 수, 0이 되면 제거
+        self._key_locks: Dict[str, List[Any]] = {}
+        self._last_cleanup = datetime.now()
+
+        # 네임스페이스별 통계 {ns: {'hits', 'misses', 'sets', 'evictions'}}
+        self._ns_stats: Dict[str, Dict[str, int]] = {}
+
         # Statistics
         self._hits = 0
         self._misses = 0
         self._sets = 0
         self._deletes = 0
         self._evictions = 0
+        self._expirations = 0
         self._start_time = datetime.now()
         self._current_memory_bytes = 0
 
@@ -89,6 +114,7 @@ class LRUCache:
         with self._lock:
             if key not in self._cache:
                 self._misses += 1
+                self._count(key, 'misses')
                 logger.debug(f"Cache MISS: {key}")
                 return None
 
@@ -99,6 +125,8 @@ class LRUCache:
                 logger.debug(f"Cache EXPIRED: {key}")
                 self._delete_entry(key)
                 self._misses += 1
+                self._expirations += 1
+                self._count(key, 'misses')
                 return None
 
             # Update access info
@@ -109,6 +137,7 @@ class LRUCache:
             self._cache.move_to_end(key)
 
             self._hits += 1
+            self._count(key, 'hits')
             logger.debug(f"Cache HIT: {key} (hits={entry.hit_count})")
 
             return entry.value
@@ -129,11 +158,7 @@ class LRUCache:
         """
         with self._lock:
             # Calculate size
-            try:
-                size_bytes = len(pickle.dumps(value))
-            except Exception as e:
-                logger.warning(f"Cannot pickle value for {key}: {e}")
-                size_bytes = 1024  # Default estimate
+            size_bytes = self._estimate_size(key, value)
 
             # Check if single entry exceeds max memory
             if size_bytes > self.max_memory_bytes:
@@ -144,6 +169,10 @@ class LRUCache:
             if key in self._cache:
                 self._delete_entry(key)
 
+            # 만료 엔트리 주기 정리 (읽히지 않는 키도 회수)
+            if (datetime.now() - self._last_cleanup).total_seconds() >= self.cleanup_interval_seconds:
+                self.cleanup_expired()
+
             # Evict entries if needed
             self._evict_if_needed(size_bytes)
 
@@ -165,6 +194,7 @@ class LRUCache:
             self._cache[key] = entry
             self._current_memory_bytes += size_bytes
             self._sets += 1
+            self._count(key, 'sets')
 
             logger.debug(f"Cache SET: {key} (size={size_bytes}, ttl={ttl}s, "
                         f"memory={self._current_memory_bytes/1024/1024:.1f}MB)")
@@ -211,6 +241,112 @@ class LRUCache:
             logger.info(f"Invalidated {len(keys_to_delete)} entries with tag '{tag}'")
             return len(keys_to_delete)
 
+    def invalidate_by_prefix(self, prefix: str) -> int:
+        """
+        키 프리픽스로 캐시 무효화
+
+        Args:
+            prefix: 키 프리픽스 (예: "deep_scan:execution_")
+
+        Returns:
+            int: 삭제된 엔트리 수
+        """
+        with self._lock:
+            keys_to_delete = [key for key in self._cache if key.startswith(prefix)]
+
+            for key in keys_to_delete:
+                self._delete_entry(key)
+
+            logger.debug(f"Invalidated {len(keys_to_delete)} entries with prefix '{prefix}'")
+            return len(keys_to_delete)
+
+    def get_or_set(self, key: str, factory: Callable[[], Any],
+                   ttl_seconds: Optional[int] = None,
+                   tags: Optional[List[str]] = None) -> Any:
+        """
+        캐시에서 조회하고, 없으면 factory 결과를 저장 후 반환
+
+        같은 키로 동시에 호출되면 factory는 한 번만 실행되고 나머지는 그 결과를 받는다.
+        factory가 None을 반환하면 저장하지 않는다.
+
+        Args:
+            key: 캐시 키
+            factory: 값 생성 함수
+            ttl_seconds: TTL (초)
+            tags: 태그 목록
+
+        Returns:
+            캐시된 값 또는 factory 결과
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            slot = self._key_locks.get(key)
+            if slot is None:
+                slot = self._key_locks[key] = [Lock(), 0]
+            slot[1] += 1
+        key_lock = slot[0]
+
+        try:
+            with key_lock:
+                # 대기하는 동안 다른 스레드가 채웠는지 확인 (통계에는 반영하지 않음)
+                with self._lock:
+                    entry = self._cache.get(key)
+                    if entry is not None and not (entry.expires_at and datetime.now() >= entry.expires_at):
+                        self._cache.move_to_end(key)
+                        return entry.value
+
+                value = factory()
+                if value is not None:
+                    self.set(key, value, ttl_seconds=ttl_seconds, tags=tags)
+                return value
+        finally:
+            with self._lock:
+                slot[1] -= 1
+                if slot[1] == 0:
+                    del self._key_locks[key]
+
+    def namespace(self, name: str, default_ttl_seconds: Optional[int] = None) -> 'CacheNamespace':
+        """
+        네임스페이스 뷰 반환 (키 앞에 "name:" 자동 부착)
+
+        Args:
+            name: 네임스페이스 이름
+            default_ttl_seconds: 네임스페이스 기본 TTL (None이면 캐시 기본값)
+        """
+        return CacheNamespace(self, name, default_ttl_seconds)
+
+    def get_namespace_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        네임스페이스별 통계
+
+        Returns:
+            {ns: {'hits', 'misses', 'sets', 'evictions', 'hit_rate', 'entries'}}
+        """
+        with self._lock:
+            entries: Dict[str, int] = {}
+            for key in self._cache:
+                ns = _namespace_of(key)
+                entries[ns] = entries.get(ns, 0) + 1
+
+            result = {}
+            for ns in set(self._ns_stats) | set(entries):
+                counts = dict(self._ns_stats.get(ns, {}))
+                total = counts.get('hits', 0) + counts.get('misses', 0)
+                counts['hit_rate'] = counts.get('hits', 0) / total if total else 0.0
+                counts['entries'] = entries.get(ns, 0)
+                result[ns] = counts
+            return result
+
+    def _count(self, key: str, field: str) -> None:
+        """네임스페이스 통계 증가 (lock 보유 상태에서 호출)"""
+        stats = self._ns_stats.get(_namespace_of(key))
+        if stats is None:
+            stats = self._ns_stats[_namespace_of(key)] = {'hits': 0, 'misses': 0, 'sets': 0, 'evictions': 0}
+        stats[field] += 1
+
     def clear(self) -> None:
         """캐시 전체 삭제"""
         with self._lock:
@@ -236,9 +372,23 @@ class LRUCache:
                 hit_rate=hit_rate,
                 memory_usage_bytes=self._current_memory_bytes,
                 entry_count=len(self._cache),
-                uptime_seconds=uptime
+                uptime_seconds=uptime,
+                total_expirations=self._expirations
             )
 
+    @staticmethod
+    def _estimate_size(key: str, value: Any) -> int:
+        """엔트리 크기 추정 (배열은 nbytes, 그 외 pickle 크기)"""
+        if hasattr(value, 'nbytes'):
+            return int(value.nbytes)
+        if isinstance(value, dict) and value and all(hasattr(v, 'nbytes') for v in value.values()):
+            return sum(int(v.nbytes) for v in value.values())
+        try:
+            return len(pickle.dumps(value))
+        except Exception as e:
+            logger.warning(f"Cannot pickle value for {key}: {e}")
+            return 1024  # Default estimate
+
     def _delete_entry(self, key: str) -> None:
         """엔트리 삭제 (internal)"""
         if key in self._cache:
@@ -255,6 +405,7 @@ class LRUCache:
             logger.debug(f"Evicting by memory: {oldest_key}")
             self._delete_entry(oldest_key)
             self._evictions += 1
+            self._count(oldest_key, 'evictions')
 
         # Evict by count limit
         while len(self._cache) >= self.max_size:
@@ -262,11 +413,13 @@ class LRUCache:
             logger.debug(f"Evicting by count: {oldest_key}")
             self._delete_entry(oldest_key)
             self._evictions += 1
+            self._count(oldest_key, 'evictions')
 
     def cleanup_expired(self) -> int:
         """만료된 엔트리 정리"""
         with self._lock:
             now = datetime.now()
+            self._last_cleanup = now
             keys_to_delete = [
                 key for key, entry in self._cache.items()
                 if entry.expires_at and entry.expires_at <= now
@@ -274,13 +427,74 @@ class LRUCache:
 
             for key in keys_to_delete:
                 self._delete_entry(key)
+            self._expirations += len(keys_to_delete)
 
             if keys_to_delete:
-                logger.info(f"Cleaned up {len(keys_to_delete)} expired entries")
+                logger.debug(f"Cleaned up {len(keys_to_delete)} expired entries")
 
             return len(keys_to_delete)
 
 
+class CacheNamespace:
+    """
+    LRUCache 네임스페이스 뷰
+
+    키 앞에 "name:"을 붙여 공용 캐시의 용량/통계를 공유하면서 모듈별로 분리한다.
+
+    Usage:
+        cache = get_namespace_cache('deep_scan', default_ttl_seconds=300)
+        cache.set('execution_005930', data)
+        cache.get_or_set('program_005930', lambda: fetch(...))
+        cache.invalidate('execution_')
+    """
+
+    def __init__(self, cache: LRUCache, name: str, default_ttl_seconds: Optional[int] = None):
+        self.cache = cache
+        self.name = name
+        self.default_ttl_seconds = default_ttl_seconds
+        self._prefix = f"{name}:"
+
+    def _key(self, key: str) -> str:
+        return self._prefix + key
+
+    def _ttl(self, ttl_seconds: Optional[int]) -> Optional[int]:
+        return ttl_seconds if ttl_seconds is not None else self.default_ttl_seconds
+
+    def get(self, key: str) -> Optional[Any]:
+        """값 조회"""
+        return self.cache.get(self._key(key))
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None,
+            tags: Optional[List[str]] = None) -> bool:
+        """값 저장"""
+        return self.cache.set(self._key(key), value, self._ttl(ttl_seconds), tags)
+
+    def delete(self, key: str) -> bool:
+        """값 삭제"""
+        return self.cache.delete(self._key(key))
+
+    def get_or_set(self, key: str, factory: Callable[[], Any],
+                   ttl_seconds: Optional[int] = None,
+                   tags: Optional[List[str]] = None) -> Any:
+        """조회 후 없으면 factory 결과 저장 (스탬피드 방지)"""
+        return self.cache.get_or_set(self._key(key), factory, self._ttl(ttl_seconds), tags)
+
+    def invalidate(self, prefix: str = '') -> int:
+        """네임스페이스 내 프리픽스 무효화 (빈 문자열이면 네임스페이스 전체)"""
+        return self.cache.invalidate_by_prefix(self._key(prefix))
+
+    def invalidate_by_tag(self, tag: str) -> int:
+        """태그 무효화 (공용 캐시 전체 대상)"""
+        return self.cache.invalidate_by_tag(tag)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """네임스페이스 통계"""
+        return self.cache.get_namespace_stats().get(
+            self.name,
+            {'hits': 0, 'misses': 0, 'sets': 0, 'evictions': 0, 'hit_rate': 0.0, 'entries': 0}
+        )
+
+
 class MultiLevelCache:
     """
     다단계 캐시
@@ -509,6 +723,8 @@ def cached(cache: LRUCache, ttl_seconds: int = 300,
 _price_cache: Optional[MultiLevelCache] = None
 _market_data_cache: Optional[MultiLevelCache] = None
 _api_cache: Optional[LRUCache] = None
+_shared_cache: Optional[LRUCache] = None
+_shared_cache_lock = Lock()
 
 
 def get_price_cache() -> MultiLevelCache:
@@ -549,6 +765,31 @@ def get_api_cache() -> LRUCache:
     return _api_cache
 
 
+def get_shared_cache() -> LRUCache:
+    """모듈 공용 캐시 (네임스페이스로 분리해서 사용)"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = LRUCache(
+                    max_size=5000,
+                    max_memory_mb=128,
+                    default_ttl_seconds=300
+                )
+    return _shared_cache
+
+
+def get_namespace_cache(name: str, default_ttl_seconds: Optional[int] = None) -> CacheNamespace:
+    """
+    공용 캐시의 네임스페이스 뷰 반환
+
+    Args:
+        name: 네임스페이스 이름 (예: 'deep_scan')
+        default_ttl_seconds: 네임스페이스 기본 TTL
+    """
+    return get_shared_cache().namespace(name, default_ttl_seconds)
+
+
 # Example usage
 if __name__ == '__main__':
     print("\n📦 Multi-Level Cache Test")
@@ -0,0 +1,274 @@
+"""
+utils/journal_store.py
+추가 기록(append-only) 저널 + 스냅샷 기반 JSON 상태 저장소
+
+- 상태는 JSON 객체 하나 (키 경로로 중첩 dict 접근)
+- 변경은 {path}.journal 에 JSON 한 줄로 이어쓰기 → 쓰기 비용이 이력 길이와 무관
+- 저널이 compact_every 레코드를 넘으면 스냅샷({path})을 임시 파일에 쓰고 os.replace로 교체한 뒤
+  저널을 비운다 (원자적 압축)
+- 시작 시 스냅샷 로드 후 저널 꼬리만 재생
+- 레코드마다 시퀀스 번호(s)를 붙이고 스냅샷에 마지막 반영 번호(_seq)를 기록하므로
+  스냅샷 교체 직후 저널 정리 전에 중단돼도 이중 반영되지 않는다
+- 쓰다 만 마지막 줄(크래시)은 재생 시 무시하고 잘라내고, 줄바꿈만 빠진 완전한 레코드는 줄바꿈을 보충한다
+
+저널 한 줄: {"s": 12, "ops": [["set", ["q_table", "s1", "buy"], 0.4], ["append", ["rewards"], 0.1, 100]]}
+"""
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+SEQ_KEY = '_seq'
+
+Key = Union[str, Sequence[str]]
+
+
+def _path(key: Key) -> List[str]:
+    return [key] if isinstance(key, str) else list(key)
+
+
+def _apply(state: Dict[str, Any], op: List[Any]) -> None:
+    """저널 연산 하나를 상태에 반영"""
+    kind, path = op[0], op[1]
+    parent = state
+    for part in path[:-1]:
+        child = parent.get(part)
+        if not isinstance(child, dict):
+            child = parent[part] = {}
+        parent = child
+    last = path[-1]
+
+    if kind == 'set':
+        parent[last] = op[2]
+    elif kind == 'delete':
+        parent.pop(last, None)
+    elif kind == 'append':
+        items = parent.get(last)
+        if not isinstance(items, list):
+            items = parent[last] = []
+        items.append(op[2])
+        limit = op[3] if len(op) > 3 else None
+        if limit and len(items) > limit:
+            del items[:-limit]
+    else:
+        raise ValueError(f"알 수 없는 저널 연산: {kind}")
+
+
+class JournalStore:
+    """
+    저널 기반 JSON 상태 저장소
+
+    사용 예:
+        store = JournalStore(Path('data/notifications.json'))
+        store.append('notifications', item, limit=100)
+        with store.batch():
+            store.set(('q_table', state, action), value)
+            store.set('epsilon', 0.2)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        compact_every: int = 1000,
+        fsync: bool = False,
+        migrate: Optional[Callable[[Any], Dict[str, Any]]] = None,
+    ):
+        """
+        Args:
+            path: 스냅샷 파일 경로 (저널은 path + '.journal')
+            compact_every: 저널 레코드 수가 이 값을 넘으면 스냅샷으로 압축
+            fsync: 레코드마다 os.fsync (전원 장애까지 대비할 때)
+            migrate: 스냅샷을 상태 dict로 변환 (기존 전체 덮어쓰기 형식 파일 호환)
+        """
+        self.path = Path(path)
+        self.journal_path = self.path.with_name(self.path.name + '.journal')
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self._migrate = migrate
+
+        self._lock = threading.RLock()
+        self._batch: Optional[List[List[Any]]] = None
+        self._seq = 0
+        self._journal_records = 0
+        self._journal = None
+
+        self.data: Dict[str, Any] = {}
+        self._load()
+
+    # ------------------------------------------------------------------
+    # 로드 / 재생
+    # ------------------------------------------------------------------
+
+    def _load(self):
+        snapshot = None
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    snapshot = json.load(f)
+            except Exception as e:
+                logger.error(f"스냅샷 로드 실패, 저널만 재생합니다: {self.path} - {e}")
+
+        if self._migrate and snapshot is not None:
+            snapshot = self._migrate(snapshot)
+        if not isinstance(snapshot, dict):
+            snapshot = {}
+        self._seq = int(snapshot.pop(SEQ_KEY, 0) or 0)
+        self.data = snapshot
+
+        replayed = self._replay()
+        if replayed:
+            logger.info(f"저널 재생: {self.journal_path.name} {replayed}건")
+
+    def _replay(self) -> int:
+        if not self.journal_path.exists():
+            return 0
+
+        replayed = 0
+        valid_bytes = 0
+        last_raw = b''
+        with open(self.journal_path, 'rb') as f:
+            for raw in f:
+                try:
+                    record = json.loads(raw)
+                    seq = int(record['s'])
+                    ops = record['ops']
+                except (ValueError, KeyError, TypeError):
+                    logger.warning(f"손상된 저널 꼬리 무시: {self.journal_path} ({len(raw)} bytes)")
+                    break
+                valid_bytes += len(raw)
+                last_raw = raw
+                self._journal_records += 1
+                if seq <= self._seq:
+                    continue  # 스냅샷에 이미 반영됨
+                for op in ops:
+                    _apply(self.data, op)
+                self._seq = seq
+                replayed += 1
+
+        if valid_bytes < self.journal_path.stat().st_size:
+            with open(self.journal_path, 'r+b') as f:
+                f.truncate(valid_bytes)
+        if last_raw and not last_raw.endswith(b'\n'):
+            # 완전한 레코드지만 줄바꿈 전에 중단됨 → 다음 레코드가 같은 줄에 붙지 않도록 보충
+            with open(self.journal_path, 'ab') as f:
+                f.write(b'\n')
+        return replayed
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def get(self, key: Key, default: Any = None) -> Any:
+        """키 경로 조회 (내부 객체를 그대로 돌려주므로 수정하지 말고 set/append로 변경)"""
+        node: Any = self.data
+        for part in _path(key):
+            if not isinstance(node, dict) or part not in node:
+                return default
+            node = node[part]
+        return node
+
+    # ------------------------------------------------------------------
+    # 변경 (저널 기록 후 메모리 반영)
+    # ------------------------------------------------------------------
+
+    def set(self, key: Key, value: Any):
+        """키 경로에 값 저장"""
+        self._record(['set', _path(key), value])
+
+    def delete(self, key: Key):
+        """키 경로 삭제"""
+        self._record(['delete', _path(key)])
+
+    def append(self, key: Key, item: Any, limit: Optional[int] = None):
+        """키 경로의 리스트에 항목 추가 (limit: 최근 N개만 유지)"""
+        op = ['append', _path(key), item]
+        if limit:
+            op.append(limit)
+        self._record(op)
+
+    @contextmanager
+    def batch(self) -> Iterator['JournalStore']:
+        """블록 안의 변경을 저널 한 줄로 묶음 (재생 시 전부 또는 전무)"""
+        with self._lock:
+            if self._batch is not None:
+                yield self
+                return
+            self._batch = []
+            try:
+                yield self
+            finally:
+                ops, self._batch = self._batch, None
+                if ops:
+                    self._write(ops)
+
+    def _record(self, op: List[Any]):
+        with self._lock:
+            # 직렬화 가능한 값만 메모리에 반영 (저널과 메모리 상태 일치)
+            op = json.loads(json.dumps(op, ensure_ascii=False, default=str))
+            _apply(self.data, op)
+            if self._batch is not None:
+                self._batch.append(op)
+            else:
+                self._write([op])
+
+    def _write(self, ops: List[List[Any]]):
+        self._seq += 1
+        line = json.dumps({'s': self._seq, 'ops': ops}, ensure_ascii=False, separators=(',', ':'))
+        try:
+            if self._journal is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._journal = open(self.journal_path, 'a', encoding='utf-8')
+            self._journal.write(line + '\n')
+            self._journal.flush()
+            if self.fsync:
+                os.fsync(self._journal.fileno())
+            self._journal_records += 1
+        except Exception as e:
+            logger.error(f"저널 기록 실패: {self.journal_path} - {e}")
+            return
+
+        if self._journal_records >= self.compact_every:
+            self.compact()
+
+    # ------------------------------------------------------------------
+    # 압축 / 종료
+    # ------------------------------------------------------------------
+
+    def compact(self) -> bool:
+        """스냅샷을 원자적으로 교체하고 저널을 비움"""
+        with self._lock:
+            snapshot = dict(self.data)
+            snapshot[SEQ_KEY] = self._seq
+            tmp = self.path.with_name(self.path.name + '.tmp')
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f, ensure_ascii=False, default=str)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, self.path)
+
+                if self._journal is not None:
+                    self._journal.close()
+                    self._journal = None
+                if self.journal_path.exists():
+                    self.journal_path.unlink()
+                self._journal_records = 0
+                return True
+            except Exception as e:
+                logger.error(f"스냅샷 압축 실패: {self.path} - {e}")
+                return False
+
+    def close(self):
+        """남은 저널을 스냅샷으로 압축하고 파일 닫기"""
+        with self._lock:
+            if self._journal_records:
+                self.compact()
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
@@ -0,0 +1,185 @@
+"""
+utils/monte_carlo.py
+공용 Monte Carlo 엔진 (NumPy 벡터화)
+
+- (시뮬레이션 수 × 기간) 수익률 행렬을 한 번에 생성하고 메모리 상한에 맞춰 청크 단위로 처리
+- 시드 고정 재현성 (numpy Generator)
+- 수익률 생성 방식: 정규분포 / 부트스트랩 / 블록 부트스트랩
+- 경로 전체 대신 최종값과 요약 통계, 선택적 경로 표본만 반환
+
+사용처: AdvancedRiskAnalytics, AdvancedBacktester, HistoricalOptimizer
+"""
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+class MonteCarloEngine:
+    """
+    벡터화 Monte Carlo 엔진
+
+    Usage:
+        engine = MonteCarloEngine(seed=42)
+
+        # 정규분포 일간 수익률 252일 복리
+        finals = engine.terminal_values(10_000_000, horizon=252, num_simulations=10000,
+                                        mean=0.0005, std=0.02)
+
+        # 거래 수익률(%) 부트스트랩
+        finals = engine.terminal_values(10_000_000, horizon=len(trades), num_simulations=1000,
+                                        sample=[t / 100 for t in trade_returns], method='bootstrap')
+    """
+
+    def __init__(self, seed: Optional[int] = None, max_chunk_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            seed: 난수 시드 (None이면 매번 다른 결과)
+            max_chunk_bytes: 청크당 수익률 행렬 최대 크기 (바이트)
+        """
+        self.rng = np.random.default_rng(seed)
+        self.max_chunk_bytes = max_chunk_bytes
+
+    # ------------------------------------------------------------------
+    # 수익률 행렬 생성
+    # ------------------------------------------------------------------
+
+    def chunk_rows(self, horizon: int) -> int:
+        """청크당 시뮬레이션 수 (float64 기준)"""
+        return max(1, self.max_chunk_bytes // (max(horizon, 1) * 8))
+
+    def iter_returns(
+        self,
+        horizon: int,
+        num_simulations: int,
+        mean: float = 0.0,
+        std: float = 0.0,
+        sample: Optional[Sequence[float]] = None,
+        method: str = 'normal',
+        block_size: int = 5
+    ) -> Iterator[np.ndarray]:
+        """
+        수익률 행렬을 청크 단위로 생성
+
+        Args:
+            horizon: 경로 길이 (일수/거래수)
+            num_simulations: 시뮬레이션 수
+            mean: 정규분포 평균 (method='normal')
+            std: 정규분포 표준편차 (method='normal')
+            sample: 재표본 대상 수익률 (method='bootstrap'/'block_bootstrap')
+            method: 'normal' | 'bootstrap' | 'block_bootstrap'
+            block_size: 블록 부트스트랩 블록 길이 (자기상관 보존)
+
+        Yields:
+            (청크 크기 × horizon) 수익률 행렬
+        """
+        if method not in ('normal', 'bootstrap', 'block_bootstrap'):
+            raise ValueError(f"지원하지 않는 Monte Carlo 방식: {method}")
+
+        data = None
+        if method != 'normal':
+            data = np.asarray(sample, dtype=np.float64)
+            if data.size == 0:
+                raise ValueError("부트스트랩에는 표본 수익률이 필요합니다")
+
+        rows = self.chunk_rows(horizon)
+        remaining = num_simulations
+        while remaining > 0:
+            n = min(rows, remaining)
+            remaining -= n
+
+            if method == 'normal':
+                yield self.rng.normal(mean, std, size=(n, horizon))
+            elif method == 'bootstrap':
+                yield data[self.rng.integers(0, data.size, size=(n, horizon))]
+            else:
+                yield data[self._block_indices(n, horizon, data.size, block_size)]
+
+    def _block_indices(self, n: int, horizon: int, size: int, block_size: int) -> np.ndarray:
+        """원형 블록 부트스트랩 인덱스 (n × horizon)"""
+        block_size = max(1, min(block_size, size))
+        num_blocks = -(-horizon // block_size)
+        starts = self.rng.integers(0, size, size=(n, num_blocks))
+        indices = (starts[:, :, None] + np.arange(block_size)) % size
+        return indices.reshape(n, num_blocks * block_size)[:, :horizon]
+
+    # ------------------------------------------------------------------
+    # 시뮬레이션
+    # ------------------------------------------------------------------
+
+    def terminal_values(
+        self,
+        initial_value: float,
+        horizon: int,
+        num_simulations: int,
+        compounding: bool = True,
+        path_sample: int = 0,
+        **return_kwargs
+    ) -> np.ndarray:
+        """
+        경로별 최종값 계산
+
+        Args:
+            initial_value: 초기값
+            horizon: 경로 길이
+            num_simulations: 시뮬레이션 수
+            compounding: True면 value *= (1 + r) 복리, False면 value += r 합산
+            path_sample: 0보다 크면 앞쪽 경로를 self.last_sample_paths에 보관
+            **return_kwargs: iter_returns 인자 (mean, std, sample, method, block_size)
+
+        Returns:
+            (num_simulations,) 최종값 배열
+        """
+        finals = np.empty(num_simulations, dtype=np.float64)
+        samples = []
+        kept = 0
+        offset = 0
+
+        for returns in self.iter_returns(horizon, num_simulations, **return_kwargs):
+            n = returns.shape[0]
+
+            if kept < path_sample:
+                take = min(path_sample - kept, n)
+                if compounding:
+                    paths = initial_value * np.cumprod(1 + returns[:take], axis=1)
+                else:
+                    paths = initial_value + np.cumsum(returns[:take], axis=1)
+                samples.append(np.hstack([np.full((take, 1), float(initial_value)), paths]))
+                kept += take
+
+            if compounding:
+                finals[offset:offset + n] = initial_value * np.prod(1 + returns, axis=1)
+            else:
+                finals[offset:offset + n] = initial_value + returns.sum(axis=1)
+            offset += n
+
+        self.last_sample_paths = np.vstack(samples) if samples else None
+        return finals
+
+    @staticmethod
+    def summarize(
+        values: np.ndarray,
+        initial_value: float,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> Dict[str, Any]:
+        """
+        최종값 요약 통계
+
+        Returns:
+            {'mean', 'median', 'std', 'min', 'max', 'percentile_<p>', 'probability_profit'}
+        """
+        summary = {
+            'mean': float(np.mean(values)),
+            'median': float(np.median(values)),
+            'std': float(np.std(values)),
+            'min': float(np.min(values)),
+            'max': float(np.max(values)),
+            'probability_profit': float((values > initial_value).mean()),
+        }
+        for p, value in zip(percentiles, np.percentile(values, percentiles)):
+            summary[f'percentile_{p:g}'] = float(value)
+        return summary
+
+
+__all__ = ['MonteCarloEngine', 'DEFAULT_PERCENTILES']
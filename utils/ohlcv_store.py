@@ -0,0 +1,472 @@
+"""
+utils/ohlcv_store.py
+히스토리컬 OHLCV 컬럼형 로컬 저장소
+
+- 종목 × 주기(daily / 1m / 5m ...) 단위로 컬럼별 바이너리 파일 저장
+  data/ohlcv/{interval}/{symbol}/timestamp.i8, open.f8, high.f8, low.f8, close.f8, volume.f8
+- 시간순 append는 파일 끝에 이어쓰기, 과거 구간이 섞이면 병합 후 재작성
+- 구간 조회는 np.memmap 슬라이스 (복사 없음)
+- meta.json: 확정 행 수(rows)와 조회 완료 구간(covered)
+  컬럼을 먼저 쓰고 meta를 나중에 교체하므로 중단돼도 rows 이후 바이트는 무시된다
+
+HistoricalDataLoader는 저장소에 없는 구간만 fetch 함수로 받아 채운 뒤
+배열 / DataFrame / 캔들 리스트 형태로 돌려준다 (백테스터/옵티마이저 공용).
+"""
+import gc
+import json
+import logging
+import os
+import shutil
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PRICE_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+_DAILY_ALIASES = {'d', 'day', 'daily', '1d'}
+
+
+def normalize_interval(interval) -> str:
+    """주기 표기 통일: 'D'/'daily' → 'daily', 5/'5'/'5m' → '5m'"""
+    text = str(interval).strip().lower()
+    if text in _DAILY_ALIASES:
+        return 'daily'
+    if text.endswith('m'):
+        text = text[:-1]
+    if not text.isdigit():
+        raise ValueError(f"지원하지 않는 주기: {interval}")
+    return f"{int(text)}m"
+
+
+def to_epoch_seconds(value, end_of_day: bool = False) -> int:
+    """
+    날짜/시각 → epoch 초 (naive 로컬 시각 기준)
+
+    Args:
+        value: 'YYYYMMDD', 'YYYY-MM-DD', 'YYYYMMDDHHMMSS', datetime, date, np.datetime64
+        end_of_day: 시각 없는 날짜면 그날 23:59:59로 해석 (구간 끝 포함용)
+    """
+    date_only = isinstance(value, date) and not isinstance(value, datetime)
+    if isinstance(value, str):
+        text = value.strip()
+        date_only = len(text) <= 10
+        if len(text) == 8 and text.isdigit():
+            ts = pd.Timestamp(datetime.strptime(text, '%Y%m%d'))
+        elif len(text) == 14 and text.isdigit():
+            ts = pd.Timestamp(datetime.strptime(text, '%Y%m%d%H%M%S'))
+        else:
+            ts = pd.Timestamp(text)
+    else:
+        ts = pd.Timestamp(value)
+
+    seconds = int(ts.to_datetime64().astype('datetime64[s]').astype(np.int64))
+    if date_only and end_of_day:
+        seconds += 86400 - 1
+    return seconds
+
+
+def bars_to_columns(bars: Sequence[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    캔들 dict 리스트 → 컬럼 배열
+
+    시각은 'timestamp' / 'datetime' 키 또는 'date'(YYYYMMDD) + 'time'(HHMMSS) 문자열에서 읽는다.
+    가격은 키움 부호 표기('-70500')를 절댓값으로 변환한다.
+    """
+    if not bars:
+        return {'timestamp': np.empty(0, dtype=np.int64), **{f: np.empty(0) for f in PRICE_FIELDS}}
+
+    first = bars[0]
+    if 'timestamp' in first or 'datetime' in first:
+        key = 'timestamp' if 'timestamp' in first else 'datetime'
+        stamps = pd.to_datetime([bar[key] for bar in bars])
+    else:
+        texts = [
+            str(bar.get('date', '')).strip() + str(bar.get('time', '') or '000000').strip().zfill(6)
+            for bar in bars
+        ]
+        stamps = pd.to_datetime(texts, format='%Y%m%d%H%M%S', errors='coerce')
+
+    columns = {'timestamp': np.asarray(stamps.values.astype('datetime64[s]').astype(np.int64))}
+    valid = ~np.asarray(stamps.isna())
+    for field in PRICE_FIELDS:
+        values = pd.to_numeric(pd.Series([bar.get(field) for bar in bars]), errors='coerce')
+        columns[field] = np.abs(values.to_numpy(dtype=np.float64))
+
+    if not valid.all():
+        columns = {name: values[valid] for name, values in columns.items()}
+    return columns
+
+
+class OHLCVStore:
+    """
+    종목/주기별 컬럼형 OHLCV 저장소
+
+    Usage:
+        store = get_ohlcv_store()
+        store.append_bars('005930', 'daily', chart_api.get_daily_chart('005930', period=0))
+
+        cols = store.range('005930', 'daily', '20240101', '20241231')
+        cols['timestamp']   # datetime64[s] (memmap 뷰)
+        cols['close']       # float64 (memmap 뷰)
+    """
+
+    def __init__(self, root: str = "data/ohlcv"):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._series_locks: Dict[Tuple[str, str], threading.RLock] = {}
+        self._maps: Dict[Tuple[str, str], Tuple[int, Dict[str, np.ndarray]]] = {}
+
+    # ------------------------------------------------------------------
+    # 경로/메타
+    # ------------------------------------------------------------------
+
+    def _key(self, symbol: str, interval) -> Tuple[str, str]:
+        return normalize_interval(interval), str(symbol)
+
+    def _series_dir(self, key: Tuple[str, str]) -> Path:
+        return self.root / key[0] / key[1]
+
+    def _series_lock(self, key: Tuple[str, str]) -> threading.RLock:
+        with self._lock:
+            lock = self._series_locks.get(key)
+            if lock is None:
+                lock = self._series_locks[key] = threading.RLock()
+            return lock
+
+    def _read_meta(self, key: Tuple[str, str]) -> Dict[str, Any]:
+        path = self._series_dir(key) / 'meta.json'
+        if not path.exists():
+            return {'rows': 0, 'covered': None}
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_meta(self, key: Tuple[str, str], meta: Dict[str, Any]):
+        directory = self._series_dir(key)
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp = directory / 'meta.json.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(tmp, directory / 'meta.json')
+
+    @staticmethod
+    def _column_file(directory: Path, name: str) -> Path:
+        return directory / (f'{name}.i8' if name == 'timestamp' else f'{name}.f8')
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+
+    def append(self, symbol: str, interval, columns: Dict[str, np.ndarray]) -> int:
+        """
+        봉 추가 (timestamp는 epoch 초)
+
+        같은 시각의 봉은 새 값으로 덮어쓴다.
+
+        Returns:
+            새로 늘어난 행 수
+        """
+        key = self._key(symbol, interval)
+        stamps = np.asarray(columns['timestamp'], dtype=np.int64)
+        if stamps.size == 0:
+            return 0
+
+        # 배치 내부 정렬 + 중복 시각은 마지막 값 유지
+        order = np.argsort(stamps, kind='stable')
+        stamps = stamps[order]
+        keep = np.append(stamps[1:] != stamps[:-1], True)
+        new = {'timestamp': stamps[keep]}
+        for field in PRICE_FIELDS:
+            new[field] = np.asarray(columns[field], dtype=np.float64)[order][keep]
+
+        with self._series_lock(key):
+            meta = self._read_meta(key)
+            rows = meta['rows']
+            directory = self._series_dir(key)
+            directory.mkdir(parents=True, exist_ok=True)
+
+            current = self._open(key, rows)
+            if rows == 0 or new['timestamp'][0] > current['timestamp'][-1]:
+                # 시간순 이어쓰기 (확정 행 이후의 잔여 바이트는 잘라냄)
+                for name, values in new.items():
+                    path = self._column_file(directory, name)
+                    with open(path, 'ab') as f:
+                        if f.tell() > rows * 8:
+                            f.truncate(rows * 8)
+                            f.seek(rows * 8)
+                        f.write(values.tobytes())
+                total = rows + len(new['timestamp'])
+            else:
+                total = self._rewrite_merged(key, current, new)
+
+            meta['rows'] = total
+            self._write_meta(key, meta)
+            self._release_maps(key)
+            return total - rows
+
+    def _rewrite_merged(self, key, current: Dict[str, np.ndarray], new: Dict[str, np.ndarray]) -> int:
+        """과거 구간이 섞인 append: 병합 후 컬럼 파일 교체"""
+        old_stamps = np.asarray(current['timestamp']).astype(np.int64)
+        stale = np.isin(old_stamps, new['timestamp'])
+        stamps = np.concatenate([old_stamps[~stale], new['timestamp']])
+        order = np.argsort(stamps, kind='stable')
+
+        directory = self._series_dir(key)
+        merged = {'timestamp': stamps[order]}
+        for field in PRICE_FIELDS:
+            merged[field] = np.concatenate([np.asarray(current[field])[~stale], new[field]])[order]
+
+        # 병합 결과는 복사본이므로 기존 memmap 참조를 모두 버린 뒤 교체
+        # (Windows는 매핑이 남아 있는 파일을 교체할 수 없다)
+        current.clear()
+        self._release_maps(key)
+        for name, values in merged.items():
+            path = self._column_file(directory, name)
+            tmp = path.with_suffix(path.suffix + '.tmp')
+            values.tofile(tmp)
+            try:
+                os.replace(tmp, path)
+            except PermissionError:
+                gc.collect()  # 순환 참조에 남은 memmap 해제 후 한 번 더
+                os.replace(tmp, path)
+        return len(merged['timestamp'])
+
+    def _release_maps(self, key) -> None:
+        """
+        캐시된 memmap 해제
+
+        np.memmap은 배열이 버퍼를 잡고 있어 명시적으로 닫을 수 없으므로
+        참조를 모두 끊어 매핑이 해제되게 한다. range()로 넘겨준 뷰는 호출 측이 놓을 때 해제된다.
+        """
+        cached = self._maps.pop(key, None)
+        if cached is not None:
+            cached[1].clear()
+
+    def append_bars(self, symbol: str, interval, bars: Sequence[Dict[str, Any]]) -> int:
+        """캔들 dict 리스트 추가 (ChartDataAPI 표준 형식 / 'timestamp' 키 형식)"""
+        return self.append(symbol, interval, bars_to_columns(bars))
+
+    def append_frame(self, symbol: str, interval, df: pd.DataFrame) -> int:
+        """'datetime' 컬럼이 있는 DataFrame 추가"""
+        stamps = pd.to_datetime(df['datetime']).values.astype('datetime64[s]').astype(np.int64)
+        columns = {'timestamp': stamps}
+        for field in PRICE_FIELDS:
+            if field in df.columns:
+                columns[field] = pd.to_numeric(df[field], errors='coerce').to_numpy(dtype=np.float64)
+            else:
+                columns[field] = np.full(len(df), np.nan)
+        return self.append(symbol, interval, columns)
+
+    def mark_covered(self, symbol: str, interval, start, end):
+        """[start, end] 구간을 조회 완료로 기록 (겹치면 합집합, 아니면 새 구간으로 교체)"""
+        key = self._key(symbol, interval)
+        lo, hi = to_epoch_seconds(start), to_epoch_seconds(end, end_of_day=True)
+        if hi < lo:
+            return
+
+        with self._series_lock(key):
+            meta = self._read_meta(key)
+            covered = meta.get('covered')
+            if covered and lo <= covered[1] + 1 and hi >= covered[0] - 1:
+                lo, hi = min(lo, covered[0]), max(hi, covered[1])
+            meta['covered'] = [lo, hi]
+            self._write_meta(key, meta)
+
+    def delete(self, symbol: str, interval):
+        """종목/주기 데이터 삭제"""
+        key = self._key(symbol, interval)
+        with self._series_lock(key):
+            self._release_maps(key)
+            shutil.rmtree(self._series_dir(key), ignore_errors=True)
+
+    # ------------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------------
+
+    def _open(self, key: Tuple[str, str], rows: int) -> Dict[str, np.ndarray]:
+        """확정 행 수만큼 memmap 열기 (행 수가 같으면 재사용)"""
+        cached = self._maps.get(key)
+        if cached is not None and cached[0] == rows:
+            return cached[1]
+
+        directory = self._series_dir(key)
+        maps: Dict[str, np.ndarray] = {}
+        for name in ('timestamp',) + PRICE_FIELDS:
+            dtype = np.int64 if name == 'timestamp' else np.float64
+            if rows == 0:
+                maps[name] = np.empty(0, dtype=dtype)
+            else:
+                maps[name] = np.memmap(self._column_file(directory, name), dtype=dtype, mode='r', shape=(rows,))
+        self._maps[key] = (rows, maps)
+        return maps
+
+    def rows(self, symbol: str, interval) -> int:
+        """저장된 봉 수"""
+        return self._read_meta(self._key(symbol, interval))['rows']
+
+    def covers(self, symbol: str, interval, start, end) -> bool:
+        """[start, end] 구간을 이미 조회했는지"""
+        covered = self._read_meta(self._key(symbol, interval)).get('covered')
+        if not covered:
+            return False
+        return covered[0] <= to_epoch_seconds(start) and to_epoch_seconds(end, end_of_day=True) <= covered[1]
+
+    def range(self, symbol: str, interval, start=None, end=None) -> Dict[str, np.ndarray]:
+        """
+        구간 조회 (끝 포함)
+
+        Returns:
+            {'timestamp': datetime64[s], 'open', 'high', 'low', 'close', 'volume'}
+            저장 파일의 memmap 뷰 (읽기 전용, 복사 없음)
+        """
+        key = self._key(symbol, interval)
+        with self._series_lock(key):
+            maps = self._open(key, self._read_meta(key)['rows'])
+
+        stamps = maps['timestamp']
+        lo = 0 if start is None else int(np.searchsorted(stamps, to_epoch_seconds(start), side='left'))
+        hi = len(stamps) if end is None else int(
+            np.searchsorted(stamps, to_epoch_seconds(end, end_of_day=True), side='right')
+        )
+
+        result = {'timestamp': stamps[lo:hi].view('datetime64[s]')}
+        for field in PRICE_FIELDS:
+            result[field] = maps[field][lo:hi]
+        return result
+
+    def symbols(self, interval) -> List[str]:
+        """주기별 저장 종목 목록"""
+        directory = self.root / normalize_interval(interval)
+        if not directory.exists():
+            return []
+        return sorted(p.name for p in directory.iterdir() if (p / 'meta.json').exists())
+
+
+class HistoricalDataLoader:
+    """
+    저장소 우선 히스토리컬 데이터 로더
+
+    Usage:
+        loader = get_data_loader()
+        df = loader.load_frame('005930', 5, '20240101', '20240331',
+                               fetch=lambda: chart_api.get_minute_chart('005930', 5, count=0))
+    """
+
+    def __init__(self, store: Optional[OHLCVStore] = None):
+        self.store = store or get_ohlcv_store()
+
+    def covers(self, symbol: str, interval, start, end) -> bool:
+        return self.store.covers(symbol, interval, start, end)
+
+    def ingest(self, symbol: str, interval, bars, start, end) -> int:
+        """
+        조회 결과 저장 + 조회 구간 기록
+
+        받은 봉이 없으면(API 오류/빈 응답) 구간을 기록하지 않고, 받은 봉의 첫~마지막 시각과
+        요청 구간이 겹치는 부분만 완료로 기록한다.
+        오늘 이후 구간은 아직 봉이 늘어날 수 있으므로 어제까지만 완료로 기록한다.
+        """
+        if isinstance(bars, pd.DataFrame):
+            if not len(bars):
+                return 0
+            stamps = pd.to_datetime(bars['datetime']).values.astype('datetime64[s]').astype(np.int64)
+            added = self.store.append_frame(symbol, interval, bars)
+        else:
+            if not bars:
+                return 0
+            columns = bars_to_columns(bars)
+            stamps = columns['timestamp']
+            added = self.store.append(symbol, interval, columns)
+
+        last_bar_end = int(stamps.max())
+        if normalize_interval(interval) == 'daily':
+            last_bar_end += 86400 - 1  # 일봉 시각은 그날 0시
+        today = to_epoch_seconds(datetime.now().strftime('%Y%m%d'))
+        covered_start = max(to_epoch_seconds(start), int(stamps.min()))
+        covered_end = min(to_epoch_seconds(end, end_of_day=True), last_bar_end, today - 1)
+        if covered_end >= covered_start:
+            self.store.mark_covered(
+                symbol, interval,
+                np.datetime64(covered_start, 's').item(), np.datetime64(covered_end, 's').item(),
+            )
+        return added
+
+    def load(
+        self,
+        symbol: str,
+        interval,
+        start,
+        end,
+        fetch: Optional[Callable[[], Any]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        구간 컬럼 조회 (저장소에 없는 구간이면 fetch 결과를 저장한 뒤 조회)
+
+        Args:
+            fetch: 캔들 dict 리스트 또는 'datetime' DataFrame을 반환하는 함수
+        """
+        if fetch is not None and not self.store.covers(symbol, interval, start, end):
+            bars = fetch()
+            added = self.ingest(symbol, interval, bars, start, end)
+            logger.debug(f"{symbol} {normalize_interval(interval)}: {added}개 봉 저장")
+        return self.store.range(symbol, interval, start, end)
+
+    def load_frame(self, symbol: str, interval, start, end, fetch=None) -> pd.DataFrame:
+        """'datetime', open/high/low/close/volume DataFrame"""
+        columns = self.load(symbol, interval, start, end, fetch)
+        frame = {'datetime': pd.to_datetime(columns['timestamp'])}
+        frame.update({field: columns[field] for field in PRICE_FIELDS})
+        return pd.DataFrame(frame)
+
+    def load_candles(self, symbol: str, interval, start, end, fetch=None) -> List[Dict[str, Any]]:
+        """'timestamp'(datetime) 키를 가진 캔들 dict 리스트"""
+        columns = self.load(symbol, interval, start, end, fetch)
+        stamps = columns['timestamp'].astype('datetime64[us]').tolist()
+        values = {field: columns[field].tolist() for field in PRICE_FIELDS}
+        return [
+            {'timestamp': stamp, **{field: values[field][i] for field in PRICE_FIELDS}}
+            for i, stamp in enumerate(stamps)
+        ]
+
+
+_store_instance: Optional[OHLCVStore] = None
+_loader_instance: Optional[HistoricalDataLoader] = None
+_instance_lock = threading.Lock()
+
+
+def get_ohlcv_store() -> OHLCVStore:
+    """공용 OHLCV 저장소 (data/ohlcv)"""
+    global _store_instance
+    if _store_instance is None:
+        with _instance_lock:
+            if _store_instance is None:
+                _store_instance = OHLCVStore()
+    return _store_instance
+
+
+def get_data_loader() -> HistoricalDataLoader:
+    """공용 히스토리컬 데이터 로더"""
+    global _loader_instance
+    if _loader_instance is None:
+        store = get_ohlcv_store()
+        with _instance_lock:
+            if _loader_instance is None:
+                _loader_instance = HistoricalDataLoader(store)
+    return _loader_instance
+
+
+__all__ = [
+    'OHLCVStore',
+    'HistoricalDataLoader',
+    'get_ohlcv_store',
+    'get_data_loader',
+    'normalize_interval',
+    'bars_to_columns',
+    'to_epoch_seconds',
+    'PRICE_FIELDS',
+]
@@ -1,5 +1,6 @@
 from pathlib import Path
 from typing import Dict
+import hashlib
 import logging
 
 logger = logging.getLogger(__name__)
@@ -31,6 +32,12 @@ def load_prompt(prompt_name: str, reload: bool = False) -> str:
         raise
 
 
+def get_prompt_version(prompt_name: str) -> str:
+    """프롬프트 템플릿 버전 (템플릿 내용 해시, 파일이 바뀌면 달라짐)"""
+    prompt = load_prompt(prompt_name)
+    return hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:12]
+
+
 def clear_prompt_cache():
     global _PROMPT_CACHE
     _PROMPT_CACHE = {}
@@ -11,6 +11,8 @@ from functools import wraps
 import hashlib
 import logging
 
+from utils.data_cache import LRUCache
+
 logger = logging.getLogger(__name__)
 
 # Import config constants
@@ -60,7 +62,7 @@ class RedisCacheManager:
             port: Redis 포트 (default: from config.constants.PORTS['redis'])
             db: Redis 데이터베이스 번호
             password: Redis 비밀번호
-            use_fallback: Redis 없을 때 메모리 캐시 사용
+            use_fallback: Redis 없을 때 메모리 캐시 사용 (LRUCache, 개수/메모리 상한)
         """
         # Use config defaults if not specified
         if host is None:
@@ -69,7 +71,11 @@ class RedisCacheManager:
             port = _REDIS_PORT
 
         self.redis_client = None
-        self.fallback_cache = {} if use_fallback else None
+        self.fallback_cache = LRUCache(
+            max_size=2000,
+            max_memory_mb=64,
+            default_ttl_seconds=0  # TTL 미지정 시 만료 없음 (Redis SET과 동일)
+        ) if use_fallback else None
         self.stats = {
             'hits': 0,
             'misses': 0,
@@ -126,16 +132,10 @@ class RedisCacheManager:
 
             elif self.fallback_cache is not None:
                 # 메모리 캐시 조회
-                if key in self.fallback_cache:
-                    data, expiry = self.fallback_cache[key]
-
-                    # 만료 확인
-                    if expiry is None or expiry > self._current_timestamp():
-                        self.stats['hits'] += 1
-                        return data
-                    else:
-                        # 만료됨 - 삭제
-                        del self.fallback_cache[key]
+                value = self.fallback_cache.get(key)
+                if value is not None:
+                    self.stats['hits'] += 1
+                    return value
 
                 self.stats['misses'] += 1
                 return default
@@ -180,11 +180,8 @@ class RedisCacheManager:
 
             elif self.fallback_cache is not None:
                 # 메모리 캐시 저장
-                expiry = None
-                if ttl:
-                    expiry = self._current_timestamp() + ttl
-
-                self.fallback_cache[key] = (value, expiry)
+                if not self.fallback_cache.set(key, value, ttl_seconds=ttl or 0):
+                    return False
                 self.stats['sets'] += 1
                 return True
 
@@ -212,8 +209,7 @@ class RedisCacheManager:
                 return result > 0
 
             elif self.fallback_cache is not None:
-                if key in self.fallback_cache:
-                    del self.fallback_cache[key]
+                if self.fallback_cache.delete(key):
                     self.stats['deletes'] += 1
                     return True
 
@@ -249,17 +245,10 @@ class RedisCacheManager:
 
             elif self.fallback_cache is not None:
                 if pattern:
-                    # 패턴 매칭 (간단한 구현)
-                    pattern_prefix = pattern.replace('*', '')
-                    keys_to_delete = [
-                        k for k in self.fallback_cache.keys()
-                        if k.startswith(pattern_prefix)
-                    ]
-                    for key in keys_to_delete:
-                        del self.fallback_cache[key]
-                    return len(keys_to_delete)
+                    # 패턴 매칭 (프리픽스 기준)
+                    return self.fallback_cache.invalidate_by_prefix(pattern.replace('*', ''))
                 else:
-                    count = len(self.fallback_cache)
+                    count = self.fallback_cache.get_stats().entry_count
                     self.fallback_cache.clear()
                     return count
 
@@ -277,12 +266,7 @@ class RedisCacheManager:
                 return self.redis_client.exists(key) > 0
 
             elif self.fallback_cache is not None:
-                if key in self.fallback_cache:
-                    _, expiry = self.fallback_cache[key]
-                    if expiry is None or expiry > self._current_timestamp():
-                        return True
-                    else:
-                        del self.fallback_cache[key]
+                return self.fallback_cache.get(key) is not None
 
             return False
 
@@ -305,11 +289,6 @@ class RedisCacheManager:
             'backend': 'redis' if self.redis_client else 'memory'
         }
 
-    def _current_timestamp(self) -> int:
-        """현재 타임스탬프 (초)"""
-        import time
-        return int(time.time())
-
     def _generate_cache_key(self, func_name: str, args: tuple, kwargs: dict) -> str:
         """캐시 키 생성"""
 
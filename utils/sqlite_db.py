@@ -0,0 +1,349 @@
+"""
+utils/sqlite_db.py
+공용 SQLite 접근 계층 (WAL + 스레드별 장수명 연결 + 그룹 커밋 쓰기 스레드)
+
+- 모든 연결에 같은 PRAGMA 적용: WAL, synchronous=NORMAL, busy_timeout, 메모리 temp/cache, mmap
+- 스레드마다 연결 하나를 계속 재사용 → sqlite3 문장 캐시(cached_statements)로 prepared statement 재사용
+  (종료된 스레드의 연결은 새 연결을 열 때 닫아 스레드를 계속 새로 만드는 호출자에서도 누적되지 않음)
+- write()/write_many()는 큐에 넣고 즉시 반환, 쓰기 스레드가 commit_interval 동안 모아
+  같은 SQL은 executemany로 묶어 트랜잭션 하나로 커밋 (거래일 대량 쓰기의 fsync 횟수 감소)
+- query()는 대기 중인 쓰기를 먼저 반영한 뒤 읽음 (같은 프로세스 내 쓰기 → 읽기 순서 보장)
+- lastrowid가 필요하거나 여러 문장을 원자적으로 처리할 때는 transaction() 사용
+- 같은 파일은 get_database()로 인스턴스 하나를 공유 (쓰기 스레드도 하나)
+- ':memory:'는 연결 하나를 잠금으로 공유
+
+SQLAlchemy 엔진은 connect 이벤트에서 configure_connection()을 호출해 같은 PRAGMA를 적용한다.
+"""
+import atexit
+import logging
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PRAGMAS: Dict[str, Any] = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,
+    'temp_store': 'MEMORY',
+    'cache_size': -16000,       # 16MB
+    'mmap_size': 134217728,     # 128MB
+}
+
+STATEMENT_CACHE_SIZE = 256
+
+
+def configure_connection(conn, pragmas: Optional[Dict[str, Any]] = None) -> None:
+    """연결에 표준 PRAGMA 적용 (sqlite3 / SQLAlchemy DBAPI 연결 공용)"""
+    cursor = conn.cursor()
+    try:
+        for name, value in (DEFAULT_PRAGMAS if pragmas is None else pragmas).items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def connect(db_path: str, pragmas: Optional[Dict[str, Any]] = None, **kwargs) -> sqlite3.Connection:
+    """PRAGMA가 적용된 단일 연결 (스크립트/일회성 작업용)"""
+    if db_path != ':memory:':
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    kwargs.setdefault('cached_statements', STATEMENT_CACHE_SIZE)
+    conn = sqlite3.connect(db_path, **kwargs)
+    configure_connection(conn, pragmas)
+    return conn
+
+
+class SQLiteDatabase:
+    """
+    WAL 모드 SQLite 접근 계층
+
+    Usage:
+        db = get_database('data/virtual_trading/trades.db')
+        db.executescript(SCHEMA)
+        db.write('INSERT INTO trades (...) VALUES (?, ?)', (a, b))            # 그룹 커밋
+        db.write_many('UPDATE positions SET price = ? WHERE id = ?', rows)    # executemany
+        with db.transaction() as conn:                                         # 즉시 커밋
+            position_id = conn.execute('INSERT ...', params).lastrowid
+        rows = db.query('SELECT * FROM trades WHERE strategy = ?', (name,))
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        pragmas: Optional[Dict[str, Any]] = None,
+        commit_interval: float = 0.05,
+        max_batch: int = 1000,
+    ):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (':memory:' 가능)
+            pragmas: PRAGMA 설정 (None이면 DEFAULT_PRAGMAS)
+            commit_interval: 쓰기 스레드가 한 트랜잭션으로 모으는 최대 대기 시간 (초)
+            max_batch: 한 트랜잭션에 넣을 최대 문장 수
+        """
+        self.db_path = str(db_path)
+        self.pragmas = dict(DEFAULT_PRAGMAS if pragmas is None else pragmas)
+        self.commit_interval = commit_interval
+        self.max_batch = max_batch
+        self.memory = self.db_path == ':memory:'
+        if self.memory:
+            self.pragmas.pop('journal_mode', None)
+            self.pragmas.pop('mmap_size', None)
+        else:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._local = threading.local()
+        self._connections: List[Tuple[threading.Thread, sqlite3.Connection]] = []  # (소유 스레드, 연결)
+        self._connections_lock = threading.Lock()
+        self._shared: Optional[sqlite3.Connection] = None
+        self._shared_lock = threading.RLock()
+
+        self._queue: Deque[Tuple[str, List[Sequence[Any]]]] = deque()
+        self._cv = threading.Condition()
+        self._queued = 0
+        self._done = 0
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+
+        self.stats = {'statements': 0, 'commits': 0, 'failed': 0}
+
+    # ------------------------------------------------------------------
+    # 연결
+    # ------------------------------------------------------------------
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            # 연결은 소유 스레드만 사용하지만, 종료된 스레드의 연결을 다른 스레드에서 닫을 수 있어야 함
+            check_same_thread=False,
+            isolation_level=None,  # 트랜잭션은 BEGIN IMMEDIATE로 명시
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        configure_connection(conn, self.pragmas)
+        with self._connections_lock:
+            self._close_dead_connections()
+            self._connections.append((threading.current_thread(), conn))
+        return conn
+
+    def _close_dead_connections(self) -> None:
+        """종료된 스레드의 연결 닫기 (_connections_lock 보유 상태에서 호출)"""
+        alive = []
+        for thread, conn in self._connections:
+            if thread.is_alive():
+                alive.append((thread, conn))
+                continue
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._connections = alive
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """현재 스레드의 장수명 연결"""
+        if self.memory:
+            with self._shared_lock:
+                if self._shared is None:
+                    self._shared = self._open()
+                yield self._shared
+            return
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._open()
+        yield conn
+
+    # ------------------------------------------------------------------
+    # 읽기 / 동기 쓰기
+    # ------------------------------------------------------------------
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        """조회 (대기 중인 쓰기를 먼저 반영)"""
+        self.flush()
+        with self.connection() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def query_one(self, sql: str, params: Sequence[Any] = ()) -> Optional[sqlite3.Row]:
+        rows = self.query(sql, params)
+        return rows[0] if rows else None
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        BEGIN IMMEDIATE ~ COMMIT (예외 시 ROLLBACK). 대기 중인 쓰기가 먼저 반영된다.
+        블록 안에서는 넘겨받은 conn만 사용 (쓰기 잠금을 쥔 채 큐를 기다리지 않도록 flush는 생략됨)
+        """
+        self.flush()
+        with self.connection() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            self._local.in_transaction = True
+            try:
+                yield conn
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            else:
+                conn.execute('COMMIT')
+                self.stats['commits'] += 1
+            finally:
+                self._local.in_transaction = False
+
+    def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> int:
+        """executemany 한 번 + 커밋 한 번 (완료까지 대기)"""
+        with self.transaction() as conn:
+            return conn.executemany(sql, rows).rowcount
+
+    def executescript(self, script: str) -> None:
+        """스키마 생성 등 DDL 스크립트"""
+        self.flush()
+        with self.connection() as conn:
+            conn.executescript(script)
+
+    # ------------------------------------------------------------------
+    # 비동기 그룹 커밋 쓰기
+    # ------------------------------------------------------------------
+
+    def write(self, sql: str, params: Sequence[Any] = ()) -> None:
+        """쓰기 큐에 추가 (쓰기 스레드가 다른 쓰기와 묶어 커밋)"""
+        self._enqueue(sql, [params])
+
+    def write_many(self, sql: str, rows: Iterable[Sequence[Any]]) -> None:
+        """executemany 대상 행들을 쓰기 큐에 추가"""
+        rows = list(rows)
+        if rows:
+            self._enqueue(sql, rows)
+
+    def _enqueue(self, sql: str, rows: List[Sequence[Any]]) -> None:
+        with self._cv:
+            if self._closed:
+                raise RuntimeError(f"닫힌 데이터베이스: {self.db_path}")
+            self._queue.append((sql, rows))
+            self._queued += 1
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._writer_loop, name=f"SQLiteWriter[{Path(self.db_path).name}]", daemon=True
+                )
+                self._writer.start()
+            self._cv.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """지금까지 큐에 들어간 쓰기가 커밋될 때까지 대기"""
+        if getattr(self._local, 'in_transaction', False):
+            return False
+        with self._cv:
+            target = self._queued
+            if self._done >= target:
+                return True
+            if threading.current_thread() is self._writer:
+                return False
+            return self._cv.wait_for(lambda: self._done >= target, timeout)
+
+    def _writer_loop(self) -> None:
+        while True:
+            with self._cv:
+                self._cv.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    return
+                # 첫 항목 이후 commit_interval 동안 더 모음
+                deadline = time.monotonic() + self.commit_interval
+                while len(self._queue) < self.max_batch and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._cv.wait(remaining):
+                        break
+                batch = [self._queue.popleft() for _ in range(min(len(self._queue), self.max_batch))]
+
+            self._commit_batch(batch)
+
+            with self._cv:
+                self._done += len(batch)
+                self._cv.notify_all()
+
+    def _commit_batch(self, batch: List[Tuple[str, List[Sequence[Any]]]]) -> None:
+        # 연속된 같은 SQL은 executemany 한 번으로
+        groups: List[Tuple[str, List[Sequence[Any]]]] = []
+        for sql, rows in batch:
+            if groups and groups[-1][0] == sql:
+                groups[-1][1].extend(rows)
+            else:
+                groups.append((sql, list(rows)))
+
+        with self.connection() as conn:
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                for sql, rows in groups:
+                    conn.executemany(sql, rows)
+                conn.execute('COMMIT')
+                self.stats['commits'] += 1
+                self.stats['statements'] += sum(len(rows) for _, rows in groups)
+                return
+            except sqlite3.Error as e:
+                if conn.in_transaction:
+                    conn.execute('ROLLBACK')
+                logger.warning(f"그룹 커밋 실패, 문장별 재시도: {self.db_path} - {e}")
+
+            # 실패한 문장만 버리고 나머지는 반영
+            for sql, rows in groups:
+                try:
+                    conn.execute('BEGIN IMMEDIATE')
+                    conn.executemany(sql, rows)
+                    conn.execute('COMMIT')
+                    self.stats['commits'] += 1
+                    self.stats['statements'] += len(rows)
+                except sqlite3.Error as e:
+                    if conn.in_transaction:
+                        conn.execute('ROLLBACK')
+                    self.stats['failed'] += len(rows)
+                    logger.error(f"SQLite 쓰기 실패: {e} - {sql.split()[0:3]}")
+
+    # ------------------------------------------------------------------
+    # 종료
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        """대기 중인 쓰기 반영 후 쓰기 스레드와 모든 연결 종료"""
+        self.flush()
+        with self._cv:
+            self._closed = True
+            self._cv.notify_all()
+        if self._writer is not None:
+            self._writer.join(timeout=5)
+        with self._connections_lock:
+            for _, conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections.clear()
+        self._local = threading.local()
+        self._shared = None
+
+
+_databases: Dict[str, SQLiteDatabase] = {}
+_databases_lock = threading.Lock()
+
+
+def get_database(db_path: str, **kwargs) -> SQLiteDatabase:
+    """파일별 공유 SQLiteDatabase (':memory:'는 매번 새 인스턴스)"""
+    if str(db_path) == ':memory:':
+        return SQLiteDatabase(':memory:', **kwargs)
+    key = str(Path(db_path).resolve())
+    with _databases_lock:
+        db = _databases.get(key)
+        if db is None or db._closed:
+            db = _databases[key] = SQLiteDatabase(str(db_path), **kwargs)
+        return db
+
+
+@atexit.register
+def _flush_all() -> None:
+    """종료 시 큐에 남은 쓰기 반영"""
+    for db in list(_databases.values()):
+        try:
+            db.flush(timeout=5)
+        except Exception:
+            pass
@@ -0,0 +1,242 @@
+"""
+utils/startup_profiler.py
+시작 시간 프로파일러
+
+- 모듈별 import 시간 (자체 시간 / 하위 import 포함 누적 시간)
+- 컴포넌트별 초기화 시간 (lap 구간)
+- 시작 시간 예산(budget) 초과 시 가장 느린 구간 경고
+
+import 시간 측정은 프로파일 모드에서만 켜진다:
+    AUTOTRADE_PROFILE_STARTUP=1 python main.py
+    python main.py --profile-startup
+"""
+import importlib.abc
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from utils.logger_new import get_logger
+
+logger = get_logger()
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """exec_module 시간을 재는 로더 래퍼 (실행 후 원래 로더로 복구)"""
+
+    def __init__(self, loader, fullname: str, profiler: 'StartupProfiler'):
+        self._loader = loader
+        self._fullname = fullname
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._enter_import()
+        started = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit_import(self._fullname, time.perf_counter() - started)
+            module.__loader__ = self._loader
+            if getattr(module, '__spec__', None) is not None:
+                module.__spec__.loader = self._loader
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _ImportTimingFinder(importlib.abc.MetaPathFinder):
+    """다른 finder가 찾은 spec의 로더를 _TimedLoader로 감싸는 meta path finder"""
+
+    def __init__(self, profiler: 'StartupProfiler'):
+        self._profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._local, 'searching', False):
+            return None
+        self._local.searching = True
+        try:
+            spec = None
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+        finally:
+            self._local.searching = False
+
+        if spec is None or spec.loader is None or not hasattr(spec.loader, 'exec_module'):
+            return spec
+        spec.loader = _TimedLoader(spec.loader, fullname, self._profiler)
+        return spec
+
+
+class StartupProfiler:
+    """
+    시작 시간 프로파일러
+
+    Usage:
+        profiler = get_startup_profiler()
+        profiler.install_import_hook()      # 프로파일 모드일 때만
+        ...
+        profiler.lap('REST API 클라이언트')  # 직전 lap 이후 경과 시간 기록
+        profiler.report()
+    """
+
+    def __init__(self, enabled: bool = False, budget_seconds: Optional[float] = None, top_n: int = 20):
+        """
+        Args:
+            enabled: 프로파일 모드 (import 시간 측정 + 상세 보고)
+            budget_seconds: 시작 시간 예산 (초과 시 경고, None이면 검사 안 함)
+            top_n: 보고서에 표시할 느린 모듈/컴포넌트 수
+        """
+        self.enabled = enabled
+        self.budget_seconds = budget_seconds
+        self.top_n = top_n
+
+        self.started_at = time.perf_counter()
+        self._last_lap = self.started_at
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._finder: Optional[_ImportTimingFinder] = None
+
+        # 모듈 → (자체 시간, 누적 시간)
+        self.imports: Dict[str, Tuple[float, float]] = {}
+        # (컴포넌트, 소요 시간) 기록 순서
+        self.components: List[Tuple[str, float]] = []
+
+    # ------------------------------------------------------------------
+    # import 시간
+    # ------------------------------------------------------------------
+
+    def install_import_hook(self) -> None:
+        """이후 import되는 모듈의 시간 측정 시작"""
+        if self._finder is None:
+            self._finder = _ImportTimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def remove_import_hook(self) -> None:
+        if self._finder is not None:
+            try:
+                sys.meta_path.remove(self._finder)
+            except ValueError:
+                pass
+            self._finder = None
+
+    def record_import(self, name: str, seconds: float) -> None:
+        """훅 설치 전 구간 등 직접 잰 import 시간 기록"""
+        with self._lock:
+            self.imports[name] = (seconds, seconds)
+
+    def _enter_import(self) -> None:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(0.0)
+
+    def _exit_import(self, name: str, elapsed: float) -> None:
+        stack = self._local.stack
+        children = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        with self._lock:
+            self.imports[name] = (max(0.0, elapsed - children), elapsed)
+
+    # ------------------------------------------------------------------
+    # 컴포넌트 초기화 시간
+    # ------------------------------------------------------------------
+
+    def reset_lap(self) -> None:
+        self._last_lap = time.perf_counter()
+
+    def lap(self, component: str) -> float:
+        """직전 lap 이후 경과 시간을 component 초기화 시간으로 기록"""
+        now = time.perf_counter()
+        elapsed = now - self._last_lap
+        self._last_lap = now
+        with self._lock:
+            self.components.append((component, elapsed))
+        return elapsed
+
+    def record_component(self, component: str, seconds: float) -> None:
+        """lap 구간 밖(백그라운드 스레드 등)에서 잰 초기화 시간 기록"""
+        with self._lock:
+            self.components.append((component, seconds))
+
+    @property
+    def elapsed(self) -> float:
+        """프로파일러 생성(프로세스 시작) 이후 경과 시간"""
+        return time.perf_counter() - self.started_at
+
+    # ------------------------------------------------------------------
+    # 보고
+    # ------------------------------------------------------------------
+
+    def slowest_imports(self, n: Optional[int] = None) -> List[Tuple[str, float, float]]:
+        """자체 시간 기준 느린 모듈 [(모듈, 자체, 누적)]"""
+        with self._lock:
+            items = [(name, own, total) for name, (own, total) in self.imports.items()]
+        items.sort(key=lambda item: item[1], reverse=True)
+        return items[:n or self.top_n]
+
+    def slowest_components(self, n: Optional[int] = None) -> List[Tuple[str, float]]:
+        with self._lock:
+            items = list(self.components)
+        items.sort(key=lambda item: item[1], reverse=True)
+        return items[:n or self.top_n]
+
+    def format_report(self) -> str:
+        lines = [f"시작 시간: {self.elapsed:.2f}초"]
+        if self.budget_seconds is not None:
+            lines[0] += f" (예산 {self.budget_seconds:.1f}초)"
+
+        if self.components:
+            lines.append("컴포넌트 초기화 시간:")
+            for name, seconds in self.components:
+                lines.append(f"  {seconds * 1000:9.1f}ms  {name}")
+
+        if self.imports:
+            lines.append(f"import 시간 상위 {self.top_n}개 (자체 / 누적):")
+            for name, own, total in self.slowest_imports():
+                lines.append(f"  {own * 1000:9.1f}ms / {total * 1000:9.1f}ms  {name}")
+        return "\n".join(lines)
+
+    def report(self) -> None:
+        """시작 시간 요약 로그 (프로파일 모드면 상세 보고, 예산 초과면 경고)"""
+        elapsed = self.elapsed
+        over_budget = self.budget_seconds is not None and elapsed > self.budget_seconds
+
+        if self.enabled:
+            logger.info("\n" + self.format_report())
+        elif over_budget:
+            slowest = ", ".join(f"{name} {seconds:.1f}초" for name, seconds in self.slowest_components(3))
+            logger.warning(
+                f"시작 시간 예산 초과: {elapsed:.1f}초 > {self.budget_seconds:.1f}초 (느린 구간: {slowest})"
+            )
+        else:
+            logger.info(f"시작 시간: {elapsed:.2f}초")
+
+
+_startup_profiler: Optional[StartupProfiler] = None
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """프로세스 공용 시작 시간 프로파일러 (config.settings.STARTUP_PROFILE 설정)"""
+    global _startup_profiler
+    if _startup_profiler is None:
+        from config.settings import STARTUP_PROFILE
+
+        enabled = STARTUP_PROFILE['ENABLED'] or '--profile-startup' in sys.argv
+        _startup_profiler = StartupProfiler(
+            enabled=enabled,
+            budget_seconds=STARTUP_PROFILE['BUDGET_SECONDS'],
+            top_n=STARTUP_PROFILE['TOP_N']
+        )
+    return _startup_profiler
+
+
+__all__ = ['StartupProfiler', 'get_startup_profiler']
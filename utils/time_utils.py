@@ -106,13 +106,14 @@ def is_market_hours(current_time: Optional[time] = None) -> bool:
     현재 시간이 정규 거래 시간인지 확인
 
     Args:
-        current_time: 확인할 시간 (None이면 현재 시간)
+        current_time: 확인할 시간 (None이면 현재 시각, 휴장일 반영)
 
     Returns:
         거래 시간 여부
     """
     if current_time is None:
-        current_time = datetime.now().time()
+        from utils.trading_calendar import get_trading_calendar
+        return get_trading_calendar().current_session().is_regular
 
     market_open = get_market_open_time()
     market_close = get_market_close_time()
@@ -150,7 +151,7 @@ def is_active_trading_hours(current_time: Optional[time] = None) -> bool:
         활발한 거래 시간 여부
     """
     if current_time is None:
-        current_time = datetime.now().time()
+        return is_market_hours() and not is_lunch_time()
 
     return is_market_hours(current_time) and not is_lunch_time(current_time)
 
@@ -186,12 +187,17 @@ def get_time_until_market_open() -> timedelta:
     Returns:
         남은 시간 (timedelta)
     """
+    from utils.trading_calendar import get_trading_calendar
+
+    calendar = get_trading_calendar()
     now = datetime.now()
-    market_open = get_market_open_datetime()
+    today = now.date()
+    market_open = datetime.combine(today, calendar.regular_hours(today)[0])
 
-    # 이미 개장 시간이 지났으면 다음 날 개장 시간으로
-    if now >= market_open:
-        market_open += timedelta(days=1)
+    # 휴장일이거나 이미 개장 시간이 지났으면 다음 거래일 개장 시간으로
+    if not calendar.is_trading_day(today) or now >= market_open:
+        next_day = calendar.next_trading_day(today)
+        market_open = datetime.combine(next_day, calendar.regular_hours(next_day)[0])
 
     return market_open - now
 
@@ -0,0 +1,385 @@
+"""
+utils/trading_calendar.py
+KRX 거래일 캘린더
+
+- 휴장일/단축·지연 개장일을 미리 계산한 거래일 테이블
+- 세션 조회 (프리마켓, 정규장, 종가 결정, NXT 애프터마켓 등)
+- 현재 세션 캐시 (다음 세션 경계 시각까지 재계산 없음)
+- 거래일 산술 (이전/다음 N 거래일, 기간 내 거래일)
+
+휴장일 테이블은 매년 KRX 휴장일 공시에 맞춰 갱신한다.
+테이블 범위 밖의 연도는 주말만 휴장으로 본다.
+"""
+import bisect
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.logger_new import get_logger
+
+logger = get_logger()
+
+
+class MarketSession(str, Enum):
+    """장 운영 세션 (NXT 포함)"""
+    PRE_MARKET = "pre_market"              # NXT 프리마켓 (지정가만)
+    PRE_MARKET_CLOSE = "pre_market_close"  # 프리마켓 종료 ~ 정규장 시작 대기
+    REGULAR = "regular"                    # 정규장 (NXT 메인마켓)
+    CLOSING_AUCTION = "closing_auction"    # KRX 종가 결정 (취소만 가능)
+    NXT_BREAK = "nxt_break"                # NXT 일시 중단
+    AFTER_HOURS = "after_hours"            # NXT 애프터마켓 (지정가만)
+    CLOSED = "closed"                      # 장 시작 전/종료 후
+    HOLIDAY = "holiday"                    # 주말/휴장일
+
+
+# KRX 휴장일 (주말 제외)
+KRX_HOLIDAYS = frozenset(date.fromisoformat(d) for d in (
+    # 2024
+    '2024-01-01', '2024-02-09', '2024-02-12', '2024-03-01', '2024-04-10',
+    '2024-05-01', '2024-05-06', '2024-05-15', '2024-06-06', '2024-08-15',
+    '2024-09-16', '2024-09-17', '2024-09-18', '2024-10-01', '2024-10-03',
+    '2024-10-09', '2024-12-25', '2024-12-31',
+    # 2025
+    '2025-01-01', '2025-01-27', '2025-01-28', '2025-01-29', '2025-01-30',
+    '2025-03-03', '2025-05-01', '2025-05-05', '2025-05-06', '2025-06-03',
+    '2025-06-06', '2025-08-15', '2025-10-03', '2025-10-06', '2025-10-07',
+    '2025-10-08', '2025-10-09', '2025-12-25', '2025-12-31',
+    # 2026
+    '2026-01-01', '2026-02-16', '2026-02-17', '2026-02-18', '2026-03-02',
+    '2026-05-01', '2026-05-05', '2026-05-25', '2026-06-03', '2026-08-17',
+    '2026-09-24', '2026-09-25', '2026-10-05', '2026-10-09', '2026-12-25',
+    '2026-12-31',
+))
+
+# 정규장 시간이 다른 날 (연초 개장일 10:00 개장, 수능일 10:00~16:30)
+KRX_SPECIAL_SESSIONS: Dict[date, Tuple[time, time]] = {
+    date(2024, 1, 2): (time(10, 0), time(15, 30)),
+    date(2024, 11, 14): (time(10, 0), time(16, 30)),
+    date(2025, 1, 2): (time(10, 0), time(15, 30)),
+    date(2025, 11, 13): (time(10, 0), time(16, 30)),
+    date(2026, 1, 2): (time(10, 0), time(15, 30)),
+    date(2026, 11, 19): (time(10, 0), time(16, 30)),
+}
+
+REGULAR_OPEN = time(9, 0)
+REGULAR_CLOSE = time(15, 30)
+NXT_OPEN = time(8, 0)
+NXT_CLOSE = time(20, 0)
+# 프리마켓 종료 ~ 정규장 시작, 종가 결정, NXT 일시 중단 구간 길이
+_AUCTION_GAP = timedelta(minutes=10)
+
+# 세션별 시장 상태 (Analyzer.get_market_status 호환 필드)
+_SESSION_STATUS = {
+    MarketSession.PRE_MARKET: (True, 'NXT 프리마켓', 'NXT 프리마켓 운영 중 (지정가만)', 'limit_only', False),
+    MarketSession.PRE_MARKET_CLOSE: (False, 'NXT 프리마켓 종료', 'NXT 메인마켓 시작 대기', 'all', False),
+    MarketSession.REGULAR: (True, 'NXT 메인마켓', 'NXT 메인마켓 운영 중', 'all', False),
+    MarketSession.CLOSING_AUCTION: (True, 'KRX 종가 결정', 'KRX 종가 결정 시간 (취소만 가능)', 'all', True),
+    MarketSession.NXT_BREAK: (False, 'NXT 일시 중단', 'NXT 애프터마켓 시작 대기', 'all', False),
+    MarketSession.AFTER_HOURS: (True, 'NXT 애프터마켓', 'NXT 애프터마켓 운영 중 (지정가만)', 'limit_only', False),
+}
+
+
+@dataclass(frozen=True)
+class SessionInfo:
+    """세션 조회 결과 (start <= 시각 < end 동안 유효)"""
+    session: MarketSession
+    trading_day: date
+    start: datetime
+    end: datetime
+
+    @property
+    def is_regular(self) -> bool:
+        """정규장 (종가 결정 포함)"""
+        return self.session in (MarketSession.REGULAR, MarketSession.CLOSING_AUCTION)
+
+    @property
+    def is_nxt(self) -> bool:
+        """NXT 단독 시간대 (프리마켓/애프터마켓 및 그 사이 대기 구간)"""
+        return self.session in (
+            MarketSession.PRE_MARKET, MarketSession.PRE_MARKET_CLOSE,
+            MarketSession.NXT_BREAK, MarketSession.AFTER_HOURS,
+        )
+
+    @property
+    def is_trading(self) -> bool:
+        """정규장 + NXT 전체 거래 시간 (08:00 ~ 20:00)"""
+        return self.is_regular or self.is_nxt
+
+
+def _combine(day: date, at: time, offset: timedelta = timedelta(0)) -> datetime:
+    return datetime.combine(day, at) + offset
+
+
+class TradingCalendar:
+    """
+    KRX 거래일 캘린더
+
+    Usage:
+        calendar = get_trading_calendar()
+        calendar.current_session().session      # MarketSession.REGULAR
+        calendar.previous_trading_days(20)       # 최근 20 거래일
+    """
+
+    def __init__(
+        self,
+        holidays: Iterable[date] = KRX_HOLIDAYS,
+        special_sessions: Optional[Dict[date, Tuple[time, time]]] = None,
+        start: date = date(2015, 1, 1),
+        end: date = date(2035, 12, 31)
+    ):
+        """
+        Args:
+            holidays: 휴장일 (주말 제외)
+            special_sessions: 정규장 시간이 다른 날 {날짜: (개장, 폐장)}
+            start, end: 거래일 테이블 범위
+        """
+        self.holidays = frozenset(holidays)
+        self.special_sessions = dict(KRX_SPECIAL_SESSIONS if special_sessions is None else special_sessions)
+        self.start = start
+        self.end = end
+
+        # 거래일 테이블: 정렬된 서수 배열 + 서수 → 인덱스
+        ordinals = []
+        day = start
+        while day <= end:
+            if day.weekday() < 5 and day not in self.holidays:
+                ordinals.append(day.toordinal())
+            day += timedelta(days=1)
+        self._ordinals = ordinals
+        self._index = {ordinal: i for i, ordinal in enumerate(ordinals)}
+
+        self._lock = threading.Lock()
+        self._schedules: Dict[date, List[Tuple[datetime, datetime, MarketSession]]] = {}
+        self._current: Optional[SessionInfo] = None
+        self._status_cache: Optional[Tuple[SessionInfo, Dict[str, Any]]] = None
+
+    # ------------------------------------------------------------------
+    # 거래일
+    # ------------------------------------------------------------------
+
+    def _check_range(self, day: date) -> None:
+        if not self.start <= day <= self.end:
+            raise ValueError(f"거래일 테이블 범위 밖: {day} ({self.start} ~ {self.end})")
+
+    def is_trading_day(self, day: date) -> bool:
+        if isinstance(day, datetime):
+            day = day.date()
+        if self.start <= day <= self.end:
+            return day.toordinal() in self._index
+        return day.weekday() < 5
+
+    def is_holiday(self, day: date) -> bool:
+        """주말 또는 휴장일"""
+        return not self.is_trading_day(day)
+
+    def _position(self, day: date) -> int:
+        """day 이하 가장 최근 거래일의 인덱스 (없으면 -1)"""
+        self._check_range(day)
+        return bisect.bisect_right(self._ordinals, day.toordinal()) - 1
+
+    def previous_trading_day(self, day: date) -> date:
+        """day 이전(당일 제외) 가장 최근 거래일"""
+        return self.previous_trading_days(1, day - timedelta(days=1))[0]
+
+    def next_trading_day(self, day: date) -> date:
+        """day 이후(당일 제외) 첫 거래일"""
+        self._check_range(day)
+        i = bisect.bisect_right(self._ordinals, day.toordinal())
+        if i >= len(self._ordinals):
+            raise ValueError(f"거래일 테이블 범위 밖: {day} 이후")
+        return date.fromordinal(self._ordinals[i])
+
+    def previous_trading_days(self, n: int, end: Optional[date] = None) -> List[date]:
+        """
+        end 이하 최근 n 거래일 (최근 날짜부터)
+
+        Args:
+            n: 거래일 수
+            end: 기준일 (포함, None이면 오늘)
+        """
+        end = end or date.today()
+        i = self._position(end)
+        if i + 1 < n:
+            raise ValueError(f"거래일 테이블 범위 밖: {end} 이전 {n} 거래일")
+        return [date.fromordinal(o) for o in reversed(self._ordinals[i + 1 - n:i + 1])]
+
+    def trading_days_between(self, start: date, end: date) -> List[date]:
+        """start ~ end (양끝 포함) 거래일 (오래된 날짜부터)"""
+        self._check_range(start)
+        self._check_range(end)
+        lo = bisect.bisect_left(self._ordinals, start.toordinal())
+        hi = bisect.bisect_right(self._ordinals, end.toordinal())
+        return [date.fromordinal(o) for o in self._ordinals[lo:hi]]
+
+    def count_trading_days(self, start: date, end: date) -> int:
+        """start ~ end (양끝 포함) 거래일 수"""
+        self._check_range(start)
+        self._check_range(end)
+        lo = bisect.bisect_left(self._ordinals, start.toordinal())
+        hi = bisect.bisect_right(self._ordinals, end.toordinal())
+        return max(0, hi - lo)
+
+    def last_trading_date(self, now: Optional[datetime] = None) -> date:
+        """
+        시장 탐색을 위한 최근 거래일
+
+        - 거래일 08:00 이후 → 당일
+        - 거래일 08:00 이전 / 휴장일 → 직전 거래일
+        """
+        now = now or datetime.now()
+        today = now.date()
+        if self.is_trading_day(today) and now.time() >= NXT_OPEN:
+            return today
+        return self.previous_trading_day(today)
+
+    # ------------------------------------------------------------------
+    # 세션
+    # ------------------------------------------------------------------
+
+    def regular_hours(self, day: date) -> Tuple[time, time]:
+        """정규장 (개장, 폐장) 시각"""
+        return self.special_sessions.get(day, (REGULAR_OPEN, REGULAR_CLOSE))
+
+    def _schedule(self, day: date) -> List[Tuple[datetime, datetime, MarketSession]]:
+        """거래일 세션 구간 [(시작, 종료, 세션)] (날짜별 캐시)"""
+        schedule = self._schedules.get(day)
+        if schedule is None:
+            open_at, close_at = self.regular_hours(day)
+            boundaries = [
+                (_combine(day, NXT_OPEN), MarketSession.PRE_MARKET),
+                (_combine(day, open_at, -_AUCTION_GAP), MarketSession.PRE_MARKET_CLOSE),
+                (_combine(day, open_at), MarketSession.REGULAR),
+                (_combine(day, close_at, -_AUCTION_GAP), MarketSession.CLOSING_AUCTION),
+                (_combine(day, close_at), MarketSession.NXT_BREAK),
+                (_combine(day, close_at, _AUCTION_GAP), MarketSession.AFTER_HOURS),
+                (_combine(day, NXT_CLOSE), None),
+            ]
+            schedule = [
+                (begin, boundaries[i + 1][0], session)
+                for i, (begin, session) in enumerate(boundaries[:-1])
+                if begin < boundaries[i + 1][0]
+            ]
+            with self._lock:
+                self._schedules[day] = schedule
+        return schedule
+
+    def session_at(self, at: datetime) -> SessionInfo:
+        """at 시각의 세션과 그 세션의 [start, end) 구간"""
+        day = at.date()
+        day_start = datetime.combine(day, time.min)
+        day_end = day_start + timedelta(days=1)
+
+        if not self.is_trading_day(day):
+            # 다음 거래일 NXT 개장 전까지 휴장
+            return SessionInfo(MarketSession.HOLIDAY, day, day_start, day_end)
+
+        schedule = self._schedule(day)
+        first_start = schedule[0][0]
+        if at < first_start:
+            return SessionInfo(MarketSession.CLOSED, day, day_start, first_start)
+        for begin, end, session in schedule:
+            if at < end:
+                return SessionInfo(session, day, begin, end)
+        return SessionInfo(MarketSession.CLOSED, day, schedule[-1][1], day_end)
+
+    def current_session(self, now: Optional[datetime] = None) -> SessionInfo:
+        """
+        현재 세션 (다음 세션 경계 시각까지 캐시)
+
+        Args:
+            now: 기준 시각 (테스트용, None이면 현재 시각)
+        """
+        now = now or datetime.now()
+        current = self._current
+        if current is not None and current.start <= now < current.end:
+            return current
+        current = self.session_at(now)
+        self._current = current
+        return current
+
+    def next_open(self, now: Optional[datetime] = None) -> datetime:
+        """다음 NXT 개장(08:00) 시각"""
+        now = now or datetime.now()
+        today = now.date()
+        if self.is_trading_day(today) and now.time() < NXT_OPEN:
+            return _combine(today, NXT_OPEN)
+        return _combine(self.next_trading_day(today), NXT_OPEN)
+
+    def market_status(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        시장 상태 정보 (research.analyzer.Analyzer.get_market_status 형식)
+
+        휴장일과 장외 시간은 종가 기준 테스트 모드로 표시한다.
+        세션별 정보는 세션 경계까지 캐시하고 current_time만 갱신한다.
+        """
+        now = now or datetime.now()
+        info = self.current_session(now)
+
+        cached = self._status_cache
+        if cached is None or cached[0] != info:
+            status = self._build_market_status(info, now)
+            self._status_cache = cached = (info, status)
+
+        status = dict(cached[1])
+        status['current_time'] = now.strftime('%H:%M:%S')
+        return status
+
+    def _build_market_status(self, info: SessionInfo, now: datetime) -> Dict[str, Any]:
+        weekday = now.weekday()
+        if info.session in _SESSION_STATUS:
+            is_trading_hours, market_type, market_status, order_type_limit, can_cancel_only = \
+                _SESSION_STATUS[info.session]
+            is_test_mode = False
+        else:
+            is_trading_hours, is_test_mode = True, True  # 종가 테스트 모드
+            market_type = '테스트 모드'
+            order_type_limit, can_cancel_only = 'all', False
+            if info.session == MarketSession.HOLIDAY:
+                market_status = '주말 (종가 테스트 모드)' if weekday >= 5 else '휴장일 (종가 테스트 모드)'
+            elif now.time() < NXT_OPEN:
+                market_status = '장 시작 전 (종가 테스트 모드)'
+            else:
+                market_status = '장 종료 후 (종가 테스트 모드)'
+
+        try:
+            next_open = self.next_open(now).strftime('%Y-%m-%d %H:%M:%S')
+        except ValueError:
+            next_open = None
+
+        return {
+            'is_trading_hours': is_trading_hours,
+            'is_test_mode': is_test_mode,
+            'market_type': market_type,
+            'session': info.session.value,
+            'weekday': ['월', '화', '수', '목', '금', '토', '일'][weekday],
+            'market_status': market_status,
+            'next_open': next_open,
+            'order_type_limit': order_type_limit,
+            'can_cancel_only': can_cancel_only,
+            # 호환성을 위한 필드
+            'is_open': is_trading_hours
+        }
+
+
+_trading_calendar: Optional[TradingCalendar] = None
+
+
+def get_trading_calendar() -> TradingCalendar:
+    """프로세스 공용 KRX 거래일 캘린더"""
+    global _trading_calendar
+    if _trading_calendar is None:
+        _trading_calendar = TradingCalendar()
+        logger.debug(f"KRX 거래일 캘린더 생성: {len(_trading_calendar._ordinals)}개 거래일")
+    return _trading_calendar
+
+
+__all__ = [
+    'MarketSession',
+    'SessionInfo',
+    'TradingCalendar',
+    'get_trading_calendar',
+    'KRX_HOLIDAYS',
+    'KRX_SPECIAL_SESSIONS',
+]
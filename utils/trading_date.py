@@ -1,8 +1,14 @@
 """
 utils/trading_date.py
 거래일 계산 유틸리티
+
+세션/휴장일 판단은 utils.trading_calendar의 KRX 거래일 캘린더를 사용한다
+(현재 세션은 다음 세션 경계까지 캐시).
 """
-from datetime import datetime, timedelta
+from datetime import datetime
+from typing import List, Optional
+
+from utils.trading_calendar import MarketSession, get_trading_calendar
 
 
 def get_last_trading_date() -> str:
@@ -10,42 +16,14 @@ def get_last_trading_date() -> str:
     시장 탐색을 위한 최근 거래일 반환
 
     규칙:
-    - 평일 08:00 ~ 23:59 → 그날 날짜 사용
-    - 평일 00:00 ~ 07:59 → 전날 날짜 사용
-    - 토요일 → 금요일 날짜 사용
-    - 일요일 → 금요일 날짜 사용
+    - 거래일 08:00 ~ 23:59 → 그날 날짜 사용
+    - 거래일 00:00 ~ 07:59 → 직전 거래일 사용
+    - 주말/휴장일 → 직전 거래일 사용
 
     Returns:
         YYYYMMDD 형식의 날짜 문자열
     """
-    now = datetime.now()
-    current_hour = now.hour
-    current_weekday = now.weekday()  # 0=월요일, 6=일요일
-
-    # 기준 날짜
-    target_date = now
-
-    # 평일 새벽 시간 (00:00 ~ 07:59)
-    if current_weekday < 5 and current_hour < 8:
-        # 전날 사용
-        target_date = now - timedelta(days=1)
-        # 만약 전날이 일요일이면 금요일로
-        if target_date.weekday() == 6:
-            target_date = target_date - timedelta(days=2)
-
-    # 토요일
-    elif current_weekday == 5:
-        # 금요일 사용
-        target_date = now - timedelta(days=1)
-
-    # 일요일
-    elif current_weekday == 6:
-        # 금요일 사용
-        target_date = now - timedelta(days=2)
-
-    # 평일 08:00 이후는 그날 날짜 사용
-
-    return target_date.strftime('%Y%m%d')
+    return get_trading_calendar().last_trading_date().strftime('%Y%m%d')
 
 
 def get_trading_date_with_fallback(days_back: int = 5) -> list:
@@ -58,21 +36,36 @@ def get_trading_date_with_fallback(days_back: int = 5) -> list:
     Returns:
         날짜 리스트 (최근 날짜부터)
     """
-    dates = []
-    last_trading_date_str = get_last_trading_date()
-    last_trading_date = datetime.strptime(last_trading_date_str, '%Y%m%d')
+    calendar = get_trading_calendar()
+    days = calendar.previous_trading_days(days_back, calendar.last_trading_date())
+    return [day.strftime('%Y%m%d') for day in days]
 
-    current_date = last_trading_date
-    count = 0
 
-    while count < days_back:
-        # 주말 제외
-        if current_date.weekday() < 5:
-            dates.append(current_date.strftime('%Y%m%d'))
-            count += 1
-        current_date = current_date - timedelta(days=1)
+def get_previous_trading_dates(count: int, end_date: Optional[str] = None) -> List[str]:
+    """
+    기준일 이하 최근 N 거래일 (백테스트/차트 조회용)
+
+    Args:
+        count: 거래일 수
+        end_date: 기준일 YYYYMMDD (포함, None이면 최근 거래일)
+
+    Returns:
+        YYYYMMDD 날짜 리스트 (최근 날짜부터)
+    """
+    calendar = get_trading_calendar()
+    end = datetime.strptime(end_date, '%Y%m%d').date() if end_date else calendar.last_trading_date()
+    return [day.strftime('%Y%m%d') for day in calendar.previous_trading_days(count, end)]
+
+
+def is_trading_day(date_str: Optional[str] = None) -> bool:
+    """
+    거래일 여부 (주말/KRX 휴장일 제외)
 
-    return dates
+    Args:
+        date_str: YYYYMMDD (None이면 오늘)
+    """
+    day = datetime.strptime(date_str, '%Y%m%d').date() if date_str else datetime.now().date()
+    return get_trading_calendar().is_trading_day(day)
 
 
 def is_nxt_hours() -> bool:
@@ -84,28 +77,9 @@ def is_nxt_hours() -> bool:
     - 애프터마켓: 15:30 ~ 20:00
 
     Returns:
-        NXT 거래 시간 여부
+        NXT 거래 시간 여부 (휴장일 False)
     """
-    now = datetime.now()
-    current_weekday = now.weekday()
-    current_hour = now.hour
-    current_minute = now.minute
-
-    # 주말은 무조건 False
-    if current_weekday >= 5:
-        return False
-
-    # 평일 프리마켓: 08:00 ~ 08:59
-    if current_hour == 8:
-        return True
-
-    # 평일 애프터마켓: 15:30 ~ 19:59
-    if current_hour == 15 and current_minute >= 30:
-        return True
-    elif 16 <= current_hour < 20:
-        return True
-
-    return False
+    return get_trading_calendar().current_session().is_nxt
 
 
 def is_market_hours() -> bool:
@@ -113,26 +87,9 @@ def is_market_hours() -> bool:
     현재가 장 운영 시간인지 확인 (정규장만, NXT 제외)
 
     Returns:
-        정규장 운영 시간 여부
+        정규장 운영 시간 여부 (휴장일 False)
     """
-    now = datetime.now()
-    current_weekday = now.weekday()
-    current_hour = now.hour
-    current_minute = now.minute
-
-    # 주말은 무조건 False
-    if current_weekday >= 5:
-        return False
-
-    # 평일 09:00 ~ 15:30
-    if current_hour == 9:
-        return True
-    elif 10 <= current_hour < 15:
-        return True
-    elif current_hour == 15 and current_minute <= 30:
-        return True
-
-    return False
+    return get_trading_calendar().current_session().is_regular
 
 
 def is_any_trading_hours() -> bool:
@@ -147,7 +104,7 @@ def is_any_trading_hours() -> bool:
     Returns:
         거래 시간 여부
     """
-    return is_nxt_hours() or is_market_hours()
+    return get_trading_calendar().current_session().is_trading
 
 
 def is_after_market_hours() -> bool:
@@ -157,22 +114,12 @@ def is_after_market_hours() -> bool:
     Returns:
         장 마감 후 여부
     """
-    now = datetime.now()
-    current_weekday = now.weekday()
-    current_hour = now.hour
-    current_minute = now.minute
-
-    # 주말은 False
-    if current_weekday >= 5:
+    calendar = get_trading_calendar()
+    info = calendar.current_session()
+    if info.session == MarketSession.HOLIDAY:
         return False
-
-    # 평일 15:30 이후 ~ 23:59
-    if current_hour > 15:
-        return True
-    elif current_hour == 15 and current_minute > 30:
-        return True
-
-    return False
+    _, close_at = calendar.regular_hours(info.trading_day)
+    return info.start >= datetime.combine(info.trading_day, close_at)
 
 
 def should_use_test_mode() -> bool:
@@ -180,32 +127,21 @@ def should_use_test_mode() -> bool:
     테스트 모드를 사용해야 하는지 확인
 
     조건:
-    - 휴일 (토요일, 일요일)
-    - 평일 거래 시간 외 (20:00 ~ 08:00)
+    - 휴일 (주말, KRX 휴장일)
+    - 거래일 거래 시간 외 (20:00 ~ 08:00)
       * 거래 시간: 08:00-20:00 (NXT 프리마켓 + 정규장 + NXT 애프터마켓)
 
     Returns:
         테스트 모드 사용 여부
     """
-    now = datetime.now()
-    current_weekday = now.weekday()  # 0=월요일, 6=일요일
-    current_hour = now.hour
-
-    # 주말은 항상 테스트 모드
-    if current_weekday >= 5:
-        return True
-
-    # 평일: 거래 시간(08:00-20:00) 외에는 테스트 모드
-    # 즉, 20:00 ~ 23:59 또는 00:00 ~ 07:59
-    if current_hour >= 20 or current_hour < 8:
-        return True
-
-    return False
+    return not get_trading_calendar().current_session().is_trading
 
 
 __all__ = [
     'get_last_trading_date',
     'get_trading_date_with_fallback',
+    'get_previous_trading_dates',
+    'is_trading_day',
     'is_nxt_hours',
     'is_market_hours',
     'is_any_trading_hours',
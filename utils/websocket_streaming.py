@@ -2,11 +2,12 @@
 Advanced WebSocket Streaming System - v5.13
 Real-time data streaming with connection management, backpressure, and optimization
 """
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Callable, Any, Set
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Callable, Any, Set, Tuple
+from datetime import datetime
 from collections import deque
 import asyncio
+import itertools
 import json
 import logging
 from enum import Enum
@@ -35,14 +36,39 @@ class ConnectionState(Enum):
 
 @dataclass
 class StreamMessage:
-    """스트림 메시지"""
+    """
+    스트림 메시지
+
+    broadcast 1회에 1개만 만들어 모든 구독자 큐가 같은 객체를 공유한다.
+    JSON 인코딩도 처음 필요할 때 한 번만 수행한다 (encoded).
+    """
     message_id: str
     channel: str
     data: Any
     priority: MessagePriority
-    timestamp: str
+    timestamp: float                    # epoch 초
     retry_count: int = 0
-    expires_at: Optional[str] = None
+    expires_at: Optional[float] = None  # epoch 초 (None이면 만료 없음)
+    _encoded: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def is_expired(self, now: float) -> bool:
+        return self.expires_at is not None and now >= self.expires_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.message_id,
+            'channel': self.channel,
+            'data': self.data,
+            'priority': self.priority.value,
+            'timestamp': self.timestamp,
+        }
+
+    @property
+    def encoded(self) -> str:
+        """JSON 문자열 (최초 1회 인코딩 후 재사용)"""
+        if self._encoded is None:
+            self._encoded = json.dumps(self.to_dict(), ensure_ascii=False, default=str)
+        return self._encoded
 
 
 @dataclass
@@ -59,18 +85,76 @@ class StreamStatistics:
     uptime_seconds: float
 
 
+_PRIORITY_ORDER = tuple(sorted(MessagePriority, key=lambda p: p.value))   # CRITICAL → LOW
+_SHED_ORDER = tuple(reversed(_PRIORITY_ORDER))                           # LOW → CRITICAL
+
+
 @dataclass
 class ClientConnection:
-    """클라이언트 연결"""
+    """
+    클라이언트 연결
+
+    우선순위별 deque 4개에 메시지를 쌓고, 전체 크기가 max_queue_size를 넘으면
+    가장 낮은 우선순위의 가장 오래된 메시지부터 버린다 (O(1)).
+    큐 조작은 연결별 lock으로만 보호한다 (전역 lock 경합 없음).
+    """
     client_id: str
     connected_at: datetime
-    last_activity: datetime
+    last_activity: float
     subscribed_channels: Set[str]
-    message_queue: deque
     state: ConnectionState
     stats: Dict[str, int]
     max_queue_size: int = 1000
     websocket: Optional[Any] = None  # Actual WebSocket connection
+    queues: Dict[MessagePriority, deque] = field(default_factory=lambda: {p: deque() for p in _PRIORITY_ORDER})
+    lock: Lock = field(default_factory=Lock, repr=False)
+    size: int = 0
+
+    def push(self, message: StreamMessage) -> int:
+        """
+        메시지 적재 (호출자가 lock 보유)
+
+        Returns:
+            백프레셔로 버린 메시지 수
+        """
+        dropped = 0
+        if self.size >= self.max_queue_size:
+            for priority in _SHED_ORDER:
+                queue = self.queues[priority]
+                if queue and priority.value >= message.priority.value:
+                    queue.popleft()
+                    self.size -= 1
+                    dropped = 1
+                    break
+            else:
+                # 큐가 전부 더 높은 우선순위 메시지 → 새 메시지를 버림
+                return -1
+
+        self.queues[message.priority].append(message)
+        self.size += 1
+        return dropped
+
+    def pop(self, max_messages: int, now: float) -> Tuple[List[StreamMessage], int]:
+        """
+        우선순위 순으로 최대 max_messages개 꺼냄 (호출자가 lock 보유)
+
+        Returns:
+            (메시지 목록, 만료로 버린 수)
+        """
+        messages: List[StreamMessage] = []
+        expired = 0
+        for priority in _PRIORITY_ORDER:
+            queue = self.queues[priority]
+            while queue and len(messages) < max_messages:
+                message = queue.popleft()
+                self.size -= 1
+                if message.is_expired(now):
+                    expired += 1
+                else:
+                    messages.append(message)
+            if len(messages) >= max_messages:
+                break
+        return messages, expired
 
 
 class WebSocketStreamManager:
@@ -79,13 +163,12 @@ class WebSocketStreamManager:
 
     Features:
     - Connection pooling and management
-    - Message prioritization and queuing
-    - Backpressure handling
-    - Automatic reconnection
+    - Per-client, per-priority bounded queues (O(1) enqueue / shed / dequeue)
+    - Lock striping: 연결 목록 lock과 연결별 큐 lock 분리
+    - Encode-once broadcast (구독자 전원이 같은 메시지/JSON 공유)
+    - Copy-on-write 채널 구독자 집합 (broadcast 시 복사 없음)
     - Rate limiting
     - Statistics and monitoring
-    - Channel-based subscriptions
-    - Message compression
     """
 
     def __init__(self, max_connections: int = 1000,
@@ -104,14 +187,19 @@ class WebSocketStreamManager:
         self.message_ttl_seconds = message_ttl_seconds
         self.heartbeat_interval = heartbeat_interval_seconds
 
-        # Connections
+        # Connections (lock은 연결 추가/삭제에만 사용)
         self.connections: Dict[str, ClientConnection] = {}
         self.connections_lock = Lock()
 
-        # Channels
-        self.channels: Dict[str, Set[str]] = {}  # channel -> set of client_ids
+        # Channels: channel -> frozenset(client_ids), 변경 시 새 집합으로 교체
+        self.channels: Dict[str, frozenset] = {}
         self.channels_lock = Lock()
 
+        # 대기 메시지가 있는 클라이언트 (StreamPublisher.drain 대상)
+        self._ready: Set[str] = set()
+        self._ready_lock = Lock()
+        self._message_ids = itertools.count(1)
+
         # Statistics
         self.stats = {
             'messages_sent': 0,
@@ -141,7 +229,7 @@ class WebSocketStreamManager:
 
         Args:
             client_id: 클라이언트 ID
-            websocket: WebSocket 연결 객체
+            websocket: WebSocket 연결 객체 (보관만 함, 전송은 StreamPublisher.drain()의 transport가 담당)
 
         Returns:
             bool: 등록 성공 여부
@@ -155,19 +243,16 @@ class WebSocketStreamManager:
                 logger.warning(f"Client {client_id} already connected")
                 return False
 
-            connection = ClientConnection(
+            self.connections[client_id] = ClientConnection(
                 client_id=client_id,
                 connected_at=datetime.now(),
-                last_activity=datetime.now(),
+                last_activity=time.time(),
                 subscribed_channels=set(),
-                message_queue=deque(maxlen=self.max_message_queue),
                 state=ConnectionState.CONNECTED,
                 stats={'messages_sent': 0, 'messages_dropped': 0},
                 max_queue_size=self.max_message_queue,
                 websocket=websocket
             )
-
-            self.connections[client_id] = connection
             self.rate_limits[client_id] = deque()
 
             logger.info(f"Client {client_id} connected. Total connections: {len(self.connections)}")
@@ -176,21 +261,21 @@ class WebSocketStreamManager:
     def unregister_connection(self, client_id: str) -> bool:
         """클라이언트 연결 해제"""
         with self.connections_lock:
-            if client_id not in self.connections:
+            connection = self.connections.pop(client_id, None)
+            if connection is None:
                 return False
+            self.rate_limits.pop(client_id, None)
+            connection.state = ConnectionState.DISCONNECTED
 
-            connection = self.connections[client_id]
-
-            # Unsubscribe from all channels
-            for channel in list(connection.subscribed_channels):
-                self._unsubscribe_from_channel(client_id, channel)
+        # Unsubscribe from all channels
+        for channel in list(connection.subscribed_channels):
+            self._unsubscribe_from_channel(client_id, channel)
 
-            del self.connections[client_id]
-            if client_id in self.rate_limits:
-                del self.rate_limits[client_id]
+        with self._ready_lock:
+            self._ready.discard(client_id)
 
-            logger.info(f"Client {client_id} disconnected. Total connections: {len(self.connections)}")
-            return True
+        logger.info(f"Client {client_id} disconnected. Total connections: {len(self.connections)}")
+        return True
 
     def subscribe(self, client_id: str, channel: str, replay_history: bool = False) -> bool:
         """
@@ -204,18 +289,16 @@ class WebSocketStreamManager:
         Returns:
             bool: 구독 성공 여부
         """
-        with self.connections_lock:
-            if client_id not in self.connections:
-                logger.warning(f"Client {client_id} not found")
-                return False
+        connection = self.connections.get(client_id)
+        if connection is None:
+            logger.warning(f"Client {client_id} not found")
+            return False
 
-            connection = self.connections[client_id]
+        with connection.lock:
             connection.subscribed_channels.add(channel)
 
         with self.channels_lock:
-            if channel not in self.channels:
-                self.channels[channel] = set()
-            self.channels[channel].add(client_id)
+            self.channels[channel] = self.channels.get(channel, frozenset()) | {client_id}
 
         logger.info(f"Client {client_id} subscribed to channel {channel}")
 
@@ -233,7 +316,7 @@ class WebSocketStreamManager:
                   priority: MessagePriority = MessagePriority.NORMAL,
                   ttl_seconds: Optional[int] = None) -> int:
         """
-        채널에 메시지 브로드캐스트
+        채널에 메시지 브로드캐스트 (메시지 1개를 모든 구독자 큐가 공유)
 
         Args:
             channel: 채널 이름
@@ -244,29 +327,12 @@ class WebSocketStreamManager:
         Returns:
             int: 전송된 클라이언트 수
         """
-        with self.channels_lock:
-            if channel not in self.channels:
-                logger.debug(f"No subscribers for channel {channel}")
-                return 0
-
-            subscribers = self.channels[channel].copy()
-
+        subscribers = self.channels.get(channel)
         if not subscribers:
+            logger.debug(f"No subscribers for channel {channel}")
             return 0
 
-        # Create message
-        message_id = f"{channel}_{int(time.time() * 1000)}"
-        ttl = ttl_seconds if ttl_seconds is not None else self.message_ttl_seconds
-        expires_at = (datetime.now() + timedelta(seconds=ttl)).isoformat()
-
-        message = StreamMessage(
-            message_id=message_id,
-            channel=channel,
-            data=data,
-            priority=priority,
-            timestamp=datetime.now().isoformat(),
-            expires_at=expires_at
-        )
+        message = self._new_message(channel, data, priority, ttl_seconds)
 
         # Save to history
         self._save_to_history(channel, message)
@@ -283,24 +349,13 @@ class WebSocketStreamManager:
     def send_to_client(self, client_id: str, channel: str, data: Any,
                       priority: MessagePriority = MessagePriority.NORMAL) -> bool:
         """특정 클라이언트에게 메시지 전송"""
-        with self.connections_lock:
-            if client_id not in self.connections:
-                return False
-
-        message_id = f"{channel}_{client_id}_{int(time.time() * 1000)}"
-        message = StreamMessage(
-            message_id=message_id,
-            channel=channel,
-            data=data,
-            priority=priority,
-            timestamp=datetime.now().isoformat()
-        )
-
-        return self._queue_message(client_id, message)
+        if client_id not in self.connections:
+            return False
+        return self._queue_message(client_id, self._new_message(channel, data, priority))
 
     def get_pending_messages(self, client_id: str, max_messages: int = 10) -> List[StreamMessage]:
         """
-        클라이언트의 대기 중인 메시지 가져오기
+        클라이언트의 대기 중인 메시지 가져오기 (우선순위 순, 만료 메시지 제외)
 
         Args:
             client_id: 클라이언트 ID
@@ -309,55 +364,32 @@ class WebSocketStreamManager:
         Returns:
             List[StreamMessage]
         """
-        with self.connections_lock:
-            if client_id not in self.connections:
-                return []
-
-            connection = self.connections[client_id]
-            messages = []
-
-            # Get messages by priority
-            priority_messages = {p: [] for p in MessagePriority}
-
-            for msg in connection.message_queue:
-                priority_messages[msg.priority].append(msg)
-
-            # Collect messages in priority order
-            for priority in [MessagePriority.CRITICAL, MessagePriority.HIGH,
-                           MessagePriority.NORMAL, MessagePriority.LOW]:
-                for msg in priority_messages[priority]:
-                    if len(messages) >= max_messages:
-                        break
-
-                    # Check expiration
-                    if msg.expires_at:
-                        expires = datetime.fromisoformat(msg.expires_at)
-                        if datetime.now() >= expires:
-                            connection.stats['messages_dropped'] += 1
-                            continue
-
-                    messages.append(msg)
-
-                if len(messages) >= max_messages:
-                    break
+        connection = self.connections.get(client_id)
+        if connection is None:
+            return []
 
-            # Remove messages from queue
-            for msg in messages:
-                try:
-                    connection.message_queue.remove(msg)
-                except ValueError:
-                    pass
-
-            # Update activity
-            connection.last_activity = datetime.now()
+        now = time.time()
+        with connection.lock:
+            messages, expired = connection.pop(max_messages, now)
+            connection.last_activity = now
             connection.stats['messages_sent'] += len(messages)
+            connection.stats['messages_dropped'] += expired
+            # 연결 lock 안에서 해제해야 그 사이 적재된 메시지의 ready 표시를 지우지 않음
+            if not connection.size:
+                with self._ready_lock:
+                    self._ready.discard(client_id)
 
-            # Update global stats
-            with self.stats_lock:
-                self.stats['messages_sent'] += len(messages)
-                self.stats['bytes_sent'] += sum(len(json.dumps(asdict(m))) for m in messages)
+        with self.stats_lock:
+            self.stats['messages_sent'] += len(messages)
+            self.stats['messages_dropped'] += expired
+            self.stats['bytes_sent'] += sum(len(m.encoded) for m in messages)
+
+        return messages
 
-            return messages
+    def pending_clients(self) -> List[str]:
+        """대기 메시지가 있는 클라이언트 ID 목록"""
+        with self._ready_lock:
+            return list(self._ready)
 
     def check_rate_limit(self, client_id: str) -> bool:
         """
@@ -386,12 +418,11 @@ class WebSocketStreamManager:
 
     def get_connection_stats(self, client_id: str) -> Optional[Dict[str, Any]]:
         """클라이언트 연결 통계"""
-        with self.connections_lock:
-            if client_id not in self.connections:
-                return None
-
-            connection = self.connections[client_id]
+        connection = self.connections.get(client_id)
+        if connection is None:
+            return None
 
+        with connection.lock:
             uptime = (datetime.now() - connection.connected_at).total_seconds()
 
             return {
@@ -400,7 +431,8 @@ class WebSocketStreamManager:
                 'uptime_seconds': uptime,
                 'state': connection.state.value,
                 'subscribed_channels': list(connection.subscribed_channels),
-                'queue_size': len(connection.message_queue),
+                'queue_size': connection.size,
+                'queue_by_priority': {p.name: len(q) for p, q in connection.queues.items()},
                 'queue_capacity': connection.max_queue_size,
                 'messages_sent': connection.stats['messages_sent'],
                 'messages_dropped': connection.stats['messages_dropped']
@@ -448,14 +480,13 @@ class WebSocketStreamManager:
 
     def cleanup_inactive_connections(self, timeout_seconds: int = 300) -> int:
         """비활성 연결 정리"""
-        now = datetime.now()
-        inactive_clients = []
+        now = time.time()
 
         with self.connections_lock:
-            for client_id, connection in self.connections.items():
-                inactive_duration = (now - connection.last_activity).total_seconds()
-                if inactive_duration > timeout_seconds:
-                    inactive_clients.append(client_id)
+            inactive_clients = [
+                client_id for client_id, connection in self.connections.items()
+                if now - connection.last_activity > timeout_seconds
+            ]
 
         # Remove inactive connections
         removed = 0
@@ -468,63 +499,59 @@ class WebSocketStreamManager:
 
     # ===== PRIVATE METHODS =====
 
-    def _queue_message(self, client_id: str, message: StreamMessage) -> bool:
-        """메시지를 클라이언트 큐에 추가"""
-        with self.connections_lock:
-            if client_id not in self.connections:
-                return False
-
-            connection = self.connections[client_id]
-
-            # Check if queue is full
-            if len(connection.message_queue) >= connection.max_queue_size:
-                # Backpressure: drop lowest priority messages
-                dropped = self._apply_backpressure(connection)
-                if dropped > 0:
-                    with self.stats_lock:
-                        self.stats['backpressure_events'] += 1
-                    logger.warning(f"Backpressure: dropped {dropped} messages for {client_id}")
-
-            connection.message_queue.append(message)
-            return True
-
-    def _apply_backpressure(self, connection: ClientConnection) -> int:
-        """백프레셔 적용 - 낮은 우선순위 메시지 제거"""
-        dropped = 0
-
-        # Remove low priority messages first
-        for priority in [MessagePriority.LOW, MessagePriority.NORMAL]:
-            to_remove = [msg for msg in connection.message_queue if msg.priority == priority]
+    def _new_message(self, channel: str, data: Any, priority: MessagePriority,
+                     ttl_seconds: Optional[int] = None) -> StreamMessage:
+        now = time.time()
+        ttl = ttl_seconds if ttl_seconds is not None else self.message_ttl_seconds
+        return StreamMessage(
+            message_id=f"{channel}_{next(self._message_ids)}",
+            channel=channel,
+            data=data,
+            priority=priority,
+            timestamp=now,
+            expires_at=now + ttl if ttl else None
+        )
 
-            for msg in to_remove[:5]:  # Remove up to 5 messages
-                try:
-                    connection.message_queue.remove(msg)
-                    dropped += 1
-                    connection.stats['messages_dropped'] += 1
+    def _queue_message(self, client_id: str, message: StreamMessage) -> bool:
+        """메시지를 클라이언트 큐에 추가 (연결별 lock만 사용)"""
+        connection = self.connections.get(client_id)
+        if connection is None:
+            return False
 
-                    with self.stats_lock:
-                        self.stats['messages_dropped'] += 1
-                except ValueError:
-                    pass
+        with connection.lock:
+            dropped = connection.push(message)
+            if dropped:
+                connection.stats['messages_dropped'] += 1
 
-            if dropped > 0:
-                break
+        if dropped:
+            # Backpressure: 낮은 우선순위의 오래된 메시지(또는 새 메시지)를 버림
+            with self.stats_lock:
+                self.stats['backpressure_events'] += 1
+                self.stats['messages_dropped'] += 1
+            logger.debug(f"Backpressure: dropped 1 message for {client_id}")
+            if dropped < 0:
+                return False
 
-        return dropped
+        if client_id not in self._ready:
+            with self._ready_lock:
+                self._ready.add(client_id)
+        return True
 
     def _unsubscribe_from_channel(self, client_id: str, channel: str) -> bool:
         """채널 구독 취소 (internal)"""
-        with self.connections_lock:
-            if client_id in self.connections:
-                connection = self.connections[client_id]
+        connection = self.connections.get(client_id)
+        if connection is not None:
+            with connection.lock:
                 connection.subscribed_channels.discard(channel)
 
         with self.channels_lock:
-            if channel in self.channels:
-                self.channels[channel].discard(client_id)
-
+            subscribers = self.channels.get(channel)
+            if subscribers is not None:
+                subscribers = subscribers - {client_id}
                 # Remove channel if no subscribers
-                if not self.channels[channel]:
+                if subscribers:
+                    self.channels[channel] = subscribers
+                else:
                     del self.channels[channel]
 
         logger.info(f"Client {client_id} unsubscribed from channel {channel}")
@@ -590,9 +617,338 @@ class StreamingDataAggregator:
             return [ch for ch, data in self.pending_data.items() if data]
 
 
+_MISSING = object()
+
+
+@dataclass
+class ChannelConfig:
+    """퍼블리시 채널 설정"""
+    min_interval: float = 0.5            # 채널 델타 최소 전송 간격 (초)
+    max_items: Optional[int] = None      # 상태 키 상한 (초과 시 오래된 키부터 삭제)
+    snapshot: Optional[Callable[[str], Dict[str, Any]]] = None  # 상태가 비었을 때 스냅샷 원천
+    priority: MessagePriority = MessagePriority.NORMAL
+
+
+class StreamPublisher:
+    """
+    서버 측 퍼블리시 파이프라인 (상태 1회 발행 → 전체 구독자에 델타 팬아웃)
+
+    - 채널별 상태(키 → 값)를 보관하고 publish()는 바뀐 키/필드만 표시
+    - 채널별 최소 간격(min_interval)마다 누적된 변경을 델타 1건으로 묶어 broadcast
+    - 구독 즉시 현재 상태 스냅샷 전송 (seq 포함, 클라이언트는 seq가 끊기면 재구독)
+    - 클라이언트 전송은 transport(client_id, event, payload)에 위임 (Socket.IO 등)
+
+    델타 형식:
+        {'channel', 'seq', 'set': {키: 전체 값}, 'patch': {키: {필드: 값}}, 'del': [키]}
+
+    Usage:
+        publisher = get_stream_publisher()
+        publisher.configure_channel('ticks', min_interval=0.25)
+        publisher.start(lambda sid, event, payload: socketio.emit(event, payload, to=sid))
+
+        publisher.publish('ticks', {'005930': {'price': 71000, 'volume': 120}})
+        publisher.publish('positions', positions_by_code, replace=True)
+    """
+
+    def __init__(self, stream_manager: Optional[WebSocketStreamManager] = None,
+                 flush_interval: float = 0.05):
+        """
+        Args:
+            stream_manager: 팬아웃용 스트림 관리자 (None이면 전역 싱글톤)
+            flush_interval: 플러시 스레드 주기 (초)
+        """
+        self.stream_manager = stream_manager or get_stream_manager()
+        self.flush_interval = flush_interval
+
+        self.channel_configs: Dict[str, ChannelConfig] = {}
+        self.default_config = ChannelConfig()
+
+        self._state: Dict[str, Dict[str, Any]] = {}
+        self._updated_at: Dict[str, float] = {}
+        self._seq: Dict[str, int] = {}
+        self._pending: Dict[str, Dict[str, Any]] = {}   # channel -> {'keys': {키: None(전체) | 필드 set}, 'del': set}
+        self._last_sent: Dict[str, float] = {}
+        self._lock = Lock()
+
+        self.transport: Optional[Callable[[str, str, Any], None]] = None
+        self._thread: Optional[Thread] = None
+        self._running = False
+
+        self.stats = {
+            'published': 0,
+            'unchanged': 0,
+            'deltas': 0,
+            'snapshots': 0,
+            'emits': 0,
+        }
+
+    # ------------------------------------------------------------------
+    # 설정 / 수명
+    # ------------------------------------------------------------------
+
+    def configure_channel(self, channel: str, **kwargs) -> ChannelConfig:
+        """
+        채널 설정 ('candles'처럼 접두사로 등록하면 'candles:005930' 등에 적용)
+        """
+        config = ChannelConfig(**kwargs)
+        self.channel_configs[channel] = config
+        return config
+
+    def _config(self, channel: str) -> ChannelConfig:
+        config = self.channel_configs.get(channel)
+        if config is None:
+            config = self.channel_configs.get(channel.split(':', 1)[0], self.default_config)
+        return config
+
+    def start(self, transport: Callable[[str, str, Any], None]):
+        """플러시 스레드 시작"""
+        self.transport = transport
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._running = True
+        self._thread = Thread(target=self._run, name='stream-publisher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+
+    def _run(self):
+        while self._running:
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Stream publisher flush error: {e}")
+            time.sleep(self.flush_interval)
+
+    # ------------------------------------------------------------------
+    # 발행
+    # ------------------------------------------------------------------
+
+    def publish(self, channel: str, updates: Dict[str, Any], replace: bool = False) -> bool:
+        """
+        채널 상태 갱신 (바뀐 키/필드만 다음 델타에 포함)
+
+        Args:
+            channel: 채널 이름
+            updates: {키: 값} (값이 dict이면 필드 단위 비교)
+            replace: True면 updates를 채널 전체 상태로 보고 없는 키는 삭제
+
+        Returns:
+            변경 여부
+        """
+        changed = False
+        with self._lock:
+            state = self._state.setdefault(channel, {})
+            pending = self._pending.setdefault(channel, {'keys': {}, 'del': set()})
+            marks, deleted = pending['keys'], pending['del']
+
+            if replace:
+                for key in [k for k in state if k not in updates]:
+                    del state[key]
+                    marks.pop(key, None)
+                    deleted.add(key)
+                    changed = True
+
+            for key, value in updates.items():
+                key = str(key)
+                old = state.get(key, _MISSING)
+                if old == value:
+                    continue
+                changed = True
+                deleted.discard(key)
+
+                if isinstance(old, dict) and isinstance(value, dict) and old.keys() <= value.keys():
+                    fields = {f for f, v in value.items() if old.get(f, _MISSING) != v}
+                    current = marks.get(key, set())
+                    if current is not None:
+                        marks[key] = current | fields
+                else:
+                    marks[key] = None
+                state[key] = dict(value) if isinstance(value, dict) else value
+
+            max_items = self._config(channel).max_items
+            if max_items is not None:
+                while len(state) > max_items:
+                    oldest = next(iter(state))
+                    del state[oldest]
+                    marks.pop(oldest, None)
+                    deleted.add(oldest)
+
+            if changed:
+                self._updated_at[channel] = time.time()
+                self.stats['published'] += 1
+            else:
+                self.stats['unchanged'] += 1
+        return changed
+
+    def remove(self, channel: str, keys: List[str]) -> bool:
+        """채널 상태에서 키 삭제"""
+        with self._lock:
+            state = self._state.get(channel)
+            if not state:
+                return False
+            pending = self._pending.setdefault(channel, {'keys': {}, 'del': set()})
+            removed = False
+            for key in keys:
+                if state.pop(str(key), _MISSING) is not _MISSING:
+                    pending['keys'].pop(str(key), None)
+                    pending['del'].add(str(key))
+                    removed = True
+            if removed:
+                self._updated_at[channel] = time.time()
+            return removed
+
+    def get_state(self, channel: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        채널 상태 사본 (REST 응답 재사용용)
+
+        Args:
+            max_age: 최근 갱신이 이 시간(초)보다 오래됐으면 None
+        """
+        with self._lock:
+            if channel not in self._state:
+                return None
+            if max_age is not None and time.time() - self._updated_at.get(channel, 0) > max_age:
+                return None
+            return dict(self._state[channel])
+
+    def snapshot(self, channel: str) -> Dict[str, Any]:
+        """현재 상태 스냅샷 (상태가 비었고 snapshot 원천이 있으면 채워서 반환)"""
+        source = self._config(channel).snapshot
+        if source is not None and not self._state.get(channel):
+            try:
+                seed = source(channel) or {}
+                if seed:
+                    self.publish(channel, seed)
+            except Exception as e:
+                logger.warning(f"Snapshot source failed for {channel}: {e}")
+
+        with self._lock:
+            return {
+                'channel': channel,
+                'seq': self._seq.get(channel, 0),
+                'data': dict(self._state.get(channel, {})),
+            }
+
+    # ------------------------------------------------------------------
+    # 구독
+    # ------------------------------------------------------------------
+
+    def connect(self, client_id: str) -> bool:
+        return self.stream_manager.register_connection(client_id)
+
+    def disconnect(self, client_id: str) -> bool:
+        return self.stream_manager.unregister_connection(client_id)
+
+    def subscribe(self, client_id: str, channel: str) -> bool:
+        """채널 구독 + 스냅샷 즉시 전송"""
+        if client_id not in self.stream_manager.connections:
+            self.connect(client_id)
+        if not self.stream_manager.subscribe(client_id, channel):
+            return False
+
+        snapshot = self.snapshot(channel)
+        self.stats['snapshots'] += 1
+        self._emit(client_id, 'stream_snapshot', snapshot)
+        return True
+
+    def unsubscribe(self, client_id: str, channel: str) -> bool:
+        return self.stream_manager.unsubscribe(client_id, channel)
+
+    # ------------------------------------------------------------------
+    # 플러시
+    # ------------------------------------------------------------------
+
+    def _build_delta(self, channel: str) -> Optional[Dict[str, Any]]:
+        """누적 변경 → 델타 (호출자가 lock 보유)"""
+        pending = self._pending.get(channel)
+        if not pending or not (pending['keys'] or pending['del']):
+            return None
+
+        state = self._state.get(channel, {})
+        full, patch = {}, {}
+        for key, fields in pending['keys'].items():
+            value = state.get(key, _MISSING)
+            if value is _MISSING:
+                continue
+            if fields is None:
+                full[key] = value
+            elif fields:
+                patch[key] = {f: value[f] for f in fields if f in value}
+
+        self._seq[channel] = self._seq.get(channel, 0) + 1
+        delta = {'channel': channel, 'seq': self._seq[channel]}
+        if full:
+            delta['set'] = full
+        if patch:
+            delta['patch'] = patch
+        if pending['del']:
+            delta['del'] = sorted(pending['del'])
+        self._pending[channel] = {'keys': {}, 'del': set()}
+        return delta
+
+    def flush(self, now: Optional[float] = None) -> int:
+        """
+        전송 시각이 된 채널의 델타를 broadcast하고 클라이언트 큐를 비움
+
+        Returns:
+            broadcast한 델타 수
+        """
+        now = time.time() if now is None else now
+        deltas = []
+        with self._lock:
+            for channel in list(self._pending):
+                config = self._config(channel)
+                if now - self._last_sent.get(channel, 0) < config.min_interval:
+                    continue
+                delta = self._build_delta(channel)
+                if delta is None:
+                    continue
+                self._last_sent[channel] = now
+                deltas.append((delta, config.priority))
+
+        for delta, priority in deltas:
+            self.stream_manager.broadcast(delta['channel'], delta, priority=priority)
+        self.stats['deltas'] += len(deltas)
+
+        self.drain()
+        return len(deltas)
+
+    def drain(self, max_messages: int = 100):
+        """대기 메시지가 있는 클라이언트에만 묶어 전송"""
+        if self.transport is None:
+            return
+        for client_id in self.stream_manager.pending_clients():
+            messages = self.stream_manager.get_pending_messages(client_id, max_messages)
+            if messages:
+                self._emit(client_id, 'stream', [m.data for m in messages])
+
+    def _emit(self, client_id: str, event: str, payload: Any):
+        if self.transport is None:
+            return
+        try:
+            self.transport(client_id, event, payload)
+            self.stats['emits'] += 1
+        except Exception as e:
+            logger.warning(f"Stream emit failed ({client_id}): {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            channels = {
+                channel: {
+                    'keys': len(state),
+                    'seq': self._seq.get(channel, 0),
+                    'subscribers': len(self.stream_manager.channels.get(channel, ())),
+                }
+                for channel, state in self._state.items()
+            }
+        return {**self.stats, 'channels': channels}
+
+
 # Global singleton
 _stream_manager: Optional[WebSocketStreamManager] = None
 _data_aggregator: Optional[StreamingDataAggregator] = None
+_stream_publisher: Optional[StreamPublisher] = None
 
 
 def get_stream_manager() -> WebSocketStreamManager:
@@ -614,3 +970,18 @@ def get_data_aggregator() -> StreamingDataAggregator:
     if _data_aggregator is None:
         _data_aggregator = StreamingDataAggregator(aggregation_window_ms=100)
     return _data_aggregator
+
+
+def get_stream_publisher() -> StreamPublisher:
+    """대시보드 퍼블리셔 싱글톤 (기본 채널 설정 포함)"""
+    global _stream_publisher
+    if _stream_publisher is None:
+        publisher = StreamPublisher(get_stream_manager())
+        publisher.configure_channel('status', min_interval=1.0, priority=MessagePriority.HIGH)
+        publisher.configure_channel('ticks', min_interval=0.25, priority=MessagePriority.HIGH)
+        publisher.configure_channel('candles', min_interval=0.5, max_items=390)
+        publisher.configure_channel('account', min_interval=1.0)
+        publisher.configure_channel('positions', min_interval=0.5, priority=MessagePriority.HIGH)
+        publisher.configure_channel('scan', min_interval=1.0, priority=MessagePriority.LOW)
+        _stream_publisher = publisher
+    return _stream_publisher
@@ -8,6 +8,7 @@ from .performance_tracker import PerformanceTracker
 from .trade_logger import TradeLogger
 from .models import VirtualTradingDB
 from .manager import VirtualTradingManager
+from .position_book import PositionBook
 from .scheduler import VirtualTradingScheduler
 from .backtest_adapter import BacktestAdapter
 from .ai_strategy_manager import AIStrategyManager
@@ -19,6 +20,7 @@ __all__ = [
     'TradeLogger',
     'VirtualTradingDB',
     'VirtualTradingManager',
+    'PositionBook',
     'VirtualTradingScheduler',
     'BacktestAdapter',
     'AIStrategyManager',
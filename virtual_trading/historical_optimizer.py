@@ -1,16 +1,58 @@
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import numpy as np
-from itertools import product
+
+from indicators.pipeline import optimizer_indicator_columns, get_or_compute
+from utils.monte_carlo import MonteCarloEngine
 
 
 class HistoricalOptimizer:
-    def __init__(self, strategy_class, initial_capital: float = 10000000):
+    def __init__(self, strategy_class, initial_capital: float = 10000000, max_workers: int = 1,
+                 prune_ratio: float = 0.0, checkpoint_path: Optional[str] = None, chart_api=None):
         self.strategy_class = strategy_class
         self.initial_capital = initial_capital
         self.results = []
 
+        # 일봉 API (있으면 로컬 OHLCV 저장소에 없는 구간을 채움)
+        self.chart_api = chart_api
+
+        # 그리드 서치 실행 설정 (max_workers > 1이면 프로세스 풀)
+        self.max_workers = max_workers
+        self.prune_ratio = prune_ratio
+        self.checkpoint_path = checkpoint_path
+
+    def _grid_executor(self):
+        from virtual_trading.parallel_optimizer import ParallelGridExecutor
+
+        return ParallelGridExecutor(
+            self.strategy_class,
+            initial_capital=self.initial_capital,
+            max_workers=self.max_workers,
+            prune_ratio=self.prune_ratio,
+            checkpoint_path=self.checkpoint_path
+        )
+
     def fetch_historical_data(self, stock_code: str, days: int = 365) -> List[Dict]:
+        """
+        최근 days일 일봉 (로컬 OHLCV 저장소 우선)
+
+        저장소와 API 모두 데이터가 없으면 합성 일봉을 반환한다.
+        """
+        from utils.ohlcv_store import get_data_loader
+
+        end_date = datetime.now().strftime('%Y%m%d')
+        start_date = (datetime.now() - timedelta(days=days)).strftime('%Y%m%d')
+
+        if self.chart_api is not None:
+            def fetch():
+                return self.chart_api.get_daily_chart(stock_code, period=0, date=end_date)
+        else:
+            fetch = None
+
+        candles = get_data_loader().load_candles(stock_code, 'daily', start_date, end_date, fetch=fetch)
+        if candles:
+            return candles
+
         candles = []
         for i in range(days):
             candles.append({
@@ -23,58 +65,31 @@ class HistoricalOptimizer:
             })
         return candles
 
-    def calculate_indicators(self, candles: List[Dict]) -> List[Dict]:
-        enriched_data = []
+    def calculate_indicators(self, candles: List[Dict], stock_code: Optional[str] = None) -> List[Dict]:
+        if not candles:
+            return []
 
-        for i, candle in enumerate(candles):
-            market_data = candle.copy()
+        def compute_columns():
+            return optimizer_indicator_columns(
+                [c['close'] for c in candles],
+                [c['volume'] for c in candles]
+            )
 
-            if i >= 20:
-                prices = [c['close'] for c in candles[i-20:i+1]]
-                market_data['ma20'] = np.mean(prices)
-                market_data['std_20'] = np.std(prices)
-            else:
-                market_data['ma20'] = candle['close']
-                market_data['std_20'] = 0
+        if stock_code is None:
+            columns = compute_columns()
+        else:
+            # 같은 (종목, 기간)의 지표 컬럼은 그리드 서치/워크포워드 간에 재사용
+            key = ('historical_optimizer', stock_code, candles[0]['timestamp'], candles[-1]['timestamp'], len(candles))
+            columns = get_or_compute(key, compute_columns)
 
-            if i >= 5:
-                prices_5 = [c['close'] for c in candles[i-5:i+1]]
-                market_data['ma5'] = np.mean(prices_5)
-            else:
-                market_data['ma5'] = candle['close']
-
-            if i >= 14:
-                gains = []
-                losses = []
-                for j in range(i-14, i):
-                    change = candles[j+1]['close'] - candles[j]['close']
-                    if change > 0:
-                        gains.append(change)
-                    else:
-                        losses.append(abs(change))
-
-                avg_gain = np.mean(gains) if gains else 0
-                avg_loss = np.mean(losses) if losses else 1
-
-                rs = avg_gain / avg_loss if avg_loss != 0 else 0
-                market_data['rsi'] = 100 - (100 / (1 + rs))
-            else:
-                market_data['rsi'] = 50
-
-            if i >= 1:
-                market_data['price_change_percent'] = ((candle['close'] - candles[i-1]['close']) / candles[i-1]['close']) * 100
-            else:
-                market_data['price_change_percent'] = 0
-
-            if i >= 20:
-                volumes = [c['volume'] for c in candles[i-20:i+1]]
-                avg_vol = np.mean(volumes[:-1]) if len(volumes) > 1 else 1
-                market_data['volume_ratio'] = candle['volume'] / avg_vol if avg_vol > 0 else 1
-            else:
-                market_data['volume_ratio'] = 1.0
+        column_lists = {name: values.tolist() for name, values in columns.items()}
 
+        enriched_data = []
+        for i, candle in enumerate(candles):
+            market_data = candle.copy()
+            for name, values in column_lists.items():
+                market_data[name] = values[i]
             market_data['current_price'] = candle['close']
-
             enriched_data.append(market_data)
 
         return enriched_data
@@ -86,6 +101,11 @@ class HistoricalOptimizer:
         position = None
         trades = []
 
+        # 타임스탬프 → 첫 등장 인덱스 (보유일 계산용)
+        first_index = {}
+        for idx, m in enumerate(market_data_list):
+            first_index.setdefault(m['timestamp'], idx)
+
         for i, market_data in enumerate(market_data_list):
             current_price = market_data['current_price']
 
@@ -99,10 +119,7 @@ class HistoricalOptimizer:
                         'quantity': 1
                     }
             else:
-                days_held = i - market_data_list.index(next(
-                    (m for m in market_data_list if m['timestamp'] == position['entry_time']),
-                    market_data_list[0]
-                ))
+                days_held = i - first_index.get(position['entry_time'], 0)
 
                 pnl_rate = ((current_price - position['entry_price']) / position['entry_price']) * 100
 
@@ -152,25 +169,12 @@ class HistoricalOptimizer:
         }
 
     def grid_search(self, market_data_list: List[Dict], param_grid: Dict[str, List]) -> List[Dict]:
-        param_names = list(param_grid.keys())
-        param_values = list(param_grid.values())
-
-        results = []
-
-        for param_combination in product(*param_values):
-            params = dict(zip(param_names, param_combination))
-
-            strategy = self.strategy_class(params)
-
-            result = self.backtest_strategy(strategy, market_data_list, params)
-            results.append(result)
-
-        return sorted(results, key=lambda x: x['return_rate'], reverse=True)
+        return self._grid_executor().grid_search(market_data_list, param_grid)
 
     def optimize_strategy(self, stock_code: str, param_grid: Dict[str, List], days: int = 365) -> Dict:
         historical_data = self.fetch_historical_data(stock_code, days)
 
-        market_data_list = self.calculate_indicators(historical_data)
+        market_data_list = self.calculate_indicators(historical_data, stock_code=stock_code)
 
         results = self.grid_search(market_data_list, param_grid)
 
@@ -194,12 +198,19 @@ class HistoricalOptimizer:
                              train_size: int = 180, test_size: int = 60) -> Dict:
         results = []
         total_data = len(market_data_list)
+        starts = list(range(0, total_data - train_size - test_size, test_size))
 
-        for start in range(0, total_data - train_size - test_size, test_size):
+        # 모든 학습 구간의 그리드 서치를 한 번에 실행 (데이터는 워커당 1회 전달)
+        train_windows = [(f"train_{start}", start, start + train_size) for start in starts]
+        train_results_by_window = self._grid_executor().grid_search_windows(
+            market_data_list, param_grid, train_windows
+        ) if starts else {}
+
+        for start in starts:
             train_data = market_data_list[start:start + train_size]
             test_data = market_data_list[start + train_size:start + train_size + test_size]
 
-            train_results = self.grid_search(train_data, param_grid)
+            train_results = train_results_by_window[f"train_{start}"]
             best_params = train_results[0]['params'] if train_results else {}
 
             strategy = self.strategy_class(best_params)
@@ -222,26 +233,42 @@ class HistoricalOptimizer:
             'results': results
         }
 
-    def monte_carlo_simulation(self, trades: List[Dict], num_simulations: int = 1000) -> Dict:
+    def monte_carlo_simulation(
+        self,
+        trades: List[Dict],
+        num_simulations: int = 1000,
+        block_size: int = 1,
+        seed: Optional[int] = None
+    ) -> Dict:
+        """
+        거래 손익 부트스트랩 Monte Carlo
+
+        Args:
+            trades: 거래 내역 (pnl 필드)
+            num_simulations: 시뮬레이션 횟수
+            block_size: 블록 부트스트랩 길이 (1이면 개별 거래 복원추출)
+            seed: 난수 시드 (재현용)
+        """
         if not trades:
             return {}
 
-        pnls = [t['pnl'] for t in trades]
-
-        simulated_returns = []
+        pnls = np.array([t['pnl'] for t in trades], dtype=np.float64)
 
-        for _ in range(num_simulations):
-            sampled_trades = np.random.choice(pnls, size=len(pnls), replace=True)
-            total_return = sum(sampled_trades)
-            simulated_returns.append(total_return)
+        engine = MonteCarloEngine(seed=seed)
+        simulated_returns = engine.terminal_values(
+            0.0, len(pnls), num_simulations, compounding=False,
+            sample=pnls, method='block_bootstrap' if block_size > 1 else 'bootstrap',
+            block_size=block_size
+        )
+        percentile_5, percentile_95 = np.percentile(simulated_returns, [5, 95])
 
         return {
-            'mean_return': np.mean(simulated_returns),
-            'std_return': np.std(simulated_returns),
-            'percentile_5': np.percentile(simulated_returns, 5),
-            'percentile_95': np.percentile(simulated_returns, 95),
-            'var_95': np.percentile(simulated_returns, 5),
-            'cvar_95': np.mean([r for r in simulated_returns if r <= np.percentile(simulated_returns, 5)])
+            'mean_return': float(simulated_returns.mean()),
+            'std_return': float(simulated_returns.std()),
+            'percentile_5': float(percentile_5),
+            'percentile_95': float(percentile_95),
+            'var_95': float(percentile_5),
+            'cvar_95': float(simulated_returns[simulated_returns <= percentile_5].mean())
         }
 
 
@@ -4,15 +4,44 @@ virtual_trading/manager.py
 
 가상매매 전략 실행, 포지션 관리, 자동 손절/익절, AI 분석 연동
 분할매수/분할매도 시스템 통합
+활성 포지션은 PositionBook(종목별 색인 + 정렬된 손절/익절 트리거)으로 평가하고
+현재가 DB 반영은 쓰기 큐로 비동기 처리
+같은 DB 파일을 쓰는 매니저(main.py / 대시보드)는 장부와 보류 트리거를 공유
 """
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+import weakref
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from .models import VirtualTradingDB
+from .position_book import BookPosition, PositionBook, Trigger, STOP_LOSS
 
 logger = logging.getLogger(__name__)
 
 
+class _SharedBook:
+    """DB(SQLiteDatabase 인스턴스)별 공유 장부 + 발동했지만 아직 매도하지 않은 트리거"""
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.book = PositionBook()
+        self.book.load(rows)
+        self.pending_triggers: Dict[int, Trigger] = {}  # 포지션 ID -> 트리거
+        self.trigger_lock = threading.Lock()
+
+
+_shared_books: 'weakref.WeakKeyDictionary[Any, _SharedBook]' = weakref.WeakKeyDictionary()
+_shared_books_lock = threading.Lock()
+
+
+def _shared_book(db: VirtualTradingDB) -> _SharedBook:
+    """get_database()가 파일별로 공유하는 연결 계층을 키로 장부 하나만 유지"""
+    with _shared_books_lock:
+        shared = _shared_books.get(db.db)
+        if shared is None:
+            shared = _shared_books[db.db] = _SharedBook(db.get_open_positions())
+        return shared
+
+
 class VirtualTradingManager:
     """가상매매 매니저 클래스"""
 
@@ -26,7 +55,14 @@ class VirtualTradingManager:
         self.db = VirtualTradingDB(db_path)
         self.active_strategies: Dict[int, Dict[str, Any]] = {}
         self.price_cache: Dict[str, float] = {}  # 종목코드 -> 현재가
-        logger.info("가상매매 매니저 초기화 완료")
+
+        # 인메모리 포지션 장부 (DB 활성 포지션으로 시작, 같은 DB의 다른 매니저와 공유)
+        shared = _shared_book(self.db)
+        self.book = shared.book
+        self._pending_triggers = shared.pending_triggers
+        self._trigger_lock = shared.trigger_lock
+
+        logger.info(f"가상매매 매니저 초기화 완료 (활성 포지션 {len(self.book)}개)")
 
     def create_strategy(
         self,
@@ -130,6 +166,10 @@ class VirtualTradingManager:
                     )
 
                     position_ids.append(position_id)
+                    self._book_position(
+                        position_id, strategy, stock_code, stock_name, split_qty, split_price,
+                        stop_loss_price, take_profit_price
+                    )
                     logger.info(
                         f"  [{i+1}/{len(split_ratios)}] {split_qty}주 @ {split_price:,.0f}원"
                     )
@@ -148,6 +188,10 @@ class VirtualTradingManager:
                     stop_loss_price=stop_loss_price,
                     take_profit_price=take_profit_price
                 )
+                self._book_position(
+                    position_id, strategy, stock_code, stock_name, quantity, price,
+                    stop_loss_price, take_profit_price
+                )
 
                 logger.info(
                     f"가상매매 매수 실행: {stock_name}({stock_code}) "
@@ -161,6 +205,33 @@ class VirtualTradingManager:
             logger.error(f"가상매매 매수 실행 실패: {e}", exc_info=True)
             return None
 
+    def _book_position(
+        self,
+        position_id: int,
+        strategy: Dict[str, Any],
+        stock_code: str,
+        stock_name: str,
+        quantity: int,
+        price: float,
+        stop_loss_price: Optional[float],
+        take_profit_price: Optional[float]
+    ):
+        """새 포지션을 장부에 등록하고 마지막 시세로 바로 트리거 평가"""
+        self.book.add(BookPosition(
+            id=position_id,
+            strategy_id=strategy['id'],
+            stock_code=stock_code,
+            stock_name=stock_name,
+            quantity=quantity,
+            avg_price=price,
+            current_price=price,
+            stop_loss_price=stop_loss_price,
+            take_profit_price=take_profit_price,
+            strategy_name=strategy.get('name', '')
+        ))
+        if stock_code in self.price_cache:
+            self._mark(stock_code, self.price_cache[stock_code])
+
     def execute_sell(
         self,
         position_id: int,
@@ -183,15 +254,14 @@ class VirtualTradingManager:
             실현 수익 (실패시 None)
         """
         try:
-            # 포지션 정보 조회
-            positions = self.db.get_open_positions()
-            position = next((p for p in positions if p['id'] == position_id), None)
+            # 포지션 정보 조회 (인메모리 장부)
+            position = self.book.get(position_id)
 
             if not position:
                 logger.error(f"포지션을 찾을 수 없음: {position_id}")
                 return None
 
-            strategy_id = position['strategy_id']
+            strategy_id = position.strategy_id
 
             # 전략 설정 조회
             strategies = self.db.get_all_strategies()
@@ -208,17 +278,18 @@ class VirtualTradingManager:
             if split_enabled:
                 # 분할매도 실행
                 split_ratios = [float(r) for r in split_ratios_str.split(',')]
-                logger.info(f"분할매도 시작: {position['stock_name']} (비율: {split_ratios})")
+                logger.info(f"분할매도 시작: {position.stock_name} (비율: {split_ratios})")
 
                 total_profit = 0
-                remaining_qty = position['quantity']
+                remaining_qty = position.quantity
+                closed = False
 
                 for i, ratio in enumerate(split_ratios):
                     if remaining_qty <= 0:
                         break
 
                     # 각 차수별 매도
-                    split_qty = int(position['quantity'] * ratio)
+                    split_qty = int(position.quantity * ratio)
                     if split_qty > remaining_qty:
                         split_qty = remaining_qty
 
@@ -230,7 +301,10 @@ class VirtualTradingManager:
                         position_id=position_id,
                         sell_price=split_price
                     )
+                    if profit is None:
+                        break
 
+                    closed = True
                     total_profit += profit if profit else 0
                     remaining_qty -= split_qty
 
@@ -238,6 +312,10 @@ class VirtualTradingManager:
                         f"  [{i+1}/{len(split_ratios)}] {split_qty}주 @ {split_price:,.0f}원 (수익: {profit:+,.0f}원)"
                     )
 
+                if not closed:
+                    self._forget_if_closed(position_id)
+                    return None
+                self.book.remove(position_id)
                 logger.info(f"✅ 분할매도 완료: 총 수익 {total_profit:+,.0f}원")
                 return total_profit
 
@@ -247,6 +325,10 @@ class VirtualTradingManager:
                     position_id=position_id,
                     sell_price=sell_price
                 )
+                if profit is None:
+                    self._forget_if_closed(position_id)
+                    return None
+                self.book.remove(position_id)
 
                 logger.info(
                     f"가상매매 매도 실행: Position #{position_id} "
@@ -260,85 +342,99 @@ class VirtualTradingManager:
             logger.error(f"가상매매 매도 실행 실패: {e}", exc_info=True)
             return None
 
+    def _forget_if_closed(self, position_id: int):
+        """
+        매도가 처리되지 않은 포지션 정리
+
+        DB에서 이미 청산됐으면(다른 매니저가 매도) 장부에서만 제거하고,
+        아직 열려 있으면 트리거를 다시 걸 수 있도록 장부에 남겨 둔다.
+        """
+        if self.db.is_position_open(position_id):
+            logger.warning(f"매도 미처리, 포지션 유지: {position_id}")
+        else:
+            self.book.remove(position_id)
+
     def update_prices(self, price_updates: Dict[str, float]):
         """
         종목 현재가 업데이트
 
+        장부에서 해당 종목 포지션만 평가하고, 교차한 손절/익절 트리거는
+        check_stop_loss_take_profit()이 매도하도록 보류 목록에 넣는다.
+        현재가 DB 반영은 쓰기 스레드가 executemany로 묶어 커밋한다.
+
         Args:
             price_updates: {종목코드: 현재가} 딕셔너리
         """
         self.price_cache.update(price_updates)
 
-        # 모든 활성 포지션의 현재가 업데이트
-        positions = self.db.get_open_positions()
-        for position in positions:
-            stock_code = position['stock_code']
-            if stock_code in price_updates:
-                current_price = price_updates[stock_code]
-                self.db.update_position_price(position['id'], current_price)
+        rows = []
+        for stock_code, price in price_updates.items():
+            rows.extend(self._mark(stock_code, price))
+        self.db.update_position_prices(rows)
+
+    def _mark(self, stock_code: str, price: float) -> List[Tuple[int, float]]:
+        rows, triggers = self.book.mark(stock_code, price)
+        if triggers:
+            with self._trigger_lock:
+                for trigger in triggers:
+                    self._pending_triggers[trigger.position.id] = trigger
+        return rows
 
     def check_stop_loss_take_profit(self) -> List[Dict[str, Any]]:
         """
-        모든 활성 포지션의 손절/익절 조건 체크
+        발동한 손절/익절 트리거 매도 실행
 
         Returns:
             실행된 매도 주문 리스트
         """
-        executed_orders = []
-        positions = self.db.get_open_positions()
+        with self._trigger_lock:
+            triggers = list(self._pending_triggers.values())
+            self._pending_triggers.clear()
 
-        for position in positions:
-            stock_code = position['stock_code']
-            current_price = self.price_cache.get(stock_code, position['current_price'])
-
-            # 손절가 체크
-            if position['stop_loss_price'] and current_price <= position['stop_loss_price']:
-                profit = self.execute_sell(
-                    position_id=position['id'],
-                    sell_price=current_price,
-                    reason="stop_loss"
+        executed_orders = []
+        for trigger in triggers:
+            position = trigger.position
+            if position.id not in self.book:
+                continue  # 이미 매도됨
+
+            stock_code = position.stock_code
+            current_price = self.price_cache.get(stock_code, trigger.price)
+            profit = self.execute_sell(
+                position_id=position.id,
+                sell_price=current_price,
+                reason=trigger.kind
+            )
+
+            if profit is None:
+                self.book.rearm(position.id)
+                continue
+
+            executed_orders.append({
+                'position_id': position.id,
+                'stock_code': stock_code,
+                'stock_name': position.stock_name,
+                'type': trigger.kind,
+                'sell_price': current_price,
+                'profit': profit
+            })
+
+            if trigger.kind == STOP_LOSS:
+                logger.warning(
+                    f"손절 실행: {position.stock_name}({stock_code}) "
+                    f"@ {current_price:,}원 (손절가: {trigger.level:,}원)"
                 )
-
-                if profit is not None:
-                    executed_orders.append({
-                        'position_id': position['id'],
-                        'stock_code': stock_code,
-                        'stock_name': position['stock_name'],
-                        'type': 'stop_loss',
-                        'sell_price': current_price,
-                        'profit': profit
-                    })
-
-                    logger.warning(
-                        f"손절 실행: {position['stock_name']}({stock_code}) "
-                        f"@ {current_price:,}원 (손절가: {position['stop_loss_price']:,}원)"
-                    )
-
-            # 익절가 체크
-            elif position['take_profit_price'] and current_price >= position['take_profit_price']:
-                profit = self.execute_sell(
-                    position_id=position['id'],
-                    sell_price=current_price,
-                    reason="take_profit"
+            else:
+                logger.info(
+                    f"익절 실행: {position.stock_name}({stock_code}) "
+                    f"@ {current_price:,}원 (익절가: {trigger.level:,}원)"
                 )
 
-                if profit is not None:
-                    executed_orders.append({
-                        'position_id': position['id'],
-                        'stock_code': stock_code,
-                        'stock_name': position['stock_name'],
-                        'type': 'take_profit',
-                        'sell_price': current_price,
-                        'profit': profit
-                    })
-
-                    logger.info(
-                        f"익절 실행: {position['stock_name']}({stock_code}) "
-                        f"@ {current_price:,}원 (익절가: {position['take_profit_price']:,}원)"
-                    )
-
         return executed_orders
 
+    def get_position_codes(self) -> List[str]:
+        """활성 포지션이 있는 종목코드 (시세 조회 대상)"""
+        return self.book.codes()
+
     def get_all_strategies(self) -> List[Dict[str, Any]]:
         """
         모든 가상매매 전략 조회
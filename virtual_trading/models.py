@@ -3,15 +3,26 @@ virtual_trading/models.py
 가상매매 데이터 모델
 
 SQLite 데이터베이스를 사용하여 가상매매 전략, 포지션, 거래 내역을 관리
+(utils.sqlite_db 공용 계층 사용: WAL + 스레드별 연결, 현재가 갱신은 그룹 커밋)
 """
 import sqlite3
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Tuple
 from pathlib import Path
 
+from utils.sqlite_db import get_database
+
 logger = logging.getLogger(__name__)
 
+# 현재가 갱신은 틱마다 반복되므로 같은 문장(캐시된 prepared statement)으로 묶어 쓴다
+_UPDATE_PRICE_SQL = """
+    UPDATE virtual_positions
+    SET current_price = ?,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+
 
 class VirtualTradingDB:
     """가상매매 데이터베이스 관리 클래스"""
@@ -28,16 +39,17 @@ class VirtualTradingDB:
         # data 디렉토리가 없으면 생성
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
-        self.conn = None
+        self.db = get_database(db_path)
         self._initialize_db()
 
     def _initialize_db(self):
         """데이터베이스 초기화 및 테이블 생성"""
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
-
-        cursor = self.conn.cursor()
+        with self.db.transaction() as conn:
+            self._create_schema(conn.cursor())
+        logger.info("✅ 가상매매 데이터베이스 초기화 및 인덱스 생성 완료")
 
+    def _create_schema(self, cursor: sqlite3.Cursor):
+        """테이블/인덱스 생성 (트랜잭션 안에서 호출)"""
         # 1. 가상매매 전략 테이블
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS virtual_strategies (
@@ -171,9 +183,6 @@ class VirtualTradingDB:
         """)
         logger.debug("  ✅ idx_trades_stock_timestamp: 종목별 거래 이력 조회 최적화")
 
-        self.conn.commit()
-        logger.info("✅ 가상매매 데이터베이스 초기화 및 인덱스 생성 완료")
-
     def create_strategy(
         self,
         name: str,
@@ -191,83 +200,78 @@ class VirtualTradingDB:
         Returns:
             생성된 전략 ID (또는 기존 전략 ID)
         """
-        cursor = self.conn.cursor()
-
-        # 먼저 기존 전략이 있는지 확인
-        cursor.execute("""
-            SELECT id FROM virtual_strategies
-            WHERE name = ? AND is_active = 1
-        """, (name,))
-
-        existing = cursor.fetchone()
-        if existing:
-            strategy_id = existing['id']
-            # Fix: 기존 전략이 있으면 활성화 상태로 업데이트 및 updated_at 갱신
-            cursor.execute("""
-                UPDATE virtual_strategies
-                SET is_active = 1,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (strategy_id,))
-            self.conn.commit()
-            logger.info(f"♻️ 가상매매 전략 재활성화: {name} (ID: {strategy_id})")
-            return strategy_id
-
-        # 없으면 새로 생성
-        try:
-            cursor.execute("""
-                INSERT INTO virtual_strategies (name, description, initial_capital, current_capital)
-                VALUES (?, ?, ?, ?)
-            """, (name, description, initial_capital, initial_capital))
-            self.conn.commit()
-
-            strategy_id = cursor.lastrowid
-            logger.info(f"✅ 가상매매 전략 생성: {name} (ID: {strategy_id})")
-            return strategy_id
-        except sqlite3.IntegrityError as e:
-            # Fix: UNIQUE constraint 에러 발생 시 다시 조회 및 활성화
-            logger.warning(f"전략 생성 중 충돌 감지, 기존 전략 재활성화: {name}")
+        with self.db.transaction() as conn:
+            cursor = conn.cursor()
+            # 먼저 기존 전략이 있는지 확인
             cursor.execute("""
                 SELECT id FROM virtual_strategies
-                WHERE name = ?
+                WHERE name = ? AND is_active = 1
             """, (name,))
+
             existing = cursor.fetchone()
             if existing:
                 strategy_id = existing['id']
-                # Fix: 활성화 상태로 업데이트
+                # Fix: 기존 전략이 있으면 활성화 상태로 업데이트 및 updated_at 갱신
                 cursor.execute("""
                     UPDATE virtual_strategies
                     SET is_active = 1,
                         updated_at = CURRENT_TIMESTAMP
                     WHERE id = ?
                 """, (strategy_id,))
-                self.conn.commit()
-                logger.info(f"✅ 기존 전략 재활성화 완료: {name} (ID: {strategy_id})")
+                logger.info(f"♻️ 가상매매 전략 재활성화: {name} (ID: {strategy_id})")
                 return strategy_id
-            raise  # 여전히 찾을 수 없으면 에러 발생
+
+            # 없으면 새로 생성
+            try:
+                cursor.execute("""
+                    INSERT INTO virtual_strategies (name, description, initial_capital, current_capital)
+                    VALUES (?, ?, ?, ?)
+                """, (name, description, initial_capital, initial_capital))
+
+                strategy_id = cursor.lastrowid
+                logger.info(f"✅ 가상매매 전략 생성: {name} (ID: {strategy_id})")
+                return strategy_id
+            except sqlite3.IntegrityError as e:
+                # Fix: UNIQUE constraint 에러 발생 시 다시 조회 및 활성화
+                logger.warning(f"전략 생성 중 충돌 감지, 기존 전략 재활성화: {name}")
+                cursor.execute("""
+                    SELECT id FROM virtual_strategies
+                    WHERE name = ?
+                """, (name,))
+                existing = cursor.fetchone()
+                if existing:
+                    strategy_id = existing['id']
+                    # Fix: 활성화 상태로 업데이트
+                    cursor.execute("""
+                        UPDATE virtual_strategies
+                        SET is_active = 1,
+                            updated_at = CURRENT_TIMESTAMP
+                        WHERE id = ?
+                    """, (strategy_id,))
+                    logger.info(f"✅ 기존 전략 재활성화 완료: {name} (ID: {strategy_id})")
+                    return strategy_id
+                raise  # 여전히 찾을 수 없으면 에러 발생
 
     def get_all_strategies(self) -> List[Dict[str, Any]]:
         """모든 가상매매 전략 조회"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
+        rows = self.db.query("""
             SELECT * FROM virtual_strategies
             WHERE is_active = 1
             ORDER BY created_at DESC
         """)
 
-        # 모든 결과를 먼저 가져옴 (cursor 재사용 문제 방지)
-        rows = cursor.fetchall()
+        # 활성 포지션 수는 전략별로 한 번에 집계
+        position_counts = {
+            r['strategy_id']: r['cnt'] for r in self.db.query("""
+                SELECT strategy_id, COUNT(*) as cnt FROM virtual_positions
+                WHERE is_closed = 0
+                GROUP BY strategy_id
+            """)
+        }
 
         strategies = []
         for row in rows:
-            # 활성 포지션 수 계산 (새로운 cursor 사용)
-            position_cursor = self.conn.cursor()
-            position_cursor.execute("""
-                SELECT COUNT(*) as cnt FROM virtual_positions
-                WHERE strategy_id = ? AND is_closed = 0
-            """, (row['id'],))
-            result = position_cursor.fetchone()
-            position_count = result['cnt'] if result else 0
+            position_count = position_counts.get(row['id'], 0)
 
             strategies.append({
                 'id': row['id'],
@@ -314,37 +318,35 @@ class VirtualTradingDB:
         Returns:
             생성된 포지션 ID
         """
-        cursor = self.conn.cursor()
-
-        # 포지션 생성
-        buy_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        cursor.execute("""
-            INSERT INTO virtual_positions
-            (strategy_id, stock_code, stock_name, quantity, avg_price, current_price,
-             buy_date, stop_loss_price, take_profit_price)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (strategy_id, stock_code, stock_name, quantity, price, price,
-              buy_date, stop_loss_price, take_profit_price))
+        with self.db.transaction() as conn:
+            cursor = conn.cursor()
+            # 포지션 생성
+            buy_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            cursor.execute("""
+                INSERT INTO virtual_positions
+                (strategy_id, stock_code, stock_name, quantity, avg_price, current_price,
+                 buy_date, stop_loss_price, take_profit_price)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (strategy_id, stock_code, stock_name, quantity, price, price,
+                  buy_date, stop_loss_price, take_profit_price))
 
-        position_id = cursor.lastrowid
+            position_id = cursor.lastrowid
 
-        # 거래 내역 기록
-        total_amount = quantity * price
-        cursor.execute("""
-            INSERT INTO virtual_trades
-            (strategy_id, stock_code, stock_name, side, quantity, price, total_amount, timestamp)
-            VALUES (?, ?, ?, 'buy', ?, ?, ?, ?)
-        """, (strategy_id, stock_code, stock_name, quantity, price, total_amount, buy_date))
-
-        # 전략 현금 차감
-        cursor.execute("""
-            UPDATE virtual_strategies
-            SET current_capital = current_capital - ?,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        """, (total_amount, strategy_id))
+            # 거래 내역 기록
+            total_amount = quantity * price
+            cursor.execute("""
+                INSERT INTO virtual_trades
+                (strategy_id, stock_code, stock_name, side, quantity, price, total_amount, timestamp)
+                VALUES (?, ?, ?, 'buy', ?, ?, ?, ?)
+            """, (strategy_id, stock_code, stock_name, quantity, price, total_amount, buy_date))
 
-        self.conn.commit()
+            # 전략 현금 차감
+            cursor.execute("""
+                UPDATE virtual_strategies
+                SET current_capital = current_capital - ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, (total_amount, strategy_id))
 
         logger.info(f"가상매매 포지션 열기: {stock_name} {quantity}주 @ {price:,}원")
         return position_id
@@ -354,7 +356,7 @@ class VirtualTradingDB:
         position_id: int,
         sell_price: float,
         current_time: str = None
-    ) -> float:
+    ) -> Optional[float]:
         """
         가상매매 포지션 닫기 (매도)
 
@@ -364,74 +366,76 @@ class VirtualTradingDB:
             current_time: 매도 시간 (None이면 현재 시간)
 
         Returns:
-            실현 수익
+            실현 수익 (없거나 이미 닫힌 포지션이면 None)
         """
         if not current_time:
             current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-        cursor = self.conn.cursor()
+        with self.db.transaction() as conn:
+            cursor = conn.cursor()
+            # 포지션 정보 조회 (BEGIN IMMEDIATE 안이므로 다른 매니저와 동시에 닫아도 한 번만 처리)
+            position = cursor.execute("""
+                SELECT * FROM virtual_positions WHERE id = ? AND is_closed = 0
+            """, (position_id,)).fetchone()
 
-        # 포지션 정보 조회
-        cursor.execute("""
-            SELECT * FROM virtual_positions WHERE id = ?
-        """, (position_id,))
-        position = cursor.execute("""
-            SELECT * FROM virtual_positions WHERE id = ?
-        """, (position_id,)).fetchone()
-
-        if not position:
-            logger.error(f"포지션을 찾을 수 없음: {position_id}")
-            return 0
-
-        # 수익 계산
-        buy_amount = position['quantity'] * position['avg_price']
-        sell_amount = position['quantity'] * sell_price
-        profit = sell_amount - buy_amount
-        profit_percent = (profit / buy_amount) * 100 if buy_amount > 0 else 0
-
-        # 포지션 닫기
-        cursor.execute("""
-            UPDATE virtual_positions
-            SET is_closed = 1,
-                current_price = ?,
-                updated_at = ?
-            WHERE id = ?
-        """, (sell_price, current_time, position_id))
-
-        # 거래 내역 기록
-        cursor.execute("""
-            INSERT INTO virtual_trades
-            (strategy_id, stock_code, stock_name, side, quantity, price, total_amount,
-             profit, profit_percent, timestamp)
-            VALUES (?, ?, ?, 'sell', ?, ?, ?, ?, ?, ?)
-        """, (position['strategy_id'], position['stock_code'], position['stock_name'],
-              position['quantity'], sell_price, sell_amount, profit, profit_percent, current_time))
-
-        # 전략 업데이트
-        cursor.execute("""
-            UPDATE virtual_strategies
-            SET current_capital = current_capital + ?,
-                total_profit = total_profit + ?,
-                trade_count = trade_count + 1,
-                win_count = win_count + ?,
-                loss_count = loss_count + ?,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        """, (sell_amount, profit, 1 if profit > 0 else 0, 1 if profit < 0 else 0, position['strategy_id']))
-
-        # 승률 및 수익률 업데이트
-        cursor.execute("""
-            UPDATE virtual_strategies
-            SET win_rate = CAST(win_count AS REAL) / trade_count * 100,
-                return_rate = (current_capital - initial_capital) / initial_capital * 100
-            WHERE id = ?
-        """, (position['strategy_id'],))
+            if not position:
+                logger.warning(f"활성 포지션 없음 (이미 청산됨): {position_id}")
+                return None
+
+            # 수익 계산
+            buy_amount = position['quantity'] * position['avg_price']
+            sell_amount = position['quantity'] * sell_price
+            profit = sell_amount - buy_amount
+            profit_percent = (profit / buy_amount) * 100 if buy_amount > 0 else 0
+
+            # 포지션 닫기
+            cursor.execute("""
+                UPDATE virtual_positions
+                SET is_closed = 1,
+                    current_price = ?,
+                    updated_at = ?
+                WHERE id = ?
+            """, (sell_price, current_time, position_id))
+
+            # 거래 내역 기록
+            cursor.execute("""
+                INSERT INTO virtual_trades
+                (strategy_id, stock_code, stock_name, side, quantity, price, total_amount,
+                 profit, profit_percent, timestamp)
+                VALUES (?, ?, ?, 'sell', ?, ?, ?, ?, ?, ?)
+            """, (position['strategy_id'], position['stock_code'], position['stock_name'],
+                  position['quantity'], sell_price, sell_amount, profit, profit_percent, current_time))
+
+            # 전략 업데이트
+            cursor.execute("""
+                UPDATE virtual_strategies
+                SET current_capital = current_capital + ?,
+                    total_profit = total_profit + ?,
+                    trade_count = trade_count + 1,
+                    win_count = win_count + ?,
+                    loss_count = loss_count + ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, (sell_amount, profit, 1 if profit > 0 else 0, 1 if profit < 0 else 0, position['strategy_id']))
 
-        self.conn.commit()
+            # 승률 및 수익률 업데이트
+            cursor.execute("""
+                UPDATE virtual_strategies
+                SET win_rate = CAST(win_count AS REAL) / trade_count * 100,
+                    return_rate = (current_capital - initial_capital) / initial_capital * 100
+                WHERE id = ?
+            """, (position['strategy_id'],))
 
         logger.info(f"가상매매 포지션 닫기: {position['stock_name']} 수익: {profit:+,.0f}원 ({profit_percent:+.2f}%)")
         return profit
 
+    def is_position_open(self, position_id: int) -> bool:
+        """포지션이 아직 청산되지 않았는지 여부"""
+        row = self.db.query_one(
+            "SELECT 1 FROM virtual_positions WHERE id = ? AND is_closed = 0", (position_id,)
+        )
+        return row is not None
+
     def get_open_positions(self, strategy_id: int = None) -> List[Dict[str, Any]]:
         """
         활성 포지션 조회
@@ -442,15 +446,9 @@ class VirtualTradingDB:
         Returns:
             활성 포지션 리스트
         """
-        # Fix: row_factory 재확인 (스레드 안전성)
-        if self.conn.row_factory != sqlite3.Row:
-            self.conn.row_factory = sqlite3.Row
-
-        cursor = self.conn.cursor()
-
         # Fix: 모든 컬럼 명시적으로 SELECT (스키마에 실제 존재하는 컬럼만)
         if strategy_id:
-            cursor.execute("""
+            rows = self.db.query("""
                 SELECT
                     p.id, p.strategy_id, p.stock_code, p.stock_name,
                     p.quantity, p.avg_price, p.current_price,
@@ -463,7 +461,7 @@ class VirtualTradingDB:
                 ORDER BY p.buy_date DESC
             """, (strategy_id,))
         else:
-            cursor.execute("""
+            rows = self.db.query("""
                 SELECT
                     p.id, p.strategy_id, p.stock_code, p.stock_name,
                     p.quantity, p.avg_price, p.current_price,
@@ -477,7 +475,7 @@ class VirtualTradingDB:
             """)
 
         positions = []
-        for row in cursor.fetchall():
+        for row in rows:
             # Fix: 안전한 dict 접근
             try:
                 quantity = row['quantity'] if row['quantity'] else 0
@@ -521,10 +519,8 @@ class VirtualTradingDB:
         Returns:
             거래 내역 리스트
         """
-        cursor = self.conn.cursor()
-
         if strategy_id:
-            cursor.execute("""
+            rows = self.db.query("""
                 SELECT t.*, s.name as strategy_name
                 FROM virtual_trades t
                 JOIN virtual_strategies s ON t.strategy_id = s.id
@@ -533,7 +529,7 @@ class VirtualTradingDB:
                 LIMIT ?
             """, (strategy_id, limit))
         else:
-            cursor.execute("""
+            rows = self.db.query("""
                 SELECT t.*, s.name as strategy_name
                 FROM virtual_trades t
                 JOIN virtual_strategies s ON t.strategy_id = s.id
@@ -542,7 +538,7 @@ class VirtualTradingDB:
             """, (limit,))
 
         trades = []
-        for row in cursor.fetchall():
+        for row in rows:
             trades.append({
                 'id': row['id'],
                 'strategy_id': row['strategy_id'],
@@ -561,15 +557,17 @@ class VirtualTradingDB:
         return trades
 
     def update_position_price(self, position_id: int, current_price: float):
-        """포지션의 현재가 업데이트"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            UPDATE virtual_positions
-            SET current_price = ?,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        """, (current_price, position_id))
-        self.conn.commit()
+        """포지션의 현재가 업데이트 (쓰기 스레드가 그룹 커밋)"""
+        self.db.write(_UPDATE_PRICE_SQL, (current_price, position_id))
+
+    def update_position_prices(self, updates: Iterable[Tuple[int, float]]):
+        """
+        여러 포지션의 현재가를 executemany 한 번으로 업데이트
+
+        Args:
+            updates: (포지션 ID, 현재가) 목록
+        """
+        self.db.write_many(_UPDATE_PRICE_SQL, [(price, position_id) for position_id, price in updates])
 
     def delete_strategy(self, strategy_id: int):
         """
@@ -578,21 +576,19 @@ class VirtualTradingDB:
         Args:
             strategy_id: 전략 ID
         """
-        cursor = self.conn.cursor()
-
-        # 전략을 비활성화 (실제 삭제가 아닌 is_active=0)
-        cursor.execute("""
-            UPDATE virtual_strategies
-            SET is_active = 0,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        """, (strategy_id,))
+        with self.db.transaction() as conn:
+            cursor = conn.cursor()
+            # 전략을 비활성화 (실제 삭제가 아닌 is_active=0)
+            cursor.execute("""
+                UPDATE virtual_strategies
+                SET is_active = 0,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, (strategy_id,))
 
-        self.conn.commit()
         logger.info(f"가상매매 전략 비활성화: ID={strategy_id}")
 
     def close(self):
-        """데이터베이스 연결 닫기"""
-        if self.conn:
-            self.conn.close()
-            logger.info("가상매매 데이터베이스 연결 종료")
+        """데이터베이스 연결 닫기 (대기 중인 쓰기 반영 후)"""
+        self.db.close()
+        logger.info("가상매매 데이터베이스 연결 종료")
@@ -0,0 +1,348 @@
+"""
+virtual_trading/parallel_optimizer.py
+HistoricalOptimizer 병렬 그리드 서치 실행기
+
+- 프로세스 풀: 시장 데이터는 워커 초기화 시 한 번만 전달하고,
+  작업에는 (구간 인덱스, 파라미터 묶음)만 담는다
+- 조기 가지치기: 구간 앞부분 표본으로 전체 조합을 평가한 뒤 하위 조합 제외 (선택)
+- 체크포인트: 완료된 조합 결과를 JSONL로 기록하고 재시작 시 건너뜀
+"""
+import hashlib
+import json
+import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# 워커 프로세스 전역 상태 (초기화 시 1회 설정)
+_worker_optimizer = None
+_worker_data: Optional[List[Dict]] = None
+
+
+def _init_worker(strategy_class, initial_capital: float, market_data_list: List[Dict]):
+    """워커 초기화: 옵티마이저와 공유 데이터 설정"""
+    global _worker_optimizer, _worker_data
+    from virtual_trading.historical_optimizer import HistoricalOptimizer
+
+    _worker_optimizer = HistoricalOptimizer(strategy_class, initial_capital) if strategy_class else None
+    _worker_data = market_data_list
+
+
+def _run_chunk(start: int, end: int, chunk: Sequence[Tuple[int, Dict]]) -> List[Tuple[int, Dict]]:
+    """워커 작업: 데이터 구간 [start:end)에서 파라미터 묶음 백테스트"""
+    data = _worker_data[start:end]
+    optimizer = _worker_optimizer
+    results = []
+    for index, params in chunk:
+        strategy = optimizer.strategy_class(params)
+        results.append((index, optimizer.backtest_strategy(strategy, data, params)))
+    return results
+
+
+def expand_grid(param_grid: Dict[str, List]) -> List[Dict]:
+    """param_grid → 파라미터 조합 리스트 (itertools.product 순서)"""
+    names = list(param_grid.keys())
+    return [dict(zip(names, values)) for values in product(*param_grid.values())]
+
+
+class GridCheckpoint:
+    """
+    그리드 서치 부분 결과 체크포인트 (JSONL)
+
+    각 줄: {"signature", "window", "index", "result"}
+    signature(그리드/데이터 식별값)가 다른 줄은 무시한다.
+    """
+
+    def __init__(self, path: str, signature: str):
+        self.path = Path(path)
+        self.signature = signature
+        self._file = None
+
+    def load(self) -> Dict[Tuple[str, int], Dict]:
+        """완료된 결과 로드 {(window, index): result}"""
+        done = {}
+        if not self.path.exists():
+            return done
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 중단 시 잘린 마지막 줄
+                if record.get('signature') == self.signature:
+                    done[(record['window'], record['index'])] = record['result']
+        return done
+
+    def append(self, window: str, results: List[Tuple[int, Dict]]):
+        """결과 기록 (묶음 단위 flush)"""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+
+        for index, result in results:
+            self._file.write(json.dumps({
+                'signature': self.signature,
+                'window': window,
+                'index': index,
+                'result': result,
+            }, ensure_ascii=False, default=float) + '\n')
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ParallelGridExecutor:
+    """
+    병렬 그리드 서치 실행기
+
+    Usage:
+        executor = ParallelGridExecutor(MyStrategy, max_workers=8)
+        results = executor.grid_search(market_data_list, param_grid)
+        windows = executor.grid_search_windows(market_data_list, param_grid,
+                                               [('w0', 0, 180), ('w1', 60, 240)])
+
+    strategy_class는 워커 프로세스에서 import 가능한 최상위 클래스여야 한다.
+    """
+
+    def __init__(
+        self,
+        strategy_class,
+        initial_capital: float = 10000000,
+        max_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        prune_ratio: float = 0.0,
+        prune_sample: float = 0.5,
+        prune_min_combinations: int = 64,
+        checkpoint_path: Optional[str] = None
+    ):
+        """
+        Args:
+            strategy_class: 전략 클래스 (params → strategy)
+            initial_capital: 초기 자본
+            max_workers: 워커 수 (None이면 CPU 수, 1이면 현재 프로세스에서 실행)
+            chunk_size: 작업당 파라미터 조합 수 (None이면 자동)
+            prune_ratio: 가지치기 비율 (0.5 = 표본 평가 하위 50% 제외, 0이면 사용 안 함)
+            prune_sample: 가지치기 표본 구간 비율 (구간 앞부분)
+            prune_min_combinations: 가지치기를 적용할 최소 조합 수
+            checkpoint_path: 체크포인트 JSONL 경로 (None이면 사용 안 함)
+        """
+        self.strategy_class = strategy_class
+        self.initial_capital = initial_capital
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.prune_ratio = prune_ratio
+        self.prune_sample = prune_sample
+        self.prune_min_combinations = prune_min_combinations
+        self.checkpoint_path = checkpoint_path
+
+        self.last_stats: Dict[str, Any] = {}
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+
+    def grid_search(self, market_data_list: List[Dict], param_grid: Dict[str, List]) -> List[Dict]:
+        """
+        전체 데이터에 대한 그리드 서치
+
+        Returns:
+            return_rate 내림차순 결과 (HistoricalOptimizer.grid_search와 같은 형식/순서)
+        """
+        return self.grid_search_windows(
+            market_data_list, param_grid, [('full', 0, len(market_data_list))]
+        )['full']
+
+    def grid_search_windows(
+        self,
+        market_data_list: List[Dict],
+        param_grid: Dict[str, List],
+        windows: Sequence[Tuple[str, int, int]]
+    ) -> Dict[str, List[Dict]]:
+        """
+        여러 데이터 구간에 대한 그리드 서치를 한 풀에서 실행
+
+        Args:
+            market_data_list: 지표가 계산된 전체 데이터
+            param_grid: {파라미터: 후보 리스트}
+            windows: [(구간 이름, 시작 인덱스, 끝 인덱스), ...]
+
+        Returns:
+            {구간 이름: return_rate 내림차순 결과}
+        """
+        combinations = expand_grid(param_grid)
+        checkpoint = None
+        done: Dict[Tuple[str, int], Dict] = {}
+        if self.checkpoint_path:
+            checkpoint = GridCheckpoint(self.checkpoint_path, self._signature(market_data_list, param_grid))
+            done = checkpoint.load()
+            if done:
+                logger.info(f"체크포인트 복원: {len(done)}개 조합 결과")
+
+        results: Dict[str, Dict[int, Dict]] = {name: {} for name, _, _ in windows}
+        for (window, index), result in done.items():
+            if window in results:
+                results[window][index] = result
+
+        pruned = 0
+        try:
+            with self._executor(market_data_list) as runner:
+                candidates: Dict[str, List[int]] = {}
+                sample_jobs = []
+                for name, start, end in windows:
+                    pending = [i for i in range(len(combinations)) if i not in results[name]]
+                    candidates[name] = pending
+                    if self._should_prune(len(pending)):
+                        sample_end = start + max(1, int((end - start) * self.prune_sample))
+                        sample_jobs.append((name, start, sample_end))
+
+                # 1단계: 표본 구간 평가 후 하위 조합 제외
+                if sample_jobs:
+                    sample_results = runner.run([
+                        (name, start, end, candidates[name]) for name, start, end in sample_jobs
+                    ], combinations)
+                    for name, _, _ in sample_jobs:
+                        scores = sample_results[name]
+                        ranked = sorted(candidates[name], key=lambda i: scores[i]['return_rate'], reverse=True)
+                        keep = max(1, int(math.ceil(len(ranked) * (1 - self.prune_ratio))))
+                        pruned += len(ranked) - keep
+                        candidates[name] = sorted(ranked[:keep])
+
+                # 2단계: 전체 구간 평가
+                full_results = runner.run([
+                    (name, start, end, candidates[name]) for name, start, end in windows
+                ], combinations, checkpoint=checkpoint)
+                for name in full_results:
+                    results[name].update(full_results[name])
+        finally:
+            if checkpoint:
+                checkpoint.close()
+
+        self.last_stats = {
+            'combinations': len(combinations),
+            'windows': len(windows),
+            'restored': len(done),
+            'pruned': pruned,
+            'workers': self.max_workers,
+        }
+
+        # product 순서 → return_rate 정렬 (안정 정렬로 기존 grid_search와 동일 순서)
+        return {
+            name: sorted(
+                (by_index[i] for i in sorted(by_index)),
+                key=lambda x: x['return_rate'], reverse=True
+            )
+            for name, by_index in results.items()
+        }
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+
+    def _should_prune(self, num_combinations: int) -> bool:
+        return 0 < self.prune_ratio < 1 and num_combinations >= self.prune_min_combinations
+
+    def _signature(self, market_data_list: List[Dict], param_grid: Dict[str, List]) -> str:
+        """체크포인트 식별값 (전략, 그리드, 데이터 범위)"""
+        first = market_data_list[0].get('timestamp') if market_data_list else None
+        last = market_data_list[-1].get('timestamp') if market_data_list else None
+        raw = json.dumps({
+            'strategy': f"{self.strategy_class.__module__}.{self.strategy_class.__qualname__}",
+            'grid': param_grid,
+            'data': [str(first), str(last), len(market_data_list)],
+            'prune': [self.prune_ratio, self.prune_sample],
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]
+
+    def _chunk_size_for(self, total: int) -> int:
+        if self.chunk_size:
+            return self.chunk_size
+        # 워커당 4개 정도의 작업으로 나눠 부하 균형
+        return max(1, math.ceil(total / (self.max_workers * 4)))
+
+    def _executor(self, market_data_list: List[Dict]):
+        """작업 실행 컨텍스트 (병렬/직렬)"""
+        return _PoolRunner(self, market_data_list)
+
+
+class _PoolRunner:
+    """ParallelGridExecutor 실행 컨텍스트: 풀을 한 번 만들고 여러 단계에서 재사용"""
+
+    def __init__(self, owner: ParallelGridExecutor, market_data_list: List[Dict]):
+        self.owner = owner
+        self.market_data_list = market_data_list
+        self.pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self):
+        owner = self.owner
+        if owner.max_workers > 1:
+            self.pool = ProcessPoolExecutor(
+                max_workers=owner.max_workers,
+                initializer=_init_worker,
+                initargs=(owner.strategy_class, owner.initial_capital, self.market_data_list)
+            )
+        else:
+            _init_worker(owner.strategy_class, owner.initial_capital, self.market_data_list)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.pool is not None:
+            self.pool.shutdown(wait=True, cancel_futures=exc_type is not None)
+            self.pool = None
+        else:
+            _init_worker(None, 0, None)
+
+    def run(
+        self,
+        jobs: Sequence[Tuple[str, int, int, List[int]]],
+        combinations: List[Dict],
+        checkpoint: Optional[GridCheckpoint] = None
+    ) -> Dict[str, Dict[int, Dict]]:
+        """
+        [(구간 이름, 시작, 끝, 조합 인덱스 리스트)] 실행
+
+        Returns:
+            {구간 이름: {조합 인덱스: 결과}}
+        """
+        total = sum(len(indices) for _, _, _, indices in jobs)
+        size = self.owner._chunk_size_for(total)
+        results: Dict[str, Dict[int, Dict]] = {name: {} for name, _, _, _ in jobs}
+
+        tasks = []
+        for name, start, end, indices in jobs:
+            for offset in range(0, len(indices), size):
+                chunk = [(i, combinations[i]) for i in indices[offset:offset + size]]
+                tasks.append((name, start, end, chunk))
+
+        if self.pool is None:
+            for name, start, end, chunk in tasks:
+                chunk_results = _run_chunk(start, end, chunk)
+                results[name].update(chunk_results)
+                if checkpoint:
+                    checkpoint.append(name, chunk_results)
+            return results
+
+        futures = {
+            self.pool.submit(_run_chunk, start, end, chunk): name
+            for name, start, end, chunk in tasks
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            chunk_results = future.result()
+            results[name].update(chunk_results)
+            if checkpoint:
+                checkpoint.append(name, chunk_results)
+
+        return results
+
+
+__all__ = ['ParallelGridExecutor', 'GridCheckpoint', 'expand_grid']
@@ -0,0 +1,217 @@
+"""
+virtual_trading/position_book.py
+가상매매 인메모리 포지션 장부
+
+- 활성 포지션을 종목코드별로 색인 → 시세 갱신 시 DB 전체 조회 없이 해당 종목 포지션만 평가
+- 손절가/익절가를 종목별 정렬 리스트로 유지 → 시세 하나로 교차한 트리거를 이분 탐색으로 찾음
+  (손절: 가격 <= 손절가, 익절: 가격 >= 익절가, 둘 다면 손절 우선)
+- 발동한 트리거는 해제되어 다음 틱에 중복 발동하지 않음 (매도 실패 시 rearm)
+- DB 반영은 호출 측(VirtualTradingManager)이 쓰기 큐로 비동기 처리
+"""
+import bisect
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+STOP_LOSS = 'stop_loss'
+TAKE_PROFIT = 'take_profit'
+
+# (트리거 가격, 포지션 ID) 오름차순
+_Levels = List[Tuple[float, int]]
+
+
+@dataclass
+class BookPosition:
+    """장부상 활성 포지션"""
+    id: int
+    strategy_id: int
+    stock_code: str
+    stock_name: str
+    quantity: int
+    avg_price: float
+    current_price: float
+    stop_loss_price: Optional[float] = None
+    take_profit_price: Optional[float] = None
+    strategy_name: str = ''
+
+    @classmethod
+    def from_dict(cls, row: Dict[str, Any]) -> 'BookPosition':
+        """VirtualTradingDB.get_open_positions() 행에서 생성"""
+        return cls(
+            id=row['id'],
+            strategy_id=row['strategy_id'],
+            stock_code=row['stock_code'],
+            stock_name=row.get('stock_name') or '',
+            quantity=row.get('quantity') or 0,
+            avg_price=row.get('avg_price') or 0,
+            current_price=row.get('current_price') or 0,
+            stop_loss_price=row.get('stop_loss_price'),
+            take_profit_price=row.get('take_profit_price'),
+            strategy_name=row.get('strategy_name') or '',
+        )
+
+
+@dataclass
+class Trigger:
+    """발동한 손절/익절 트리거"""
+    kind: str
+    position: BookPosition
+    price: float
+
+    @property
+    def level(self) -> Optional[float]:
+        if self.kind == STOP_LOSS:
+            return self.position.stop_loss_price
+        return self.position.take_profit_price
+
+
+class PositionBook:
+    """
+    종목별 포지션 색인 + 정렬된 손절/익절 트리거
+
+    Usage:
+        book = PositionBook()
+        book.load(db.get_open_positions())
+        rows, triggers = book.mark('005930', 70000)   # rows: [(position_id, price)] → DB 비동기 반영
+        for trigger in triggers:
+            ...매도...
+            book.remove(trigger.position.id)
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._positions: Dict[int, BookPosition] = {}
+        self._by_code: Dict[str, Set[int]] = {}
+        self._stops: Dict[str, _Levels] = {}
+        self._targets: Dict[str, _Levels] = {}
+        self._armed: Set[int] = set()
+
+    # ------------------------------------------------------------------
+    # 포지션 등록 / 제거
+    # ------------------------------------------------------------------
+
+    def load(self, rows: List[Dict[str, Any]]) -> None:
+        """DB 활성 포지션으로 장부 재구성"""
+        with self._lock:
+            self._positions.clear()
+            self._by_code.clear()
+            self._stops.clear()
+            self._targets.clear()
+            self._armed.clear()
+            for row in rows:
+                self.add(BookPosition.from_dict(row))
+
+    def add(self, position: BookPosition) -> None:
+        with self._lock:
+            if position.id in self._positions:
+                self.remove(position.id)
+            self._positions[position.id] = position
+            self._by_code.setdefault(position.stock_code, set()).add(position.id)
+            self._arm(position)
+
+    def remove(self, position_id: int) -> Optional[BookPosition]:
+        with self._lock:
+            position = self._positions.pop(position_id, None)
+            if position is None:
+                return None
+            self._disarm(position)
+            ids = self._by_code.get(position.stock_code)
+            if ids is not None:
+                ids.discard(position_id)
+                if not ids:
+                    del self._by_code[position.stock_code]
+            return position
+
+    def rearm(self, position_id: int) -> None:
+        """발동 후 매도에 실패한 포지션의 트리거 재등록"""
+        with self._lock:
+            position = self._positions.get(position_id)
+            if position is not None and position_id not in self._armed:
+                self._arm(position)
+
+    def _arm(self, position: BookPosition) -> None:
+        code = position.stock_code
+        if position.stop_loss_price:
+            bisect.insort(self._stops.setdefault(code, []), (position.stop_loss_price, position.id))
+        if position.take_profit_price:
+            bisect.insort(self._targets.setdefault(code, []), (position.take_profit_price, position.id))
+        self._armed.add(position.id)
+
+    def _disarm(self, position: BookPosition) -> None:
+        if position.id not in self._armed:
+            return
+        self._armed.discard(position.id)
+        for levels, level in ((self._stops, position.stop_loss_price),
+                              (self._targets, position.take_profit_price)):
+            entries = levels.get(position.stock_code)
+            if not level or not entries:
+                continue
+            i = bisect.bisect_left(entries, (level, position.id))
+            if i < len(entries) and entries[i] == (level, position.id):
+                del entries[i]
+
+    # ------------------------------------------------------------------
+    # 시세 반영
+    # ------------------------------------------------------------------
+
+    def mark(self, stock_code: str, price: float) -> Tuple[List[Tuple[int, float]], List[Trigger]]:
+        """
+        종목 시세 반영
+
+        Returns:
+            ([(포지션 ID, 현재가)] - DB 반영 대상, 이번 시세로 교차한 트리거 목록)
+        """
+        with self._lock:
+            ids = self._by_code.get(stock_code)
+            if not ids:
+                return [], []
+
+            rows = []
+            for position_id in ids:
+                self._positions[position_id].current_price = price
+                rows.append((position_id, price))
+
+            triggers: List[Trigger] = []
+            stops = self._stops.get(stock_code)
+            if stops:
+                # 손절가 >= 가격인 구간 = 리스트 꼬리
+                start = bisect.bisect_left(stops, (price, -1))
+                triggers.extend(Trigger(STOP_LOSS, self._positions[pid], price) for _, pid in stops[start:])
+            targets = self._targets.get(stock_code)
+            if targets:
+                # 익절가 <= 가격인 구간 = 리스트 머리
+                end = bisect.bisect_right(targets, (price, float('inf')))
+                stopped = {t.position.id for t in triggers}
+                triggers.extend(
+                    Trigger(TAKE_PROFIT, self._positions[pid], price)
+                    for _, pid in targets[:end] if pid not in stopped
+                )
+
+            for trigger in triggers:
+                self._disarm(trigger.position)
+            return rows, triggers
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def get(self, position_id: int) -> Optional[BookPosition]:
+        with self._lock:
+            return self._positions.get(position_id)
+
+    def positions(self, stock_code: Optional[str] = None) -> List[BookPosition]:
+        with self._lock:
+            if stock_code is None:
+                return list(self._positions.values())
+            return [self._positions[pid] for pid in self._by_code.get(stock_code, ())]
+
+    def codes(self) -> List[str]:
+        """활성 포지션이 있는 종목코드"""
+        with self._lock:
+            return list(self._by_code)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, position_id: int) -> bool:
+        return position_id in self._positions
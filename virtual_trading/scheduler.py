@@ -95,22 +95,16 @@ class VirtualTradingScheduler:
     def _update_prices(self):
         """활성 포지션의 현재가 업데이트"""
         try:
-            # 모든 활성 포지션 조회
-            positions = self.virtual_manager.get_positions()
+            # 활성 포지션 종목 (인메모리 장부, DB 조회 없음)
+            stock_codes = self.virtual_manager.get_position_codes()
 
-            if not positions:
+            if not stock_codes:
                 return
 
             # 종목별 현재가 수집
             price_updates = {}
 
-            for position in positions:
-                stock_code = position['stock_code']
-
-                # 이미 조회한 종목은 스킵
-                if stock_code in price_updates:
-                    continue
-
+            for stock_code in stock_codes:
                 # 현재가 조회
                 if self.data_fetcher:
                     try:
@@ -125,6 +119,9 @@ class VirtualTradingScheduler:
                 self.virtual_manager.update_prices(price_updates)
                 logger.debug(f"가격 업데이트: {len(price_updates)}개 종목")
 
+                # 이번 시세로 발동한 손절/익절은 다음 체크 주기를 기다리지 않고 처리
+                self._check_stop_loss_take_profit()
+
         except Exception as e:
             logger.error(f"가격 업데이트 중 오류: {e}", exc_info=True)
 
@@ -156,5 +153,5 @@ class VirtualTradingScheduler:
             'is_running': self.is_running,
             'update_thread_alive': self.update_thread.is_alive() if self.update_thread else False,
             'check_thread_alive': self.check_thread.is_alive() if self.check_thread else False,
-            'positions_count': len(self.virtual_manager.get_positions()) if self.virtual_manager else 0
+            'positions_count': len(self.virtual_manager.book) if self.virtual_manager else 0
         }
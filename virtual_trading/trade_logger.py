@@ -6,9 +6,10 @@ from typing import Dict, List, Optional
 from datetime import datetime
 from pathlib import Path
 import json
-import sqlite3
 import logging
 
+from utils.sqlite_db import get_database
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,13 +20,11 @@ class TradeLogger:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.trades: List[Dict] = []
+        self.db = get_database(str(self.db_path))
         self._initialize_database()
 
     def _initialize_database(self):
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
-        cursor.execute('''
+        self.db.executescript('''
             CREATE TABLE IF NOT EXISTS trades (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 strategy TEXT NOT NULL,
@@ -41,10 +40,8 @@ class TradeLogger:
                 reason TEXT,
                 technical_indicators TEXT,
                 market_condition TEXT
-            )
-        ''')
+            );
 
-        cursor.execute('''
             CREATE TABLE IF NOT EXISTS strategy_performance (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 strategy TEXT NOT NULL,
@@ -59,10 +56,8 @@ class TradeLogger:
                 sharpe_ratio REAL DEFAULT 0,
                 max_drawdown REAL DEFAULT 0,
                 parameters TEXT
-            )
-        ''')
+            );
 
-        cursor.execute('''
             CREATE TABLE IF NOT EXISTS market_snapshots (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 timestamp TEXT NOT NULL,
@@ -73,30 +68,24 @@ class TradeLogger:
                 volume_ratio REAL,
                 price_change REAL,
                 additional_data TEXT
-            )
-        ''')
-
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_strategy ON trades(strategy)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_timestamp ON trades(timestamp)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_performance_strategy ON strategy_performance(strategy)')
+            );
 
-        conn.commit()
-        conn.close()
+            CREATE INDEX IF NOT EXISTS idx_trades_strategy ON trades(strategy);
+            CREATE INDEX IF NOT EXISTS idx_trades_timestamp ON trades(timestamp);
+            CREATE INDEX IF NOT EXISTS idx_performance_strategy ON strategy_performance(strategy);
+        ''')
 
     def log_trade(self, trade_data: Dict):
-        """거래 로그 기록"""
+        """거래 로그 기록 (쓰기 스레드가 그룹 커밋)"""
         trade_record = {
             'timestamp': datetime.now().isoformat(),
             **trade_data
         }
         self.trades.append(trade_record)
 
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
         technical_indicators = json.dumps(trade_data.get('technical_indicators', {}))
 
-        cursor.execute('''
+        self.db.write('''
             INSERT INTO trades (
                 strategy, action, stock_code, stock_name, price, quantity,
                 amount, timestamp, realized_pnl, pnl_rate, reason,
@@ -118,9 +107,6 @@ class TradeLogger:
             trade_data.get('market_condition', '')
         ))
 
-        conn.commit()
-        conn.close()
-
     def log_buy(self, strategy: str, stock_code: str, stock_name: str,
                 price: int, quantity: int, reason: str = ""):
         """매수 로그"""
@@ -153,12 +139,9 @@ class TradeLogger:
         })
 
     def log_strategy_performance(self, performance_data: Dict):
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
         parameters = json.dumps(performance_data.get('parameters', {}))
 
-        cursor.execute('''
+        self.db.write('''
             INSERT INTO strategy_performance (
                 strategy, timestamp, total_trades, winning_trades,
                 losing_trades, total_pnl, win_rate, avg_profit,
@@ -179,16 +162,10 @@ class TradeLogger:
             parameters
         ))
 
-        conn.commit()
-        conn.close()
-
     def log_market_snapshot(self, market_data: Dict):
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
         additional_data = json.dumps(market_data.get('additional', {}))
 
-        cursor.execute('''
+        self.db.write('''
             INSERT INTO market_snapshots (
                 timestamp, market_condition, fear_greed_index,
                 rsi, macd, volume_ratio, price_change, additional_data
@@ -204,25 +181,16 @@ class TradeLogger:
             additional_data
         ))
 
-        conn.commit()
-        conn.close()
-
     def get_trade_analysis(self, strategy: Optional[str] = None) -> Dict:
         """거래 분석 (SQLite 기반)"""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
         if strategy:
-            cursor.execute('''
+            rows = self.db.query('''
                 SELECT action, realized_pnl, pnl_rate, stock_name, stock_code
                 FROM trades
                 WHERE strategy = ?
             ''', (strategy,))
         else:
-            cursor.execute('SELECT action, realized_pnl, pnl_rate, stock_name, stock_code FROM trades')
-
-        rows = cursor.fetchall()
-        conn.close()
+            rows = self.db.query('SELECT action, realized_pnl, pnl_rate, stock_name, stock_code FROM trades')
 
         if not rows:
             return {}
@@ -279,12 +247,8 @@ class TradeLogger:
 
     def get_strategy_comparison(self) -> Dict[str, Dict]:
         """전략별 비교"""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
-        cursor.execute('SELECT DISTINCT strategy FROM trades WHERE strategy IS NOT NULL')
-        strategies = [row[0] for row in cursor.fetchall()]
-        conn.close()
+        rows = self.db.query('SELECT DISTINCT strategy FROM trades WHERE strategy IS NOT NULL')
+        strategies = [row[0] for row in rows]
 
         return {
             strategy: self.get_trade_analysis(strategy)
@@ -293,18 +257,12 @@ class TradeLogger:
 
     def get_stock_analysis(self, stock_code: str) -> Dict:
         """종목별 거래 분석"""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
-        cursor.execute('''
+        rows = self.db.query('''
             SELECT action, stock_name, amount, realized_pnl, strategy
             FROM trades
             WHERE stock_code = ?
         ''', (stock_code,))
 
-        rows = cursor.fetchall()
-        conn.close()
-
         if not rows:
             return {}
 
@@ -328,36 +286,25 @@ class TradeLogger:
 
     def get_recent_trades(self, limit: int = 10, strategy: Optional[str] = None) -> List[Dict]:
         """최근 거래 내역"""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
         if strategy:
-            cursor.execute('''
+            rows = self.db.query('''
                 SELECT * FROM trades
                 WHERE strategy = ?
                 ORDER BY timestamp DESC
                 LIMIT ?
             ''', (strategy, limit))
         else:
-            cursor.execute('''
+            rows = self.db.query('''
                 SELECT * FROM trades
                 ORDER BY timestamp DESC
                 LIMIT ?
             ''', (limit,))
 
-        rows = cursor.fetchall()
-        conn.close()
-
         return [dict(row) for row in rows]
 
     def get_all_strategies_stats(self) -> List[Dict]:
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
-        cursor.execute('SELECT DISTINCT strategy FROM trades WHERE strategy IS NOT NULL')
-        strategies = [row[0] for row in cursor.fetchall()]
-        conn.close()
+        rows = self.db.query('SELECT DISTINCT strategy FROM trades WHERE strategy IS NOT NULL')
+        strategies = [row[0] for row in rows]
 
         stats = []
         for strategy in strategies:
@@ -403,26 +350,19 @@ class TradeLogger:
         print("="*60)
 
     def get_trades_by_date_range(self, start_date: str, end_date: str, strategy: Optional[str] = None) -> List[Dict]:
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
         if strategy:
-            cursor.execute('''
+            rows = self.db.query('''
                 SELECT * FROM trades
                 WHERE timestamp BETWEEN ? AND ? AND strategy = ?
                 ORDER BY timestamp DESC
             ''', (start_date, end_date, strategy))
         else:
-            cursor.execute('''
+            rows = self.db.query('''
                 SELECT * FROM trades
                 WHERE timestamp BETWEEN ? AND ?
                 ORDER BY timestamp DESC
             ''', (start_date, end_date))
 
-        rows = cursor.fetchall()
-        conn.close()
-
         return [dict(row) for row in rows]
 
     def clear_old_data(self, days: int = 30):
@@ -431,14 +371,9 @@ class TradeLogger:
         cutoff = datetime.now() - timedelta(days=days)
         cutoff_str = cutoff.isoformat()
 
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
-        cursor.execute('DELETE FROM trades WHERE timestamp < ?', (cutoff_str,))
-        cursor.execute('DELETE FROM market_snapshots WHERE timestamp < ?', (cutoff_str,))
-
-        conn.commit()
-        conn.close()
+        with self.db.transaction() as conn:
+            conn.execute('DELETE FROM trades WHERE timestamp < ?', (cutoff_str,))
+            conn.execute('DELETE FROM market_snapshots WHERE timestamp < ?', (cutoff_str,))
 
     def load_historical_trades(self, days: int = 7) -> int:
         """